@@ -1,11 +1,27 @@
 from fastapi import FastAPI
 from dcrx_kv.services.storage.service import storage_router
 from dcrx_kv.services.users.service import users_router
+from dcrx_kv.services.cluster.service import cluster_router
+from dcrx_kv.services.replication.service import replication_router
+from dcrx_kv.services.monitoring.service import monitoring_router
 from dcrx_kv.lifespan import lifespan
+from dcrx_kv.middleware.admission_middleware import AdmissionMiddleware
 from dcrx_kv.middleware.auth_middleware import AuthMidlleware
+from dcrx_kv.middleware.cluster_middleware import ClusterMiddleware
+from dcrx_kv.middleware.metrics_middleware import MetricsMiddleware
+from dcrx_kv.middleware.replication_middleware import ReplicationMiddleware
+from dcrx_kv.middleware.tracing_middleware import TracingMiddleware
 
 
 app = FastAPI(lifespan=lifespan)
 app.include_router(storage_router)
 app.include_router(users_router)
-app.add_middleware(AuthMidlleware)
\ No newline at end of file
+app.include_router(cluster_router)
+app.include_router(replication_router)
+app.include_router(monitoring_router)
+app.add_middleware(AdmissionMiddleware)
+app.add_middleware(ClusterMiddleware)
+app.add_middleware(ReplicationMiddleware)
+app.add_middleware(AuthMidlleware)
+app.add_middleware(MetricsMiddleware)
+app.add_middleware(TracingMiddleware)
\ No newline at end of file
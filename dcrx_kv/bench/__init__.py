@@ -0,0 +1,20 @@
+from .client import (
+    BenchClient,
+    bench_client
+)
+from .keys import KeyChooser
+from .metadata import run_metadata_bench
+from .micro import MicroBenchmark
+from .mix import (
+    OperationMix,
+    parse_mix
+)
+from .models import (
+    BenchConfig,
+    BenchResult,
+    MicroBenchResult,
+    MicroResult,
+    OperationStats
+)
+from .runner import BenchRunner
+from .value_sizes import ValueSizes
@@ -0,0 +1,118 @@
+import httpx
+from contextlib import asynccontextmanager
+from dcrx_kv.env import load_env, Env
+from dcrx_kv.services.auth.node_signer import NodeSigner
+from typing import (
+    AsyncIterator,
+    Dict,
+    Optional
+)
+
+
+class BenchClient:
+    """
+    Sends bench requests either to the app in-process, through an
+    ASGI transport, or to a running server. Requests are
+    authenticated with a login cookie when credentials are given,
+    and otherwise signed as a cluster node with the shared secret.
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        signer: Optional[NodeSigner]=None
+    ) -> None:
+        self.client = client
+        self.signer = signer
+
+    async def login(
+        self,
+        username: str,
+        password: str
+    ):
+        response = await self.client.post(
+            '/users/login',
+            json={
+                'username': username,
+                'password': password
+            }
+        )
+
+        response.raise_for_status()
+        self.signer = None
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        content: Optional[bytes]=None
+    ) -> httpx.Response:
+        headers: Dict[str, str] = {}
+
+        if self.signer:
+            headers = self.signer.sign(
+                method,
+                path,
+                body=content or b''
+            )
+
+        return await self.client.request(
+            method,
+            path,
+            content=content,
+            headers=headers
+        )
+
+
+@asynccontextmanager
+async def bench_client(
+    target: Optional[str]=None,
+    username: Optional[str]=None,
+    password: Optional[str]=None,
+    timeout: Optional[float]=None
+) -> AsyncIterator[BenchClient]:
+
+    env = load_env(Env.types_map())
+    signer = NodeSigner(env)
+
+    limits = httpx.Limits(
+        max_connections=None,
+        max_keepalive_connections=None
+    )
+
+    if target:
+        async with httpx.AsyncClient(
+            base_url=target,
+            timeout=timeout,
+            limits=limits
+        ) as client:
+            bench = BenchClient(client, signer=signer)
+
+            if username and password:
+                await bench.login(username, password)
+
+            yield bench
+
+        return
+
+    # Imported here so benchmarking a remote server does not build
+    # the app and its routers.
+    from dcrx_kv.app import app
+    from dcrx_kv.lifespan import lifespan
+
+    async with lifespan(app):
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(
+                app=app,
+                raise_app_exceptions=False
+            ),
+            base_url='http://dcrx-kv',
+            timeout=timeout,
+            limits=limits
+        ) as client:
+            bench = BenchClient(client, signer=signer)
+
+            if username and password:
+                await bench.login(username, password)
+
+            yield bench
@@ -0,0 +1,47 @@
+import bisect
+import itertools
+import random
+from typing import List
+
+
+class KeyChooser:
+    """
+    Picks keys from a fixed set of size cardinality, either
+    uniformly or with a zipfian skew where a few keys take most of
+    the traffic.
+    """
+
+    def __init__(
+        self,
+        cardinality: int,
+        distribution: str='uniform',
+        exponent: float=1.0
+    ) -> None:
+        if cardinality < 1:
+            raise ValueError('Key cardinality must be at least one.')
+        
+        if distribution not in ['uniform', 'zipf']:
+            raise ValueError(f'Unknown key distribution - {distribution}')
+
+        self.cardinality = cardinality
+        self.distribution = distribution
+        self.keys: List[str] = [
+            f'key-{idx}' for idx in range(cardinality)
+        ]
+
+        self._cumulative: List[float] = []
+        if distribution == 'zipf':
+            self._cumulative = list(
+                itertools.accumulate([
+                    1/(rank**exponent) for rank in range(1, cardinality + 1)
+                ])
+            )
+
+    def choose(self, generator: random.Random) -> str:
+        if self.distribution == 'uniform':
+            return self.keys[generator.randrange(self.cardinality)]
+
+        point = generator.random() * self._cumulative[-1]
+        idx = bisect.bisect_left(self._cumulative, point)
+
+        return self.keys[min(idx, self.cardinality - 1)]
@@ -0,0 +1,204 @@
+import os
+import platform
+import tempfile
+import time
+from dcrx_kv.database import RowDecoder
+from dcrx_kv.env import Env
+from dcrx_kv.services.storage.connection import StorageConnection
+from dcrx_kv.services.storage.job_state import JobState
+from dcrx_kv.services.storage.models import (
+    Blob,
+    JobMetadata
+)
+from dcrx_kv.services.storage.status import JobStatus
+from sqlalchemy.dialects import sqlite
+from typing import List
+from .micro import MicroBenchmark
+from .models import (
+    MicroBenchResult,
+    MicroResult
+)
+
+
+async def run_metadata_bench(
+    iterations: int=10000,
+    database_iterations: int=1000,
+    secret_key: str='dcrx-kv-bench'
+) -> MicroBenchResult:
+    """
+    Benchmarks each step the metadata layer runs per request -
+    building statements, converting values through the table's
+    types_map, compiling, executing them against a scratch sqlite
+    database and decoding rows back into JobMetadata.
+    """
+
+    started = time.time()
+    results: List[MicroResult] = []
+
+    benchmark = MicroBenchmark(iterations=iterations)
+    database_benchmark = MicroBenchmark(
+        iterations=database_iterations,
+        warmup=10,
+        allocation_samples=min(database_iterations, 100)
+    )
+
+    with tempfile.TemporaryDirectory() as database_directory:
+        env = Env(
+            DCRX_KV_SECRET_KEY=secret_key,
+            DCRX_KV_DATABASE_TYPE='sqlite',
+            DCRX_KV_DATABASE_NAME=os.path.join(
+                database_directory,
+                'bench.db'
+            )
+        )
+
+        connection = StorageConnection(env)
+        await connection.connect()
+        await connection.init()
+
+        state = JobState(
+            Blob(
+                key='key',
+                namespace='bench',
+                filename='key',
+                path='bench/key',
+                operation_type='upload'
+            )
+        )
+
+        state.transition(
+            JobStatus.WRITING,
+            'starting upload'
+        )
+
+        metadata = state.to_metadata()
+        metadata_values = metadata.dict()
+
+        table = connection.table
+        types_map = table.selected.types_map
+        filters = {
+            'path': state.path
+        }
+
+        dialect = sqlite.dialect()
+        insert_statement = table.insert([metadata])[0]
+
+        results.extend([
+            benchmark.run(
+                'statement.insert',
+                lambda: table.insert([metadata])
+            ),
+            benchmark.run(
+                'statement.update',
+                lambda: table.update([metadata], filters=filters)
+            ),
+            benchmark.run(
+                'statement.update_values',
+                lambda: table.update_values(
+                    state.status_values(),
+                    filters=filters
+                )
+            ),
+            benchmark.run(
+                'statement.select',
+                lambda: table.select(filters=filters)
+            ),
+            benchmark.run(
+                'statement.delete',
+                lambda: table.delete(filters)
+            ),
+            benchmark.run(
+                'template.insert_params',
+                lambda: table.insert_params(metadata)
+            ),
+            benchmark.run(
+                'template.update_by_path_params',
+                lambda: table.update_by_path_params(metadata)
+            ),
+            benchmark.run(
+                'template.update_status_params',
+                lambda: table.update_status_by_path_params(
+                    state.path,
+                    state.status_values()
+                )
+            ),
+            benchmark.run(
+                'statement.compile',
+                lambda: insert_statement.compile(dialect=dialect)
+            ),
+            benchmark.run(
+                'types_map.convert',
+                lambda: {
+                    name: types_map.get(name)(value) for name, value in metadata_values.items()
+                }
+            ),
+            benchmark.run(
+                'model.to_metadata',
+                state.to_metadata
+            )
+        ])
+
+        await connection.create([metadata])
+
+        results.extend([
+            await database_benchmark.run_async(
+                'execute.update_status',
+                lambda: connection.update_status(state)
+            ),
+            await database_benchmark.run_async(
+                'execute.update',
+                lambda: connection.update(
+                    [metadata],
+                    filters=filters
+                )
+            ),
+            await database_benchmark.run_async(
+                'execute.update_by_path',
+                lambda: connection.update_by_path([metadata])
+            ),
+            await database_benchmark.run_async(
+                'execute.select',
+                lambda: connection.select(filters=filters)
+            ),
+            await database_benchmark.run_async(
+                'execute.select_by_path',
+                lambda: connection.select_by_path(state.path)
+            )
+        ])
+
+        selected = await connection.get(
+            table.select_by_path_template,
+            params=table.path_params(state.path)
+        )
+
+        row = selected.data[0]
+        columns = list(row._fields)
+
+        validating_decoder = RowDecoder(
+            JobMetadata,
+            decoders=table.selected.decoders
+        )
+
+        validating_plan = validating_decoder.plan(columns)
+        trusted_plan = connection.decoder.plan(columns)
+
+        results.extend([
+            benchmark.run(
+                'decode.job_metadata',
+                lambda: validating_decoder.decode(row, validating_plan)
+            ),
+            benchmark.run(
+                'decode.job_metadata_trusted',
+                lambda: connection.decoder.decode(row, trusted_plan)
+            )
+        ])
+
+        await connection.close()
+        await connection.engine.dispose()
+
+    return MicroBenchResult(
+        suite='metadata',
+        started=started,
+        python=platform.python_version(),
+        results=results
+    )
@@ -0,0 +1,129 @@
+import sys
+import time
+import tracemalloc
+from typing import (
+    Any,
+    Awaitable,
+    Callable
+)
+from .models import MicroResult
+
+
+class MicroBenchmark:
+    """
+    Times a callable over a fixed number of iterations, then runs
+    it again under tracemalloc to measure allocations per call.
+    Allocations are measured in a separate pass since tracing them
+    slows every call down.
+
+    peak_bytes_per_op is the average high-water mark of memory a
+    single call allocates, and retained_blocks_per_op the average
+    number of memory blocks a call leaves allocated.
+    """
+
+    def __init__(
+        self,
+        iterations: int=10000,
+        warmup: int=100,
+        allocation_samples: int=200
+    ) -> None:
+        self.iterations = iterations
+        self.warmup = warmup
+        self.allocation_samples = allocation_samples
+
+    def run(
+        self,
+        name: str,
+        function: Callable[[], Any]
+    ) -> MicroResult:
+        
+        for _ in range(self.warmup):
+            function()
+
+        start = time.perf_counter_ns()
+
+        for _ in range(self.iterations):
+            function()
+
+        elapsed = time.perf_counter_ns() - start
+
+        tracemalloc.start()
+        blocks = sys.getallocatedblocks()
+        peak_bytes = 0
+
+        for _ in range(self.allocation_samples):
+            tracemalloc.reset_peak()
+            traced, _ = tracemalloc.get_traced_memory()
+
+            function()
+
+            _, peak = tracemalloc.get_traced_memory()
+            peak_bytes += peak - traced
+
+        retained_blocks = sys.getallocatedblocks() - blocks
+        tracemalloc.stop()
+
+        return self._result(
+            name,
+            elapsed,
+            peak_bytes,
+            retained_blocks
+        )
+
+    async def run_async(
+        self,
+        name: str,
+        function: Callable[[], Awaitable[Any]]
+    ) -> MicroResult:
+        
+        for _ in range(self.warmup):
+            await function()
+
+        start = time.perf_counter_ns()
+
+        for _ in range(self.iterations):
+            await function()
+
+        elapsed = time.perf_counter_ns() - start
+
+        tracemalloc.start()
+        blocks = sys.getallocatedblocks()
+        peak_bytes = 0
+
+        for _ in range(self.allocation_samples):
+            tracemalloc.reset_peak()
+            traced, _ = tracemalloc.get_traced_memory()
+
+            await function()
+
+            _, peak = tracemalloc.get_traced_memory()
+            peak_bytes += peak - traced
+
+        retained_blocks = sys.getallocatedblocks() - blocks
+        tracemalloc.stop()
+
+        return self._result(
+            name,
+            elapsed,
+            peak_bytes,
+            retained_blocks
+        )
+    
+    def _result(
+        self,
+        name: str,
+        elapsed: int,
+        peak_bytes: int,
+        retained_blocks: int
+    ) -> MicroResult:
+        ns_per_op = elapsed/self.iterations
+        samples = max(self.allocation_samples, 1)
+
+        return MicroResult(
+            name=name,
+            iterations=self.iterations,
+            ns_per_op=ns_per_op,
+            ops_per_second=1e9/ns_per_op if ns_per_op > 0 else 0.0,
+            peak_bytes_per_op=peak_bytes/samples,
+            retained_blocks_per_op=retained_blocks/samples
+        )
@@ -0,0 +1,57 @@
+import bisect
+import itertools
+import random
+from typing import Dict, List
+
+
+OPERATIONS = (
+    'read',
+    'write',
+    'delete'
+)
+
+
+def parse_mix(mix: str) -> Dict[str, float]:
+    """
+    Parses a mix like read=80,write=15,delete=5 into operation
+    weights. Weights are relative, so they need not sum to 100.
+    """
+
+    weights: Dict[str, float] = {}
+
+    for part in mix.split(','):
+        if part.strip() == '':
+            continue
+
+        operation, _, weight = part.partition('=')
+        operation = operation.strip().lower()
+
+        if operation not in OPERATIONS:
+            raise ValueError(f'Unknown operation - {operation}')
+        
+        weights[operation] = float(weight)
+
+    if sum(weights.values()) <= 0:
+        raise ValueError(f'Invalid mix - {mix} - weights must sum above zero')
+    
+    return weights
+
+
+class OperationMix:
+
+    def __init__(self, weights: Dict[str, float]) -> None:
+        self.operations: List[str] = [
+            operation for operation, weight in weights.items() if weight > 0
+        ]
+
+        self._cumulative: List[float] = list(
+            itertools.accumulate([
+                weights[operation] for operation in self.operations
+            ])
+        )
+
+    def choose(self, generator: random.Random) -> str:
+        point = generator.random() * self._cumulative[-1]
+        idx = bisect.bisect_right(self._cumulative, point)
+
+        return self.operations[min(idx, len(self.operations) - 1)]
@@ -0,0 +1,5 @@
+from .bench_config import BenchConfig
+from .bench_result import BenchResult
+from .micro_bench_result import MicroBenchResult
+from .micro_result import MicroResult
+from .operation_stats import OperationStats
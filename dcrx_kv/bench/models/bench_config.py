@@ -0,0 +1,21 @@
+from pydantic import (
+    BaseModel,
+    StrictFloat,
+    StrictInt,
+    StrictStr
+)
+from typing import Dict, Optional
+
+
+class BenchConfig(BaseModel):
+    target: Optional[StrictStr]
+    namespace: StrictStr='bench'
+    duration: StrictFloat=30
+    requests: Optional[StrictInt]
+    concurrency: StrictInt=16
+    keys: StrictInt=1000
+    key_distribution: StrictStr='uniform'
+    value_size: StrictStr='fixed:4kb'
+    mix: Dict[StrictStr, StrictFloat]
+    preload: bool=True
+    seed: Optional[StrictInt]
@@ -0,0 +1,21 @@
+from pydantic import (
+    BaseModel,
+    StrictFloat,
+    StrictInt,
+    StrictStr
+)
+from typing import List
+from .bench_config import BenchConfig
+from .operation_stats import OperationStats
+
+
+class BenchResult(BaseModel):
+    mode: StrictStr
+    config: BenchConfig
+    started: StrictFloat
+    elapsed: StrictFloat
+    total: StrictInt
+    errors: StrictInt
+    preload_errors: StrictInt=0
+    throughput: StrictFloat
+    operations: List[OperationStats]
@@ -0,0 +1,14 @@
+from pydantic import (
+    BaseModel,
+    StrictFloat,
+    StrictStr
+)
+from typing import List
+from .micro_result import MicroResult
+
+
+class MicroBenchResult(BaseModel):
+    suite: StrictStr
+    started: StrictFloat
+    python: StrictStr
+    results: List[MicroResult]
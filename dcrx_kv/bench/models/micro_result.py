@@ -0,0 +1,15 @@
+from pydantic import (
+    BaseModel,
+    StrictFloat,
+    StrictInt,
+    StrictStr
+)
+
+
+class MicroResult(BaseModel):
+    name: StrictStr
+    iterations: StrictInt
+    ns_per_op: StrictFloat
+    ops_per_second: StrictFloat
+    peak_bytes_per_op: StrictFloat
+    retained_blocks_per_op: StrictFloat
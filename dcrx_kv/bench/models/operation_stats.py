@@ -0,0 +1,22 @@
+from pydantic import (
+    BaseModel,
+    StrictFloat,
+    StrictInt,
+    StrictStr
+)
+from typing import Dict
+
+
+class OperationStats(BaseModel):
+    operation: StrictStr
+    count: StrictInt
+    errors: StrictInt
+    statuses: Dict[StrictStr, StrictInt]
+    bytes: StrictInt
+    throughput: StrictFloat
+    mean_ms: StrictFloat
+    p50_ms: StrictFloat
+    p95_ms: StrictFloat
+    p99_ms: StrictFloat
+    p999_ms: StrictFloat
+    max_ms: StrictFloat
@@ -0,0 +1,189 @@
+import asyncio
+import os
+import random
+import time
+from typing import (
+    Dict,
+    Optional
+)
+from .client import BenchClient
+from .keys import KeyChooser
+from .mix import OperationMix
+from .models import (
+    BenchConfig,
+    BenchResult
+)
+from .stats import OperationRecorder
+from .value_sizes import ValueSizes
+
+
+class BenchRunner:
+    """
+    Runs concurrent workers against the store's raw put, get and
+    delete endpoints until the duration elapses or the request
+    count is reached, timing every request by operation.
+    """
+
+    def __init__(
+        self,
+        config: BenchConfig,
+        client: BenchClient
+    ) -> None:
+        self.config = config
+        self.client = client
+
+        self._random = random.Random(config.seed)
+        self.keys = KeyChooser(
+            config.keys,
+            distribution=config.key_distribution
+        )
+
+        self.mix = OperationMix(config.mix)
+        self.value_sizes = ValueSizes(config.value_size)
+
+        # Values are sliced from one random buffer, so generating
+        # them costs a copy rather than a call to urandom.
+        self._values = os.urandom(self.value_sizes.largest)
+
+        self._recorders: Dict[str, OperationRecorder] = {
+            operation: OperationRecorder(operation) for operation in self.mix.operations
+        }
+
+        self._issued = 0
+        self._deadline: Optional[float] = None
+
+    def _path(
+        self,
+        operation: str,
+        key: str
+    ) -> str:
+        if operation == 'write':
+            return f'/store/put/raw/{self.config.namespace}/{key}'
+
+        elif operation == 'delete':
+            return f'/store/delete/{self.config.namespace}/{key}'
+
+        return f'/store/get/{self.config.namespace}/{key}'
+
+    async def _write(self, key: str) -> int:
+        size = self.value_sizes.sample(self._random)
+
+        response = await self.client.request(
+            'PUT',
+            self._path('write', key),
+            content=self._values[:size]
+        )
+
+        return response.status_code
+
+    async def preload(self) -> int:
+        """
+        Writes every key once so reads in the measured run hit
+        stored values rather than missing keys, returning how many
+        of the writes failed.
+        """
+
+        keys = iter(self.keys.keys)
+        failed = 0
+
+        async def load():
+            nonlocal failed
+
+            for key in keys:
+                if await self._write(key) >= 400:
+                    failed += 1
+
+        await asyncio.gather(*[
+            load() for _ in range(self.config.concurrency)
+        ])
+
+        return failed
+
+    def _next(self) -> bool:
+        if self.config.requests is not None:
+            if self._issued >= self.config.requests:
+                return False
+            
+            self._issued += 1
+            return True
+
+        return time.monotonic() < self._deadline
+
+    async def _worker(self):
+        while self._next():
+            operation = self.mix.choose(self._random)
+            key = self.keys.choose(self._random)
+            recorder = self._recorders[operation]
+
+            content: Optional[bytes] = None
+            method = 'GET'
+
+            if operation == 'write':
+                method = 'PUT'
+                content = self._values[:self.value_sizes.sample(self._random)]
+
+            elif operation == 'delete':
+                method = 'DELETE'
+
+            start = time.perf_counter()
+
+            try:
+                response = await self.client.request(
+                    method,
+                    self._path(operation, key),
+                    content=content
+                )
+
+                await response.aread()
+
+                latency = time.perf_counter() - start
+                status = response.status_code
+
+                # Deletes leave keys missing, so a 404 is an
+                # expected outcome of the mix rather than a failure.
+                recorder.record(
+                    latency,
+                    str(status),
+                    status >= 400 and status != 404,
+                    size=len(content) if content else len(response.content)
+                )
+
+            except Exception as request_error:
+                recorder.record(
+                    time.perf_counter() - start,
+                    type(request_error).__name__,
+                    True
+                )
+
+    async def run(self, mode: str) -> BenchResult:
+        preload_errors = 0
+        if self.config.preload:
+            preload_errors = await self.preload()
+
+        started = time.time()
+        start = time.monotonic()
+        self._deadline = start + self.config.duration
+
+        await asyncio.gather(*[
+            self._worker() for _ in range(self.config.concurrency)
+        ])
+
+        elapsed = time.monotonic() - start
+
+        operations = [
+            recorder.summarize(elapsed) for recorder in self._recorders.values()
+        ]
+
+        total = sum([stats.count for stats in operations])
+
+        return BenchResult(
+            mode=mode,
+            config=self.config,
+            started=started,
+            elapsed=elapsed,
+            total=total,
+            errors=sum([stats.errors for stats in operations]),
+            preload_errors=preload_errors,
+            throughput=total/elapsed if elapsed > 0 else 0.0,
+            operations=operations
+        )
@@ -0,0 +1,67 @@
+import math
+from typing import Dict, List
+from .models import OperationStats
+
+
+class OperationRecorder:
+
+    __slots__ = (
+        'operation',
+        'latencies',
+        'statuses',
+        'errors',
+        'bytes'
+    )
+
+    def __init__(self, operation: str) -> None:
+        self.operation = operation
+        self.latencies: List[float] = []
+        self.statuses: Dict[str, int] = {}
+        self.errors = 0
+        self.bytes = 0
+
+    def record(
+        self,
+        latency: float,
+        status: str,
+        failed: bool,
+        size: int=0
+    ):
+        self.latencies.append(latency)
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        self.bytes += size
+
+        if failed:
+            self.errors += 1
+
+    def summarize(self, elapsed: float) -> OperationStats:
+        latencies = sorted(self.latencies)
+
+        return OperationStats(
+            operation=self.operation,
+            count=len(latencies),
+            errors=self.errors,
+            statuses=self.statuses,
+            bytes=self.bytes,
+            throughput=len(latencies)/elapsed if elapsed > 0 else 0.0,
+            mean_ms=sum(latencies)/len(latencies) * 1000 if latencies else 0.0,
+            p50_ms=percentile(latencies, 50) * 1000,
+            p95_ms=percentile(latencies, 95) * 1000,
+            p99_ms=percentile(latencies, 99) * 1000,
+            p999_ms=percentile(latencies, 99.9) * 1000,
+            max_ms=latencies[-1] * 1000 if latencies else 0.0
+        )
+
+
+def percentile(
+    ordered: List[float],
+    percent: float
+) -> float:
+    # Nearest-rank, so every reported value is one that was
+    # actually observed.
+    if len(ordered) < 1:
+        return 0.0
+    
+    rank = math.ceil(percent * len(ordered)/100)
+
+    return float(ordered[max(rank, 1) - 1])
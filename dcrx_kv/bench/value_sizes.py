@@ -0,0 +1,88 @@
+import math
+import random
+from typing import Tuple
+
+
+SIZE_UNITS = {
+    'b': 1,
+    'kb': 1024,
+    'mb': 1024**2,
+    'gb': 1024**3
+}
+
+
+def parse_size(size: str) -> int:
+    size = size.strip().lower()
+
+    for unit in sorted(SIZE_UNITS, key=len, reverse=True):
+        if size.endswith(unit):
+            return int(float(size[:-len(unit)]) * SIZE_UNITS[unit])
+        
+    return int(size)
+
+
+class ValueSizes:
+    """
+    Draws value sizes from a distribution given as one of:
+
+        fixed:<size>
+        uniform:<min>-<max>
+        lognormal:<median>,<sigma>
+
+    where sizes accept b, kb, mb and gb suffixes. Lognormal sizes
+    are capped at max_size so one draw can not exhaust memory.
+    """
+
+    def __init__(
+        self,
+        spec: str,
+        max_size: int=64 * 1024**2
+    ) -> None:
+        self.spec = spec
+        self.max_size = max_size
+
+        kind, _, args = spec.partition(':')
+        self.kind = kind.strip().lower()
+
+        try:
+            if self.kind == 'fixed':
+                self.bounds: Tuple[int, int] = (parse_size(args), parse_size(args))
+
+            elif self.kind == 'uniform':
+                minimum, _, maximum = args.partition('-')
+                self.bounds = (parse_size(minimum), parse_size(maximum))
+
+            elif self.kind == 'lognormal':
+                median, _, sigma = args.partition(',')
+                self.median = parse_size(median)
+                self.sigma = float(sigma or 1)
+                self.bounds = (1, max_size)
+
+            else:
+                raise ValueError(f'unknown distribution - {self.kind}')
+            
+        except ValueError as parse_error:
+            raise ValueError(
+                f'Invalid value size - {spec} - {parse_error}'
+            )
+
+        if self.bounds[0] > self.bounds[1] or self.bounds[0] < 0:
+            raise ValueError(f'Invalid value size - {spec} - bad bounds')
+
+    @property
+    def largest(self) -> int:
+        return min(self.bounds[1], self.max_size)
+
+    def sample(self, generator: random.Random) -> int:
+        if self.kind == 'fixed':
+            return self.bounds[0]
+        
+        elif self.kind == 'uniform':
+            return generator.randint(*self.bounds)
+        
+        size = generator.lognormvariate(
+            math.log(max(self.median, 1)),
+            self.sigma
+        )
+
+        return max(1, min(int(size), self.max_size))
@@ -8,6 +8,8 @@ from typing import List, Union, Optional, Callable, Any
 class CLI(click.MultiCommand):
 
     command_files = {
+        'bench': 'bench.py',
+        'cluster': 'cluster.py',
         'database': 'database.py',
         'server': 'server.py'
     }
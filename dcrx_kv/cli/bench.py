@@ -0,0 +1,258 @@
+import asyncio
+import click
+import json
+from dcrx_kv.bench import (
+    BenchConfig,
+    BenchResult,
+    BenchRunner,
+    KeyChooser,
+    MicroBenchResult,
+    ValueSizes,
+    bench_client,
+    parse_mix,
+    run_metadata_bench
+)
+from dcrx_kv.env.time_parser import TimeParser
+from typing import Optional
+
+
+async def run_bench(
+    config: BenchConfig,
+    username: Optional[str],
+    password: Optional[str]
+) -> BenchResult:
+    async with bench_client(
+        target=config.target,
+        username=username,
+        password=password
+    ) as client:
+        runner = BenchRunner(config, client)
+
+        return await runner.run(
+            'remote' if config.target else 'in-process'
+        )
+
+
+def print_result(result: BenchResult):
+    click.echo(
+        f'{result.mode} - {result.total} requests in {result.elapsed:.2f}s - {result.throughput:.1f} req/s - {result.errors} errors'
+    )
+
+    if result.preload_errors > 0:
+        click.echo(f'{result.preload_errors} preload writes failed')
+
+    header = f'{"operation":<10}{"count":>10}{"errors":>8}{"req/s":>10}{"p50 ms":>10}{"p95 ms":>10}{"p99 ms":>10}{"p999 ms":>10}{"max ms":>10}'
+    click.echo(header)
+
+    for stats in result.operations:
+        click.echo(
+            f'{stats.operation:<10}{stats.count:>10}{stats.errors:>8}{stats.throughput:>10.1f}{stats.p50_ms:>10.2f}{stats.p95_ms:>10.2f}{stats.p99_ms:>10.2f}{stats.p999_ms:>10.2f}{stats.max_ms:>10.2f}'
+        )
+
+
+def print_micro_result(result: MicroBenchResult):
+    click.echo(f'{result.suite} - python {result.python}')
+
+    header = f'{"benchmark":<32}{"iterations":>12}{"ns/op":>14}{"ops/s":>14}{"peak B/op":>12}{"blocks/op":>12}'
+    click.echo(header)
+
+    for micro_result in result.results:
+        click.echo(
+            f'{micro_result.name:<32}{micro_result.iterations:>12}{micro_result.ns_per_op:>14.0f}{micro_result.ops_per_second:>14.0f}{micro_result.peak_bytes_per_op:>12.0f}{micro_result.retained_blocks_per_op:>12.2f}'
+        )
+
+
+@click.group(help='Commands to benchmark a DCRX-KV server.')
+def bench():
+    pass
+
+
+@bench.command(help='Run a load benchmark in-process, or against a running server with --target.')
+@click.option(
+    '--target',
+    default=None,
+    help='URL of a running server. Runs the app in-process if not set.'
+)
+@click.option(
+    '--duration',
+    default='30s',
+    help='How long to run for, e.g. 30s or 5m.'
+)
+@click.option(
+    '--requests',
+    default=None,
+    type=int,
+    help='Stop after this many requests instead of after the duration.'
+)
+@click.option(
+    '--concurrency',
+    default=16,
+    help='Number of concurrent workers.'
+)
+@click.option(
+    '--keys',
+    default=1000,
+    help='Number of distinct keys to spread requests over.'
+)
+@click.option(
+    '--key-distribution',
+    default='uniform',
+    type=click.Choice(['uniform', 'zipf']),
+    help='How keys are picked.'
+)
+@click.option(
+    '--value-size',
+    default='fixed:4kb',
+    help='Value size distribution: fixed:<size>, uniform:<min>-<max> or lognormal:<median>,<sigma>.'
+)
+@click.option(
+    '--mix',
+    default='read=80,write=15,delete=5',
+    help='Relative weights of read, write and delete operations.'
+)
+@click.option(
+    '--namespace',
+    default='bench',
+    help='Namespace to write bench keys under.'
+)
+@click.option(
+    '--preload/--no-preload',
+    default=True,
+    help='Write every key once before the measured run.'
+)
+@click.option(
+    '--seed',
+    default=None,
+    type=int,
+    help='Seed for key, operation and size choices.'
+)
+@click.option(
+    '--username',
+    default=None,
+    help='Username to log in with. Requests are node-signed with DCRX_KV_SECRET_KEY if not set.'
+)
+@click.option(
+    '--password',
+    default=None,
+    help='Password to log in with.'
+)
+@click.option(
+    '--output',
+    default=None,
+    type=click.Path(dir_okay=False, writable=True),
+    help='Write results as JSON to this file.'
+)
+@click.option(
+    '--json',
+    'as_json',
+    is_flag=True,
+    help='Print results as JSON instead of a table.'
+)
+def run(
+    target: Optional[str],
+    duration: str,
+    requests: Optional[int],
+    concurrency: int,
+    keys: int,
+    key_distribution: str,
+    value_size: str,
+    mix: str,
+    namespace: str,
+    preload: bool,
+    seed: Optional[int],
+    username: Optional[str],
+    password: Optional[str],
+    output: Optional[str],
+    as_json: bool
+):
+    try:
+        config = BenchConfig(
+            target=target,
+            namespace=namespace,
+            duration=float(TimeParser(duration).time),
+            requests=requests,
+            concurrency=concurrency,
+            keys=keys,
+            key_distribution=key_distribution,
+            value_size=value_size,
+            mix=parse_mix(mix),
+            preload=preload,
+            seed=seed
+        )
+
+        ValueSizes(config.value_size)
+        KeyChooser(config.keys, distribution=config.key_distribution)
+
+    except ValueError as config_error:
+        raise click.BadParameter(str(config_error))
+
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+
+    result = loop.run_until_complete(
+        run_bench(
+            config,
+            username,
+            password
+        )
+    )
+
+    if output:
+        with open(output, 'w') as output_file:
+            json.dump(result.dict(), output_file, indent=2)
+
+    if as_json:
+        click.echo(result.json(indent=2))
+
+    else:
+        print_result(result)
+
+
+@bench.command(help='Run micro-benchmarks of the metadata layer against a scratch sqlite database.')
+@click.option(
+    '--iterations',
+    default=10000,
+    help='Iterations of each statement, conversion and decode benchmark.'
+)
+@click.option(
+    '--database-iterations',
+    default=1000,
+    help='Iterations of each benchmark that executes against sqlite.'
+)
+@click.option(
+    '--output',
+    default=None,
+    type=click.Path(dir_okay=False, writable=True),
+    help='Write results as JSON to this file.'
+)
+@click.option(
+    '--json',
+    'as_json',
+    is_flag=True,
+    help='Print results as JSON instead of a table.'
+)
+def metadata(
+    iterations: int,
+    database_iterations: int,
+    output: Optional[str],
+    as_json: bool
+):
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+
+    result = loop.run_until_complete(
+        run_metadata_bench(
+            iterations=iterations,
+            database_iterations=database_iterations
+        )
+    )
+
+    if output:
+        with open(output, 'w') as output_file:
+            json.dump(result.dict(), output_file, indent=2)
+
+    if as_json:
+        click.echo(result.json(indent=2))
+
+    else:
+        print_micro_result(result)
@@ -0,0 +1,89 @@
+import click
+import os
+import subprocess
+import sys
+from typing import List
+
+
+@click.group(help='Commands to run and manage a DCRX-KV cluster.')
+def cluster():
+    pass
+
+
+@cluster.command(help='Run a local DCRX-KV cluster with one process per node.')
+@click.option(
+    '--nodes',
+    default=3,
+    help='Number of local nodes to run.'
+)
+@click.option(
+    '--host',
+    default='127.0.0.1',
+    help='Host address to run the cluster nodes on.'
+)
+@click.option(
+    '--base-port',
+    default=2278,
+    help='Port of the first node. Each subsequent node uses the next port.'
+)
+@click.option(
+    '--log-level',
+    default='info',
+    help='Log level to use for Uvicorn'
+)
+def run(
+    nodes: int,
+    host: str,
+    base_port: int,
+    log_level: str
+):
+    ports = [
+        base_port + node_idx for node_idx in range(nodes)
+    ]
+
+    addresses = [
+        f'http://{host}:{port}' for port in ports
+    ]
+
+    processes: List[subprocess.Popen] = []
+
+    for port, address in zip(ports, addresses):
+        node_env = dict(os.environ)
+        node_env.update({
+            'DCRX_KV_CLUSTER_NODE_ADDRESS': address,
+            'DCRX_KV_CLUSTER_NODES': ','.join(addresses),
+            'DCRX_KV_STORAGE_BACKEND': 'memory'
+        })
+
+        processes.append(
+            subprocess.Popen(
+                [
+                    sys.executable,
+                    '-m',
+                    'uvicorn',
+                    'dcrx_kv.app:app',
+                    '--host',
+                    host,
+                    '--port',
+                    str(port),
+                    '--log-level',
+                    log_level
+                ],
+                env=node_env
+            )
+        )
+
+    try:
+        for process in processes:
+            process.wait()
+
+    except KeyboardInterrupt:
+        pass
+
+    finally:
+        for process in processes:
+            if process.poll() is None:
+                process.terminate()
+
+        for process in processes:
+            process.wait()
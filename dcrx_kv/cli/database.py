@@ -4,10 +4,11 @@ import click
 import uuid
 from dcrx_kv.env import load_env, Env
 from dcrx_kv.services.auth.manager import AuthorizationSessionManager
+from dcrx_kv.services.storage.connection import StorageConnection
 from dcrx_kv.services.users.connection import UsersConnection
 from dcrx_kv.services.users.models import DBUser, NewUser
 from sqlalchemy_utils import database_exists, create_database
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 
 
@@ -108,6 +109,38 @@ async def create_user(
     await connection.close()
 
 
+async def migrate_storage(
+    env: Env,
+    target: Optional[int],
+    status: bool
+):
+    connection = StorageConnection(env)
+    await connection.connect()
+
+    await connection.create_table(
+        connection.table.selected.table
+    )
+
+    runner = connection.migrations()
+
+    if status is False:
+        applied = await runner.migrate(target=target)
+
+        for migration in applied:
+            click.echo(f'Applied {migration.name} {migration.version} - {migration.description}')
+
+        if len(applied) < 1:
+            click.echo('No migrations to apply.')
+
+    else:
+        for migration in await runner.status():
+            state = 'applied' if migration.applied_at else 'pending'
+            click.echo(f'{migration.name} {migration.version} {state} - {migration.description}')
+
+    await connection.close()
+    await connection.engine.dispose()
+
+
 @click.group(help='Commands to migrate or initialize the database.')
 def database():
     pass
@@ -156,3 +189,32 @@ def initialize(
         }, env)
     )
 
+
+@database.command(help='Apply pending schema migrations.')
+@click.option(
+    '--target',
+    default=None,
+    type=int,
+    help='Migrate up to and including this version.'
+)
+@click.option(
+    '--status',
+    is_flag=True,
+    help='List migrations and whether they are applied instead of applying them.'
+)
+def migrate(
+    target: Optional[int],
+    status: bool
+):
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+
+    env = load_env(Env.types_map())
+
+    loop.run_until_complete(
+        migrate_storage(
+            env,
+            target,
+            status
+        )
+    )
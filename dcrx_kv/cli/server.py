@@ -1,8 +1,10 @@
 import click
 import dcrx_kv
+import os
 import pathlib
 import uvicorn
 from dcrx_kv.app import app
+from dcrx_kv.env import load_env, Env
 
 
 @click.group(help='Commands to manage the DCRX server.')
@@ -56,6 +58,18 @@ def run(
         )
 
     elif workers > 1:
+        # Workers are separate processes, so they must share the
+        # memory-mapped store to see each other's blobs. Any arena
+        # left over from a previous run is discarded to match the
+        # empty store a single worker starts with.
+        os.environ.setdefault('DCRX_KV_STORAGE_BACKEND', 'shared')
+        env = load_env(Env.types_map())
+
+        if env.DCRX_KV_STORAGE_BACKEND == 'shared' and os.path.exists(
+            env.DCRX_KV_STORAGE_SHARED_MEMORY_PATH
+        ):
+            os.remove(env.DCRX_KV_STORAGE_SHARED_MEMORY_PATH)
+
         uvicorn.run(
             "dcrx_kv.app:app",
             host=host,
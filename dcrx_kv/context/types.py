@@ -5,4 +5,6 @@ class ContextType(Enum):
     AUTH_SERVICE='AUTH_SERVICE'
     STORAGE_SERVICE='STORAGE_SERVICE'
     MONITORING_SERVICE='MONITORING_SERVICE'
-    USERS_SERVICE='USERS_SERVICE'
\ No newline at end of file
+    USERS_SERVICE='USERS_SERVICE'
+    CLUSTER_SERVICE='CLUSTER_SERVICE'
+    REPLICATION_SERVICE='REPLICATION_SERVICE'
\ No newline at end of file
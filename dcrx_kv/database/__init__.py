@@ -1,2 +1,3 @@
 from .connection import DatabaseConnection
-from .connection_config import ConnectionConfig
\ No newline at end of file
+from .connection_config import ConnectionConfig
+from .row_decoder import RowDecoder
@@ -1,4 +1,5 @@
 import asyncio
+import time
 from sqlalchemy import Table
 from sqlalchemy.sql import (
     Select,
@@ -18,18 +19,43 @@ from sqlalchemy.ext.asyncio import (
     AsyncConnection
 )
 from typing import (
+    Any,
+    Dict,
     Union, 
     Generic,
     TypeVar,
-    List
+    List,
+    Optional
 )
+from dcrx_kv.metrics import metrics
+from dcrx_kv.tracing import tracer
 from .connection_config import ConnectionConfig
 from .models import DatabaseTransactionResult
+from .row_decoder import RowDecoder
 
 
 T = TypeVar('T')
 
 
+STATEMENT_SECONDS = metrics.histogram(
+    'dcrx_kv_database_statement_seconds',
+    'Time to execute and commit a database transaction.',
+    labels=('operation',)
+)
+
+TRANSACTION_RETRIES = metrics.counter(
+    'dcrx_kv_database_retries_total',
+    'Database transactions retried after a failed attempt.',
+    labels=('operation',)
+)
+
+TRANSACTION_FAILURES = metrics.counter(
+    'dcrx_kv_database_failures_total',
+    'Database transactions that failed on every attempt.',
+    labels=('operation',)
+)
+
+
 class DatabaseConnection(Generic[T]):
 
     def __init__(self, config: ConnectionConfig) -> None:
@@ -137,22 +163,44 @@ class DatabaseConnection(Generic[T]):
         )
 
 
+    @tracer.traced('db.get')
     async def get(
         self, 
-        statement: Select
+        statement: Select,
+        params: Optional[Dict[str, Any]]=None,
+        decoder: Optional[RowDecoder]=None
     ) -> DatabaseTransactionResult[T]:
         
         last_error: Union[str, None]=None
         results: List[T] = []
 
-        for _ in range(self.config.database_transaction_retries):
+        for attempt in range(self.config.database_transaction_retries):
             async with self.engine.connect() as connection:
                 
+                start = time.perf_counter()
+
                 try:
 
-                    results: List[T] = await connection.execute(statement)
+                    results: List[T] = await connection.execute(
+                        statement,
+                        params
+                    )
                     await connection.commit()
 
+                    STATEMENT_SECONDS.observe(
+                        time.perf_counter() - start,
+                        'get'
+                    )
+
+                    if decoder:
+                        return DatabaseTransactionResult(
+                            message='Records successfully retrieved',
+                            data=decoder.decode_all(
+                                results.keys(),
+                                results
+                            )
+                        )
+
                     return DatabaseTransactionResult(
                         message='Records successfully retrieved',
                         data=[
@@ -164,29 +212,53 @@ class DatabaseConnection(Generic[T]):
                     last_error = str(transaction_exception)
                     await connection.rollback()
 
+                    if attempt < self.config.database_transaction_retries - 1:
+                        TRANSACTION_RETRIES.inc('get')
+
                 await connection.commit()
 
+        TRANSACTION_FAILURES.inc('get')
+
         return DatabaseTransactionResult(
             message='Database transaction failed',
             error=last_error
         )
     
+    @tracer.traced('db.insert_or_update')
     async def insert_or_update(
         self,
         statements: List[
             Union[Insert, Update]
-        ]
+        ],
+        params: Optional[
+            List[
+                Union[
+                    Dict[str, Any],
+                    List[Dict[str, Any]]
+                ]
+            ]
+        ]=None
     ) -> DatabaseTransactionResult[T]:
         
         last_error: Union[str, None]=None
-        for _ in range(self.config.database_transaction_retries):
+        for attempt in range(self.config.database_transaction_retries):
             async with self.engine.connect() as connection:
+                start = time.perf_counter()
+
                 try:
-                    for statement in statements:
-                        await connection.execute(statement)
+                    for idx, statement in enumerate(statements):
+                        await connection.execute(
+                            statement,
+                            params[idx] if params else None
+                        )
 
                     await connection.commit()
 
+                    STATEMENT_SECONDS.observe(
+                        time.perf_counter() - start,
+                        'insert_or_update'
+                    )
+
                     return DatabaseTransactionResult(
                         message='Records successfully created or updated'
                     )
@@ -194,30 +266,49 @@ class DatabaseConnection(Generic[T]):
                 except Exception as transaction_exception:
                     last_error = str(transaction_exception)
                     await connection.rollback()
+
+                    if attempt < self.config.database_transaction_retries - 1:
+                        TRANSACTION_RETRIES.inc('insert_or_update')
                 
                 await connection.commit()
         
+        TRANSACTION_FAILURES.inc('insert_or_update')
+
         return DatabaseTransactionResult(
             message='Database transaction failed',
             error=last_error
         )
 
 
+    @tracer.traced('db.delete')
     async def delete(
         self,
-        statements: List[Delete]
+        statements: List[Delete],
+        params: Optional[
+            List[Dict[str, Any]]
+        ]=None
     ) -> DatabaseTransactionResult[T]:
         
         last_error: Union[str, None]=None
-        for _ in range(self.config.database_transaction_retries):
+        for attempt in range(self.config.database_transaction_retries):
             async with self.engine.connect() as connection:
 
+                start = time.perf_counter()
+
                 try:
-                    for statement in statements:
-                        await connection.execute(statement)
+                    for idx, statement in enumerate(statements):
+                        await connection.execute(
+                            statement,
+                            params[idx] if params else None
+                        )
 
                     await connection.commit()
 
+                    STATEMENT_SECONDS.observe(
+                        time.perf_counter() - start,
+                        'delete'
+                    )
+
                     return DatabaseTransactionResult(
                         message='Records successfully dropped'
                     )
@@ -225,9 +316,14 @@ class DatabaseConnection(Generic[T]):
                 except Exception as transaction_exception:
                     last_error = str(transaction_exception)
                     await connection.rollback()
+
+                    if attempt < self.config.database_transaction_retries - 1:
+                        TRANSACTION_RETRIES.inc('delete')
             
                 await connection.commit()
         
+        TRANSACTION_FAILURES.inc('delete')
+
         return DatabaseTransactionResult(
             message='Database transaction failed',
             error=last_error
@@ -0,0 +1,8 @@
+from .migration import Migration
+from .migration_runner import MigrationRunner
+from .operations import (
+    add_column,
+    create_indexes,
+    get_column_names,
+    get_index_names
+)
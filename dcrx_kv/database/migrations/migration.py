@@ -0,0 +1,30 @@
+from sqlalchemy import Table
+from sqlalchemy.ext.asyncio import AsyncConnection
+from typing import (
+    Awaitable,
+    Callable
+)
+
+
+class Migration:
+    """
+    One versioned change to a table's schema. Operations must be
+    idempotent, checking the live schema before changing it, since
+    tables created fresh already have the latest definition.
+
+    Migrations that can not run inside a transaction, like building
+    a Postgres index concurrently, set transactional=False to run
+    with autocommit.
+    """
+
+    def __init__(
+        self,
+        version: int,
+        description: str,
+        operation: Callable[[AsyncConnection, Table], Awaitable[None]],
+        transactional: bool=True
+    ) -> None:
+        self.version = version
+        self.description = description
+        self.operation = operation
+        self.transactional = transactional
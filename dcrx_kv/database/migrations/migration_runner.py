@@ -0,0 +1,145 @@
+import sqlalchemy
+import time
+from dcrx_kv.database.models import AppliedMigration
+from sqlalchemy import Table
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.schema import CreateTable
+from typing import (
+    Dict,
+    List,
+    Optional
+)
+from .migration import Migration
+
+
+class MigrationRunner:
+    """
+    Applies a table's migrations in version order, recording each
+    in a shared schema_migrations table under the table's name.
+    Every migration runs on its own connection, so one that must
+    run outside a transaction does not affect the others.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        table: Table,
+        migrations: List[Migration]
+    ) -> None:
+        self.engine = engine
+        self.table = table
+        self.migrations = sorted(
+            migrations,
+            key=lambda migration: migration.version
+        )
+
+        self.versions_table = Table(
+            'schema_migrations',
+            sqlalchemy.MetaData(),
+            sqlalchemy.Column(
+                'name',
+                sqlalchemy.String(255),
+                primary_key=True
+            ),
+            sqlalchemy.Column(
+                'version',
+                sqlalchemy.Integer,
+                primary_key=True
+            ),
+            sqlalchemy.Column(
+                'description',
+                sqlalchemy.TEXT
+            ),
+            sqlalchemy.Column(
+                'applied_at',
+                sqlalchemy.Double
+            )
+        )
+
+    async def _applied(self) -> Dict[int, AppliedMigration]:
+        async with self.engine.connect() as connection:
+            await connection.execute(
+                CreateTable(
+                    self.versions_table,
+                    if_not_exists=True
+                )
+            )
+
+            results = await connection.execute(
+                self.versions_table.select().where(
+                    self.versions_table.c.name == self.table.name
+                )
+            )
+
+            await connection.commit()
+
+            return {
+                row.version: AppliedMigration(
+                    name=row.name,
+                    version=row.version,
+                    description=row.description,
+                    applied_at=row.applied_at
+                ) for row in results
+            }
+
+    async def status(self) -> List[AppliedMigration]:
+        applied = await self._applied()
+
+        return [
+            applied.get(
+                migration.version,
+                AppliedMigration(
+                    name=self.table.name,
+                    version=migration.version,
+                    description=migration.description
+                )
+            ) for migration in self.migrations
+        ]
+
+    async def migrate(
+        self,
+        target: Optional[int]=None
+    ) -> List[AppliedMigration]:
+        applied = await self._applied()
+        completed: List[AppliedMigration] = []
+
+        for migration in self.migrations:
+            if migration.version in applied:
+                continue
+
+            if target is not None and migration.version > target:
+                break
+
+            async with self.engine.connect() as connection:
+                if migration.transactional is False:
+                    connection = await connection.execution_options(
+                        isolation_level='AUTOCOMMIT'
+                    )
+
+                await migration.operation(connection, self.table)
+
+                record = AppliedMigration(
+                    name=self.table.name,
+                    version=migration.version,
+                    description=migration.description,
+                    applied_at=time.time()
+                )
+
+                try:
+                    await connection.execute(
+                        self.versions_table.insert().values(record.dict())
+                    )
+
+                    await connection.commit()
+
+                except IntegrityError:
+                    # Another worker applied and recorded it first.
+                    # Operations are idempotent, so both runs left
+                    # the schema in the same state.
+                    await connection.rollback()
+                    continue
+
+            completed.append(record)
+
+        return completed
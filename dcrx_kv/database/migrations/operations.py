@@ -0,0 +1,93 @@
+import sqlalchemy
+from sqlalchemy import (
+    Column,
+    Index,
+    Table,
+    text
+)
+from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlalchemy.schema import CreateIndex
+from typing import List, Set
+
+
+async def get_column_names(
+    connection: AsyncConnection,
+    table_name: str
+) -> Set[str]:
+    columns = await connection.run_sync(
+        lambda sync_connection: sqlalchemy.inspect(
+            sync_connection
+        ).get_columns(table_name)
+    )
+
+    return set([
+        column['name'] for column in columns
+    ])
+
+
+async def get_index_names(
+    connection: AsyncConnection,
+    table_name: str
+) -> Set[str]:
+    indexes = await connection.run_sync(
+        lambda sync_connection: sqlalchemy.inspect(
+            sync_connection
+        ).get_indexes(table_name)
+    )
+
+    return set([
+        index['name'] for index in indexes
+    ])
+
+
+async def add_column(
+    connection: AsyncConnection,
+    table: Table,
+    column: Column
+):
+    if column.name in await get_column_names(connection, table.name):
+        return
+    
+    preparer = connection.dialect.identifier_preparer
+    column_type = column.type.compile(dialect=connection.dialect)
+
+    # Nullable columns without defaults are a metadata-only change
+    # on every supported dialect, so existing rows are not rewritten.
+    await connection.execute(
+        text(
+            f'ALTER TABLE {preparer.format_table(table)} ADD COLUMN {preparer.format_column(column)} {column_type}'
+        )
+    )
+
+
+async def create_indexes(
+    connection: AsyncConnection,
+    table: Table,
+    indexes: List[Index]
+):
+    existing = await get_index_names(connection, table.name)
+
+    for index in indexes:
+        if index.name in existing:
+            continue
+
+        if connection.dialect.name == 'mysql':
+            # InnoDB builds secondary indexes in place without
+            # blocking writes when asked to.
+            statement = str(
+                CreateIndex(index).compile(dialect=connection.dialect)
+            )
+
+            await connection.execute(
+                text(f'{statement} ALGORITHM=INPLACE LOCK=NONE')
+            )
+
+        else:
+            # Postgres indexes declare postgresql_concurrently, so
+            # they build without locking out writes.
+            await connection.execute(
+                CreateIndex(
+                    index,
+                    if_not_exists=True
+                )
+            )
@@ -1 +1,2 @@
-from .database_transaction_result import DatabaseTransactionResult
\ No newline at end of file
+from .applied_migration import AppliedMigration
+from .database_transaction_result import DatabaseTransactionResult
@@ -0,0 +1,14 @@
+from pydantic import (
+    BaseModel,
+    StrictFloat,
+    StrictInt,
+    StrictStr
+)
+from typing import Optional
+
+
+class AppliedMigration(BaseModel):
+    name: StrictStr
+    version: StrictInt
+    description: StrictStr
+    applied_at: Optional[StrictFloat]
@@ -0,0 +1,121 @@
+from pydantic import BaseModel
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar
+)
+
+
+M = TypeVar('M', bound=BaseModel)
+
+
+DecodeStep = Tuple[str, int, Optional[Callable[[Any], Any]]]
+
+
+class DecodePlan:
+
+    __slots__ = (
+        'steps',
+        'complete'
+    )
+
+    def __init__(
+        self,
+        steps: Tuple[DecodeStep, ...],
+        complete: bool
+    ) -> None:
+        self.steps = steps
+        self.complete = complete
+
+
+class RowDecoder(Generic[M]):
+    """
+    Maps result rows straight into models through a column plan
+    built once per result shape, rather than by name lookups and
+    hand-built keyword arguments per row.
+
+    With validate=False rows are trusted - values pass through the
+    table's decoders and the model is constructed without pydantic
+    validation. Only use that for rows read from tables this
+    service writes itself.
+    """
+
+    def __init__(
+        self,
+        model: Type[M],
+        decoders: Optional[Dict[str, Callable[[Any], Any]]]=None,
+        validate: bool=True
+    ) -> None:
+        self.model = model
+        self.decoders = decoders or {}
+        self.validate = validate
+
+        self._fields = frozenset(model.__fields__.keys())
+        self._plans: Dict[Tuple[str, ...], DecodePlan] = {}
+
+    def plan(self, columns: Sequence[str]) -> DecodePlan:
+        columns = tuple(columns)
+        plan = self._plans.get(columns)
+
+        if plan is None:
+            steps = tuple([
+                (
+                    name,
+                    idx,
+                    None if self.validate else self.decoders.get(name)
+                ) for idx, name in enumerate(columns) if name in self._fields
+            ])
+
+            plan = DecodePlan(
+                steps,
+                self._fields.issubset(columns)
+            )
+
+            self._plans[columns] = plan
+
+        return plan
+    
+    def decode(
+        self,
+        row: Sequence[Any],
+        plan: DecodePlan
+    ) -> M:
+        values = {
+            name: row[idx] if decode is None or row[idx] is None else decode(row[idx]) for name, idx, decode in plan.steps
+        }
+
+        if self.validate:
+            return self.model(**values)
+        
+        if plan.complete is False:
+            return self.model.construct(
+                _fields_set=set(values),
+                **values
+            )
+        
+        # Every field is present, so there are no defaults for
+        # construct() to fill and the model's state is set directly.
+        model = self.model.__new__(self.model)
+        object.__setattr__(model, '__dict__', values)
+        object.__setattr__(model, '__fields_set__', set(self._fields))
+
+        return model
+
+    def decode_all(
+        self,
+        columns: Sequence[str],
+        rows: Iterable[Sequence[Any]]
+    ) -> List[M]:
+        plan = self.plan(columns)
+
+        return [
+            self.decode(row, plan) for row in rows
+        ]
@@ -18,6 +18,12 @@ PrimaryType = Union[str, int, float, bytes, bool]
 
 class Env(BaseModel):
     DCRX_KV_MAX_MEMORY_PERCENT_USAGE: StrictFloat=50
+    DCRX_KV_MONITOR_INTERVAL: StrictStr='1s'
+    DCRX_KV_MONITOR_WINDOW: StrictInt=300
+    DCRX_KV_TRACING_SAMPLE_RATE: StrictFloat=0.01
+    DCRX_KV_TRACING_MAX_TRACES: StrictInt=1000
+    DCRX_KV_PROFILING_MAX_DURATION: StrictStr='5m'
+    DCRX_KV_PROFILING_MAX_SNAPSHOTS: StrictInt=10
     DCRX_KV_STORAGE_UPLOAD_TIMEOUT: StrictStr='10m'
     DCRX_KV_STORAGE_DOWNLOAD_TIMEOUT: StrictStr='10m'
     DCRX_KV_STORAGE_PRUNE_INTERVAL: StrictStr='1s'
@@ -26,9 +32,41 @@ class Env(BaseModel):
     DCRX_KV_STORAGE_MAX_PENDING_WAIT: StrictStr='10m'
     DCRX_KV_STORAGE_MAX_PENDING: StrictInt=100
     DCRX_KV_STORAGE_POOL_SIZE: StrictInt=10
+    DCRX_KV_STORAGE_BACKEND: StrictStr='memory'
+    DCRX_KV_STORAGE_SHARED_MEMORY_PATH: StrictStr='/dev/shm/dcrx-kv.arena'
+    DCRX_KV_STORAGE_SHARED_MEMORY_SIZE_MB: StrictInt=512
+    DCRX_KV_STORAGE_SHARED_MEMORY_MAX_KEYS: StrictInt=65536
+    DCRX_KV_STORAGE_SHARED_MEMORY_MAX_BLOB_MB: StrictInt=64
+    DCRX_KV_STORAGE_MAX_JOB_WAIT: StrictStr='1m'
+    DCRX_KV_STORAGE_JOB_EVENTS_HEARTBEAT: StrictStr='15s'
+    DCRX_KV_STORAGE_CHANGE_FEED_SIZE: StrictInt=10000
+    DCRX_KV_STORAGE_WATCH_HEARTBEAT: StrictStr='15s'
+    DCRX_KV_STORAGE_HISTORY_PARTITION_INTERVAL: StrictStr='1d'
+    DCRX_KV_STORAGE_HISTORY_RETENTION: StrictStr='7d'
+    DCRX_KV_STORAGE_HISTORY_FLUSH_INTERVAL: StrictStr='1s'
+    DCRX_KV_STORAGE_HISTORY_BATCH_SIZE: StrictInt=500
+    DCRX_KV_STORAGE_HISTORY_MAX_BUFFERED: StrictInt=50000
+    DCRX_KV_STORAGE_ENCRYPTED_NAMESPACES: Optional[StrictStr]
+    DCRX_KV_STORAGE_ENCRYPTION_KEY: Optional[StrictStr]
+    DCRX_KV_STORAGE_ENCRYPTION_CHUNK_SIZE: StrictInt=65536
+    DCRX_KV_STORAGE_MAX_STORE_SIZE_MB: Optional[StrictInt]
+    DCRX_KV_STORAGE_RETRY_AFTER: StrictStr='1s'
+    DCRX_KV_STORAGE_NAMESPACE_MAX_SIZE_MB: Optional[StrictInt]
+    DCRX_KV_STORAGE_NAMESPACE_MAX_KEYS: Optional[StrictInt]
+    DCRX_KV_STORAGE_NAMESPACE_RATE: Optional[StrictFloat]
+    DCRX_KV_STORAGE_NAMESPACE_BURST: Optional[StrictInt]
     DCRX_KV_SECRET_KEY: StrictStr
     DCRX_KV_AUTH_ALGORITHM: StrictStr='HS256'
     DCRX_KV_TOKEN_EXPIRATION: StrictStr='15m'
+    DCRX_KV_AUTH_TOKEN_CACHE_SIZE: StrictInt=10000
+    DCRX_KV_AUTH_TOKEN_CACHE_TTL: StrictStr='30s'
+    DCRX_KV_AUTH_HASH_WORKERS: StrictInt=2
+    DCRX_KV_AUTH_HASH_MAX_PENDING: StrictInt=32
+    DCRX_KV_AUTH_RETRY_AFTER: StrictStr='1s'
+    DCRX_KV_AUTH_NAMESPACE_ACCESS: Optional[StrictStr]
+    DCRX_KV_AUTH_OPERATORS: Optional[StrictStr]
+    DCRX_KV_NODE_SIGNATURE_MAX_AGE: StrictStr='1m'
+    DCRX_KV_SIGNED_URL_MAX_AGE: StrictStr='1h'
     DCRX_KV_DATABASE_TRANSACTION_RETRIES: StrictInt=3
     DCRX_KV_DATABASE_TYPE: Optional[StrictStr]='sqlite'
     DCRX_KV_DATABASE_USER: Optional[StrictStr]
@@ -36,11 +74,29 @@ class Env(BaseModel):
     DCRX_KV_DATABASE_PORT: Optional[StrictInt]
     DCRX_KV_DATABASE_PASSWORD: Optional[StrictStr]
     DCRX_KV_DATABASE_NAME: StrictStr='dcrx'
+    DCRX_KV_CLUSTER_NODE_ADDRESS: Optional[StrictStr]
+    DCRX_KV_CLUSTER_NODES: Optional[StrictStr]
+    DCRX_KV_CLUSTER_VIRTUAL_NODES: StrictInt=128
+    DCRX_KV_CLUSTER_POOL_SIZE: StrictInt=100
+    DCRX_KV_CLUSTER_REQUEST_TIMEOUT: StrictStr='30s'
+    DCRX_KV_REPLICATION_ROLE: StrictStr='none'
+    DCRX_KV_REPLICATION_PRIMARY_ADDRESS: Optional[StrictStr]
+    DCRX_KV_REPLICATION_REPLICA_ID: Optional[StrictStr]
+    DCRX_KV_REPLICATION_LOG_SIZE: StrictInt=100000
+    DCRX_KV_REPLICATION_HEARTBEAT_INTERVAL: StrictStr='5s'
+    DCRX_KV_REPLICATION_ACK_INTERVAL: StrictStr='1s'
+    DCRX_KV_REPLICATION_READ_WAIT: StrictStr='1s'
 
     @classmethod
     def types_map(self) -> Dict[str, Callable[[str], PrimaryType]]:
         return {
             'DCRX_KV_MAX_MEMORY_PERCENT_USAGE': float,
+            'DCRX_KV_MONITOR_INTERVAL': str,
+            'DCRX_KV_MONITOR_WINDOW': int,
+            'DCRX_KV_TRACING_SAMPLE_RATE': float,
+            'DCRX_KV_TRACING_MAX_TRACES': int,
+            'DCRX_KV_PROFILING_MAX_DURATION': str,
+            'DCRX_KV_PROFILING_MAX_SNAPSHOTS': int,
             'DCRX_KV_STORAGE_PRUNE_INTERVAL': str,
             'DCRX_KV_STORAGE_UPLOAD_TIMEOUT': str,
             'DCRX_KV_STORAGE_DOWNLOAD_TIMEOUT': str,
@@ -49,14 +105,58 @@ class Env(BaseModel):
             'DCRX_KV_STORAGE_MAX_PENDING_WAIT': str,
             'DCRX_KV_STORAGE_MAX_PENDING': int,
             'DCRX_KV_STORAGE_POOL_SIZE': int,
+            'DCRX_KV_STORAGE_BACKEND': str,
+            'DCRX_KV_STORAGE_SHARED_MEMORY_PATH': str,
+            'DCRX_KV_STORAGE_SHARED_MEMORY_SIZE_MB': int,
+            'DCRX_KV_STORAGE_SHARED_MEMORY_MAX_KEYS': int,
+            'DCRX_KV_STORAGE_SHARED_MEMORY_MAX_BLOB_MB': int,
+            'DCRX_KV_STORAGE_MAX_JOB_WAIT': str,
+            'DCRX_KV_STORAGE_JOB_EVENTS_HEARTBEAT': str,
+            'DCRX_KV_STORAGE_CHANGE_FEED_SIZE': int,
+            'DCRX_KV_STORAGE_WATCH_HEARTBEAT': str,
+            'DCRX_KV_STORAGE_HISTORY_PARTITION_INTERVAL': str,
+            'DCRX_KV_STORAGE_HISTORY_RETENTION': str,
+            'DCRX_KV_STORAGE_HISTORY_FLUSH_INTERVAL': str,
+            'DCRX_KV_STORAGE_HISTORY_BATCH_SIZE': int,
+            'DCRX_KV_STORAGE_HISTORY_MAX_BUFFERED': int,
+            'DCRX_KV_STORAGE_ENCRYPTED_NAMESPACES': str,
+            'DCRX_KV_STORAGE_ENCRYPTION_KEY': str,
+            'DCRX_KV_STORAGE_ENCRYPTION_CHUNK_SIZE': int,
+            'DCRX_KV_STORAGE_MAX_STORE_SIZE_MB': int,
+            'DCRX_KV_STORAGE_RETRY_AFTER': str,
+            'DCRX_KV_STORAGE_NAMESPACE_MAX_SIZE_MB': int,
+            'DCRX_KV_STORAGE_NAMESPACE_MAX_KEYS': int,
+            'DCRX_KV_STORAGE_NAMESPACE_RATE': float,
+            'DCRX_KV_STORAGE_NAMESPACE_BURST': int,
             'DCRX_KV_SECRET_KEY': str,
             'DCRX_KV_AUTH_ALGORITHM': str,
             'DCRX_KV_TOKEN_EXPIRATION': str,
+            'DCRX_KV_AUTH_TOKEN_CACHE_SIZE': int,
+            'DCRX_KV_AUTH_TOKEN_CACHE_TTL': str,
+            'DCRX_KV_AUTH_HASH_WORKERS': int,
+            'DCRX_KV_AUTH_HASH_MAX_PENDING': int,
+            'DCRX_KV_AUTH_RETRY_AFTER': str,
+            'DCRX_KV_AUTH_NAMESPACE_ACCESS': str,
+            'DCRX_KV_AUTH_OPERATORS': str,
+            'DCRX_KV_NODE_SIGNATURE_MAX_AGE': str,
+            'DCRX_KV_SIGNED_URL_MAX_AGE': str,
             'DCRX_KV_DATABASE_TRANSACTION_RETRIES': int,
             'DCRX_KV_DATABASE_TYPE': str,
             'DCRX_KV_DATABASE_USER': str,
             'DCRX_KV_DATABASE_PASSWORD': str,
             'DCRX_KV_DATABASE_NAME': str,
             'DCRX_KV_DATABASE_URI': str,
-            'DCRX_KV_DATABASE_PORT': int
+            'DCRX_KV_DATABASE_PORT': int,
+            'DCRX_KV_CLUSTER_NODE_ADDRESS': str,
+            'DCRX_KV_CLUSTER_NODES': str,
+            'DCRX_KV_CLUSTER_VIRTUAL_NODES': int,
+            'DCRX_KV_CLUSTER_POOL_SIZE': int,
+            'DCRX_KV_CLUSTER_REQUEST_TIMEOUT': str,
+            'DCRX_KV_REPLICATION_ROLE': str,
+            'DCRX_KV_REPLICATION_PRIMARY_ADDRESS': str,
+            'DCRX_KV_REPLICATION_REPLICA_ID': str,
+            'DCRX_KV_REPLICATION_LOG_SIZE': int,
+            'DCRX_KV_REPLICATION_HEARTBEAT_INTERVAL': str,
+            'DCRX_KV_REPLICATION_ACK_INTERVAL': str,
+            'DCRX_KV_REPLICATION_READ_WAIT': str
         }
\ No newline at end of file
@@ -1,6 +1,12 @@
 import re
 from datetime import timedelta
 
+
+# Matches a whole duration such as "30", "1.5s" or "1h30m", for
+# validating input before it is parsed.
+TIME_PATTERN = r'^(?i:\d+(\.\d+)?[smhdw]?)+$'
+
+
 class TimeParser:
 
     def __init__(self, time_amount: str) -> None:
@@ -4,23 +4,35 @@ from dcrx_kv.services.auth.context import (
     AuthorizationSessionManager,
     AuthServiceContext
 )
+from dcrx_kv.services.cluster.context import (
+    ClusterManager,
+    ClusterServiceContext
+)
+from dcrx_kv.services.replication.context import (
+    ReplicationManager,
+    ReplicationServiceContext
+)
 from dcrx_kv.services.users.context import (
     UsersConnection,
     UsersServiceContext
 )
 from dcrx_kv.services.monitoring.context import (
-    CPUMonitor,
-    MemoryMonitor,
-    MonitoringServiceContext
+    CPUProfiler,
+    HeapProfiler,
+    MonitoringServiceContext,
+    SystemSampler
 )
 from dcrx_kv.services.storage.context import (
+    JobHistory,
     JobQueue,
     StorageConnection,
     StorageServiceContext
 )
 
 from dcrx_kv.context.manager import context
+from dcrx_kv.tracing import tracer
 from .env import load_env, Env
+from .env.time_parser import TimeParser
 
 
 @asynccontextmanager
@@ -28,6 +40,11 @@ async def lifespan(app: FastAPI):
 
     env = load_env(Env.types_map())
 
+    tracer.configure(
+        env.DCRX_KV_TRACING_SAMPLE_RATE,
+        env.DCRX_KV_TRACING_MAX_TRACES
+    )
+
     auth_service_context = AuthServiceContext(
         env=env,
         manager=AuthorizationSessionManager(env)
@@ -36,18 +53,43 @@ async def lifespan(app: FastAPI):
     monitoring_service_context = MonitoringServiceContext(
         env=env,
         monitor_name='dcrx.main',
-        cpu=CPUMonitor(),
-        memory=MemoryMonitor()
+        sampler=SystemSampler(
+            'dcrx.main',
+            interval=TimeParser(env.DCRX_KV_MONITOR_INTERVAL).time,
+            window_size=env.DCRX_KV_MONITOR_WINDOW
+        ),
+        cpu_profiler=CPUProfiler(),
+        heap_profiler=HeapProfiler(
+            max_snapshots=env.DCRX_KV_PROFILING_MAX_SNAPSHOTS,
+            max_tracing=TimeParser(env.DCRX_KV_PROFILING_MAX_DURATION).time
+        )
     )
 
     storage_service_connection = StorageConnection(env)
+    storage_service_history = JobHistory(
+        env,
+        storage_service_connection
+    )
+
+    storage_service_queue = JobQueue(
+        env,
+        storage_service_connection,
+        history=storage_service_history
+    )
+
+    # Memory is measured against the process's own limit, counting
+    # what the store holds outside the heap, and uploads are admitted
+    # against the headroom that leaves.
+    monitoring_service_context.sampler.memory.track_external_usage(
+        storage_service_queue.external_memory_bytes
+    )
+    storage_service_queue.memory_headroom = monitoring_service_context.get_memory_headroom
+
     storage_service_context = StorageServiceContext(
         env=env,
         connection=storage_service_connection,
-        queue=JobQueue(
-            env,
-            storage_service_connection
-        )
+        queue=storage_service_queue,
+        history=storage_service_history
     )
 
     users_service_context = UsersServiceContext(
@@ -55,11 +97,27 @@ async def lifespan(app: FastAPI):
         connection=UsersConnection(env)
     )
 
+    cluster_service_context = ClusterServiceContext(
+        env=env,
+        manager=ClusterManager(env)
+    )
+
+    replication_service_context = ReplicationServiceContext(
+        env=env,
+        manager=ReplicationManager(
+            env,
+            storage_service_queue,
+            storage_service_connection
+        )
+    )
+
     await context.initialize([
         auth_service_context,
         monitoring_service_context,
         storage_service_context,
-        users_service_context
+        users_service_context,
+        cluster_service_context,
+        replication_service_context
     ])
 
     yield
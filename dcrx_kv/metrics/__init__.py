@@ -0,0 +1,7 @@
+from .counter import Counter
+from .gauge import Gauge
+from .histogram import Histogram
+from .registry import (
+    MetricsRegistry,
+    metrics
+)
@@ -0,0 +1,37 @@
+from typing import (
+    Dict,
+    List,
+    Tuple,
+    Union
+)
+from .labels import format_labels
+
+
+class Counter:
+
+    metric_type = 'counter'
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        labels: Tuple[str, ...]=()
+    ) -> None:
+        self.name = name
+        self.description = description
+        self.label_names = labels
+
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(
+        self,
+        *label_values: str,
+        amount: Union[int, float]=1
+    ):
+        self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def render(self) -> List[str]:
+        return [
+            f'{self.name}{format_labels(self.label_names, label_values)} {value}'
+            for label_values, value in self._values.items()
+        ]
@@ -0,0 +1,83 @@
+from typing import (
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union
+)
+from .labels import format_labels
+
+
+class Gauge:
+
+    metric_type = 'gauge'
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        labels: Tuple[str, ...]=()
+    ) -> None:
+        self.name = name
+        self.description = description
+        self.label_names = labels
+
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._functions: Dict[
+            Tuple[str, ...],
+            Callable[[], Union[int, float]]
+        ] = {}
+
+    def set(
+        self,
+        value: Union[int, float],
+        *label_values: str
+    ):
+        self._values[label_values] = value
+
+    def inc(
+        self,
+        *label_values: str,
+        amount: Union[int, float]=1
+    ):
+        self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def dec(
+        self,
+        *label_values: str,
+        amount: Union[int, float]=1
+    ):
+        self.inc(
+            *label_values,
+            amount=-amount
+        )
+
+    def set_function(
+        self,
+        function: Callable[[], Union[int, float]],
+        *label_values: str
+    ):
+        """
+        Reads the gauge from the function at scrape time, for values
+        the owning service already tracks.
+        """
+        self._functions[label_values] = function
+
+    def _read(self, label_values: Tuple[str, ...]) -> Optional[float]:
+        function = self._functions.get(label_values)
+        if function:
+            return function()
+
+        return self._values.get(label_values)
+
+    def render(self) -> List[str]:
+        label_sets = list(self._values)
+        label_sets.extend([
+            label_values for label_values in self._functions if label_values not in self._values
+        ])
+
+        return [
+            f'{self.name}{format_labels(self.label_names, label_values)} {self._read(label_values)}'
+            for label_values in label_sets
+        ]
@@ -0,0 +1,105 @@
+from bisect import bisect_left
+from typing import (
+    Dict,
+    List,
+    Tuple,
+    Union
+)
+from .labels import format_labels
+
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+    30
+)
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram. Observations land in one per-bucket
+    counter found by bisection, and the cumulative Prometheus buckets
+    are only summed up at scrape time.
+    """
+
+    metric_type = 'histogram'
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        labels: Tuple[str, ...]=(),
+        buckets: Tuple[float, ...]=DEFAULT_BUCKETS
+    ) -> None:
+        self.name = name
+        self.description = description
+        self.label_names = labels
+        self.buckets = tuple(sorted(buckets))
+
+        # Per label set: [bucket counts..., +Inf count], sum
+        self._series: Dict[Tuple[str, ...], Tuple[List[int], List[float]]] = {}
+
+    def observe(
+        self,
+        value: Union[int, float],
+        *label_values: str
+    ):
+        series = self._series.get(label_values)
+        if series is None:
+            series = (
+                [0] * (len(self.buckets) + 1),
+                [0.0]
+            )
+            self._series[label_values] = series
+
+        counts, total = series
+        counts[bisect_left(self.buckets, value)] += 1
+        total[0] += value
+
+    def render(self) -> List[str]:
+        lines: List[str] = []
+
+        for label_values, (counts, total) in self._series.items():
+            cumulative = 0
+
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                bucket_labels = format_labels(
+                    self.label_names,
+                    label_values,
+                    extra=f'le="{bound}"'
+                )
+
+                lines.append(f'{self.name}_bucket{bucket_labels} {cumulative}')
+
+            cumulative += counts[-1]
+            bucket_labels = format_labels(
+                self.label_names,
+                label_values,
+                extra='le="+Inf"'
+            )
+
+            labels = format_labels(
+                self.label_names,
+                label_values
+            )
+
+            lines.extend([
+                f'{self.name}_bucket{bucket_labels} {cumulative}',
+                f'{self.name}_sum{labels} {total[0]}',
+                f'{self.name}_count{labels} {cumulative}'
+            ])
+
+        return lines
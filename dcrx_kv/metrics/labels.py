@@ -0,0 +1,30 @@
+from typing import Tuple
+
+
+def escape_label_value(value: str) -> str:
+    return value.replace(
+        '\\', '\\\\'
+    ).replace(
+        '\n', '\\n'
+    ).replace(
+        '"', '\\"'
+    )
+
+
+def format_labels(
+    label_names: Tuple[str, ...],
+    label_values: Tuple[str, ...],
+    extra: str=''
+) -> str:
+    pairs = [
+        f'{name}="{escape_label_value(str(value))}"'
+        for name, value in zip(label_names, label_values)
+    ]
+
+    if extra:
+        pairs.append(extra)
+
+    if len(pairs) < 1:
+        return ''
+
+    return '{' + ','.join(pairs) + '}'
@@ -0,0 +1,97 @@
+from typing import (
+    Dict,
+    List,
+    Tuple,
+    Union
+)
+from .counter import Counter
+from .gauge import Gauge
+from .histogram import (
+    Histogram,
+    DEFAULT_BUCKETS
+)
+
+
+Metric = Union[Counter, Gauge, Histogram]
+
+
+class MetricsRegistry:
+    """
+    Process-wide set of metrics rendered in the Prometheus text
+    format. Metrics are recorded from the event loop, so updates are
+    plain dict and list writes with no locking.
+    """
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, Metric] = {}
+
+    def _register(self, metric: Metric) -> Metric:
+        registered = self._metrics.get(metric.name)
+        if registered:
+            return registered
+
+        self._metrics[metric.name] = metric
+
+        return metric
+
+    def counter(
+        self,
+        name: str,
+        description: str,
+        labels: Tuple[str, ...]=()
+    ) -> Counter:
+        return self._register(
+            Counter(
+                name,
+                description,
+                labels=labels
+            )
+        )
+
+    def gauge(
+        self,
+        name: str,
+        description: str,
+        labels: Tuple[str, ...]=()
+    ) -> Gauge:
+        return self._register(
+            Gauge(
+                name,
+                description,
+                labels=labels
+            )
+        )
+
+    def histogram(
+        self,
+        name: str,
+        description: str,
+        labels: Tuple[str, ...]=(),
+        buckets: Tuple[float, ...]=DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self._register(
+            Histogram(
+                name,
+                description,
+                labels=labels,
+                buckets=buckets
+            )
+        )
+
+    def render(self) -> str:
+        lines: List[str] = []
+
+        for metric in self._metrics.values():
+            lines.extend([
+                f'# HELP {metric.name} {metric.description}',
+                f'# TYPE {metric.name} {metric.metric_type}'
+            ])
+
+            lines.extend(metric.render())
+
+        lines.append('')
+
+        return '\n'.join(lines)
+
+
+metrics = MetricsRegistry()
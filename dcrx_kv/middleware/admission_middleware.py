@@ -0,0 +1,117 @@
+import json
+import math
+from dcrx_kv.context.manager import context, ContextType
+from dcrx_kv.services.storage.models import ServerLimitException
+from starlette.types import (
+    ASGIApp,
+    Receive,
+    Scope,
+    Send
+)
+
+
+BLOB_OPERATIONS = frozenset({
+    'get',
+    'put',
+    'delete',
+    'metadata'
+})
+
+
+class AdmissionMiddleware:
+    """
+    Applies namespace rate limits to blob requests and turns uploads
+    away with a 429 before their body is read, so a rejected request
+    costs a few counter comparisons rather than a parsed multipart
+    body, a job row and a thread pool.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send
+    ):
+        
+        if scope['type'] != 'http' or scope['path'].startswith('/store/') is False:
+            return await self.app(scope, receive, send)
+        
+        path_segments = scope['path'].strip('/').split('/')
+        if len(path_segments) < 4 or path_segments[1] not in BLOB_OPERATIONS:
+            return await self.app(scope, receive, send)
+
+        storage_service_context = context.get(ContextType.STORAGE_SERVICE)
+        queue = storage_service_context.queue
+
+        namespace, key = path_segments[-2:]
+
+        is_upload = scope['method'] == 'PUT' and path_segments[1] == 'put'
+
+        rate_limit_wait = queue.quotas.acquire(namespace)
+        if rate_limit_wait > 0:
+            return await self._reject(
+                send,
+                ServerLimitException(
+                    message=f'Request rate limit for namespace - {namespace} - reached.',
+                    limit=queue.quotas.get(namespace).requests_per_second,
+                    current=round(rate_limit_wait, 3)
+                ),
+                math.ceil(rate_limit_wait),
+                close=is_upload
+            )
+        
+        if is_upload is False:
+            return await self.app(scope, receive, send)
+
+        content_length = None
+        for header_name, header_value in scope['headers']:
+            if header_name == b'content-length' and header_value.isdigit():
+                content_length = int(header_value)
+
+        rejection = queue.admit(
+            content_length,
+            path=f'{namespace}/{key}'
+        )
+
+        if rejection is None:
+            return await self.app(scope, receive, send)
+
+        await self._reject(
+            send,
+            rejection,
+            queue.retry_after,
+            close=True
+        )
+
+    async def _reject(
+        self,
+        send: Send,
+        rejection: ServerLimitException,
+        retry_after: int,
+        close: bool=False
+    ):
+        headers = [
+            (b'content-type', b'application/json'),
+            (b'retry-after', str(retry_after).encode())
+        ]
+
+        # An upload's body is left unread, so its connection cannot
+        # be reused for another request.
+        if close:
+            headers.append((b'connection', b'close'))
+
+        await send({
+            'type': 'http.response.start',
+            'status': 429,
+            'headers': headers
+        })
+
+        await send({
+            'type': 'http.response.body',
+            'body': json.dumps({
+                'detail': rejection.dict()
+            }).encode()
+        })
@@ -1,50 +1,243 @@
 import json
 from dcrx_kv.context.manager import context, ContextType
+from dcrx_kv.tracing import tracer
+from starlette.requests import Request
 from starlette.responses import Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import (
+    ASGIApp,
+    Message,
+    Receive,
+    Scope,
+    Send
+)
+from typing import List, Union
 
 
+ALLOWED_PATHS = frozenset({
+    "/docs",
+    "/docs/oauth2-redirect",
+    "/favicon.ico",
+    "/metrics",
+    "/openapi.json",
+    "/users/login"
+})
 
-class AuthMidlleware(BaseHTTPMiddleware):
-    def __init__(self, app):
-        super().__init__(app)
+# The routes peers call on each other - membership, replication,
+# and the blob and job routes nodes relay and rebalance through.
+# Node signatures are only accepted in place of a login here.
+NODE_PATH_PREFIXES = (
+    "/cluster/members",
+    "/replication/",
+    "/store/put/",
+    "/store/get/",
+    "/store/delete/",
+    "/store/metadata/get/",
+    "/store/jobs/"
+)
 
-    async def dispatch(self, request, call_next):
+# Routes changing how the node runs rather than what it stores,
+# open only to users named in DCRX_KV_AUTH_OPERATORS.
+OPERATOR_ROUTES = (
+    (frozenset({"PUT", "DELETE"}), "/store/quotas/"),
+    (frozenset({"GET", "POST", "DELETE"}), "/monitoring/profiling/")
+)
+
+# Routes addressing a blob as .../<namespace>/<key>, which token
+# authenticated users may only reach for namespaces granted to them.
+BLOB_PATH_PREFIXES = (
+    "/store/put/",
+    "/store/get/",
+    "/store/delete/",
+    "/store/metadata/get/"
+)
+
+
+class AuthMidlleware:
+    """
+    Plain ASGI middleware, so request and response bodies pass
+    straight through to the app rather than being relayed through
+    the task and memory stream BaseHTTPMiddleware wraps them in.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send
+    ):
+
+        if scope['type'] != 'http' or scope['path'] in ALLOWED_PATHS:
+            return await self.app(scope, receive, send)
+
+        request = Request(scope)
+
+        auth_service_context = context.get(ContextType.AUTH_SERVICE)
+        node_signer = auth_service_context.manager.node_signer
+
+        if scope['path'].startswith(NODE_PATH_PREFIXES) and node_signer.verify(request):
+            return await self._serve_node_request(
+                request,
+                scope,
+                receive,
+                send
+            )
+
+        with tracer.span('auth'):
+            rejection = await self._authorize(request)
+
+        if rejection:
+            return await rejection(scope, receive, send)
+
+        await self.app(scope, receive, send)
+
+    async def _serve_node_request(
+        self,
+        request: Request,
+        scope: Scope,
+        receive: Receive,
+        send: Send
+    ):
+        """
+        Buffers the body of a node signed request and checks it
+        against the signed digest before handing it to the app.
+        """
 
+        auth_service_context = context.get(ContextType.AUTH_SERVICE)
+
+        messages: List[Message] = []
+        body = bytearray()
+
+        with tracer.span('auth'):
+            more_body = True
+            while more_body:
+                message = await receive()
+                messages.append(message)
+
+                if message['type'] != 'http.request':
+                    break
+
+                body.extend(message.get('body', b''))
+                more_body = message.get('more_body', False)
+
+            body_verified = auth_service_context.manager.node_signer.verify_body(
+                request,
+                bytes(body)
+            )
+
+        if body_verified is False:
+            response = Response(
+                status_code=401,
+                content=json.dumps({
+                    'detail': 'Node signed request body does not match its digest'
+                }),
+                media_type='application/json'
+            )
+
+            return await response(scope, receive, send)
+
+        async def replay_receive() -> Message:
+            if messages:
+                return messages.pop(0)
+
+            return await receive()
+
+        await self.app(scope, replay_receive, send)
+
+    async def _authorize(self, request: Request) -> Union[Response, None]:
         auth_service_context = context.get(ContextType.AUTH_SERVICE)
         users_service_context = context.get(ContextType.USERS_SERVICE)
 
-        allowed_urls = [
-            "/docs",
-            "/favicon.ico",
-            "/openapi.json",
-            "/users/login"
-        ]
-        
-        if request.url.path in allowed_urls:
-            response = await call_next(request)
-            return response
+        if auth_service_context.manager.url_signer.verify(request):
+            return None
 
+        token = request.headers.get('authorization')
+        token_from_cookie = False
 
-        token = request.cookies.get('X-Auth-Token')
+        if token is None:
+            token = request.cookies.get('X-Auth-Token')
+            token_from_cookie = token is not None
 
         authorization = await auth_service_context.manager.verify_token(
             users_service_context.connection,
             token
         )
 
-        if authorization.error:
-            response = Response(
-                status_code=401,
-                content=json.dumps({
-                    'detail': authorization.error
-                })
+        if authorization.error is None:
+            request.state.username = authorization.username
+
+            operator_rejection = self._check_operator(
+                request,
+                authorization.username
             )
 
-            if token:
-                response.delete_cookie('X-Auth-Token')
+            if operator_rejection:
+                return operator_rejection
+
+            return self._check_namespace_access(
+                request,
+                authorization.username
+            )
+        
+        response = Response(
+            status_code=401,
+            content=json.dumps({
+                'detail': authorization.error
+            }),
+            media_type='application/json'
+        )
+
+        if token_from_cookie:
+            response.delete_cookie('X-Auth-Token')
 
-            return response
+        return response
 
-        response = await call_next(request)
-        return response
\ No newline at end of file
+    def _check_operator(
+        self,
+        request: Request,
+        username: str
+    ) -> Union[Response, None]:
+        auth_service_context = context.get(ContextType.AUTH_SERVICE)
+
+        operator_route = any(
+            request.method in methods and request.url.path.startswith(prefix) for methods, prefix in OPERATOR_ROUTES
+        )
+
+        if operator_route is False or auth_service_context.manager.is_operator(username):
+            return None
+
+        return Response(
+            status_code=403,
+            content=json.dumps({
+                'detail': f'User {username} is not an operator'
+            }),
+            media_type='application/json'
+        )
+
+    def _check_namespace_access(
+        self,
+        request: Request,
+        username: str
+    ) -> Union[Response, None]:
+        auth_service_context = context.get(ContextType.AUTH_SERVICE)
+
+        if request.url.path.startswith(BLOB_PATH_PREFIXES) is False:
+            return None
+
+        path_segments = request.url.path.strip('/').split('/')
+        if len(path_segments) < 4:
+            return None
+
+        namespace = path_segments[-2]
+        if auth_service_context.manager.can_access(username, namespace):
+            return None
+
+        return Response(
+            status_code=403,
+            content=json.dumps({
+                'detail': f'User {username} may not access namespace {namespace}'
+            }),
+            media_type='application/json'
+        )
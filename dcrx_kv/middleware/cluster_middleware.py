@@ -0,0 +1,78 @@
+import uuid
+from dcrx_kv.context.manager import context, ContextType
+from starlette.requests import Request
+from starlette.types import (
+    ASGIApp,
+    Receive,
+    Scope,
+    Send
+)
+from typing import Union
+
+
+class ClusterMiddleware:
+    """
+    Forwards blob requests to the node owning their key, and job
+    requests to the node that ran the job. Forwarded requests keep
+    the caller's credentials and are authenticated again by the
+    owner, so clustered nodes share their users database. Plain ASGI,
+    so requests pass straight through when clustering is disabled
+    or the request is served locally.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send
+    ):
+
+        if scope['type'] != 'http':
+            return await self.app(scope, receive, send)
+
+        cluster_service_context = context.get(ContextType.CLUSTER_SERVICE)
+        manager = cluster_service_context.manager
+
+        path_segments = scope['path'].strip('/').split('/')
+
+        if manager.enabled is False or path_segments[0] != 'store' or len(path_segments) < 3:
+            return await self.app(scope, receive, send)
+
+        request = Request(scope, receive)
+
+        # Requests relayed by a peer are always served locally so
+        # that nodes with briefly diverging rings cannot loop.
+        if manager.verify(request, signed_payload=False):
+            return await self.app(scope, receive, send)
+
+        # Job routes are keyed by job id rather than by path, and
+        # are answered by the node that ran the job, tagged in its id.
+        if path_segments[1] == 'jobs':
+            owner = self._job_owner(path_segments[2])
+
+        elif len(path_segments) >= 4:
+            namespace, key = path_segments[-2:]
+            owner = manager.owner(f'{namespace}/{key}')
+
+        else:
+            owner = None
+
+        if owner is None:
+            return await self.app(scope, receive, send)
+
+        response = await manager.forward(request, owner)
+        await response(scope, receive, send)
+
+    def _job_owner(self, job_id: str) -> Union[str, None]:
+        cluster_service_context = context.get(ContextType.CLUSTER_SERVICE)
+
+        try:
+            return cluster_service_context.manager.job_owner(
+                uuid.UUID(job_id)
+            )
+
+        except ValueError:
+            return None
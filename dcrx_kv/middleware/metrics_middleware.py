@@ -0,0 +1,60 @@
+import time
+from dcrx_kv.metrics import metrics
+from starlette.types import (
+    ASGIApp,
+    Message,
+    Receive,
+    Scope,
+    Send
+)
+
+
+REQUEST_SECONDS = metrics.histogram(
+    'dcrx_kv_request_duration_seconds',
+    'Time from receiving a request to the end of its response.',
+    labels=('method', 'route', 'status')
+)
+
+
+class MetricsMiddleware:
+    """
+    Records request latency per route template (not per raw path,
+    which would give every key its own series).
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send
+    ):
+
+        if scope['type'] != 'http':
+            return await self.app(scope, receive, send)
+
+        status_code = 500
+        start = time.perf_counter()
+
+        async def send_with_status(message: Message):
+            nonlocal status_code
+
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+
+        finally:
+            route = scope.get('route')
+
+            REQUEST_SECONDS.observe(
+                time.perf_counter() - start,
+                scope['method'],
+                route.path if route else 'unmatched',
+                str(status_code)
+            )
@@ -0,0 +1,114 @@
+from dcrx_kv.context.manager import context, ContextType
+from starlette.datastructures import MutableHeaders
+from starlette.responses import RedirectResponse
+from starlette.types import (
+    ASGIApp,
+    Message,
+    Receive,
+    Scope,
+    Send
+)
+from typing import Callable
+
+
+LOG_POSITION_HEADER = 'x-dcrx-kv-log-position'
+MIN_LOG_POSITION_HEADER = 'x-dcrx-kv-min-log-position'
+
+
+class ReplicationMiddleware:
+    """
+    Tags responses with the node's replication log position and
+    sends writes (or reads a replica has not caught up to) to the
+    primary. Plain ASGI, so nodes without replication pass requests
+    straight through.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send
+    ):
+
+        if scope['type'] != 'http':
+            return await self.app(scope, receive, send)
+
+        replication_service_context = context.get(ContextType.REPLICATION_SERVICE)
+        manager = replication_service_context.manager
+
+        if manager.role == 'primary':
+            return await self.app(
+                scope,
+                receive,
+                self._with_position(
+                    send,
+                    lambda: manager.log.position
+                )
+            )
+
+        elif manager.role != 'replica' or scope['path'].startswith('/store/') is False:
+            return await self.app(scope, receive, send)
+        
+        primary_url = f'{manager.primary}{scope["path"]}'
+        query_string = scope.get('query_string', b'').decode()
+        if query_string:
+            primary_url = f'{primary_url}?{query_string}'
+
+        # Replicas are read-only, and reads that need a write the
+        # replica has not applied yet are served by the primary.
+        if scope['method'] not in ['GET', 'HEAD']:
+            response = RedirectResponse(
+                primary_url,
+                status_code=307
+            )
+
+            return await response(scope, receive, send)
+        
+        min_position = None
+        for header_name, header_value in scope['headers']:
+            if header_name.decode() == MIN_LOG_POSITION_HEADER:
+                min_position = header_value.decode()
+
+        if min_position and min_position.isdigit():
+            position_applied = await manager.wait_for_position(
+                int(min_position)
+            )
+
+            if position_applied is False:
+                response = RedirectResponse(
+                    primary_url,
+                    status_code=307
+                )
+
+                return await response(scope, receive, send)
+
+        await self.app(
+            scope,
+            receive,
+            self._with_position(
+                send,
+                lambda: manager.position
+            )
+        )
+
+    def _with_position(
+        self,
+        send: Send,
+        position: Callable[[], int]
+    ) -> Send:
+
+        async def send_with_position(message: Message):
+            # Read when the response starts, so it covers every
+            # write finished by then. Uploads accepted with a 202
+            # have not been written yet, so they carry no position
+            # - clients read it from the finished job instead.
+            if message['type'] == 'http.response.start' and message['status'] != 202:
+                headers = MutableHeaders(scope=message)
+                headers[LOG_POSITION_HEADER] = str(position())
+
+            await send(message)
+
+        return send_with_position
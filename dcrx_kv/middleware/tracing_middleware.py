@@ -0,0 +1,72 @@
+from dcrx_kv.tracing import tracer
+from starlette.types import (
+    ASGIApp,
+    Message,
+    Receive,
+    Scope,
+    Send
+)
+
+
+TRACE_HEADER = 'x-dcrx-kv-trace'
+TRACE_ID_HEADER = 'x-dcrx-kv-trace-id'
+
+
+class TracingMiddleware:
+    """
+    Starts the root span for sampled requests, or for any request
+    sent with an x-dcrx-kv-trace: 1 header, and returns the trace id
+    in an x-dcrx-kv-trace-id response header.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send
+    ):
+
+        if scope['type'] != 'http':
+            return await self.app(scope, receive, send)
+        
+        force = False
+        for header_name, header_value in scope['headers']:
+            if header_name == TRACE_HEADER.encode():
+                force = header_value == b'1'
+
+        root = tracer.start_trace(
+            'request',
+            force=force,
+            method=scope['method'],
+            path=scope['path']
+        )
+
+        if root is None:
+            return await self.app(scope, receive, send)
+        
+        async def send_with_trace_id(message: Message):
+            if message['type'] == 'http.response.start':
+                root.set('status', message['status'])
+
+                message['headers'] = list(message.get('headers', [])) + [
+                    (TRACE_ID_HEADER.encode(), root.trace_id.encode())
+                ]
+
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_trace_id)
+
+        except Exception as request_error:
+            root.error = repr(request_error)
+            raise
+
+        finally:
+            route = scope.get('route')
+            if route:
+                root.set('route', route.path)
+
+            tracer.end_trace(root)
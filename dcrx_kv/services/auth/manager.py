@@ -2,18 +2,26 @@ import asyncio
 import base64
 import datetime
 import functools
-from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import hmac
+import math
+import multiprocessing
+from concurrent.futures import (
+    ProcessPoolExecutor,
+    ThreadPoolExecutor
+)
 from cryptography.fernet import Fernet
 from dcrx_kv.env import Env
 from jose import JWTError, jwt
 from fastapi.security import OAuth2PasswordBearer
 from fastapi.security.utils import get_authorization_scheme_param
-from passlib.context import CryptContext
 from typing import (
     Optional,
     Dict,
     Any,
     List,
+    Set,
+    Tuple,
     Union
 )
 from dcrx_kv.env.time_parser import TimeParser
@@ -22,10 +30,18 @@ from dcrx_kv.services.users.models import (
     DBUser,
     LoginUser
 )
+from .node_signer import NodeSigner
+from .password_hashing import (
+    hash_password,
+    verify_password
+)
+from .token_cache import TokenCache
+from .url_signer import UrlSigner
 from .models import (
     AuthResponse,
     AuthClaims,
-    GeneratedToken
+    GeneratedToken,
+    PasswordHashingLimitException
 )
 
 
@@ -34,38 +50,165 @@ class AuthorizationSessionManager:
     def __init__(self, env: Env) -> None:
 
         self.pool_size = env.DCRX_KV_STORAGE_WORKERS
-        self.context = CryptContext(
-            schemes=["bcrypt"], 
-            deprecated="auto"
+        self.hash_workers = env.DCRX_KV_AUTH_HASH_WORKERS
+        self.hash_max_pending = env.DCRX_KV_AUTH_HASH_MAX_PENDING
+
+        # Whole seconds, as sent in the Retry-After header when the
+        # hashing queue is full.
+        self.retry_after = max(
+            math.ceil(TimeParser(env.DCRX_KV_AUTH_RETRY_AFTER).time),
+            1
         )
 
         self.scheme = OAuth2PasswordBearer(tokenUrl="token")
         self.secret_key = env.DCRX_KV_SECRET_KEY
         self.auth_algorithm = env.DCRX_KV_AUTH_ALGORITHM
         self.token_expiration_time = TimeParser(env.DCRX_KV_TOKEN_EXPIRATION).time
+        self.node_signer = NodeSigner(env)
+        self.url_signer = UrlSigner(env)
+        self.token_cache = TokenCache(
+            max_size=env.DCRX_KV_AUTH_TOKEN_CACHE_SIZE,
+            ttl=TimeParser(env.DCRX_KV_AUTH_TOKEN_CACHE_TTL).time
+        )
 
         self._executor: Union[ThreadPoolExecutor, None] = None
+        self._hash_executor: Union[ProcessPoolExecutor, None] = None
         self._loop: Union[asyncio.AbstractEventLoop, None] = None
 
+        self._hashing_count = 0
+        self._verifications: Dict[Tuple[str, bytes], asyncio.Future] = {}
+
+        self.operators: Set[str] = set()
+        if env.DCRX_KV_AUTH_OPERATORS:
+            self.operators = {
+                username.strip() for username in env.DCRX_KV_AUTH_OPERATORS.split(',') if username.strip()
+            }
+
+        # Grants are given as user=namespace|namespace,user=...
+        # and users without one may reach every namespace.
+        self.namespace_access: Dict[str, Set[str]] = {}
+        if env.DCRX_KV_AUTH_NAMESPACE_ACCESS:
+            for grant in env.DCRX_KV_AUTH_NAMESPACE_ACCESS.split(','):
+                username, _, namespaces = grant.partition('=')
+                self.namespace_access[username.strip()] = {
+                    namespace.strip() for namespace in namespaces.split('|') if namespace.strip()
+                }
+
         fernet_key = base64.urlsafe_b64encode(
             self.secret_key.encode().ljust(32)[:32]
         )
 
         self._encrypter = Fernet(fernet_key)
 
+    def is_operator(self, username: Union[str, None]) -> bool:
+        return username is not None and username in self.operators
+
+    def can_access(
+        self,
+        username: Union[str, None],
+        namespace: str
+    ) -> bool:
+        if username is None:
+            return False
+
+        granted_namespaces = self.namespace_access.get(username)
+        if granted_namespaces is None:
+            return True
+
+        return namespace in granted_namespaces
+
     async def connect(self):
         self._loop = asyncio.get_event_loop()
         self._executor = ThreadPoolExecutor(max_workers=self.pool_size)
 
-    async def encrypt(self, password: str):
-        return await self._loop.run_in_executor(
-            self._executor,
+        # bcrypt gets its own processes so a burst of logins can
+        # neither hold the GIL nor take threads from storage jobs.
+        self._hash_executor = ProcessPoolExecutor(
+            max_workers=self.hash_workers,
+            mp_context=multiprocessing.get_context('spawn')
+        )
+
+    def _hashing_limit(self) -> Union[PasswordHashingLimitException, None]:
+        hashing_limit = self.hash_workers + self.hash_max_pending
+
+        if self._hashing_count >= hashing_limit:
+            return PasswordHashingLimitException(
+                message='Password hashing queue is full. Please try again later.',
+                limit=hashing_limit,
+                current=self._hashing_count
+            )
+        
+    async def _run_hashing(
+        self,
+        hashing_call: functools.partial
+    ) -> Union[Any, PasswordHashingLimitException]:
+        
+        hashing_limit = self._hashing_limit()
+        if hashing_limit:
+            return hashing_limit
+        
+        self._hashing_count += 1
+
+        try:
+            return await self._loop.run_in_executor(
+                self._hash_executor,
+                hashing_call
+            )
+        
+        finally:
+            self._hashing_count -= 1
+
+    async def encrypt(self, password: str) -> Union[str, PasswordHashingLimitException]:
+        return await self._run_hashing(
             functools.partial(
-                self.context.hash,
+                hash_password,
                 password
             )
         )
     
+    async def _verify_password(
+        self,
+        username: str,
+        password: str,
+        hashed_password: str
+    ) -> Union[bool, PasswordHashingLimitException]:
+        """
+        Verifies a username and password, sharing the running check
+        between concurrent attempts with the same credentials. Other
+        attempts for the username run alongside it, so bad passwords
+        can not lock out a user, and are only limited by the global
+        hashing queue.
+        """
+        
+        password_digest = hmac.new(
+            self.secret_key.encode(),
+            password.encode(),
+            hashlib.sha256
+        ).digest()
+
+        verification_key = (username, password_digest)
+
+        running_verification = self._verifications.get(verification_key)
+        if running_verification:
+            return await asyncio.shield(running_verification)
+        
+        verification = asyncio.ensure_future(
+            self._run_hashing(
+                functools.partial(
+                    verify_password,
+                    password,
+                    hashed_password
+                )
+            )
+        )
+
+        self._verifications[verification_key] = verification
+        verification.add_done_callback(
+            lambda _: self._verifications.pop(verification_key, None)
+        )
+
+        return await asyncio.shield(verification)
+    
     async def encrypt_fernet(self, password: str):
         encrypted_password = await self._loop.run_in_executor(
             self._executor,
@@ -93,7 +236,12 @@ class AuthorizationSessionManager:
         db_connection: UsersConnection,
         username: str, 
         password: str
-    ) -> Union[DBUser, None]:
+    ) -> Union[DBUser, AuthResponse, PasswordHashingLimitException]:
+
+        hashing_limit = self._hashing_limit()
+        if hashing_limit:
+            return hashing_limit
+        
         users = await db_connection.select(
             filters={
                 'username': username
@@ -108,16 +256,16 @@ class AuthorizationSessionManager:
         
         user = users.data.pop()
         
-        password_verified = await self._loop.run_in_executor(
-            self._executor,
-            functools.partial(
-                self.context.verify,
-                password, 
-                user.hashed_password
-            )
+        password_verified = await self._verify_password(
+            username,
+            password,
+            user.hashed_password
         )
 
-        if password_verified is False:
+        if isinstance(password_verified, PasswordHashingLimitException):
+            return password_verified
+
+        elif password_verified is False:
             return AuthResponse(
                 error='User authorization failed',
                 message='Authentication failed'
@@ -155,14 +303,14 @@ class AuthorizationSessionManager:
         self,
         db_connection: UsersConnection,
         login_user: LoginUser
-    ) -> AuthResponse:
+    ) -> Union[AuthResponse, PasswordHashingLimitException]:
         user = await self.authenticate_user(
             db_connection, 
             login_user.username, 
             login_user.password
         )
 
-        if isinstance(user, AuthResponse):
+        if isinstance(user, (AuthResponse, PasswordHashingLimitException)):
             return user
 
         access_token_expires = datetime.timedelta(
@@ -202,6 +350,13 @@ class AuthorizationSessionManager:
                     error='User authorization failed',
                     message='Authentication failed'
                 )
+            
+            cached_username = self.token_cache.get(value)
+            if cached_username:
+                return AuthResponse(
+                    message='OK',
+                    username=cached_username
+                )
 
             payload = await self._loop.run_in_executor(
                 self._executor,
@@ -240,9 +395,17 @@ class AuthorizationSessionManager:
                 message='Authentication failed'
             )
         
+        self.token_cache.put(
+            value,
+            token_data.username,
+            token_expires_at=payload.get('exp')
+        )
+        
         return AuthResponse(
-            message='OK'
+            message='OK',
+            username=token_data.username
         )
     
     async def close(self):
-        self._executor.shutdown(cancel_futures=True)
\ No newline at end of file
+        self._executor.shutdown(cancel_futures=True)
+        self._hash_executor.shutdown(cancel_futures=True)
\ No newline at end of file
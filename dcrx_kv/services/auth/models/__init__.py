@@ -1,4 +1,5 @@
 from .auth_response import AuthResponse
 from .auth_claims import AuthClaims
 from .authentication_failure_exception import AuthenticationFailureException
-from .generated_token import GeneratedToken
\ No newline at end of file
+from .generated_token import GeneratedToken
+from .password_hashing_limit_exception import PasswordHashingLimitException
\ No newline at end of file
@@ -10,4 +10,5 @@ class AuthResponse(BaseModel):
     error: Optional[StrictStr]
     message: StrictStr
     token: Optional[StrictStr]
-    token_expires: Optional[StrictInt]
\ No newline at end of file
+    token_expires: Optional[StrictInt]
+    username: Optional[StrictStr]
\ No newline at end of file
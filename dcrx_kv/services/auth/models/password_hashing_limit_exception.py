@@ -0,0 +1,11 @@
+from pydantic import (
+    BaseModel,
+    StrictStr,
+    StrictInt
+)
+
+
+class PasswordHashingLimitException(BaseModel):
+    message: StrictStr
+    limit: StrictInt
+    current: StrictInt
@@ -0,0 +1,125 @@
+import hashlib
+import hmac
+import time
+from dcrx_kv.env import Env
+from dcrx_kv.env.time_parser import TimeParser
+from starlette.requests import Request
+from typing import Dict, Optional
+
+
+NODE_TIMESTAMP_HEADER = 'x-dcrx-kv-node-timestamp'
+NODE_SIGNATURE_HEADER = 'x-dcrx-kv-node-signature'
+NODE_CONTENT_DIGEST_HEADER = 'x-dcrx-kv-node-content-sha256'
+
+# Marks relayed requests whose body is streamed through and so
+# cannot be hashed up front. These only identify the sender as a
+# node and never authenticate the request.
+UNSIGNED_PAYLOAD = 'UNSIGNED-PAYLOAD'
+
+
+class NodeSigner:
+
+    def __init__(self, env: Env) -> None:
+        self.signature_max_age = TimeParser(env.DCRX_KV_NODE_SIGNATURE_MAX_AGE).time
+        self._secret_key = env.DCRX_KV_SECRET_KEY.encode()
+
+    def _signature(
+        self,
+        method: str,
+        path: str,
+        query: str,
+        content_digest: str,
+        timestamp: str
+    ) -> str:
+        return hmac.new(
+            self._secret_key,
+            f'{method.upper()}\n{path}\n{query}\n{content_digest}\n{timestamp}'.encode(),
+            hashlib.sha256
+        ).hexdigest()
+
+    def digest(self, body: bytes) -> str:
+        return hashlib.sha256(body).hexdigest()
+
+    def sign(
+        self,
+        method: str,
+        path: str,
+        query: str='',
+        body: Optional[bytes]=b''
+    ) -> Dict[str, str]:
+        """
+        Signs the request line and a digest of the body. Passing a
+        body of None signs the request as UNSIGNED_PAYLOAD.
+        """
+
+        timestamp = str(time.time())
+        content_digest = UNSIGNED_PAYLOAD if body is None else self.digest(body)
+
+        return {
+            NODE_TIMESTAMP_HEADER: timestamp,
+            NODE_CONTENT_DIGEST_HEADER: content_digest,
+            NODE_SIGNATURE_HEADER: self._signature(
+                method,
+                path,
+                query,
+                content_digest,
+                timestamp
+            )
+        }
+
+    def verify(
+        self,
+        request: Request,
+        signed_payload: bool=True
+    ) -> bool:
+        """
+        Checks the signature over the request line and the claimed
+        body digest. The body itself is checked against the digest
+        with verify_body once read.
+        """
+
+        timestamp = request.headers.get(NODE_TIMESTAMP_HEADER)
+        signature = request.headers.get(NODE_SIGNATURE_HEADER)
+        content_digest = request.headers.get(NODE_CONTENT_DIGEST_HEADER)
+
+        if timestamp is None or signature is None or content_digest is None:
+            return False
+
+        if signed_payload and content_digest == UNSIGNED_PAYLOAD:
+            return False
+
+        try:
+            signature_age = abs(time.time() - float(timestamp))
+
+        except ValueError:
+            return False
+
+        if signature_age > self.signature_max_age:
+            return False
+
+        expected_signature = self._signature(
+            request.method,
+            request.url.path,
+            request.url.query,
+            content_digest,
+            timestamp
+        )
+
+        return hmac.compare_digest(
+            expected_signature,
+            signature
+        )
+
+    def verify_body(
+        self,
+        request: Request,
+        body: bytes
+    ) -> bool:
+        content_digest = request.headers.get(NODE_CONTENT_DIGEST_HEADER)
+        if content_digest is None or content_digest == UNSIGNED_PAYLOAD:
+            return False
+
+        return hmac.compare_digest(
+            self.digest(body),
+            content_digest
+        )
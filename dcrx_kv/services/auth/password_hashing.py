@@ -0,0 +1,33 @@
+from passlib.context import CryptContext
+from typing import Union
+
+
+# Created in each hashing worker process on first use, as
+# CryptContext instances do not pickle across the pool.
+_context: Union[CryptContext, None] = None
+
+
+def _get_context() -> CryptContext:
+    global _context
+
+    if _context is None:
+        _context = CryptContext(
+            schemes=["bcrypt"],
+            deprecated="auto"
+        )
+
+    return _context
+
+
+def hash_password(password: str) -> str:
+    return _get_context().hash(password)
+
+
+def verify_password(
+    password: str,
+    hashed_password: str
+) -> bool:
+    return _get_context().verify(
+        password,
+        hashed_password
+    )
@@ -0,0 +1,94 @@
+import hashlib
+import time
+from collections import OrderedDict
+from typing import (
+    Dict,
+    Set,
+    Tuple,
+    Union
+)
+
+
+class TokenCache:
+    """
+    Bounded LRU of tokens that have passed verification, keyed by
+    token digest so raw tokens are never held. Entries live until
+    the earlier of the token's expiry and the cache TTL, and can be
+    dropped per user when that user changes.
+    """
+
+    def __init__(
+        self,
+        max_size: int=10000,
+        ttl: Union[int, float]=30
+    ) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+
+        self._entries: OrderedDict[bytes, Tuple[str, float]] = OrderedDict()
+        self._user_tokens: Dict[str, Set[bytes]] = {}
+
+    def _digest(self, token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> Union[str, None]:
+        digest = self._digest(token)
+
+        entry = self._entries.get(digest)
+        if entry is None:
+            return None
+
+        username, expires_at = entry
+        if time.time() >= expires_at:
+            self._evict(digest)
+            return None
+
+        self._entries.move_to_end(digest)
+
+        return username
+
+    def put(
+        self,
+        token: str,
+        username: str,
+        token_expires_at: Union[int, float, None]=None
+    ):
+
+        if self.max_size < 1 or self.ttl <= 0:
+            return
+
+        expires_at = time.time() + self.ttl
+        if token_expires_at is not None:
+            expires_at = min(expires_at, token_expires_at)
+
+        digest = self._digest(token)
+        self._evict(digest)
+
+        self._entries[digest] = (username, expires_at)
+        self._user_tokens.setdefault(username, set()).add(digest)
+
+        while len(self._entries) > self.max_size:
+            oldest_digest = next(iter(self._entries))
+            self._evict(oldest_digest)
+
+    def _evict(self, digest: bytes):
+        entry = self._entries.pop(digest, None)
+        if entry is None:
+            return
+
+        username, _ = entry
+
+        user_tokens = self._user_tokens.get(username)
+        if user_tokens:
+            user_tokens.discard(digest)
+
+            if len(user_tokens) < 1:
+                del self._user_tokens[username]
+
+    def invalidate_user(self, username: str):
+        for digest in list(self._user_tokens.get(username, ())):
+            self._evict(digest)
+
+    def clear(self):
+        self._entries.clear()
+        self._user_tokens.clear()
@@ -0,0 +1,121 @@
+import hashlib
+import hmac
+import time
+from dcrx_kv.env import Env
+from dcrx_kv.env.time_parser import TimeParser
+from starlette.requests import Request
+from typing import (
+    Dict,
+    Literal,
+    Optional,
+    Union
+)
+
+
+URL_EXPIRES_PARAM = 'dcrx_kv_expires'
+URL_OPERATION_PARAM = 'dcrx_kv_operation'
+URL_SCOPE_PARAM = 'dcrx_kv_scope'
+URL_SIGNATURE_PARAM = 'dcrx_kv_signature'
+
+
+OPERATION_METHODS: Dict[str, str] = {
+    'get': 'GET',
+    'put': 'PUT'
+}
+
+
+class UrlSigner:
+    """
+    Signs and verifies pre-signed /store/get and /store/put URLs.
+    A signature covers an operation, a scope (a namespace or a single
+    namespace/key) and an expiry, so verification is one HMAC over
+    the query string and never touches the users table.
+    """
+
+    def __init__(self, env: Env) -> None:
+        self.max_age = TimeParser(env.DCRX_KV_SIGNED_URL_MAX_AGE).time
+        self._secret_key = env.DCRX_KV_SECRET_KEY.encode()
+
+    def _signature(
+        self,
+        operation: str,
+        scope: str,
+        expires: str
+    ) -> str:
+        return hmac.new(
+            self._secret_key,
+            f'url\n{operation}\n{scope}\n{expires}'.encode(),
+            hashlib.sha256
+        ).hexdigest()
+
+    def sign(
+        self,
+        operation: Literal["get", "put"],
+        namespace: str,
+        key: Optional[str]=None,
+        expires_in: Union[int, float, None]=None
+    ) -> Dict[str, str]:
+
+        if expires_in is None or expires_in > self.max_age:
+            expires_in = self.max_age
+
+        scope = namespace if key is None else f'{namespace}/{key}'
+        expires = str(int(time.time() + expires_in))
+
+        return {
+            URL_OPERATION_PARAM: operation,
+            URL_SCOPE_PARAM: scope,
+            URL_EXPIRES_PARAM: expires,
+            URL_SIGNATURE_PARAM: self._signature(
+                operation,
+                scope,
+                expires
+            )
+        }
+
+    def verify(self, request: Request) -> bool:
+        signature = request.query_params.get(URL_SIGNATURE_PARAM)
+        if signature is None:
+            return False
+
+        operation = request.query_params.get(URL_OPERATION_PARAM)
+        scope = request.query_params.get(URL_SCOPE_PARAM)
+        expires = request.query_params.get(URL_EXPIRES_PARAM)
+
+        if operation not in OPERATION_METHODS or scope is None or expires is None:
+            return False
+
+        if request.method != OPERATION_METHODS[operation]:
+            return False
+
+        try:
+            if time.time() > int(expires):
+                return False
+
+        except ValueError:
+            return False
+
+        # Only /store/<operation>/[raw/]<namespace>/<key> may be
+        # reached, and only for a blob inside the signed scope.
+        path_segments = request.url.path.strip('/').split('/')
+        if len(path_segments) < 4 or path_segments[:2] != ['store', operation]:
+            return False
+
+        if len(path_segments) == 5 and (operation != 'put' or path_segments[2] != 'raw'):
+            return False
+
+        elif len(path_segments) > 5:
+            return False
+
+        namespace, key = path_segments[-2:]
+        if scope != namespace and scope != f'{namespace}/{key}':
+            return False
+
+        return hmac.compare_digest(
+            self._signature(
+                operation,
+                scope,
+                expires
+            ),
+            signature
+        )
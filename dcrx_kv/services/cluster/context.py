@@ -0,0 +1,20 @@
+from dcrx_kv.context.types import ContextType
+from dcrx_kv.env import Env
+from pydantic import BaseModel
+from .manager import ClusterManager
+
+
+
+class ClusterServiceContext(BaseModel):
+    env: Env
+    manager: ClusterManager
+    context_type: ContextType=ContextType.CLUSTER_SERVICE
+
+    class Config:
+        arbitrary_types_allowed = True
+
+    async def initialize(self):
+        await self.manager.connect()
+
+    async def close(self):
+        await self.manager.close()
@@ -0,0 +1,377 @@
+import asyncio
+import httpx
+import uuid
+from dcrx_kv.env import Env
+from dcrx_kv.env.time_parser import TimeParser
+from dcrx_kv.services.auth.node_signer import NodeSigner
+from dcrx_kv.services.storage.queue import JobQueue
+from dcrx_kv.services.storage.models import (
+    BlobChange,
+    PathNotFoundException
+)
+from starlette.background import BackgroundTask
+from starlette.requests import Request
+from starlette.responses import (
+    Response,
+    StreamingResponse
+)
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Union
+)
+from urllib.parse import urlencode
+from .models import (
+    ClusterMembership,
+    ClusterStatus
+)
+from .ring import (
+    HashRing,
+    normalize_node
+)
+
+
+HOP_BY_HOP_HEADERS = {
+    'connection',
+    'keep-alive',
+    'host',
+    'transfer-encoding',
+    'te',
+    'trailer',
+    'upgrade',
+    'proxy-authorization',
+    'proxy-authenticate'
+}
+
+
+class ClusterManager:
+
+    def __init__(self, env: Env) -> None:
+        self.address = self._normalize(
+            env.DCRX_KV_CLUSTER_NODE_ADDRESS
+        ) if env.DCRX_KV_CLUSTER_NODE_ADDRESS else None
+
+        self.enabled = self.address is not None
+        self.pool_size = env.DCRX_KV_CLUSTER_POOL_SIZE
+        self.request_timeout = TimeParser(env.DCRX_KV_CLUSTER_REQUEST_TIMEOUT).time
+        self.signer = NodeSigner(env)
+
+        members: List[str] = []
+        if env.DCRX_KV_CLUSTER_NODES:
+            members = [
+                self._normalize(node) for node in env.DCRX_KV_CLUSTER_NODES.split(',') if node.strip()
+            ]
+
+        if self.enabled and self.address not in members:
+            members.append(self.address)
+
+        self.ring = HashRing(
+            members,
+            virtual_nodes=env.DCRX_KV_CLUSTER_VIRTUAL_NODES
+        )
+
+        self._client: Union[httpx.AsyncClient, None] = None
+        self._rebalance_task: Union[asyncio.Task, None] = None
+        self._propagate_tasks: List[asyncio.Task] = []
+
+        self.moved = 0
+        self.failed = 0
+        self.last_error: Union[str, None] = None
+
+    def _normalize(self, address: str) -> str:
+        return normalize_node(address)
+
+    async def connect(self):
+        if self.enabled:
+            self._client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self.pool_size,
+                    max_keepalive_connections=self.pool_size
+                ),
+                timeout=self.request_timeout
+            )
+
+    @property
+    def rebalancing(self) -> bool:
+        return self._rebalance_task is not None and self._rebalance_task.done() is False
+
+    def status(self) -> ClusterStatus:
+        return ClusterStatus(
+            node=self.address,
+            members=self.ring.nodes,
+            rebalancing=self.rebalancing,
+            moved=self.moved,
+            failed=self.failed,
+            error=self.last_error
+        )
+
+    def owner(self, path: str) -> Union[str, None]:
+        """
+        Returns the address of the node owning the path, or None
+        if the path is owned by (or clustering is disabled on)
+        this node.
+        """
+
+        if self.enabled is False:
+            return None
+
+        owner = self.ring.owner(path)
+        if owner == self.address:
+            return None
+
+        return owner
+
+    def job_owner(self, job_id: uuid.UUID) -> Union[str, None]:
+        """
+        Returns the address of the node that ran the job, or None
+        if it ran here, on a node no longer in the ring, or
+        clustering is disabled.
+        """
+
+        if self.enabled is False:
+            return None
+
+        owner = self.ring.job_owner(job_id)
+        if owner == self.address:
+            return None
+
+        return owner
+
+    def sign(
+        self,
+        method: str,
+        path: str,
+        query: str='',
+        body: Optional[bytes]=b''
+    ) -> Dict[str, str]:
+        return self.signer.sign(
+            method,
+            path,
+            query,
+            body=body
+        )
+
+    def verify(
+        self,
+        request: Request,
+        signed_payload: bool=True
+    ) -> bool:
+        return self.enabled and self.signer.verify(
+            request,
+            signed_payload=signed_payload
+        )
+
+    async def forward(
+        self,
+        request: Request,
+        owner: str
+    ) -> Response:
+
+        headers = {
+            name: value for name, value in request.headers.items() if name not in HOP_BY_HOP_HEADERS
+        }
+
+        # The body is streamed through unhashed, so the signature
+        # only marks the request as relayed. The owner authenticates
+        # it from the caller's own forwarded credentials.
+        headers.update(
+            self.sign(
+                request.method,
+                request.url.path,
+                request.url.query,
+                body=None
+            )
+        )
+
+        url = f'{owner}{request.url.path}'
+        if request.url.query:
+            url = f'{url}?{request.url.query}'
+
+        upstream_request = self._client.build_request(
+            request.method,
+            url,
+            headers=headers,
+            content=request.stream()
+        )
+
+        try:
+            upstream_response = await self._client.send(
+                upstream_request,
+                stream=True
+            )
+
+        except httpx.HTTPError as forward_error:
+            return Response(
+                status_code=503,
+                content=ClusterStatus(
+                    node=self.address,
+                    members=self.ring.nodes,
+                    error=f'Owner node {owner} unavailable - {str(forward_error)}'
+                ).json(),
+                media_type='application/json'
+            )
+
+        return StreamingResponse(
+            upstream_response.aiter_raw(),
+            status_code=upstream_response.status_code,
+            headers={
+                name: value for name, value in upstream_response.headers.items() if name not in HOP_BY_HOP_HEADERS
+            },
+            background=BackgroundTask(upstream_response.aclose)
+        )
+
+    async def update_members(
+        self,
+        members: List[str],
+        queue: JobQueue,
+        propagate: bool=False
+    ) -> ClusterStatus:
+
+        previous_members = set(self.ring.nodes)
+        updated_members = {
+            self._normalize(member) for member in members
+        }
+
+        self.ring.update(updated_members)
+
+        if propagate:
+            peers = (previous_members | updated_members) - {self.address}
+            self._propagate_tasks.append(
+                asyncio.create_task(
+                    self._propagate(
+                        list(peers),
+                        ClusterMembership(
+                            members=self.ring.nodes
+                        )
+                    )
+                )
+            )
+
+        if self.rebalancing:
+            self._rebalance_task.cancel()
+
+        self._rebalance_task = asyncio.create_task(
+            self.rebalance(queue)
+        )
+
+        return self.status()
+
+    async def _propagate(
+        self,
+        peers: List[str],
+        membership: ClusterMembership
+    ):
+        request_path = '/cluster/members'
+        content = membership.json().encode()
+
+        results = await asyncio.gather(*[
+            self._client.put(
+                f'{peer}{request_path}',
+                content=content,
+                headers={
+                    'content-type': 'application/json',
+                    **self.sign('PUT', request_path, body=content)
+                }
+            ) for peer in peers
+        ], return_exceptions=True)
+
+        for peer, result in zip(peers, results):
+            if isinstance(result, Exception):
+                self.last_error = f'Failed to update membership on {peer} - {str(result)}'
+
+            elif result.status_code >= 300:
+                self.last_error = f'Failed to update membership on {peer} - {result.text}'
+
+        self._propagate_tasks = [
+            task for task in self._propagate_tasks if task.done() is False
+        ]
+
+    async def rebalance(self, queue: JobQueue):
+        """
+        Hands every locally held blob that this node no longer owns
+        to its new owner, evicting the local copy once accepted
+        and emitting an evict change for watchers and replicas.
+        """
+
+        for path in await queue.list_paths():
+
+            owner = self.owner(path)
+            if owner is None:
+                continue
+
+            namespace, key = path.split('/', 1)
+
+            params = {
+                'filename': key,
+                'encoding': 'utf-8',
+                'persist': 'disk'
+            }
+
+            content_type = 'application/octet-stream'
+
+            metadata = await queue.get_job_metadata(namespace, key)
+            if isinstance(metadata, PathNotFoundException):
+                metadata = None
+
+            else:
+                params.update({
+                    'filename': metadata.filename,
+                    'encoding': metadata.encoding,
+                    'persist': metadata.backup_type
+                })
+
+                content_type = metadata.content_type
+
+            request_path = f'/store/put/raw/{namespace}/{key}'
+            query = urlencode(params)
+
+            try:
+                # The owner encrypts on receipt, so hand it plaintext.
+                data = await queue.read_path(
+                    path,
+                    decrypt=True
+                )
+                response = await self._client.put(
+                    f'{owner}{request_path}?{query}',
+                    content=data,
+                    headers={
+                        'content-type': content_type,
+                        **self.sign('PUT', request_path, query, body=data)
+                    }
+                )
+
+            except Exception as rebalance_error:
+                self.failed += 1
+                self.last_error = f'Failed to move {path} to {owner} - {str(rebalance_error)}'
+                continue
+
+            if response.status_code >= 300:
+                self.failed += 1
+                self.last_error = f'Failed to move {path} to {owner} - {response.text}'
+                continue
+
+            await queue.evict_path(path)
+            self.moved += 1
+
+            queue.emit(
+                BlobChange(
+                    operation='evict',
+                    namespace=namespace,
+                    key=key,
+                    path=path,
+                    metadata=metadata
+                )
+            )
+
+    async def close(self):
+
+        if self.rebalancing:
+            self._rebalance_task.cancel()
+
+        for task in self._propagate_tasks:
+            if task.done() is False:
+                task.cancel()
+
+        if self._client:
+            await self._client.aclose()
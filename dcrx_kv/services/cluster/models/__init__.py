@@ -0,0 +1,2 @@
+from .cluster_membership import ClusterMembership
+from .cluster_status import ClusterStatus
@@ -0,0 +1,9 @@
+from pydantic import (
+    BaseModel,
+    StrictStr
+)
+from typing import List
+
+
+class ClusterMembership(BaseModel):
+    members: List[StrictStr]
@@ -0,0 +1,16 @@
+from pydantic import (
+    BaseModel,
+    StrictStr,
+    StrictInt,
+    StrictBool
+)
+from typing import List, Optional
+
+
+class ClusterStatus(BaseModel):
+    node: Optional[StrictStr]
+    members: List[StrictStr]
+    rebalancing: StrictBool=False
+    moved: StrictInt=0
+    failed: StrictInt=0
+    error: Optional[StrictStr]
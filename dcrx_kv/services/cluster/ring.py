@@ -0,0 +1,99 @@
+import bisect
+import hashlib
+import os
+import uuid
+from typing import (
+    List,
+    Iterable,
+    Optional,
+    Union
+)
+
+
+JOB_ID_TAG_SIZE = 4
+
+
+def normalize_node(address: str) -> str:
+    return address.strip().rstrip('/')
+
+
+def node_tag(node: str) -> bytes:
+    return hashlib.blake2b(
+        node.encode(),
+        digest_size=JOB_ID_TAG_SIZE
+    ).digest()
+
+
+def new_job_id(node: Optional[str]=None) -> uuid.UUID:
+    """
+    Returns a random job id, prefixed with a tag of the node
+    running the job when clustered so that job lookups can be
+    routed back to it.
+    """
+
+    if node is None:
+        return uuid.uuid4()
+
+    return uuid.UUID(
+        bytes=node_tag(node) + os.urandom(16 - JOB_ID_TAG_SIZE),
+        version=4
+    )
+
+
+class HashRing:
+
+    def __init__(
+        self,
+        nodes: Iterable[str],
+        virtual_nodes: int=128
+    ) -> None:
+        self.virtual_nodes = virtual_nodes
+        self.nodes: List[str] = []
+
+        self._hashes: List[int] = []
+        self._owners: List[str] = []
+
+        self.update(nodes)
+
+    def _hash(self, value: str) -> int:
+        return int.from_bytes(
+            hashlib.blake2b(
+                value.encode(),
+                digest_size=8
+            ).digest(),
+            'big'
+        )
+
+    def update(self, nodes: Iterable[str]):
+        members = sorted(set(nodes))
+
+        points = sorted(
+            (
+                self._hash(f'{node}#{replica}'),
+                node
+            ) for node in members for replica in range(self.virtual_nodes)
+        )
+
+        self._hashes = [point_hash for point_hash, _ in points]
+        self._owners = [node for _, node in points]
+        self.nodes = members
+
+    def owner(self, key: str) -> Union[str, None]:
+        if len(self._hashes) < 1:
+            return None
+
+        ring_idx = bisect.bisect(
+            self._hashes,
+            self._hash(key)
+        ) % len(self._hashes)
+
+        return self._owners[ring_idx]
+
+    def job_owner(self, job_id: uuid.UUID) -> Union[str, None]:
+        tag = job_id.bytes[:JOB_ID_TAG_SIZE]
+
+        for node in self.nodes:
+            if node_tag(node) == tag:
+                return node
+
+        return None
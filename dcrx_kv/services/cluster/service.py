@@ -0,0 +1,64 @@
+from dcrx_kv.context.manager import context, ContextType
+from fastapi import APIRouter, HTTPException, Request
+from .context import ClusterServiceContext
+from .models import (
+    ClusterMembership,
+    ClusterStatus
+)
+
+
+cluster_router = APIRouter()
+
+
+@cluster_router.get('/cluster/members')
+async def get_members() -> ClusterStatus:
+    cluster_service_context: ClusterServiceContext = context.get(ContextType.CLUSTER_SERVICE)
+
+    return cluster_service_context.manager.status()
+
+
+@cluster_router.put(
+    '/cluster/members',
+    status_code=202,
+    responses={
+        400: {
+            "model": ClusterStatus
+        }
+    }
+)
+async def update_members(
+    membership: ClusterMembership,
+    request: Request
+) -> ClusterStatus:
+    cluster_service_context: ClusterServiceContext = context.get(ContextType.CLUSTER_SERVICE)
+    storage_service_context = context.get(ContextType.STORAGE_SERVICE)
+
+    manager = cluster_service_context.manager
+
+    if manager.enabled is False:
+        raise HTTPException(
+            400,
+            detail=ClusterStatus(
+                node=manager.address,
+                members=manager.ring.nodes,
+                error='Clustering is not enabled on this node.'
+            ).dict()
+        )
+    
+    if len(membership.members) < 1:
+        raise HTTPException(
+            400,
+            detail=ClusterStatus(
+                node=manager.address,
+                members=manager.ring.nodes,
+                error='Cluster membership must include at least one node.'
+            ).dict()
+        )
+
+    # Membership changes made by a user are pushed to every peer,
+    # while changes pushed by a peer are only applied locally.
+    return await manager.update_members(
+        membership.members,
+        storage_service_context.queue,
+        propagate=manager.verify(request) is False
+    )
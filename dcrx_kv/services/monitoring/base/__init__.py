@@ -0,0 +1,2 @@
+from .monitor import BaseMonitor
+from .ring_buffer import RingBuffer
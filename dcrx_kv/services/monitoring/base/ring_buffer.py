@@ -0,0 +1,50 @@
+import math
+from array import array
+from typing import (
+    List,
+    Union
+)
+
+
+class RingBuffer:
+    """
+    Fixed-size window of float samples. Appends overwrite the oldest
+    sample in place, so keeping history never allocates.
+    """
+
+    def __init__(self, size: int) -> None:
+        self.size = max(size, 1)
+        self._samples = array('d', bytes(8 * self.size))
+        self._next = 0
+        self.count = 0
+
+    def append(self, value: Union[int, float]):
+        self._samples[self._next] = value
+        self._next = (self._next + 1) % self.size
+
+        if self.count < self.size:
+            self.count += 1
+
+    @property
+    def latest(self) -> float:
+        if self.count < 1:
+            return 0
+
+        return self._samples[self._next - 1]
+
+    def values(self) -> List[float]:
+        if self.count < self.size:
+            return self._samples[:self.count].tolist()
+
+        return (
+            self._samples[self._next:] + self._samples[:self._next]
+        ).tolist()
+
+    def percentile(self, percent: Union[int, float]) -> float:
+        ordered = sorted(self._samples[:self.count])
+        if len(ordered) < 1:
+            return 0
+
+        rank = math.ceil(percent * len(ordered) / 100) - 1
+
+        return ordered[min(max(rank, 0), len(ordered) - 1)]
@@ -4,18 +4,20 @@ from pydantic import (
     BaseModel,
     StrictStr
 )
-from .cpu import CPUMonitor
-from .memory import (
-    MemoryMonitor
+from .profiling import (
+    CPUProfiler,
+    HeapProfiler
 )
+from .sampler import SystemSampler
 
 
 
 class MonitoringServiceContext(BaseModel):
     env: Env
     monitor_name: StrictStr
-    cpu: CPUMonitor
-    memory: MemoryMonitor
+    sampler: SystemSampler
+    cpu_profiler: CPUProfiler
+    heap_profiler: HeapProfiler
     context_type: ContextType=ContextType.MONITORING_SERVICE
 
     class Config:
@@ -26,12 +28,24 @@ class MonitoringServiceContext(BaseModel):
         return self.get_memory_usage_pct() > self.env.DCRX_KV_MAX_MEMORY_PERCENT_USAGE
 
     def get_memory_usage_pct(self) -> float:
-        return self.memory.get_percent_used(self.monitor_name)
+        return self.sampler.memory.get_percent_used(self.monitor_name)
+
+    def get_memory_headroom(self) -> int:
+        """
+        Bytes left before usage reaches DCRX_KV_MAX_MEMORY_PERCENT_USAGE
+        of the process's memory limit.
+        """
+        return self.sampler.memory.get_headroom(
+            self.env.DCRX_KV_MAX_MEMORY_PERCENT_USAGE
+        )
 
     async def initialize(self):
-        await self.cpu.start_background_monitor(self.monitor_name)
-        await self.memory.start_background_monitor(self.monitor_name)
+        await self.sampler.start()
 
     async def close(self):
-        await self.cpu.stop_background_monitor(self.monitor_name)
-        await self.memory.stop_background_monitor(self.monitor_name)
\ No newline at end of file
+        await self.sampler.stop()
+
+        if self.cpu_profiler.running:
+            self.cpu_profiler.stop()
+
+        self.heap_profiler.stop()
@@ -4,11 +4,18 @@ from dcrx_kv.services.monitoring.base.monitor import BaseMonitor
 
 class CPUMonitor(BaseMonitor):
 
-    def __init__(self) -> None:
-        super().__init__()
-
-    def update_monitor(self, monitor_name: str):
-        self.active[monitor_name] = psutil.cpu_percent()
+    def __init__(self, window_size: int=300) -> None:
+        super().__init__(window_size=window_size)
+        self._process = psutil.Process()
 
+        # psutil reports usage since the previous call, so prime
+        # both counters for the first sample to be meaningful.
+        psutil.cpu_percent()
+        self._process.cpu_percent()
 
-        
\ No newline at end of file
+    def update_monitor(self, monitor_name: str):
+        self.record(monitor_name, psutil.cpu_percent())
+        self.record(
+            f'{monitor_name}_process',
+            self._process.cpu_percent()
+        )
@@ -0,0 +1 @@
+from .monitor import EventLoopMonitor
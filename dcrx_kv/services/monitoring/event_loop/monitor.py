@@ -0,0 +1,29 @@
+import time
+from typing import Union
+from dcrx_kv.services.monitoring.base.monitor import BaseMonitor
+
+
+class EventLoopMonitor(BaseMonitor):
+    """
+    Measures event loop lag as how late each sampler tick wakes
+    relative to when its sleep should have ended.
+    """
+
+    def __init__(
+        self,
+        interval: Union[int, float],
+        window_size: int=300
+    ) -> None:
+        super().__init__(window_size=window_size)
+        self.interval = interval
+        self._expected_tick: Union[float, None] = None
+
+    def mark(self):
+        self._expected_tick = time.monotonic() + self.interval
+
+    def update_monitor(self, monitor_name: str):
+        if self._expected_tick is not None:
+            self.record(
+                f'{monitor_name}_lag',
+                max(time.monotonic() - self._expected_tick, 0)
+            )
@@ -0,0 +1,52 @@
+import gc
+import time
+from typing import Dict, Union
+from dcrx_kv.services.monitoring.base.monitor import BaseMonitor
+
+
+class GCMonitor(BaseMonitor):
+    """
+    Records collections and total collector pause time per sampler
+    tick, using gc callbacks so nothing is polled between ticks.
+    """
+
+    def __init__(self, window_size: int=300) -> None:
+        super().__init__(window_size=window_size)
+
+        self._collection_start: Union[float, None] = None
+        self._collections = 0
+        self._pause_time = 0.0
+        self._registered = False
+
+    def _track_collection(
+        self,
+        phase: str,
+        info: Dict[str, int]
+    ):
+        if phase == 'start':
+            self._collection_start = time.perf_counter()
+
+        elif self._collection_start is not None:
+            self._pause_time += time.perf_counter() - self._collection_start
+            self._collections += 1
+            self._collection_start = None
+
+    def start(self):
+        if self._registered is False:
+            gc.callbacks.append(self._track_collection)
+            self._registered = True
+
+    def stop(self):
+        if self._registered:
+            gc.callbacks.remove(self._track_collection)
+            self._registered = False
+
+    def update_monitor(self, monitor_name: str):
+        collections = self._collections
+        pause_time = self._pause_time
+
+        self._collections = 0
+        self._pause_time = 0.0
+
+        self.record(f'{monitor_name}_collections', collections)
+        self.record(f'{monitor_name}_pause', pause_time)
@@ -0,0 +1,205 @@
+import os
+from typing import (
+    List,
+    Optional,
+    Tuple
+)
+
+
+CGROUP_ROOT = '/sys/fs/cgroup'
+
+# cgroup v1 reports "no limit" as a page-aligned LONG_MAX.
+CGROUP_V1_UNLIMITED = 2**60
+
+# The limit and usage files, and the memory.stat entry for
+# inactive file cache, under each cgroup version.
+CGROUP_V2_FILES = (
+    'memory.max',
+    'memory.current',
+    'inactive_file'
+)
+
+CGROUP_V1_FILES = (
+    'memory.limit_in_bytes',
+    'memory.usage_in_bytes',
+    'total_inactive_file'
+)
+
+
+def _read_limit(limit_path: str) -> Optional[int]:
+    try:
+        with open(limit_path) as limit_file:
+            value = limit_file.read().strip()
+
+    except OSError:
+        return None
+
+    if value == 'max' or value.isdigit() is False:
+        return None
+
+    limit = int(value)
+    if limit >= CGROUP_V1_UNLIMITED:
+        return None
+
+    return limit
+
+
+def _read_usage(usage_path: str) -> Optional[int]:
+    try:
+        with open(usage_path) as usage_file:
+            value = usage_file.read().strip()
+
+    except OSError:
+        return None
+
+    if value.isdigit() is False:
+        return None
+
+    return int(value)
+
+
+def _read_stat(
+    stat_path: str,
+    stat_name: str
+) -> int:
+    try:
+        with open(stat_path) as stat_file:
+            for line in stat_file:
+                name, value = line.split()
+                if name == stat_name:
+                    return int(value)
+
+    except (OSError, ValueError):
+        pass
+
+    return 0
+
+
+def _candidate_paths(
+    controller_root: str,
+    cgroup_path: str,
+    files: Tuple[str, str, str]
+) -> List[Tuple[str, Tuple[str, str, str]]]:
+    # Limits on any ancestor cgroup apply too, and inside a
+    # container the process's own path is often not mounted, so
+    # check every level up to the controller root.
+    candidates: List[Tuple[str, Tuple[str, str, str]]] = []
+    cgroup_path = cgroup_path.strip('/')
+
+    while True:
+        candidates.append((
+            os.path.join(controller_root, cgroup_path),
+            files
+        ))
+
+        if cgroup_path == '':
+            return candidates
+
+        cgroup_path = os.path.dirname(cgroup_path)
+
+
+def _limiting_cgroup(proc_cgroup_path: str) -> Optional[Tuple[int, str, Tuple[str, str, str]]]:
+    try:
+        with open(proc_cgroup_path) as cgroup_file:
+            entries = cgroup_file.read().splitlines()
+
+    except OSError:
+        return None
+
+    candidates: List[Tuple[str, Tuple[str, str, str]]] = []
+
+    for entry in entries:
+        hierarchy_id, controllers, cgroup_path = entry.split(':', 2)
+
+        if hierarchy_id == '0' and controllers == '':
+            for controller_root in [CGROUP_ROOT, os.path.join(CGROUP_ROOT, 'unified')]:
+                candidates.extend(
+                    _candidate_paths(controller_root, cgroup_path, CGROUP_V2_FILES)
+                )
+
+        elif 'memory' in controllers.split(','):
+            candidates.extend(
+                _candidate_paths(
+                    os.path.join(CGROUP_ROOT, 'memory'),
+                    cgroup_path,
+                    CGROUP_V1_FILES
+                )
+            )
+
+    limited = [
+        (limit, cgroup_dir, files) for limit, cgroup_dir, files in (
+            (
+                _read_limit(os.path.join(cgroup_dir, files[0])),
+                cgroup_dir,
+                files
+            ) for cgroup_dir, files in candidates
+        ) if limit is not None
+    ]
+
+    if len(limited) < 1:
+        return None
+
+    return min(limited, key=lambda limiting: limiting[0])
+
+
+def read_cgroup_memory_limit(proc_cgroup_path: str='/proc/self/cgroup') -> Optional[int]:
+    """
+    Returns the tightest cgroup v2 or v1 memory limit in bytes that
+    applies to this process, or None if it is not limited.
+    """
+
+    limiting = _limiting_cgroup(proc_cgroup_path)
+    if limiting is None:
+        return None
+
+    limit, _, _ = limiting
+    return limit
+
+
+def read_cgroup_memory(proc_cgroup_path: str='/proc/self/cgroup') -> Tuple[Optional[int], Optional[int]]:
+    """
+    Returns the tightest cgroup memory limit and the working set of
+    the cgroup that sets it - usage less inactive file cache, as the
+    kernel reclaims that before the limit is hit. The cgroup covers
+    every process in it, sibling workers included, along with the
+    shared memory pages they touch. Both are None without a limit,
+    and usage is None if the cgroup does not report it.
+    """
+
+    limiting = _limiting_cgroup(proc_cgroup_path)
+    if limiting is None:
+        return None, None
+
+    limit, cgroup_dir, (_, usage_filename, inactive_file_stat) = limiting
+
+    usage = _read_usage(
+        os.path.join(cgroup_dir, usage_filename)
+    )
+
+    if usage is None:
+        return limit, None
+
+    inactive_file = _read_stat(
+        os.path.join(cgroup_dir, 'memory.stat'),
+        inactive_file_stat
+    )
+
+    return limit, max(usage - inactive_file, 0)
+
+
+def read_shared_resident_bytes(proc_status_path: str='/proc/self/status') -> int:
+    """
+    Returns the process's resident shared memory (RssShmem), which
+    covers touched pages of a shared memory store.
+    """
+
+    try:
+        with open(proc_status_path) as status_file:
+            for line in status_file:
+                if line.startswith('RssShmem:'):
+                    return int(line.split()[1]) * 1024
+
+    except (OSError, ValueError):
+        pass
+
+    return 0
@@ -1,21 +1,83 @@
-import os
 import psutil
 from dcrx_kv.services.monitoring.base.monitor import BaseMonitor
+from typing import (
+    Callable,
+    Optional,
+    Union
+)
+from .cgroup import (
+    read_cgroup_memory,
+    read_shared_resident_bytes
+)
 
 
 class MemoryMonitor(BaseMonitor):
+    """
+    Measures memory against whatever limit applies. Under a cgroup
+    limit that is the cgroup's own working set, which covers every
+    worker in the pod and the shared memory they touch. Without one
+    it is this process's RSS (less any shared memory pages) plus
+    bytes the store holds outside the process heap, against host
+    memory.
+    """
 
-    def __init__(self) -> None:
-        super().__init__()
+    def __init__(self, window_size: int=300) -> None:
+        super().__init__(window_size=window_size)
         self.total_memory = int(psutil.virtual_memory().total/10**6)
+        self._process = psutil.Process()
+
+        cgroup_limit, _ = read_cgroup_memory()
+
+        self.limit_bytes = self._limit(cgroup_limit)
+        self.used_bytes = 0
+        self._external_usage: Optional[Callable[[], int]] = None
+
+    def _limit(self, cgroup_limit: Optional[int]) -> int:
+        host_memory = psutil.virtual_memory().total
+
+        if cgroup_limit is None:
+            return host_memory
+
+        return min(cgroup_limit, host_memory)
+
+    def track_external_usage(self, external_usage: Callable[[], int]):
+        """
+        Registers a count of memory held outside the process heap,
+        such as a shared memory store, to add to each sample.
+        """
+        self._external_usage = external_usage
     
     def get_percent_used(self, monitor_name) -> float:
         precentile_usage_metric = f'{monitor_name}_pct_usage'
-        return self.active.get(precentile_usage_metric, 0)
+        return self.latest(precentile_usage_metric)
+
+    def get_headroom(self, max_percent_usage: Union[int, float]) -> int:
+        return int(self.limit_bytes * max_percent_usage / 100) - self.used_bytes
 
     def update_monitor(self, monitor_name: str):
 
-        self.active[monitor_name] = int(psutil.virtual_memory().used/10**6)
+        # Container limits can be resized in place, so the limit is
+        # re-read with every sample.
+        cgroup_limit, cgroup_usage = read_cgroup_memory()
+        self.limit_bytes = self._limit(cgroup_limit)
+
+        rss = self._process.memory_info().rss
+        self.record(f'{monitor_name}_rss', rss)
+
+        if cgroup_usage is not None:
+            used_bytes = cgroup_usage
+
+        else:
+            used_bytes = rss - read_shared_resident_bytes()
+
+            if self._external_usage:
+                used_bytes += self._external_usage()
+
+        self.used_bytes = used_bytes
+        self.record(f'{monitor_name}_used', used_bytes)
 
         precentile_usage_metric = f'{monitor_name}_pct_usage'
-        self.active[precentile_usage_metric] = psutil.virtual_memory().percent
\ No newline at end of file
+        self.record(
+            precentile_usage_metric,
+            used_bytes / self.limit_bytes * 100
+        )
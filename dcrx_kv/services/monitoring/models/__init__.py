@@ -0,0 +1,9 @@
+from .heap_module_usage import HeapModuleUsage
+from .heap_snapshot import HeapSnapshot
+from .object_census import ObjectCensus
+from .profiler_busy_exception import ProfilerBusyException
+from .sample_summary import SampleSummary
+from .system_stats import SystemStats
+from .trace import Trace
+from .trace_span import TraceSpan
+from .trace_summary import TraceSummary
@@ -0,0 +1,13 @@
+from pydantic import (
+    BaseModel,
+    StrictInt,
+    StrictStr
+)
+
+
+class HeapModuleUsage(BaseModel):
+    module: StrictStr
+    size: StrictInt
+    count: StrictInt
+    size_diff: StrictInt=0
+    count_diff: StrictInt=0
@@ -0,0 +1,16 @@
+from pydantic import (
+    BaseModel,
+    StrictFloat,
+    StrictInt
+)
+from typing import List, Optional
+from .heap_module_usage import HeapModuleUsage
+
+
+class HeapSnapshot(BaseModel):
+    snapshot_id: StrictInt
+    created: StrictFloat
+    baseline_id: Optional[StrictInt]
+    traced_bytes: StrictInt
+    peak_traced_bytes: StrictInt
+    modules: List[HeapModuleUsage]
@@ -0,0 +1,16 @@
+from pydantic import (
+    BaseModel,
+    StrictInt,
+    StrictStr
+)
+from typing import Dict
+
+
+class ObjectCensus(BaseModel):
+    objects: Dict[StrictStr, StrictInt]
+    jobs_tracked: StrictInt
+    jobs_completing: StrictInt
+    jobs_with_live_executors: StrictInt
+    executor_threads: StrictInt
+    thread_count: StrictInt
+    threads: Dict[StrictStr, StrictInt]
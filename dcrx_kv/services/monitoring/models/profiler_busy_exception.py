@@ -0,0 +1,10 @@
+from pydantic import (
+    BaseModel,
+    StrictFloat,
+    StrictStr
+)
+
+
+class ProfilerBusyException(BaseModel):
+    started: StrictFloat
+    message: StrictStr
@@ -0,0 +1,13 @@
+from pydantic import (
+    BaseModel,
+    StrictFloat,
+    StrictInt
+)
+
+
+class SampleSummary(BaseModel):
+    latest: StrictFloat
+    samples: StrictInt
+    p50: StrictFloat
+    p90: StrictFloat
+    p99: StrictFloat
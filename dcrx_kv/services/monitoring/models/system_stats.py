@@ -0,0 +1,15 @@
+from pydantic import (
+    BaseModel,
+    StrictFloat,
+    StrictInt,
+    StrictStr
+)
+from typing import Dict
+from .sample_summary import SampleSummary
+
+
+class SystemStats(BaseModel):
+    monitor_name: StrictStr
+    interval: StrictFloat
+    window_size: StrictInt
+    metrics: Dict[StrictStr, SampleSummary]
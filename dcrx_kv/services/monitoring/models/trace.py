@@ -0,0 +1,13 @@
+from pydantic import (
+    BaseModel,
+    StrictStr
+)
+from typing import List
+from .trace_span import TraceSpan
+from .trace_summary import TraceSummary
+
+
+class Trace(BaseModel):
+    trace_id: StrictStr
+    summary: TraceSummary
+    spans: List[TraceSpan]
@@ -0,0 +1,20 @@
+from pydantic import (
+    BaseModel,
+    StrictFloat,
+    StrictStr
+)
+from typing import (
+    Any,
+    Dict,
+    Optional
+)
+
+
+class TraceSpan(BaseModel):
+    span_id: StrictStr
+    parent_id: Optional[StrictStr]
+    name: StrictStr
+    start: StrictFloat
+    duration: Optional[StrictFloat]
+    attributes: Dict[StrictStr, Any]
+    error: Optional[StrictStr]
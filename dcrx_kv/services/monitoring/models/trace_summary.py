@@ -0,0 +1,17 @@
+from pydantic import (
+    BaseModel,
+    StrictFloat,
+    StrictInt,
+    StrictStr
+)
+from typing import Dict, Optional
+
+
+class TraceSummary(BaseModel):
+    trace_id: StrictStr
+    name: StrictStr
+    start: StrictFloat
+    duration: Optional[StrictFloat]
+    status: Optional[StrictInt]
+    spans: StrictInt
+    stages: Dict[StrictStr, StrictFloat]
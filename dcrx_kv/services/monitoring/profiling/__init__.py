@@ -0,0 +1,10 @@
+from .census import count_instances
+from .cpu_profiler import CPUProfiler
+from .heap_profiler import (
+    HeapProfiler,
+    HeapSnapshotEntry
+)
+from .threads import (
+    count_threads,
+    thread_group
+)
@@ -0,0 +1,26 @@
+import gc
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    Type
+)
+
+
+def count_instances(types: Iterable[Type]) -> Dict[Type, List[object]]:
+    """
+    Walks the objects the garbage collector tracks once, collecting
+    live instances of exactly each of the given types.
+    """
+
+    instances: Dict[Type, List[object]] = {
+        tracked_type: [] for tracked_type in types
+    }
+
+    for obj in gc.get_objects():
+        matches = instances.get(type(obj))
+
+        if matches is not None:
+            matches.append(obj)
+
+    return instances
@@ -0,0 +1,120 @@
+import sys
+import threading
+import time
+from types import FrameType
+from typing import (
+    Dict,
+    List,
+    Union
+)
+from .threads import thread_group
+
+
+class CPUProfiler:
+    """
+    Samples the stack of every thread at a fixed frequency from a
+    background thread, counting identical stacks so the result can
+    be rendered in the collapsed format flame graph tools read.
+    """
+
+    def __init__(self, max_depth: int=128) -> None:
+        self.max_depth = max_depth
+        self.frequency = 100
+        self.samples = 0
+        self.started: Union[float, None] = None
+        self.stopped: Union[float, None] = None
+
+        self._stacks: Dict[str, int] = {}
+        self._thread: Union[threading.Thread, None] = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, frequency: int=100) -> bool:
+        with self._lock:
+            if self.running:
+                return False
+
+            self.frequency = frequency
+            self.samples = 0
+            self.started = time.time()
+            self.stopped = None
+            self._stacks = {}
+            self._stop.clear()
+
+            self._thread = threading.Thread(
+                target=self._run,
+                name='dcrx-kv-cpu-profiler',
+                daemon=True
+            )
+
+            self._thread.start()
+
+            return True
+
+    def stop(self) -> str:
+        self._stop.set()
+
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+        if self.stopped is None:
+            self.stopped = time.time()
+
+        return self.collapsed()
+
+    def collapsed(self) -> str:
+        stacks = sorted(
+            self._stacks.items(),
+            key=lambda stack: stack[1],
+            reverse=True
+        )
+
+        return ''.join([
+            f'{stack} {count}\n' for stack, count in stacks
+        ])
+
+    def _run(self):
+        interval = 1/self.frequency
+        profiler_thread = threading.get_ident()
+
+        while not self._stop.wait(interval):
+            thread_names = {
+                thread.ident: thread_group(thread.name) for thread in threading.enumerate()
+            }
+
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == profiler_thread:
+                    continue
+
+                stack = self._collapse(
+                    thread_names.get(thread_id, str(thread_id)),
+                    frame
+                )
+
+                self._stacks[stack] = self._stacks.get(stack, 0) + 1
+
+            self.samples += 1
+
+    def _collapse(
+        self,
+        thread_name: str,
+        frame: Union[FrameType, None]
+    ) -> str:
+        frames: List[str] = []
+
+        while frame is not None and len(frames) < self.max_depth:
+            code = frame.f_code
+            module = frame.f_globals.get('__name__', code.co_filename)
+
+            frames.append(f'{module}:{code.co_name}')
+            frame = frame.f_back
+
+        frames.append(thread_name)
+        frames.reverse()
+
+        return ';'.join(frames)
@@ -0,0 +1,208 @@
+import asyncio
+import os
+import sys
+import time
+import tracemalloc
+from collections import OrderedDict
+from typing import (
+    Dict,
+    List,
+    Tuple,
+    Union
+)
+
+
+class HeapSnapshotEntry:
+
+    __slots__ = (
+        'snapshot_id',
+        'created',
+        'snapshot'
+    )
+
+    def __init__(
+        self,
+        snapshot_id: int,
+        snapshot: tracemalloc.Snapshot
+    ) -> None:
+        self.snapshot_id = snapshot_id
+        self.created = time.time()
+        self.snapshot = snapshot
+
+
+class HeapProfiler:
+    """
+    Takes tracemalloc snapshots on demand and groups their
+    allocations by module. Tracing starts with the first snapshot
+    and, since it slows every allocation, runs only until stopped
+    or max_tracing seconds after the latest snapshot. Tracing that
+    was already on (e.g. from PYTHONTRACEMALLOC) is left running.
+    """
+
+    def __init__(
+        self,
+        max_snapshots: int=10,
+        frames: int=1,
+        max_tracing: Union[int, float, None]=None
+    ) -> None:
+        self.max_snapshots = max_snapshots
+        self.frames = frames
+        self.max_tracing = max_tracing
+
+        self._snapshots: Dict[int, HeapSnapshotEntry] = OrderedDict()
+        self._next_id = 1
+        self._owns_tracing = False
+        self._stop_timer: Union[asyncio.TimerHandle, None] = None
+
+    @property
+    def tracing(self) -> bool:
+        return tracemalloc.is_tracing()
+
+    def snapshot(self) -> HeapSnapshotEntry:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._owns_tracing = True
+
+        snapshot = tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+            tracemalloc.Filter(False, '<unknown>')
+        ])
+
+        entry = HeapSnapshotEntry(
+            self._next_id,
+            snapshot
+        )
+
+        self._next_id += 1
+        self._snapshots[entry.snapshot_id] = entry
+
+        while len(self._snapshots) > self.max_snapshots:
+            self._snapshots.popitem(last=False)
+
+        return entry
+    
+    def get(self, snapshot_id: int) -> Union[HeapSnapshotEntry, None]:
+        return self._snapshots.get(snapshot_id)
+    
+    def previous(self, snapshot_id: int) -> Union[HeapSnapshotEntry, None]:
+        earlier = [
+            entry for entry in self._snapshots.values() if entry.snapshot_id < snapshot_id
+        ]
+
+        if len(earlier) < 1:
+            return None
+        
+        return earlier[-1]
+    
+    def traced_memory(self) -> Tuple[int, int]:
+        return tracemalloc.get_traced_memory()
+
+    def expire_tracing(self, loop: asyncio.AbstractEventLoop):
+        """
+        (Re)schedules tracing to stop max_tracing seconds from now.
+        Called on the loop after each snapshot.
+        """
+
+        if self.max_tracing is None or self._owns_tracing is False:
+            return
+
+        if self._stop_timer:
+            self._stop_timer.cancel()
+
+        self._stop_timer = loop.call_later(
+            self.max_tracing,
+            self.stop
+        )
+
+    def stop(self):
+        self._snapshots.clear()
+
+        if self._stop_timer:
+            self._stop_timer.cancel()
+            self._stop_timer = None
+
+        if self._owns_tracing and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+        self._owns_tracing = False
+
+    def by_module(
+        self,
+        entry: HeapSnapshotEntry
+    ) -> List[Dict[str, Union[str, int]]]:
+        modules = self._module_names()
+        grouped: Dict[str, Dict[str, Union[str, int]]] = {}
+
+        for stat in entry.snapshot.statistics('filename'):
+            module = self._module(stat.traceback[0].filename, modules)
+
+            totals = grouped.setdefault(module, {
+                'module': module,
+                'size': 0,
+                'count': 0,
+                'size_diff': 0,
+                'count_diff': 0
+            })
+
+            totals['size'] += stat.size
+            totals['count'] += stat.count
+
+        return self._sorted(grouped, 'size')
+
+    def compare(
+        self,
+        entry: HeapSnapshotEntry,
+        baseline: HeapSnapshotEntry
+    ) -> List[Dict[str, Union[str, int]]]:
+        modules = self._module_names()
+        grouped: Dict[str, Dict[str, Union[str, int]]] = {}
+
+        for stat in entry.snapshot.compare_to(baseline.snapshot, 'filename'):
+            module = self._module(stat.traceback[0].filename, modules)
+
+            totals = grouped.setdefault(module, {
+                'module': module,
+                'size': 0,
+                'count': 0,
+                'size_diff': 0,
+                'count_diff': 0
+            })
+
+            totals['size'] += stat.size
+            totals['count'] += stat.count
+            totals['size_diff'] += stat.size_diff
+            totals['count_diff'] += stat.count_diff
+
+        return self._sorted(grouped, 'size_diff')
+
+    def _sorted(
+        self,
+        grouped: Dict[str, Dict[str, Union[str, int]]],
+        field: str
+    ) -> List[Dict[str, Union[str, int]]]:
+        return sorted(
+            grouped.values(),
+            key=lambda totals: abs(totals[field]),
+            reverse=True
+        )
+
+    def _module(
+        self,
+        filename: str,
+        modules: Dict[str, str]
+    ) -> str:
+        return modules.get(filename, filename)
+
+    def _module_names(self) -> Dict[str, str]:
+        modules: Dict[str, str] = {}
+
+        for name, module in list(sys.modules.items()):
+            filename = getattr(module, '__file__', None)
+
+            if filename:
+                modules[os.path.abspath(filename)] = name
+                modules[filename] = name
+
+        return modules
@@ -0,0 +1,23 @@
+import re
+import threading
+from typing import Dict
+
+
+THREAD_NUMBER = re.compile(r'[-_]\d+')
+
+
+def thread_group(name: str) -> str:
+    # Every Job runs its own ThreadPoolExecutor, so thread names
+    # like ThreadPoolExecutor-12_3 are grouped with their numbers
+    # stripped.
+    return THREAD_NUMBER.sub('', name) or name
+
+
+def count_threads() -> Dict[str, int]:
+    counts: Dict[str, int] = {}
+
+    for thread in threading.enumerate():
+        group = thread_group(thread.name)
+        counts[group] = counts.get(group, 0) + 1
+
+    return counts
@@ -0,0 +1,101 @@
+import asyncio
+from typing import (
+    Dict,
+    List,
+    Union
+)
+from .base.monitor import BaseMonitor
+from .cpu import CPUMonitor
+from .event_loop import EventLoopMonitor
+from .garbage_collection import GCMonitor
+from .memory import MemoryMonitor
+
+
+class SystemSampler:
+    """
+    Single task that ticks every monitor on the application's own
+    event loop. Each tick is a handful of psutil and gc reads, so it
+    needs no threads or loops of its own.
+    """
+
+    def __init__(
+        self,
+        monitor_name: str,
+        interval: Union[int, float]=1,
+        window_size: int=300
+    ) -> None:
+        self.monitor_name = monitor_name
+        self.interval = interval
+        self.window_size = window_size
+
+        self.cpu = CPUMonitor(window_size=window_size)
+        self.memory = MemoryMonitor(window_size=window_size)
+        self.event_loop = EventLoopMonitor(
+            interval,
+            window_size=window_size
+        )
+        self.garbage_collection = GCMonitor(window_size=window_size)
+
+        # The event loop monitor goes first so its lag reading is
+        # not inflated by the other monitors' sampling.
+        self.monitors: List[BaseMonitor] = [
+            self.event_loop,
+            self.cpu,
+            self.memory,
+            self.garbage_collection
+        ]
+
+        self._task: Union[asyncio.Task, None] = None
+        self._running = False
+
+    def sample(self):
+        for monitor in self.monitors:
+            monitor.update_monitor(self.monitor_name)
+
+    async def _run(self):
+        while self._running:
+            self.sample()
+
+            self.event_loop.mark()
+            await asyncio.sleep(self.interval)
+
+    async def start(self):
+        if self._task is None:
+            self._running = True
+            self.garbage_collection.start()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        self._running = False
+        self.garbage_collection.stop()
+
+        if self._task:
+            self._task.cancel()
+
+            try:
+                await self._task
+
+            except asyncio.CancelledError:
+                pass
+
+            self._task = None
+
+    def summary(
+        self,
+        percentiles: List[Union[int, float]]=[50, 90, 99]
+    ) -> Dict[str, Dict[str, float]]:
+        summaries: Dict[str, Dict[str, float]] = {}
+
+        for monitor in self.monitors:
+            for metric_name, samples in monitor.samples.items():
+                summary = {
+                    'latest': samples.latest,
+                    'samples': samples.count
+                }
+
+                for percent in percentiles:
+                    summary[f'p{percent}'] = samples.percentile(percent)
+
+                summaries[metric_name] = summary
+
+        return summaries
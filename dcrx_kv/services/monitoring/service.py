@@ -0,0 +1,421 @@
+import asyncio
+from dcrx_kv.context.manager import context, ContextType
+from dcrx_kv.env.time_parser import TimeParser
+from dcrx_kv.metrics import metrics
+from dcrx_kv.services.storage.job import Job
+from dcrx_kv.services.storage.job_state import JobState
+from dcrx_kv.services.storage.models import (
+    Blob,
+    JobMetadata
+)
+from dcrx_kv.tracing import (
+    TraceRecord,
+    tracer
+)
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import PlainTextResponse
+from typing import (
+    Dict,
+    List,
+    Optional
+)
+from .context import MonitoringServiceContext
+from .profiling import (
+    count_instances,
+    count_threads
+)
+from .models import (
+    HeapModuleUsage,
+    HeapSnapshot,
+    ObjectCensus,
+    ProfilerBusyException,
+    SystemStats,
+    Trace,
+    TraceSpan,
+    TraceSummary
+)
+
+
+monitoring_router = APIRouter()
+
+
+STORE_KEYS = metrics.gauge(
+    'dcrx_kv_store_keys',
+    'Blobs held in the store.'
+)
+
+STORE_BYTES = metrics.gauge(
+    'dcrx_kv_store_bytes',
+    'Total size of the blobs held in the store.'
+)
+
+CPU_PERCENT = metrics.gauge(
+    'dcrx_kv_cpu_percent',
+    'System CPU usage from the background monitor.'
+)
+
+MEMORY_PERCENT = metrics.gauge(
+    'dcrx_kv_memory_percent',
+    'Memory usage as a percent of the memory limit - the cgroup working set under a cgroup limit, and process and store memory otherwise.'
+)
+
+MEMORY_LIMIT = metrics.gauge(
+    'dcrx_kv_memory_limit_bytes',
+    'The cgroup memory limit, or host memory when there is none.'
+)
+
+MEMORY_HEADROOM = metrics.gauge(
+    'dcrx_kv_memory_headroom_bytes',
+    'Bytes left before memory usage reaches its configured maximum.'
+)
+
+PROCESS_RSS = metrics.gauge(
+    'dcrx_kv_process_resident_bytes',
+    'Resident memory of this process.'
+)
+
+EVENT_LOOP_LAG = metrics.gauge(
+    'dcrx_kv_event_loop_lag_seconds',
+    'Event loop lag over the sampler window.',
+    labels=('quantile',)
+)
+
+GC_PAUSE = metrics.gauge(
+    'dcrx_kv_gc_pause_seconds',
+    'Garbage collector pause time per sampler tick over the window.',
+    labels=('quantile',)
+)
+
+
+@monitoring_router.get(
+    '/metrics',
+    response_class=PlainTextResponse
+)
+async def get_metrics() -> PlainTextResponse:
+    monitoring_service_context: MonitoringServiceContext = context.get(ContextType.MONITORING_SERVICE)
+    storage_service_context = context.get(ContextType.STORAGE_SERVICE)
+
+    usage = await storage_service_context.queue.usage()
+
+    STORE_KEYS.set(usage['keys'])
+    STORE_BYTES.set(usage['stored_bytes'])
+
+    sampler = monitoring_service_context.sampler
+    monitor_name = monitoring_service_context.monitor_name
+
+    CPU_PERCENT.set(
+        sampler.cpu.latest(monitor_name)
+    )
+
+    MEMORY_PERCENT.set(
+        monitoring_service_context.get_memory_usage_pct()
+    )
+
+    MEMORY_LIMIT.set(sampler.memory.limit_bytes)
+    MEMORY_HEADROOM.set(
+        monitoring_service_context.get_memory_headroom()
+    )
+
+    PROCESS_RSS.set(
+        sampler.memory.latest(f'{monitor_name}_rss')
+    )
+
+    for quantile in ['0.5', '0.99']:
+        percent = float(quantile) * 100
+
+        EVENT_LOOP_LAG.set(
+            sampler.event_loop.percentile(f'{monitor_name}_lag', percent),
+            quantile
+        )
+
+        GC_PAUSE.set(
+            sampler.garbage_collection.percentile(f'{monitor_name}_pause', percent),
+            quantile
+        )
+
+    return PlainTextResponse(
+        metrics.render(),
+        media_type='text/plain; version=0.0.4'
+    )
+
+
+@monitoring_router.get('/monitoring/system')
+async def get_system_stats() -> SystemStats:
+    monitoring_service_context: MonitoringServiceContext = context.get(ContextType.MONITORING_SERVICE)
+
+    sampler = monitoring_service_context.sampler
+
+    return SystemStats(
+        monitor_name=monitoring_service_context.monitor_name,
+        interval=float(sampler.interval),
+        window_size=sampler.window_size,
+        metrics=sampler.summary()
+    )
+
+
+def _summarize_trace(record: TraceRecord) -> TraceSummary:
+    spans = list(record.spans)
+    root = next(
+        (span for span in spans if span.parent_id is None),
+        spans[0]
+    )
+
+    # Total time per span name, so a slow request can be pinned on
+    # the stage it spent its time in.
+    stages: Dict[str, float] = {}
+    for span in spans:
+        if span.parent_id is not None and span.duration is not None:
+            stages[span.name] = stages.get(span.name, 0) + span.duration
+
+    route = root.attributes.get('route', root.attributes.get('path', ''))
+
+    return TraceSummary(
+        trace_id=record.trace_id,
+        name=f'{root.attributes.get("method", root.name)} {route}'.strip(),
+        start=root.start,
+        duration=root.duration,
+        status=root.attributes.get('status'),
+        spans=len(spans),
+        stages=stages
+    )
+
+
+@monitoring_router.get('/monitoring/traces')
+async def get_traces(
+    min_duration: float=0,
+    name: Optional[str]=None,
+    limit: int=50
+) -> List[TraceSummary]:
+    
+    summaries: List[TraceSummary] = []
+
+    for record in tracer.exporter.recent():
+        if len(summaries) >= limit:
+            break
+
+        if len(record.spans) < 1:
+            continue
+
+        summary = _summarize_trace(record)
+
+        if (summary.duration or 0) < min_duration:
+            continue
+
+        if name and name not in summary.name:
+            continue
+
+        summaries.append(summary)
+
+    return summaries
+
+
+@monitoring_router.get('/monitoring/traces/{trace_id}')
+async def get_trace(trace_id: str) -> Trace:
+    record = tracer.exporter.get(trace_id)
+
+    if record is None or len(record.spans) < 1:
+        raise HTTPException(404, detail={
+            'trace_id': trace_id,
+            'message': f'Trace - {trace_id} - not found.'
+        })
+    
+    spans = sorted(
+        list(record.spans),
+        key=lambda span: span.start
+    )
+
+    return Trace(
+        trace_id=record.trace_id,
+        summary=_summarize_trace(record),
+        spans=[
+            TraceSpan(
+                span_id=span.span_id,
+                parent_id=span.parent_id,
+                name=span.name,
+                start=span.start,
+                duration=span.duration,
+                attributes=span.attributes,
+                error=span.error
+            ) for span in spans
+        ]
+    )
+
+
+@monitoring_router.post(
+    '/monitoring/profiling/cpu',
+    response_class=PlainTextResponse,
+    responses={
+        409: {
+            "model": ProfilerBusyException
+        }
+    }
+)
+async def profile_cpu(
+    duration: str='10s',
+    frequency: int=100
+) -> PlainTextResponse:
+    monitoring_service_context: MonitoringServiceContext = context.get(ContextType.MONITORING_SERVICE)
+
+    profiler = monitoring_service_context.cpu_profiler
+    max_duration = TimeParser(
+        monitoring_service_context.env.DCRX_KV_PROFILING_MAX_DURATION
+    ).time
+
+    profile_duration = min(
+        TimeParser(duration).time,
+        max_duration
+    )
+
+    started = profiler.start(
+        frequency=max(1, min(frequency, 1000))
+    )
+
+    if started is False:
+        raise HTTPException(
+            409,
+            detail=ProfilerBusyException(
+                started=profiler.started,
+                message='A CPU profile is already running.'
+            ).dict()
+        )
+    
+    # Stopping in finally means a client that gives up early does
+    # not leave the sampling thread running. Joining the thread can
+    # block for a sampling interval, so it runs off the loop.
+    try:
+        await asyncio.sleep(profile_duration)
+
+    finally:
+        stacks = await asyncio.get_running_loop().run_in_executor(
+            None,
+            profiler.stop
+        )
+
+    return PlainTextResponse(
+        stacks,
+        headers={
+            'x-dcrx-kv-profile-samples': str(profiler.samples),
+            'x-dcrx-kv-profile-frequency': str(profiler.frequency)
+        }
+    )
+
+
+@monitoring_router.post('/monitoring/profiling/heap')
+async def take_heap_snapshot(limit: int=25) -> HeapSnapshot:
+    monitoring_service_context: MonitoringServiceContext = context.get(ContextType.MONITORING_SERVICE)
+
+    profiler = monitoring_service_context.heap_profiler
+
+    # Snapshots walk every traced allocation, so are taken off the
+    # loop. Tracing stops on its own if no further snapshot follows
+    # within the max profiling duration.
+    loop = asyncio.get_running_loop()
+    entry = await loop.run_in_executor(
+        None,
+        profiler.snapshot
+    )
+
+    profiler.expire_tracing(loop)
+
+    traced_bytes, peak_traced_bytes = profiler.traced_memory()
+
+    return HeapSnapshot(
+        snapshot_id=entry.snapshot_id,
+        created=entry.created,
+        traced_bytes=traced_bytes,
+        peak_traced_bytes=peak_traced_bytes,
+        modules=[
+            HeapModuleUsage(**usage) for usage in profiler.by_module(entry)[:limit]
+        ]
+    )
+
+
+@monitoring_router.get('/monitoring/profiling/heap/{snapshot_id}/diff')
+async def diff_heap_snapshots(
+    snapshot_id: int,
+    baseline: Optional[int]=None,
+    limit: int=25
+) -> HeapSnapshot:
+    monitoring_service_context: MonitoringServiceContext = context.get(ContextType.MONITORING_SERVICE)
+
+    profiler = monitoring_service_context.heap_profiler
+    entry = profiler.get(snapshot_id)
+
+    if baseline is None:
+        baseline_entry = profiler.previous(snapshot_id)
+
+    else:
+        baseline_entry = profiler.get(baseline)
+
+    if entry is None or baseline_entry is None:
+        raise HTTPException(404, detail={
+            'snapshot_id': snapshot_id,
+            'baseline': baseline,
+            'message': 'Heap snapshot or its baseline not found.'
+        })
+    
+    traced_bytes, peak_traced_bytes = profiler.traced_memory()
+
+    return HeapSnapshot(
+        snapshot_id=entry.snapshot_id,
+        created=entry.created,
+        baseline_id=baseline_entry.snapshot_id,
+        traced_bytes=traced_bytes,
+        peak_traced_bytes=peak_traced_bytes,
+        modules=[
+            HeapModuleUsage(**usage) for usage in profiler.compare(
+                entry,
+                baseline_entry
+            )[:limit]
+        ]
+    )
+
+
+@monitoring_router.delete(
+    '/monitoring/profiling/heap',
+    status_code=204
+)
+async def stop_heap_profiling():
+    monitoring_service_context: MonitoringServiceContext = context.get(ContextType.MONITORING_SERVICE)
+    monitoring_service_context.heap_profiler.stop()
+
+
+@monitoring_router.get('/monitoring/profiling/objects')
+async def get_object_census() -> ObjectCensus:
+    storage_service_context = context.get(ContextType.STORAGE_SERVICE)
+    queue = storage_service_context.queue
+
+    instances = count_instances([
+        Job,
+        JobState,
+        JobMetadata,
+        Blob
+    ])
+
+    jobs_with_live_executors = 0
+    executor_threads = 0
+
+    # Executors keep their thread set after shutdown, so only
+    # threads still alive count against a job.
+    for job in instances[Job]:
+        live_threads = [
+            thread for thread in list(job._executor._threads) if thread.is_alive()
+        ]
+
+        executor_threads += len(live_threads)
+        if len(live_threads) > 0:
+            jobs_with_live_executors += 1
+
+    threads = count_threads()
+
+    return ObjectCensus(
+        objects={
+            instance_type.__name__: len(objects) for instance_type, objects in instances.items()
+        },
+        jobs_tracked=queue.tracked_jobs_count,
+        jobs_completing=len(queue.completed),
+        jobs_with_live_executors=jobs_with_live_executors,
+        executor_threads=executor_threads,
+        thread_count=sum(threads.values()),
+        threads=threads
+    )
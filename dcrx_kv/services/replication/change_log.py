@@ -0,0 +1,95 @@
+import asyncio
+import time
+import uuid
+from collections import deque
+from dcrx_kv.services.storage.models import BlobChange
+from typing import (
+    Deque,
+    List,
+    Union
+)
+from .models import ReplicationRecord
+
+
+class ChangeLog:
+
+    def __init__(self, max_size: int=100000) -> None:
+        self.epoch = str(uuid.uuid4())
+        self.position = 0
+
+        self._records: Deque[ReplicationRecord] = deque(maxlen=max_size)
+        self._updated = asyncio.Event()
+
+    @property
+    def first_position(self) -> int:
+        if len(self._records) < 1:
+            return self.position + 1
+        
+        return self._records[0].position
+
+    def append(self, change: BlobChange) -> ReplicationRecord:
+        self.position += 1
+
+        # Replicas hold no jobs of their own to age out, and follow
+        # the primary rather than the ring, so expiry and rebalance
+        # eviction on the primary are both replayed as a delete.
+        operation = 'delete' if change.operation in ['expire', 'evict'] else change.operation
+
+        record = ReplicationRecord(
+            position=self.position,
+            epoch=self.epoch,
+            operation=operation,
+            path=change.path,
+            metadata=change.metadata,
+            timestamp=time.time()
+        )
+
+        self._records.append(record)
+
+        # Wake every stream waiting on the current event and hand
+        # later waiters a fresh one.
+        self._updated.set()
+        self._updated = asyncio.Event()
+
+        return record
+    
+    def get(self, position: int) -> Union[ReplicationRecord, None]:
+        record_idx = position - self.first_position
+        if record_idx < 0 or record_idx >= len(self._records):
+            return None
+        
+        return self._records[record_idx]
+
+    def read_after(self, position: int) -> List[ReplicationRecord]:
+        records: List[ReplicationRecord] = []
+
+        for record in reversed(self._records):
+            if record.position <= position:
+                break
+
+            records.append(record)
+
+        records.reverse()
+
+        return records
+    
+    async def wait(
+        self,
+        position: int,
+        timeout: Union[int, float]
+    ) -> bool:
+        if self.position > position:
+            return True
+        
+        updated = self._updated
+
+        try:
+            await asyncio.wait_for(
+                updated.wait(),
+                timeout
+            )
+
+        except asyncio.TimeoutError:
+            return False
+        
+        return True
@@ -0,0 +1,20 @@
+from dcrx_kv.context.types import ContextType
+from dcrx_kv.env import Env
+from pydantic import BaseModel
+from .manager import ReplicationManager
+
+
+
+class ReplicationServiceContext(BaseModel):
+    env: Env
+    manager: ReplicationManager
+    context_type: ContextType=ContextType.REPLICATION_SERVICE
+
+    class Config:
+        arbitrary_types_allowed = True
+
+    async def initialize(self):
+        await self.manager.connect()
+
+    async def close(self):
+        await self.manager.close()
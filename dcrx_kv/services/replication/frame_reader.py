@@ -0,0 +1,51 @@
+from typing import (
+    AsyncIterator,
+    Tuple
+)
+from .models import ReplicationRecord
+
+
+class FrameReader:
+    """
+    Splits a replication stream into records. Each frame is a JSON
+    encoded ReplicationRecord terminated by a newline, followed by
+    the record's length in raw bytes.
+    """
+
+    def __init__(self, stream: AsyncIterator[bytes]) -> None:
+        self._stream = stream.__aiter__()
+        self._buffer = bytearray()
+
+    async def _fill(self) -> bool:
+        try:
+            self._buffer.extend(
+                await self._stream.__anext__()
+            )
+
+        except StopAsyncIteration:
+            return False
+
+        return True
+
+    async def __aiter__(self) -> AsyncIterator[Tuple[ReplicationRecord, bytes]]:
+        while True:
+            header_end = self._buffer.find(b'\n')
+            while header_end < 0:
+                if await self._fill() is False:
+                    return
+                
+                header_end = self._buffer.find(b'\n')
+
+            record = ReplicationRecord.parse_raw(
+                self._buffer[:header_end]
+            )
+
+            frame_end = header_end + 1 + record.length
+            while len(self._buffer) < frame_end:
+                if await self._fill() is False:
+                    return
+
+            data = bytes(self._buffer[header_end + 1:frame_end])
+            del self._buffer[:frame_end]
+
+            yield record, data
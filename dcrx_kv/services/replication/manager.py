@@ -0,0 +1,472 @@
+import asyncio
+import httpx
+import os
+import socket
+import time
+from dcrx_kv.env import Env
+from dcrx_kv.env.time_parser import TimeParser
+from dcrx_kv.services.auth.node_signer import NodeSigner
+from dcrx_kv.services.storage.connection import StorageConnection
+from dcrx_kv.services.storage.queue import JobQueue
+from dcrx_kv.services.storage.models import (
+    BlobChange,
+    PathNotFoundException
+)
+from fs.errors import ResourceNotFound
+from typing import (
+    AsyncIterator,
+    Dict,
+    List,
+    Union
+)
+from urllib.parse import urlencode
+from .change_log import ChangeLog
+from .frame_reader import FrameReader
+from .models import (
+    ReplicaAck,
+    ReplicaStatus,
+    ReplicationRecord,
+    ReplicationStatus
+)
+
+
+class ReplicationManager:
+
+    def __init__(
+        self,
+        env: Env,
+        queue: JobQueue,
+        connection: StorageConnection
+    ) -> None:
+        self.role = env.DCRX_KV_REPLICATION_ROLE
+        self.primary = env.DCRX_KV_REPLICATION_PRIMARY_ADDRESS
+        if self.primary:
+            self.primary = self.primary.rstrip('/')
+
+        self.replica_id = env.DCRX_KV_REPLICATION_REPLICA_ID
+        if self.replica_id is None:
+            self.replica_id = f'{socket.gethostname()}-{os.getpid()}'
+
+        self.heartbeat_interval = TimeParser(env.DCRX_KV_REPLICATION_HEARTBEAT_INTERVAL).time
+        self.ack_interval = TimeParser(env.DCRX_KV_REPLICATION_ACK_INTERVAL).time
+        self.read_wait = TimeParser(env.DCRX_KV_REPLICATION_READ_WAIT).time
+
+        self.log = ChangeLog(
+            max_size=env.DCRX_KV_REPLICATION_LOG_SIZE
+        )
+
+        self.signer = NodeSigner(env)
+
+        self._queue = queue
+        self._connection = connection
+        self._replicas: Dict[str, ReplicaStatus] = {}
+
+        # Replica state
+        self.epoch: Union[str, None] = None
+        self.position = 0
+        self.primary_position: Union[int, None] = None
+        self.connected = False
+        self.last_error: Union[str, None] = None
+
+        self._syncing = False
+        self._applied = asyncio.Event()
+        self._client: Union[httpx.AsyncClient, None] = None
+        self._running = False
+        self._tasks: List[asyncio.Task] = []
+
+    async def connect(self):
+
+        if self.role == 'primary':
+            self._queue.add_listener(self.log.append)
+
+        elif self.role == 'replica':
+
+            if self.primary is None:
+                raise ValueError(
+                    'DCRX_KV_REPLICATION_PRIMARY_ADDRESS must be set for replica nodes.'
+                )
+
+            self._running = True
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(
+                    10,
+                    read=self.heartbeat_interval * 3
+                )
+            )
+
+            self._tasks = [
+                asyncio.create_task(
+                    self._follow()
+                ),
+                asyncio.create_task(
+                    self._acknowledge()
+                )
+            ]
+
+    def status(self) -> ReplicationStatus:
+
+        if self.role == 'primary':
+            return ReplicationStatus(
+                role=self.role,
+                epoch=self.log.epoch,
+                position=self.log.position,
+                replicas=[
+                    self._replica_lag(replica) for replica in self._replicas.values()
+                ]
+            )
+
+        lag_records: Union[int, None] = None
+        if self.primary_position is not None:
+            lag_records = max(self.primary_position - self.position, 0)
+
+        return ReplicationStatus(
+            role=self.role,
+            epoch=self.epoch,
+            position=self.position,
+            primary=self.primary,
+            connected=self.connected if self.role == 'replica' else None,
+            primary_position=self.primary_position,
+            lag_records=lag_records,
+            error=self.last_error
+        )
+
+    def _replica_lag(self, replica: ReplicaStatus) -> ReplicaStatus:
+        replica.lag_records = max(self.log.position - replica.acked_position, 0)
+        replica.lag_seconds = 0.
+
+        oldest_unacked = self.log.get(replica.acked_position + 1)
+        if oldest_unacked:
+            replica.lag_seconds = round(time.time() - oldest_unacked.timestamp, 3)
+
+        return replica
+
+    def acknowledge(self, ack: ReplicaAck) -> ReplicaStatus:
+        replica = self._replicas.get(ack.replica_id)
+        if replica is None:
+            replica = ReplicaStatus(
+                replica_id=ack.replica_id
+            )
+
+            self._replicas[ack.replica_id] = replica
+
+        if ack.epoch == self.log.epoch:
+            replica.acked_position = ack.position
+
+        replica.last_ack = time.time()
+
+        return self._replica_lag(replica)
+
+    def _frame(
+        self,
+        record: ReplicationRecord,
+        data: bytes=b''
+    ) -> bytes:
+        record.length = len(data)
+        return record.json().encode() + b'\n' + data
+
+    def _control_record(
+        self,
+        operation: str,
+        position: int
+    ) -> ReplicationRecord:
+        return ReplicationRecord(
+            position=position,
+            epoch=self.log.epoch,
+            operation=operation,
+            timestamp=time.time()
+        )
+
+    async def _snapshot(self, position: int) -> AsyncIterator[bytes]:
+        yield self._frame(
+            self._control_record('reset', position)
+        )
+
+        for path in await self._queue.list_paths():
+            namespace, key = path.split('/', 1)
+            metadata = await self._queue.get_job_metadata(namespace, key)
+
+            try:
+                data = await self._queue.read_path(path)
+
+            except ResourceNotFound:
+                continue
+
+            yield self._frame(
+                ReplicationRecord(
+                    position=position,
+                    epoch=self.log.epoch,
+                    operation='upload',
+                    path=path,
+                    metadata=None if isinstance(metadata, PathNotFoundException) else metadata,
+                    timestamp=time.time()
+                ),
+                data
+            )
+
+        yield self._frame(
+            self._control_record('synced', position)
+        )
+
+    async def stream(
+        self,
+        replica_id: str,
+        position: int,
+        epoch: Union[str, None]=None
+    ) -> AsyncIterator[bytes]:
+
+        replica = self._replicas.get(replica_id)
+        if replica is None:
+            replica = ReplicaStatus(
+                replica_id=replica_id
+            )
+
+            self._replicas[replica_id] = replica
+
+        replica.connected = True
+
+        try:
+
+            # Replicas on an older epoch or ahead of us start over
+            # from a full snapshot.
+            resync = epoch != self.log.epoch or position > self.log.position
+
+            while True:
+
+                # So do replicas that fall behind the retained log,
+                # whether on connecting or while streaming.
+                if resync or position + 1 < self.log.first_position:
+                    resync = False
+                    position = self.log.position
+
+                    async for frame in self._snapshot(position):
+                        yield frame
+
+                    replica.sent_position = position
+
+                records = self.log.read_after(position)
+
+                for record in records:
+                    data = b''
+
+                    if record.operation == 'upload':
+                        try:
+                            data = await self._queue.read_path(record.path)
+
+                        except ResourceNotFound:
+                            # Removed since it was logged, so the replica
+                            # should not hold it either.
+                            record = ReplicationRecord(
+                                position=record.position,
+                                epoch=record.epoch,
+                                operation='delete',
+                                path=record.path,
+                                metadata=record.metadata,
+                                timestamp=record.timestamp
+                            )
+
+                    yield self._frame(record, data)
+
+                    position = record.position
+                    replica.sent_position = position
+
+                if len(records) < 1:
+                    updated = await self.log.wait(
+                        position,
+                        self.heartbeat_interval
+                    )
+
+                    if updated is False:
+                        yield self._frame(
+                            self._control_record(
+                                'heartbeat',
+                                self.log.position
+                            )
+                        )
+
+        finally:
+            replica.connected = False
+
+    async def _follow(self):
+        request_path = '/replication/stream'
+
+        while self._running:
+
+            query = urlencode({
+                'replica_id': self.replica_id,
+                'position': self.position,
+                'epoch': self.epoch or ''
+            })
+
+            try:
+                async with self._client.stream(
+                    'GET',
+                    f'{self.primary}{request_path}?{query}',
+                    headers=self.signer.sign('GET', request_path, query)
+                ) as response:
+
+                    if response.status_code != 200:
+                        await response.aread()
+                        raise httpx.HTTPStatusError(
+                            f'Primary rejected replication stream - {response.text}',
+                            request=response.request,
+                            response=response
+                        )
+
+                    self.connected = True
+                    self.last_error = None
+
+                    async for record, data in FrameReader(response.aiter_bytes()):
+                        await self._apply(record, data)
+
+            except asyncio.CancelledError:
+                raise
+
+            except Exception as replication_error:
+                self.last_error = str(replication_error) or replication_error.__class__.__name__
+
+            self.connected = False
+            await asyncio.sleep(1)
+
+    async def _apply(
+        self,
+        record: ReplicationRecord,
+        data: bytes
+    ):
+
+        if record.operation == 'heartbeat':
+            self.primary_position = record.position
+            return
+
+        elif record.operation == 'reset':
+            self._syncing = True
+            self.epoch = None
+            self.position = 0
+
+            for path in await self._queue.list_paths():
+                await self._queue.evict_path(path)
+
+            # The snapshot brings metadata for every blob it holds,
+            # so rows for anything else would be stale.
+            result = await self._connection.remove({})
+            if result.error:
+                self.last_error = result.error
+
+            return
+
+        elif record.operation == 'synced':
+            self._syncing = False
+            self.epoch = record.epoch
+            self._advance(record.position)
+            return
+
+        namespace, key = record.path.split('/', 1)
+
+        if record.operation == 'upload':
+            await self._queue.write_path(record.path, data)
+
+        else:
+            await self._queue.evict_path(record.path)
+
+        if record.metadata:
+            result = await self._connection.create([
+                record.metadata
+            ])
+
+            if result.error:
+                await self._connection.update_by_path([
+                    record.metadata
+                ])
+
+        self._queue.emit(
+            BlobChange(
+                operation=record.operation,
+                namespace=namespace,
+                key=key,
+                path=record.path,
+                metadata=record.metadata
+            )
+        )
+
+        if self._syncing is False:
+            self.epoch = record.epoch
+            self._advance(record.position)
+
+    def _advance(self, position: int):
+        self.position = position
+        if self.primary_position is None or position > self.primary_position:
+            self.primary_position = position
+
+        self._applied.set()
+        self._applied = asyncio.Event()
+
+    async def wait_for_position(self, position: int) -> bool:
+        """
+        Waits up to the configured read wait for this replica to
+        apply the given log position.
+        """
+
+        deadline = time.monotonic() + self.read_wait
+
+        while self.position < position:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+
+            applied = self._applied
+
+            try:
+                await asyncio.wait_for(
+                    applied.wait(),
+                    remaining
+                )
+
+            except asyncio.TimeoutError:
+                return False
+
+        return True
+
+    async def _acknowledge(self):
+        request_path = '/replication/ack'
+        acked_position: Union[int, None] = None
+
+        while self._running:
+            await asyncio.sleep(self.ack_interval)
+
+            if self.epoch is None or self.position == acked_position:
+                continue
+
+            ack = ReplicaAck(
+                replica_id=self.replica_id,
+                epoch=self.epoch,
+                position=self.position
+            )
+
+            content = ack.json().encode()
+
+            try:
+                response = await self._client.post(
+                    f'{self.primary}{request_path}',
+                    content=content,
+                    headers={
+                        'content-type': 'application/json',
+                        **self.signer.sign('POST', request_path, body=content)
+                    }
+                )
+
+                if response.status_code < 300:
+                    acked_position = ack.position
+
+            except httpx.HTTPError as ack_error:
+                self.last_error = str(ack_error)
+
+    async def close(self):
+        self._running = False
+
+        for task in self._tasks:
+            if task.done() is False:
+                task.cancel()
+
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+        if self._client:
+            await self._client.aclose()
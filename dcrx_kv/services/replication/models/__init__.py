@@ -0,0 +1,4 @@
+from .replica_ack import ReplicaAck
+from .replica_status import ReplicaStatus
+from .replication_record import ReplicationRecord
+from .replication_status import ReplicationStatus
@@ -0,0 +1,11 @@
+from pydantic import (
+    BaseModel,
+    StrictStr,
+    StrictInt
+)
+
+
+class ReplicaAck(BaseModel):
+    replica_id: StrictStr
+    epoch: StrictStr
+    position: StrictInt
@@ -0,0 +1,18 @@
+from pydantic import (
+    BaseModel,
+    StrictStr,
+    StrictInt,
+    StrictFloat,
+    StrictBool
+)
+from typing import Optional
+
+
+class ReplicaStatus(BaseModel):
+    replica_id: StrictStr
+    connected: StrictBool=False
+    sent_position: StrictInt=0
+    acked_position: StrictInt=0
+    lag_records: StrictInt=0
+    lag_seconds: StrictFloat=0.
+    last_ack: Optional[StrictFloat]
@@ -0,0 +1,24 @@
+from dcrx_kv.services.storage.models import JobMetadata
+from pydantic import (
+    BaseModel,
+    StrictStr,
+    StrictInt,
+    StrictFloat
+)
+from typing import Literal, Optional
+
+
+class ReplicationRecord(BaseModel):
+    position: StrictInt
+    epoch: StrictStr
+    operation: Literal[
+        "upload",
+        "delete",
+        "reset",
+        "synced",
+        "heartbeat"
+    ]
+    path: Optional[StrictStr]
+    metadata: Optional[JobMetadata]
+    length: StrictInt=0
+    timestamp: StrictFloat
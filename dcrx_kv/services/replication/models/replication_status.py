@@ -0,0 +1,24 @@
+from pydantic import (
+    BaseModel,
+    StrictStr,
+    StrictInt,
+    StrictBool
+)
+from typing import (
+    List,
+    Literal,
+    Optional
+)
+from .replica_status import ReplicaStatus
+
+
+class ReplicationStatus(BaseModel):
+    role: Literal["none", "primary", "replica"]
+    epoch: Optional[StrictStr]
+    position: StrictInt=0
+    primary: Optional[StrictStr]
+    connected: Optional[StrictBool]
+    primary_position: Optional[StrictInt]
+    lag_records: Optional[StrictInt]
+    error: Optional[StrictStr]
+    replicas: List[ReplicaStatus]=[]
@@ -0,0 +1,73 @@
+from dcrx_kv.context.manager import context, ContextType
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+from typing import Optional
+from .context import ReplicationServiceContext
+from .models import (
+    ReplicaAck,
+    ReplicaStatus,
+    ReplicationStatus
+)
+
+
+replication_router = APIRouter()
+
+
+@replication_router.get('/replication/status')
+async def get_replication_status() -> ReplicationStatus:
+    replication_service_context: ReplicationServiceContext = context.get(ContextType.REPLICATION_SERVICE)
+
+    return replication_service_context.manager.status()
+
+
+@replication_router.get(
+    '/replication/stream',
+    responses={
+        400: {
+            "model": ReplicationStatus
+        }
+    }
+)
+async def stream_changes(
+    replica_id: str,
+    position: int=0,
+    epoch: Optional[str]=None
+) -> StreamingResponse:
+    replication_service_context: ReplicationServiceContext = context.get(ContextType.REPLICATION_SERVICE)
+    manager = replication_service_context.manager
+
+    if manager.role != 'primary':
+        raise HTTPException(
+            400,
+            detail=manager.status().dict()
+        )
+
+    return StreamingResponse(
+        manager.stream(
+            replica_id,
+            position,
+            epoch=epoch or None
+        ),
+        media_type='application/octet-stream'
+    )
+
+
+@replication_router.post(
+    '/replication/ack',
+    responses={
+        400: {
+            "model": ReplicationStatus
+        }
+    }
+)
+async def acknowledge_changes(ack: ReplicaAck) -> ReplicaStatus:
+    replication_service_context: ReplicationServiceContext = context.get(ContextType.REPLICATION_SERVICE)
+    manager = replication_service_context.manager
+
+    if manager.role != 'primary':
+        raise HTTPException(
+            400,
+            detail=manager.status().dict()
+        )
+
+    return manager.acknowledge(ack)
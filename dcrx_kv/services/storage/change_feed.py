@@ -0,0 +1,147 @@
+import asyncio
+import itertools
+import time
+import uuid
+from collections import deque
+from typing import (
+    AsyncIterator,
+    Deque,
+    List,
+    Optional,
+    Union
+)
+from .models import (
+    BlobChange,
+    ChangeEvent
+)
+
+
+class ChangeFeed:
+    """
+    A bounded, in-process buffer of blob changes numbered by a
+    sequence that restarts (under a new epoch) with the process.
+    Watchers resuming from a sequence that has left the buffer, or
+    from another epoch, are sent a reset event so they can drop
+    anything they cached.
+    """
+
+    def __init__(self, max_size: int=10000) -> None:
+        self.epoch = str(uuid.uuid4())
+        self.sequence = 0
+
+        self._events: Deque[ChangeEvent] = deque(maxlen=max_size)
+        self._updated = asyncio.Event()
+
+    @property
+    def first_sequence(self) -> int:
+        if len(self._events) < 1:
+            return self.sequence + 1
+
+        return self._events[0].sequence
+
+    def append(self, change: BlobChange) -> ChangeEvent:
+        self.sequence += 1
+
+        event = ChangeEvent(
+            sequence=self.sequence,
+            epoch=self.epoch,
+            operation=change.operation,
+            namespace=change.namespace,
+            key=change.key,
+            path=change.path,
+            metadata=change.metadata,
+            timestamp=time.time()
+        )
+
+        self._events.append(event)
+
+        self._updated.set()
+        self._updated = asyncio.Event()
+
+        return event
+
+    def read_after(self, sequence: int) -> List[ChangeEvent]:
+        start = max(sequence + 1 - self.first_sequence, 0)
+
+        return list(
+            itertools.islice(self._events, start, None)
+        )
+
+    async def wait(
+        self,
+        sequence: int,
+        timeout: Union[int, float]
+    ) -> bool:
+        if self.sequence > sequence:
+            return True
+
+        updated = self._updated
+
+        try:
+            await asyncio.wait_for(
+                updated.wait(),
+                timeout
+            )
+
+        except asyncio.TimeoutError:
+            return False
+
+        return True
+
+    def _reset(self) -> ChangeEvent:
+        return ChangeEvent(
+            sequence=self.sequence,
+            epoch=self.epoch,
+            operation='reset',
+            timestamp=time.time()
+        )
+
+    async def watch(
+        self,
+        namespace: Optional[str]=None,
+        prefix: Optional[str]=None,
+        since: Optional[int]=None,
+        epoch: Optional[str]=None,
+        heartbeat: Union[int, float]=15
+    ) -> AsyncIterator[Union[ChangeEvent, None]]:
+        """
+        Yields changes to blobs in the namespace and/or with keys
+        starting with the prefix, beginning after the since sequence
+        (or now). Yields None as a heartbeat while idle.
+        """
+
+        sequence = self.sequence if since is None else since
+
+        if (epoch and epoch != self.epoch) or sequence > self.sequence:
+            sequence = self.sequence
+            yield self._reset()
+
+        while True:
+
+            if sequence + 1 < self.first_sequence:
+                sequence = self.sequence
+                yield self._reset()
+
+            events = self.read_after(sequence)
+
+            if len(events) < 1:
+                updated = await self.wait(
+                    sequence,
+                    heartbeat
+                )
+
+                if updated is False:
+                    yield None
+
+                continue
+
+            for event in events:
+                sequence = event.sequence
+
+                if namespace and event.namespace != namespace:
+                    continue
+
+                if prefix and event.key.startswith(prefix) is False:
+                    continue
+
+                yield event
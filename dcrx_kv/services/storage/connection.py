@@ -1,15 +1,37 @@
+import sqlalchemy
+import uuid
 from dcrx_kv.database import (
     DatabaseConnection,
-    ConnectionConfig
+    ConnectionConfig,
+    RowDecoder
+)
+from dcrx_kv.database.migrations import (
+    MigrationRunner,
+    create_indexes
+)
+from dcrx_kv.database.models import (
+    AppliedMigration,
+    DatabaseTransactionResult
 )
 from dcrx_kv.env import Env
+from dcrx_kv.env.time_parser import TimeParser
+from sqlalchemy.schema import CreateTable
 from typing import (
     List,
     Dict,
-    Any
+    Any,
+    Optional
+)
+from .job_state import JobState
+from .models import (
+    JobHistoryEntry,
+    JobMetadata
+)
+from .table import (
+    STORAGE_MIGRATIONS,
+    JobHistoryTable,
+    StorageTable
 )
-from .models import JobMetadata
-from .table import StorageTable
 
 
 class StorageConnection(DatabaseConnection[JobMetadata]):
@@ -31,8 +53,52 @@ class StorageConnection(DatabaseConnection[JobMetadata]):
             database_type=self.config.database_type
         )
 
+        # Rows only ever come from the blobs table this service
+        # writes, so they are decoded without validation.
+        self.decoder: RowDecoder[JobMetadata] = RowDecoder(
+            JobMetadata,
+            decoders=self.table.selected.decoders,
+            validate=False
+        )
+
+        self.history_table = JobHistoryTable(
+            'blobs_history',
+            self.table.selected,
+            TimeParser(env.DCRX_KV_STORAGE_HISTORY_PARTITION_INTERVAL).time
+        )
+
+        self.history_decoder: RowDecoder[JobHistoryEntry] = RowDecoder(
+            JobHistoryEntry,
+            decoders=self.history_table.decoders,
+            validate=False
+        )
+
     async def init(self):
-        return await self.create_table(self.table.selected.table)
+        result = await self.create_table(self.table.selected.table)
+
+        # Tables created by earlier releases are brought up to the
+        # current schema before anything writes to them.
+        await self.migrate()
+
+        if self.history_table.partitioned:
+            await self._create_history_table(
+                self.history_table.parent
+            )
+
+        return result
+    
+    def migrations(self) -> MigrationRunner:
+        return MigrationRunner(
+            self.engine,
+            self.table.selected.table,
+            STORAGE_MIGRATIONS
+        )
+
+    async def migrate(
+        self,
+        target: Optional[int]=None
+    ) -> List[AppliedMigration]:
+        return await self.migrations().migrate(target=target)
 
     async def select(
         self, 
@@ -40,12 +106,16 @@ class StorageConnection(DatabaseConnection[JobMetadata]):
     ):
         return await self.get(
             self.table.select(
-                filters={
-                    name: self.table.selected.types_map.get(
-                        name
-                    )(value) for name, value in filters.items()
-                }
-            )
+                filters=filters
+            ),
+            decoder=self.decoder
+        )
+
+    async def select_by_path(self, path: str):
+        return await self.get(
+            self.table.select_by_path_template,
+            params=self.table.path_params(path),
+            decoder=self.decoder
         )
 
     async def create(
@@ -53,7 +123,12 @@ class StorageConnection(DatabaseConnection[JobMetadata]):
         blobs: List[JobMetadata]
     ):
        return await self.insert_or_update(
-           self.table.insert(blobs)
+           [
+               self.table.insert_template for _ in blobs
+           ],
+           params=[
+               self.table.insert_params(blob) for blob in blobs
+           ]
        )
     
     async def update(
@@ -64,26 +139,191 @@ class StorageConnection(DatabaseConnection[JobMetadata]):
         return await self.insert_or_update(
             self.table.update(
                 blobs,
-                filters={
-                    name: self.table.selected.types_map.get(
-                        name
-                    )(value) for name, value in filters.items()
-                }
+                filters=filters
             )
         )
     
+    async def update_by_path(
+        self,
+        blobs: List[JobMetadata]
+    ):
+        return await self.insert_or_update(
+            [
+                self.table.update_by_path_template for _ in blobs
+            ],
+            params=[
+                self.table.update_by_path_params(blob) for blob in blobs
+            ]
+        )
+    
+    async def update_status(self, state: JobState):
+        return await self.insert_or_update(
+            [
+                self.table.update_status_by_path_template
+            ],
+            params=[
+                self.table.update_status_by_path_params(
+                    state.path,
+                    state.status_values()
+                )
+            ]
+        )
+    
     async def remove(
         self,
         filters: Dict[str, Any]
     ):
         return await self.delete([
-            self.table.delete({
-                name: self.table.selected.types_map.get(
-                    name
-                )(value) for name, value in filters.items()
-            })
+            self.table.delete(filters)
         ])
     
+    async def remove_by_path(self, path: str):
+        return await self.delete(
+            [
+                self.table.delete_by_path_template
+            ],
+            params=[
+                self.table.path_params(path)
+            ]
+        )
+    
+    async def _create_history_table(
+        self,
+        table: sqlalchemy.Table,
+        start: Optional[int]=None
+    ) -> DatabaseTransactionResult[JobHistoryEntry]:
+        async with self.engine.connect() as connection:
+            try:
+                if start is not None and self.history_table.partitioned:
+                    # Partitions take their columns and indexes from
+                    # the parent table.
+                    await connection.execute(
+                        self.history_table.create_partition_statement(
+                            start,
+                            connection.dialect
+                        )
+                    )
+
+                else:
+                    await connection.execute(
+                        CreateTable(
+                            table,
+                            if_not_exists=True
+                        )
+                    )
+
+                    await create_indexes(
+                        connection,
+                        table,
+                        list(table.indexes)
+                    )
+
+                await connection.commit()
+
+            except Exception as transaction_exception:
+                await connection.rollback()
+
+                return DatabaseTransactionResult(
+                    message='Database transaction failed',
+                    error=str(transaction_exception)
+                )
+
+        return DatabaseTransactionResult(
+            message='Table created'
+        )
+
+    async def create_history_partition(
+        self,
+        start: int
+    ) -> DatabaseTransactionResult[JobHistoryEntry]:
+        return await self._create_history_table(
+            self.history_table.partition(start),
+            start=start
+        )
+
+    async def list_history_partitions(self) -> DatabaseTransactionResult[int]:
+        async with self.engine.connect() as connection:
+            try:
+                table_names: List[str] = await connection.run_sync(
+                    lambda sync_connection: sqlalchemy.inspect(
+                        sync_connection
+                    ).get_table_names()
+                )
+
+            except Exception as transaction_exception:
+                return DatabaseTransactionResult(
+                    message='Database transaction failed',
+                    error=str(transaction_exception)
+                )
+
+        starts = [
+            self.history_table.parse_partition(table_name) for table_name in table_names
+        ]
+
+        return DatabaseTransactionResult(
+            message='Records successfully retrieved',
+            data=sorted([
+                start for start in starts if start is not None
+            ])
+        )
+
+    async def drop_history_partition(
+        self,
+        start: int
+    ) -> DatabaseTransactionResult[JobHistoryEntry]:
+        result = await self.drop_table(
+            self.history_table.partition(start)
+        )
+
+        if result.error is None:
+            self.history_table.forget_partition(start)
+
+        return result
+
+    async def append_history(
+        self,
+        start: int,
+        entries: List[JobHistoryEntry]
+    ):
+        # One executemany per partition, rather than a statement
+        # per transition.
+        return await self.insert_or_update(
+            [
+                self.history_table.insert_template(start)
+            ],
+            params=[
+                [
+                    self.history_table.entry_params(entry) for entry in entries
+                ]
+            ]
+        )
+
+    async def select_history(
+        self,
+        job_id: uuid.UUID
+    ) -> DatabaseTransactionResult[JobHistoryEntry]:
+        starts: List[int] = []
+
+        if self.history_table.partitioned is False:
+            partitions = await self.list_history_partitions()
+            if partitions.error:
+                return partitions
+
+            starts = partitions.data
+
+        statement = self.history_table.select_by_job(starts)
+        if statement is None:
+            return DatabaseTransactionResult(
+                message='Records successfully retrieved',
+                data=[]
+            )
+
+        return await self.get(
+            statement,
+            params=self.history_table.job_params(job_id),
+            decoder=self.history_decoder
+        )
+
     async def drop(self):
         return await self.drop_table(self.table)
     
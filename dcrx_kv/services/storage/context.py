@@ -2,6 +2,7 @@ from dcrx_kv.context.types import ContextType
 from dcrx_kv.env import Env
 from pydantic import BaseModel
 from .connection import StorageConnection
+from .job_history import JobHistory
 from .queue import JobQueue
 
 
@@ -10,6 +11,7 @@ class StorageServiceContext(BaseModel):
     env: Env
     connection: StorageConnection
     queue: JobQueue
+    history: JobHistory
     context_type: ContextType=ContextType.STORAGE_SERVICE
 
 
@@ -19,6 +21,12 @@ class StorageServiceContext(BaseModel):
     async def initialize(self):
         await self.connection.connect()
         await self.connection.init()
+        await self.history.start()
+        await self.queue.start()
 
     async def close(self):
+        await self.queue.close()
+
+        # Buffered history is written before the connection goes.
+        await self.history.close()
         await self.connection.close()
\ No newline at end of file
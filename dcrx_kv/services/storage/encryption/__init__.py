@@ -0,0 +1,5 @@
+from .blob_cipher import (
+    BlobCipher,
+    BlobDecryptionError
+)
+from .namespace_encryption import NamespaceEncryption
@@ -0,0 +1,91 @@
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from typing import Iterator
+from .chunk_encryptor import ChunkEncryptor
+from .chunk_format import (
+    ENCRYPTION_MAGIC,
+    HEADER_FORMAT,
+    HEADER_SIZE,
+    TAG_SIZE,
+    chunk_nonce
+)
+
+
+class BlobDecryptionError(Exception):
+    pass
+
+
+class BlobCipher:
+    """
+    Chunked AES-256-GCM for one namespace's blobs. The blob path is
+    bound in as associated data, so ciphertext copied to another key
+    fails to decrypt.
+    """
+
+    def __init__(
+        self,
+        key: bytes,
+        chunk_size: int=65536
+    ) -> None:
+        self.chunk_size = chunk_size
+        self._aead = AESGCM(key)
+
+    def encryptor(self, path: str) -> ChunkEncryptor:
+        return ChunkEncryptor(
+            self._aead,
+            path.encode(),
+            self.chunk_size
+        )
+
+    def decrypt_chunks(
+        self,
+        path: str,
+        data: bytes
+    ) -> Iterator[bytes]:
+
+        if len(data) < HEADER_SIZE + TAG_SIZE:
+            raise BlobDecryptionError(f'Blob {path} is not encrypted or is truncated')
+
+        magic, nonce_prefix, chunk_size = HEADER_FORMAT.unpack_from(data, 0)
+        if magic != ENCRYPTION_MAGIC:
+            raise BlobDecryptionError(f'Blob {path} is not encrypted')
+
+        associated_data = path.encode()
+        sealed_size = chunk_size + TAG_SIZE
+
+        view = memoryview(data)
+        offset = HEADER_SIZE
+        chunk_idx = 0
+
+        while True:
+            last = len(data) - offset <= sealed_size
+            sealed = view[offset:offset + sealed_size]
+
+            try:
+                yield self._aead.decrypt(
+                    chunk_nonce(
+                        nonce_prefix,
+                        chunk_idx,
+                        last
+                    ),
+                    sealed,
+                    associated_data
+                )
+
+            except InvalidTag:
+                raise BlobDecryptionError(f'Blob {path} failed authentication')
+
+            if last:
+                return
+
+            offset += sealed_size
+            chunk_idx += 1
+
+    def decrypt(
+        self,
+        path: str,
+        data: bytes
+    ) -> bytes:
+        return b''.join(
+            self.decrypt_chunks(path, data)
+        )
@@ -0,0 +1,106 @@
+import os
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from typing import List
+from .chunk_format import (
+    ENCRYPTION_MAGIC,
+    HEADER_FORMAT,
+    NONCE_PREFIX_SIZE,
+    MAX_CHUNKS,
+    chunk_nonce
+)
+
+
+class ChunkEncryptor:
+    """
+    Incrementally seals a blob. Input is buffered only up to one
+    chunk, and a full chunk is held back until more data arrives
+    so that finalize always has the last chunk to seal.
+    """
+
+    def __init__(
+        self,
+        aead: AESGCM,
+        associated_data: bytes,
+        chunk_size: int
+    ) -> None:
+        self._aead = aead
+        self._associated_data = associated_data
+        self.chunk_size = chunk_size
+
+        self._nonce_prefix = os.urandom(NONCE_PREFIX_SIZE)
+        self._chunk_idx = 0
+        self._buffer = bytearray()
+
+    def header(self) -> bytes:
+        return HEADER_FORMAT.pack(
+            ENCRYPTION_MAGIC,
+            self._nonce_prefix,
+            self.chunk_size
+        )
+
+    def _seal(
+        self,
+        chunk: bytes,
+        last: bool=False
+    ) -> bytes:
+
+        if self._chunk_idx >= MAX_CHUNKS:
+            raise OverflowError('Blob exceeds the maximum encrypted chunk count')
+
+        sealed = self._aead.encrypt(
+            chunk_nonce(
+                self._nonce_prefix,
+                self._chunk_idx,
+                last
+            ),
+            chunk,
+            self._associated_data
+        )
+
+        self._chunk_idx += 1
+
+        return sealed
+
+    def update(self, data: bytes) -> bytes:
+        view = memoryview(data)
+        sealed_chunks: List[bytes] = []
+
+        if len(self._buffer) > 0:
+            remaining = self.chunk_size - len(self._buffer)
+
+            if len(view) <= remaining:
+                self._buffer.extend(view)
+                return b''
+
+            self._buffer.extend(view[:remaining])
+            view = view[remaining:]
+
+            sealed_chunks.append(
+                self._seal(bytes(self._buffer))
+            )
+
+            self._buffer.clear()
+
+        # Seal straight from the input, keeping back whatever
+        # could still turn out to be the final chunk.
+        offset = 0
+        while len(view) - offset > self.chunk_size:
+            sealed_chunks.append(
+                self._seal(view[offset:offset + self.chunk_size])
+            )
+
+            offset += self.chunk_size
+
+        self._buffer.extend(view[offset:])
+
+        return b''.join(sealed_chunks)
+
+    def finalize(self) -> bytes:
+        sealed = self._seal(
+            bytes(self._buffer),
+            last=True
+        )
+
+        self._buffer.clear()
+
+        return sealed
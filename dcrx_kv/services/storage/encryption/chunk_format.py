@@ -0,0 +1,23 @@
+import struct
+
+
+# Encrypted blobs are a fixed header followed by AES-GCM sealed
+# chunks of CHUNK_SIZE plaintext bytes (the last may be shorter).
+# Each chunk's nonce is the header's random prefix, the chunk's
+# big-endian index and a final-chunk flag, so chunks can be neither
+# reordered nor dropped from the end without failing authentication.
+ENCRYPTION_MAGIC = b'DCRXAE01'
+HEADER_FORMAT = struct.Struct('<8s7sI')
+HEADER_SIZE = HEADER_FORMAT.size
+
+NONCE_PREFIX_SIZE = 7
+TAG_SIZE = 16
+MAX_CHUNKS = 2**32
+
+
+def chunk_nonce(
+    nonce_prefix: bytes,
+    chunk_idx: int,
+    last: bool
+) -> bytes:
+    return nonce_prefix + chunk_idx.to_bytes(4, 'big') + (b'\x01' if last else b'\x00')
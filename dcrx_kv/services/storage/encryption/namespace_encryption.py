@@ -0,0 +1,57 @@
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+from dcrx_kv.env import Env
+from typing import (
+    Dict,
+    Union
+)
+from .blob_cipher import BlobCipher
+
+
+class NamespaceEncryption:
+    """
+    Resolves which namespaces are encrypted at rest and holds one
+    cipher per namespace, each keyed by HKDF from the configured
+    encryption key (or DCRX_KV_SECRET_KEY).
+    """
+
+    def __init__(self, env: Env) -> None:
+        namespaces = env.DCRX_KV_STORAGE_ENCRYPTED_NAMESPACES or ''
+
+        self.namespaces = {
+            namespace.strip() for namespace in namespaces.split(',') if namespace.strip()
+        }
+
+        self.encrypt_all = '*' in self.namespaces
+        self.chunk_size = env.DCRX_KV_STORAGE_ENCRYPTION_CHUNK_SIZE
+
+        encryption_key = env.DCRX_KV_STORAGE_ENCRYPTION_KEY or env.DCRX_KV_SECRET_KEY
+        self._key_material = encryption_key.encode()
+        self._ciphers: Dict[str, BlobCipher] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return len(self.namespaces) > 0
+
+    def cipher(self, namespace: str) -> Union[BlobCipher, None]:
+
+        if self.encrypt_all is False and namespace not in self.namespaces:
+            return None
+
+        cipher = self._ciphers.get(namespace)
+        if cipher is None:
+            key = HKDF(
+                algorithm=hashes.SHA256(),
+                length=32,
+                salt=None,
+                info=f'dcrx-kv/namespace/{namespace}'.encode()
+            ).derive(self._key_material)
+
+            cipher = BlobCipher(
+                key,
+                chunk_size=self.chunk_size
+            )
+
+            self._ciphers[namespace] = cipher
+
+        return cipher
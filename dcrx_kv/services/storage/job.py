@@ -5,7 +5,9 @@ import psutil
 import time
 import uuid
 from concurrent.futures import ThreadPoolExecutor
-from fastapi import UploadFile
+from contextlib import contextmanager
+from dcrx_kv.metrics import metrics
+from dcrx_kv.tracing import tracer
 from fs.memoryfs import MemoryFS
 from fs.errors import (
     ResourceReadOnly,
@@ -13,181 +15,283 @@ from fs.errors import (
     ResourceError,
     ResourceNotFound
 )
-from typing import Union, Optional
+from starlette.requests import ClientDisconnect
+from typing import (
+    Union,
+    Optional,
+    AsyncIterator,
+    Callable
+)
 from .connection import StorageConnection
+from .encryption import (
+    BlobCipher,
+    BlobDecryptionError
+)
+from .job_history import JobHistory
+from .job_state import JobState
+from .shared_memory import (
+    SharedMemoryFS,
+    SharedMemoryWriter
+)
 from .models import (
     Blob,
+    BlobIntegrityException,
     JobMetadata,
     PathNotFoundException
 )
 from .status import JobStatus
 
 
+# Streamed uploads are written here first and only moved over
+# their blob once complete, so a failed upload leaves any blob it
+# was replacing as it was.
+PARTIAL_UPLOADS_PATH = '.partial'
+
+
+JOB_STAGE_SECONDS = metrics.histogram(
+    'dcrx_kv_job_stage_seconds',
+    'Time spent in each stage of a storage job.',
+    labels=('operation', 'stage')
+)
+
+
 class Job:
 
     def __init__(
         self,
         blob: Blob,
         connection: StorageConnection,
-        workers: int=psutil.cpu_count()
+        workers: int=psutil.cpu_count(),
+        cipher: Optional[BlobCipher]=None,
+        history: Optional[JobHistory]=None,
+        job_id: Optional[uuid.UUID]=None
     ) -> None:
         self.loop = asyncio.get_event_loop()
 
-        self.waiter: Union[asyncio.Future, None] = None
         self._executor = ThreadPoolExecutor(
             max_workers=workers
         )
         self._connection = connection
+        self._cipher = cipher
+        self._history = history
         self.job_start_time = time.monotonic()
-        
-        self.filesystem: Union[MemoryFS, None] = None
-
-        job_id = uuid.uuid4()
-        self.metadata = JobMetadata(
-            id=job_id,
-            key=blob.key,
-            namespace=blob.namespace,
-            content_type=blob.content_type,
-            filename=blob.filename,
-            path=blob.path,
-            operation_type=blob.operation_type,
-            backup_type=blob.backup_type,
-            encoding=blob.encoding,
-            context=f'Job {str(job_id)} creating',
-            status=JobStatus.CREATING.value
+        self.enqueued_time: Union[float, None] = None
+        self.stored_bytes = 0
+
+        # The shared memory generation the blob was written under.
+        self.generation: Union[int, None] = None
+
+        self.filesystem: Union[MemoryFS, SharedMemoryFS, None] = None
+        self._updated = asyncio.Event()
+
+        self.state = JobState(
+            blob,
+            job_id=job_id
         )
 
         self.shutdown = False
 
+    @property
+    def metadata(self) -> JobMetadata:
+        return self.state.to_metadata()
+
+    @property
+    def finished(self) -> bool:
+        return self.state.finished
+
     @property
     def path(self):
-        return os.path.join( 
-            self.metadata.namespace,
-            self.metadata.key
+        return os.path.join(
+            self.state.namespace,
+            self.state.key
+        )
+
+    @property
+    def partial_path(self):
+        return os.path.join(
+            PARTIAL_UPLOADS_PATH,
+            str(self.state.id)
         )
-    
-    async def run(self, 
-        filesystem: MemoryFS,
-        data: Optional[UploadFile]=None
-    ) -> Union[Blob, PathNotFoundException]:
-        
+
+    async def _transition(
+        self,
+        status: JobStatus,
+        context: str,
+        error: Optional[str]=None
+    ):
+        self.state.transition(
+            status,
+            context,
+            error=error
+        )
+
+        # Wake anything waiting on this job, then arm a fresh
+        # event for the next status change.
+        self._updated.set()
+        self._updated = asyncio.Event()
+
+        if self._history:
+            self._history.record(self.state)
+
+        # With a history to hold them, transient statuses never
+        # touch the blobs row, which is only written again once
+        # the job finishes.
+        if self._history and self.state.finished is False:
+            return
+
+        with self._stage('metadata'):
+            await self._connection.update_status(self.state)
+
+    @contextmanager
+    def _stage(self, stage: str):
+        """
+        Times a stage of the job into its latency histogram, and
+        into a span when the job is part of a sampled trace.
+        """
+
+        start = time.perf_counter()
+
+        with tracer.span(
+            f'job.{stage}',
+            operation=self.state.operation_type
+        ):
+            yield
+
+        JOB_STAGE_SECONDS.observe(
+            time.perf_counter() - start,
+            self.state.operation_type,
+            stage
+        )
+
+    async def run(self,
+        filesystem: Union[MemoryFS, SharedMemoryFS],
+        data: Optional[
+            Union[bytes, AsyncIterator[bytes]]
+        ]=None,
+        reserve: Optional[
+            Callable[[int], bool]
+        ]=None
+    ) -> Union[Blob, PathNotFoundException, BlobIntegrityException]:
+
         self.filesystem = filesystem
 
         path_exists = await self.loop.run_in_executor(
             self._executor,
-            functools.partial(      
+            functools.partial(
                 self.filesystem.exists,
                 self.path
             )
         )
 
-        if self.metadata.operation_type != "upload" and path_exists is False:
+        if self.state.operation_type != "upload" and path_exists is False:
             return PathNotFoundException(
-                namespace=self.metadata.namespace,
-                key=self.metadata.key,
-                message=f'Blob - {self.metadata.path} - not found.'
+                namespace=self.state.namespace,
+                key=self.state.key,
+                message=f'Blob - {self.state.path} - not found.'
             )
 
-        
-        if self.metadata.operation_type == 'upload':
-            result = await self.upload(data)
 
-        elif self.metadata.operation_type == "delete":
+        if self.state.operation_type == 'upload':
+            result = await self.upload(
+                data,
+                reserve=reserve
+            )
+
+        elif self.state.operation_type == "delete":
             result = await self.delete()
-            
+
         else:
             result = await self.download()
-        
+
         await self.close()
 
         return result
-    
+
     async def create(self) -> JobMetadata:
 
         try:
 
-            result = await self._connection.create([
-                self.metadata
-            ])
+            metadata = self.metadata
 
-            if result.error:
-                result = await self._connection.update([
-                    self.metadata
-                ], filters={
-                    'path': self.metadata.path
-                })
+            with self._stage('create'):
+                result = await self._connection.create([
+                    metadata
+                ])
 
-            return self.metadata
+                if result.error:
+                    result = await self._connection.update_by_path([
+                        metadata
+                    ])
+
+            if self._history:
+                self._history.record(self.state)
+
+            return metadata
 
         except Exception as create_error:
-            return JobMetadata(
-                id=self.metadata.id,
-                key=self.metadata.key,
-                namespace=self.metadata.namespace,
-                filename=self.metadata.filename,
-                path=self.metadata.path,
-                content_type=self.metadata.content_type,
-                operation_type=self.metadata.operation_type,
-                backup_type=self.metadata.backup_type,
-                encoding=self.metadata.encoding,
-                error=str(create_error),
-                context=f'Job {str(self.metadata.id)} failed to create',
-                status=JobStatus.FAILED.value
+            self.state.transition(
+                JobStatus.FAILED,
+                'failed to create',
+                error=str(create_error)
             )
-            
-    async def download(self) -> Blob:
-
-        self.metadata = JobMetadata(
-            id=self.metadata.id,
-            key=self.metadata.key,
-            namespace=self.metadata.namespace,
-            filename=self.metadata.filename,
-            path=self.metadata.path,
-            content_type=self.metadata.content_type,
-            operation_type=self.metadata.operation_type,
-            backup_type=self.metadata.backup_type,
-            encoding=self.metadata.encoding,
-            context=f'Job {str(self.metadata.id)} starting read',
-            status=JobStatus.READING.value
-        )
 
-        await self._connection.update([
-            self.metadata
-        ], filters={
-            'path': self.metadata.path
-        })
+            if self._history:
+                self._history.record(self.state)
+
+            return self.metadata
+
+    async def download(self) -> Union[Blob, BlobIntegrityException]:
+
+        await self._transition(
+            JobStatus.READING,
+            'starting read'
+        )
 
         result: Union[bytes, None] = None
 
         try:
-            
-            result = await self.loop.run_in_executor(
-                self._executor,
-                functools.partial(
-                    self.filesystem.readbytes,
-                    self.path
+
+            with self._stage('store'):
+                result = await self.loop.run_in_executor(
+                    self._executor,
+                    tracer.wrap(
+                        'store.read',
+                        self.filesystem.readbytes,
+                        self.path
+                    )
                 )
+
+                if self._cipher:
+                    result = await self.loop.run_in_executor(
+                        self._executor,
+                        tracer.wrap(
+                            'cipher.decrypt',
+                            self._cipher.decrypt,
+                            self.path,
+                            result
+                        )
+                    )
+
+            await self._transition(
+                JobStatus.DONE,
+                'read complete'
             )
 
-            self.metadata = JobMetadata(
-                id=self.metadata.id,
-                key=self.metadata.key,
-                namespace=self.metadata.namespace,
-                filename=self.metadata.filename,
-                path=self.metadata.path,
-                content_type=self.metadata.content_type,
-                operation_type=self.metadata.operation_type,
-                backup_type=self.metadata.backup_type,
-                encoding=self.metadata.encoding,
-                context=f'Job {str(self.metadata.id)} read complete',
-                status=JobStatus.DONE.value
+        except BlobDecryptionError as decryption_error:
+            await self._transition(
+                JobStatus.FAILED,
+                'download failed',
+                error=str(decryption_error)
             )
 
-            await self._connection.update([
-                self.metadata
-            ], filters={
-                'path': self.metadata.path
-            })
+            # Ciphertext that fails authentication was tampered with
+            # or written under another key, which is not the same as
+            # a blob that could not be read.
+            return BlobIntegrityException(
+                namespace=self.state.namespace,
+                key=self.state.key,
+                message=f'Blob - {self.state.path} - failed integrity check.'
+            )
 
         except (
             ResourceReadOnly,
@@ -195,130 +299,78 @@ class Job:
             ResourceError,
             ResourceNotFound
         ) as download_error:
-            self.metadata = JobMetadata(
-                id=self.metadata.id,
-                key=self.metadata.key,
-                namespace=self.metadata.namespace,
-                filename=self.metadata.filename,
-                path=self.metadata.path,
-                content_type=self.metadata.content_type,
-                operation_type=self.metadata.operation_type,
-                backup_type=self.metadata.backup_type,
-                encoding=self.metadata.encoding,
-                error=str(download_error),
-                context=f'Job {str(self.metadata.id)} download failed',
-                status=JobStatus.FAILED.value
-            )
+            result = None
 
-            await self._connection.update([
-                self.metadata
-            ], filters={
-                 'path': self.metadata.path
-            })
-
-            return Blob(
-                key=self.metadata.key,
-                namespace=self.metadata.namespace,
-                filename=self.metadata.filename,
-                path=self.metadata.path,
-                content_type=self.metadata.content_type,
-                operation_type=self.metadata.operation_type,
-                data=result,
-                error=self.metadata.error,
-                backup_type=self.metadata.backup_type,
-                encoding=self.metadata.encoding
+            await self._transition(
+                JobStatus.FAILED,
+                'download failed',
+                error=str(download_error)
             )
-        
-        await self._connection.update([
-            self.metadata
-        ], filters={
-             'path': self.metadata.path
-        })
-
-        return Blob(
-            key=self.metadata.key,
-            namespace=self.metadata.namespace,
-            filename=self.metadata.filename,
-            path=self.metadata.path,
-            content_type=self.metadata.content_type,
-            operation_type=self.metadata.operation_type,
-            data=result,
-            backup_type=self.metadata.backup_type,
-            encoding=self.metadata.encoding
-        )
+
+        return self.state.to_blob(data=result)
 
     async def upload(
-        self, 
-        data: bytes
+        self,
+        data: Union[bytes, AsyncIterator[bytes]],
+        reserve: Optional[
+            Callable[[int], bool]
+        ]=None
     ) -> Blob:
-        
-        self.metadata = JobMetadata(
-            id=self.metadata.id,
-            key=self.metadata.key,
-            namespace=self.metadata.namespace,
-            filename=self.metadata.filename,
-            path=self.metadata.path,
-            content_type=self.metadata.content_type,
-            operation_type=self.metadata.operation_type,
-            backup_type=self.metadata.backup_type,
-            encoding=self.metadata.encoding,
-            context=f'Job {str(self.metadata.id)} starting upload',
-            status=JobStatus.READING.value
-        )
 
-        await self._connection.update([
-            self.metadata
-        ], filters={
-             'path': self.metadata.path
-        })
+        await self._transition(
+            JobStatus.READING,
+            'starting upload'
+        )
 
         try:
 
-            namespace_exists = await self.loop.run_in_executor(
-                self._executor,
-                functools.partial(
-                    self.filesystem.exists,
-                    self.metadata.namespace
-                )
-            )
-
-            if namespace_exists is False:
-                await self.loop.run_in_executor(
+            with self._stage('store'):
+                namespace_exists = await self.loop.run_in_executor(
                     self._executor,
                     functools.partial(
-                        self.filesystem.makedirs,
-                        self.metadata.namespace
+                        self.filesystem.exists,
+                        self.state.namespace
                     )
                 )
 
-            await self.loop.run_in_executor(
-                self._executor,
-                functools.partial(
-                    self.filesystem.writebytes,
-                    self.path,
-                    data
-                )
-            )
+                if namespace_exists is False:
+                    await self.loop.run_in_executor(
+                        self._executor,
+                        functools.partial(
+                            self.filesystem.makedirs,
+                            self.state.namespace
+                        )
+                    )
 
-            self.metadata = JobMetadata(
-                id=self.metadata.id,
-                key=self.metadata.key,
-                namespace=self.metadata.namespace,
-                filename=self.metadata.filename,
-                path=self.metadata.path,
-                content_type=self.metadata.content_type,
-                operation_type=self.metadata.operation_type,
-                backup_type=self.metadata.backup_type,
-                encoding=self.metadata.encoding,
-                context=f'Job {str(self.metadata.id)} upload complete',
-                status=JobStatus.DONE.value
-            )
+                if isinstance(data, bytes) and self._cipher:
+                    await self._write_stream(
+                        self._iterate_bytes(data),
+                        reserve=reserve
+                    )
+
+                elif isinstance(data, bytes):
+                    self.generation = await self.loop.run_in_executor(
+                        self._executor,
+                        tracer.wrap(
+                            'store.write',
+                            self.filesystem.writebytes,
+                            self.path,
+                            data
+                        )
+                    )
 
-            await self._connection.update([
-                self.metadata
-            ], filters={
-                 'path': self.metadata.path
-            })
+                    self.stored_bytes = len(data)
+
+                else:
+                    await self._write_stream(
+                        data,
+                        reserve=reserve
+                    )
+
+            await self._transition(
+                JobStatus.DONE,
+                'upload complete'
+            )
 
         except (
             ResourceReadOnly,
@@ -326,186 +378,207 @@ class Job:
             ResourceError,
             ResourceNotFound
         ) as upload_error:
-            self.metadata = JobMetadata(
-                id=self.metadata.id,
-                key=self.metadata.key,
-                namespace=self.metadata.namespace,
-                filename=self.metadata.filename,
-                path=self.metadata.path,
-                content_type=self.metadata.content_type,
-                operation_type=self.metadata.operation_type,
-                backup_type=self.metadata.backup_type,
-                encoding=self.metadata.encoding,
-                error=str(upload_error),
-                context=f'Job {str(self.metadata.id)} upload failed',
-                status=JobStatus.FAILED.value,
+            await self._discard()
+
+            await self._transition(
+                JobStatus.FAILED,
+                'upload failed',
+                error=str(upload_error)
             )
 
-            await self._connection.update([
-                self.metadata
-            ], filters={
-                 'path': self.metadata.path
-            })
-
-            return Blob(
-                key=self.metadata.key,
-                namespace=self.metadata.namespace,
-                filename=self.metadata.filename,
-                path=self.metadata.path,
-                content_type=self.metadata.content_type,
-                operation_type=self.metadata.operation_type,
-                error=self.metadata.error,
-                backup_type=self.metadata.backup_type,
-                encoding=self.metadata.encoding,
+        return self.state.to_blob()
+
+    async def _iterate_bytes(self, data: bytes) -> AsyncIterator[bytes]:
+        view = memoryview(data)
+        for offset in range(0, len(data), self._cipher.chunk_size):
+            yield view[offset:offset + self._cipher.chunk_size]
+
+    async def _discard(self):
+        try:
+            await self.loop.run_in_executor(
+                self._executor,
+                self.filesystem.remove,
+                self.partial_path
+            )
+
+        except (
+            ResourceReadOnly,
+            ResourceLocked,
+            ResourceError,
+            ResourceNotFound
+        ):
+            pass
+
+    async def _write_stream(
+        self,
+        stream: AsyncIterator[bytes],
+        reserve: Optional[
+            Callable[[int], bool]
+        ]=None
+    ):
+        """
+        Writes the stream to the blob, encrypting it when the job
+        has a cipher. The reserve callback is given the bytes
+        received so far and aborts the upload when it refuses them.
+        """
+
+        await self.loop.run_in_executor(
+            self._executor,
+            functools.partial(
+                self.filesystem.makedirs,
+                PARTIAL_UPLOADS_PATH,
+                recreate=True
             )
-        
-        await self._connection.update([
-            self.metadata
-        ], filters={
-             'path': self.metadata.path
-        })
-
-        return Blob(
-            key=self.metadata.key,
-            namespace=self.metadata.namespace,
-            filename=self.metadata.filename,
-            path=self.metadata.path,
-            content_type=self.metadata.content_type,
-            operation_type=self.metadata.operation_type,
-            encoding=self.metadata.encoding,
-            backup_type=self.metadata.backup_type,
         )
-    
-    async def delete(self) -> Blob:
-        
-        self.metadata = JobMetadata(
-            id=self.metadata.id,
-            key=self.metadata.key,
-            namespace=self.metadata.namespace,
-            filename=self.metadata.filename,
-            path=self.metadata.path,
-            content_type=self.metadata.content_type,
-            operation_type=self.metadata.operation_type,
-            backup_type=self.metadata.backup_type,
-            encoding=self.metadata.encoding,
-            context=f'Job {str(self.metadata.id)} starting deletion',
-            status=JobStatus.DELETING.value
+
+        blob_file = await self.loop.run_in_executor(
+            self._executor,
+            functools.partial(
+                self.filesystem.openbin,
+                self.partial_path,
+                mode='w'
+            )
         )
 
-        await self._connection.update([
-            self.metadata
-        ], filters={
-             'path': self.metadata.path
-        })
+        completed = False
+
+        self.stored_bytes = 0
+        received_bytes = 0
+
+        encryptor = None
+        if self._cipher:
+            encryptor = self._cipher.encryptor(self.path)
+            self.stored_bytes += await self.loop.run_in_executor(
+                self._executor,
+                blob_file.write,
+                encryptor.header()
+            )
 
         try:
+            async for chunk in stream:
+                received_bytes += len(chunk)
+
+                if reserve and reserve(received_bytes) is False:
+                    raise ResourceError(
+                        self.path,
+                        msg='upload of {path} exceeded the storage quota'
+                    )
+
+                if chunk and encryptor:
+                    chunk = await self.loop.run_in_executor(
+                        self._executor,
+                        encryptor.update,
+                        chunk
+                    )
+
+                if chunk:
+                    self.stored_bytes += await self.loop.run_in_executor(
+                        self._executor,
+                        blob_file.write,
+                        chunk
+                    )
+
+            if encryptor:
+                self.stored_bytes += await self.loop.run_in_executor(
+                    self._executor,
+                    blob_file.write,
+                    encryptor.finalize()
+                )
+
+            completed = True
+
+        except ClientDisconnect as disconnect_error:
+            raise ResourceError(
+                self.path,
+                exc=disconnect_error,
+                msg='client disconnected before upload of {path} completed'
+            )
+
+        finally:
+            # Shared memory blobs are committed on close, so an
+            # unfinished one is dropped rather than closed.
+            if completed is False and isinstance(blob_file, SharedMemoryWriter):
+                blob_file.discard()
 
             await self.loop.run_in_executor(
                 self._executor,
-                functools.partial(
-                    self.filesystem.remove,
-                    self.path
-                )
+                blob_file.close
             )
 
-            self.metadata = JobMetadata(
-                id=self.metadata.id,
-                key=self.metadata.key,
-                namespace=self.metadata.namespace,
-                filename=self.metadata.filename,
-                path=self.metadata.path,
-                content_type=self.metadata.content_type,
-                operation_type=self.metadata.operation_type,
-                backup_type=self.metadata.backup_type,
-                encoding=self.metadata.encoding,
-                context=f'Job {str(self.metadata.id)} deletion complete',
-                status=JobStatus.DONE.value
+        self.generation = await self.loop.run_in_executor(
+            self._executor,
+            tracer.wrap(
+                'store.move',
+                self.filesystem.move,
+                self.partial_path,
+                self.path,
+                overwrite=True
             )
+        )
 
-            await self._connection.update([
-                self.metadata
-            ], filters={
-                 'path': self.metadata.path
-            })
+    async def delete(self) -> Blob:
+
+        await self._transition(
+            JobStatus.DELETING,
+            'starting deletion'
+        )
+
+        try:
+
+            with self._stage('store'):
+                await self.loop.run_in_executor(
+                    self._executor,
+                    tracer.wrap(
+                        'store.remove',
+                        self.filesystem.remove,
+                        self.path
+                    )
+                )
+
+            await self._transition(
+                JobStatus.DONE,
+                'deletion complete'
+            )
 
         except (
             ResourceReadOnly,
             ResourceLocked,
             ResourceError,
             ResourceNotFound
-        ) as download_error:
-            self.metadata = JobMetadata(
-                id=self.metadata.id,
-                key=self.metadata.key,
-                filename=self.metadata.filename,
-                path=self.metadata.path,
-                content_type=self.metadata.content_type,
-                namespace=self.metadata.namespace,
-                operation_type=self.metadata.operation_type,
-                backup_type=self.metadata.backup_type,
-                encoding=self.metadata.encoding,
-                error=str(download_error),
-                context=f'Job {str(self.metadata.id)} deletion failed',
-                status=JobStatus.FAILED.value,
+        ) as delete_error:
+            await self._transition(
+                JobStatus.FAILED,
+                'deletion failed',
+                error=str(delete_error)
             )
 
-            await self._connection.update([
-                self.metadata
-            ], filters={
-                 'path': self.metadata.path
-            })
-
-            return Blob(
-                key=self.metadata.key,
-                namespace=self.metadata.namespace,
-                filename=self.metadata.filename,
-                path=self.metadata.path,
-                content_type=self.metadata.content_type,
-                operation_type=self.metadata.operation_type,
-                error=self.metadata.error,
-                backup_type=self.metadata.backup_type,
-                encoding=self.metadata.encoding,
-            )
-        
-        await self._connection.update([
-            self.metadata
-        ], filters={
-             'path': self.metadata.path
-        })
-
-        return Blob(
-            key=self.metadata.key,
-            namespace=self.metadata.namespace,
-            filename=self.metadata.filename,
-            path=self.metadata.path,
-            content_type=self.metadata.content_type,
-            operation_type=self.metadata.operation_type,
-            encoding=self.metadata.encoding,
-            backup_type=self.metadata.backup_type,
-        )
-    
+        return self.state.to_blob()
+
     async def cancel(self):
-        self.metadata = JobMetadata(
-            id=self.metadata.id,
-            key=self.metadata.key,
-            namespace=self.metadata.namespace,
-            filename=self.metadata.filename,
-            path=self.metadata.path,
-            content_type=self.metadata.content_type,
-            operation_type=self.metadata.operation_type,
-            backup_type=self.metadata.backup_type,
-            encoding=self.metadata.encoding,
-            context=f'Job {str(self.metadata.id)} cancelled',
-            status=JobStatus.CANCELLED.value,
+        await self._transition(
+            JobStatus.CANCELLED,
+            'cancelled'
         )
 
-        await self._connection.update([
-            self.metadata
-        ], filters={
-             'path': self.metadata.path
-        })
-    
+    async def wait_for_update(self, timeout: float) -> bool:
+        """
+        Waits up to the timeout for the job's status to change,
+        returning False if it did not.
+        """
+
+        updated = self._updated
+
+        try:
+            await asyncio.wait_for(
+                updated.wait(),
+                timeout
+            )
+
+        except asyncio.TimeoutError:
+            return False
+
+        return True
+
     async def close(self):
         self._executor.shutdown(cancel_futures=True)
-        
-        
\ No newline at end of file
+
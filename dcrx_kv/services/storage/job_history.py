@@ -0,0 +1,257 @@
+import asyncio
+import time
+import uuid
+from dcrx_kv.env import Env
+from dcrx_kv.env.time_parser import TimeParser
+from dcrx_kv.metrics import metrics
+from typing import (
+    Dict,
+    List,
+    Set,
+    Union
+)
+from .connection import StorageConnection
+from .job_state import JobState
+from .models import JobHistoryEntry
+
+
+HISTORY_ENTRIES = metrics.counter(
+    'dcrx_kv_job_history_entries_total',
+    'Job history entries by whether they were written or dropped.',
+    labels=('result',)
+)
+
+HISTORY_FLUSH_SECONDS = metrics.histogram(
+    'dcrx_kv_job_history_flush_seconds',
+    'Time to append a batch of job history entries.'
+)
+
+HISTORY_BUFFERED = metrics.gauge(
+    'dcrx_kv_job_history_buffered',
+    'Job history entries waiting to be written.'
+)
+
+HISTORY_PARTITIONS_DROPPED = metrics.counter(
+    'dcrx_kv_job_history_partitions_dropped_total',
+    'Job history partitions dropped once past retention.'
+)
+
+
+# Partitions are checked for creation and retention at most this
+# often, however short the flush interval.
+MAINTENANCE_INTERVAL = 60
+
+
+class JobHistory:
+    """
+    Buffers job status transitions and appends them to the job
+    history table in batches, so jobs never wait on the log. A
+    single task flushes every interval or as soon as a batch fills,
+    creates partitions ahead of use and drops those past retention.
+    """
+
+    def __init__(
+        self,
+        env: Env,
+        connection: StorageConnection
+    ) -> None:
+        self._connection = connection
+
+        self.flush_interval = TimeParser(env.DCRX_KV_STORAGE_HISTORY_FLUSH_INTERVAL).time
+        self.retention = TimeParser(env.DCRX_KV_STORAGE_HISTORY_RETENTION).time
+        self.batch_size = env.DCRX_KV_STORAGE_HISTORY_BATCH_SIZE
+        self.max_buffered = env.DCRX_KV_STORAGE_HISTORY_MAX_BUFFERED
+
+        self._buffer: List[JobHistoryEntry] = []
+        self._flushing: List[JobHistoryEntry] = []
+        self._flush_requested = asyncio.Event()
+        self._partitions: Set[int] = set()
+
+        self.last_error: Union[str, None] = None
+
+        self._task: Union[asyncio.Task, None] = None
+        self._running = False
+
+        HISTORY_BUFFERED.set_function(
+            lambda: len(self._buffer) + len(self._flushing)
+        )
+
+    def record(self, state: JobState):
+        if len(self._buffer) >= self.max_buffered:
+            HISTORY_ENTRIES.inc('dropped')
+            return
+
+        self._buffer.append(
+            JobHistoryEntry.construct(
+                job_id=state.id,
+                key=state.key,
+                namespace=state.namespace,
+                path=state.path,
+                operation_type=state.operation_type,
+                status=state.status,
+                context=state.context,
+                error=state.error,
+                version=state.version,
+                recorded_at=time.time()
+            )
+        )
+
+        if len(self._buffer) >= self.batch_size:
+            self._flush_requested.set()
+
+    async def start(self):
+        if self._task is None:
+            self._running = True
+            await self.maintain()
+
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self):
+        last_maintained = time.monotonic()
+
+        while self._running:
+            try:
+                await asyncio.wait_for(
+                    self._flush_requested.wait(),
+                    self.flush_interval
+                )
+
+            except asyncio.TimeoutError:
+                pass
+
+            self._flush_requested.clear()
+            await self.flush()
+
+            if time.monotonic() - last_maintained >= MAINTENANCE_INTERVAL:
+                await self.maintain()
+                last_maintained = time.monotonic()
+
+    async def flush(self):
+        if len(self._buffer) < 1:
+            return
+
+        self._flushing = self._buffer
+        self._buffer = []
+
+        table = self._connection.history_table
+
+        batches: Dict[int, List[JobHistoryEntry]] = {}
+        for entry in self._flushing:
+            start = table.partition_start(entry.recorded_at)
+            batches.setdefault(start, []).append(entry)
+
+        failed: List[JobHistoryEntry] = []
+
+        for start, entries in batches.items():
+
+            if start not in self._partitions:
+                result = await self._connection.create_history_partition(start)
+                if result.error:
+                    self.last_error = result.error
+                    failed.extend(entries)
+                    continue
+
+                self._partitions.add(start)
+
+            flush_start = time.perf_counter()
+            result = await self._connection.append_history(
+                start,
+                entries
+            )
+
+            if result.error:
+                self.last_error = result.error
+                failed.extend(entries)
+                continue
+
+            HISTORY_FLUSH_SECONDS.observe(
+                time.perf_counter() - flush_start
+            )
+
+            HISTORY_ENTRIES.inc(
+                'written',
+                amount=len(entries)
+            )
+
+        # Failed batches are retried on the next flush, ahead of
+        # anything recorded since, as long as the buffer has room.
+        retained = failed[:max(self.max_buffered - len(self._buffer), 0)]
+        if len(retained) < len(failed):
+            HISTORY_ENTRIES.inc(
+                'dropped',
+                amount=len(failed) - len(retained)
+            )
+
+        self._buffer = retained + self._buffer
+        self._flushing = []
+
+    async def maintain(self):
+        table = self._connection.history_table
+
+        partitions = await self._connection.list_history_partitions()
+        if partitions.error:
+            self.last_error = partitions.error
+            return
+
+        self._partitions = set(partitions.data)
+
+        now = time.time()
+        cutoff = now - self.retention
+
+        for start in partitions.data:
+            if start + table.partition_interval > cutoff:
+                continue
+
+            result = await self._connection.drop_history_partition(start)
+            if result.error:
+                self.last_error = result.error
+                continue
+
+            self._partitions.discard(start)
+            HISTORY_PARTITIONS_DROPPED.inc()
+
+        # The next partition is created ahead of time, so the first
+        # flush after a rollover does not wait on DDL.
+        current = table.partition_start(now)
+        for start in [current, current + table.partition_interval]:
+            if start in self._partitions:
+                continue
+
+            result = await self._connection.create_history_partition(start)
+            if result.error:
+                self.last_error = result.error
+                continue
+
+            self._partitions.add(start)
+
+    def pending(self, job_id: uuid.UUID) -> List[JobHistoryEntry]:
+        return [
+            entry for entry in self._flushing + self._buffer if entry.job_id == job_id
+        ]
+
+    async def get(self, job_id: uuid.UUID) -> List[JobHistoryEntry]:
+        entries: Dict[int, JobHistoryEntry] = {}
+
+        result = await self._connection.select_history(job_id)
+        if result.error:
+            self.last_error = result.error
+
+        # Entries still buffered are included, and any written
+        # while the select ran are only counted once.
+        for entry in (result.data or []) + self.pending(job_id):
+            entries[entry.version] = entry
+
+        return sorted(
+            entries.values(),
+            key=lambda entry: entry.version
+        )
+
+    async def close(self):
+        self._running = False
+        self._flush_requested.set()
+
+        if self._task:
+            await self._task
+            self._task = None
+
+        await self.flush()
@@ -0,0 +1,114 @@
+import uuid
+from typing import (
+    Any,
+    Dict,
+    Optional,
+    Union
+)
+from .models import (
+    Blob,
+    JobMetadata
+)
+from .status import (
+    JobStatus,
+    FINISHED_STATUSES
+)
+
+
+class JobState:
+    """
+    Mutable, unvalidated record of a job's progress. Fields are
+    copied once from the already-validated Blob, and transitions
+    only touch status, context and error, so pydantic models are
+    built solely when state leaves the queue.
+    """
+
+    __slots__ = (
+        'id',
+        'key',
+        'namespace',
+        'filename',
+        'path',
+        'content_type',
+        'operation_type',
+        'backup_type',
+        'encoding',
+        'context',
+        'status',
+        'error',
+        'version'
+    )
+
+    def __init__(
+        self,
+        blob: Blob,
+        job_id: Optional[uuid.UUID]=None
+    ) -> None:
+        self.id = job_id or uuid.uuid4()
+        self.key = blob.key
+        self.namespace = blob.namespace
+        self.filename = blob.filename
+        self.path = blob.path
+        self.content_type = blob.content_type
+        self.operation_type = blob.operation_type
+        self.backup_type = blob.backup_type
+        self.encoding = blob.encoding
+        self.context = f'Job {str(self.id)} creating'
+        self.status = JobStatus.CREATING.value
+        self.error: Union[str, None] = None
+        self.version = 0
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATUSES
+
+    def transition(
+        self,
+        status: JobStatus,
+        context: str,
+        error: Optional[str]=None
+    ):
+        self.status = status.value
+        self.context = f'Job {str(self.id)} {context}'
+        self.error = error
+        self.version += 1
+
+    def status_values(self) -> Dict[str, Any]:
+        return {
+            'context': self.context,
+            'status': self.status,
+            'error': self.error
+        }
+
+    def to_metadata(self) -> JobMetadata:
+        return JobMetadata.construct(
+            id=self.id,
+            key=self.key,
+            namespace=self.namespace,
+            filename=self.filename,
+            path=self.path,
+            content_type=self.content_type,
+            operation_type=self.operation_type,
+            backup_type=self.backup_type,
+            encoding=self.encoding,
+            context=self.context,
+            status=self.status,
+            error=self.error
+        )
+
+    def to_blob(
+        self,
+        data: Optional[bytes]=None
+    ) -> Blob:
+        return Blob.construct(
+            key=self.key,
+            namespace=self.namespace,
+            filename=self.filename,
+            path=self.path,
+            content_type=self.content_type,
+            operation_type=self.operation_type,
+            data=data,
+            error=self.error,
+            encoding=self.encoding,
+            backup_type=self.backup_type
+        )
@@ -1,5 +1,14 @@
 from .blob import Blob
+from .blob_change import BlobChange
+from .blob_integrity_exception import BlobIntegrityException
+from .change_event import ChangeEvent
+from .job_history_entry import JobHistoryEntry
 from .job_metadata import JobMetadata
+from .job_not_found_exception import JobNotFoundException
+from .namespace_quota import NamespaceQuota
+from .namespace_usage import NamespaceUsage
 from .path_not_found_exception import PathNotFoundException
 from .new_blob import NewBlob
-from .server_limit_exception import ServerLimitException
\ No newline at end of file
+from .server_limit_exception import ServerLimitException
+from .signed_url import SignedUrl
+from .signed_url_request import SignedUrlRequest
\ No newline at end of file
@@ -0,0 +1,19 @@
+from pydantic import (
+    BaseModel,
+    StrictStr
+)
+from typing import Literal, Optional
+from .job_metadata import JobMetadata
+
+
+class BlobChange(BaseModel):
+    operation: Literal[
+        "upload",
+        "delete",
+        "expire",
+        "evict"
+    ]
+    namespace: StrictStr
+    key: StrictStr
+    path: StrictStr
+    metadata: Optional[JobMetadata]
@@ -0,0 +1,7 @@
+from pydantic import BaseModel, StrictStr
+
+
+class BlobIntegrityException(BaseModel):
+    namespace: StrictStr
+    key: StrictStr
+    message: StrictStr
@@ -0,0 +1,25 @@
+from pydantic import (
+    BaseModel,
+    StrictStr,
+    StrictInt,
+    StrictFloat
+)
+from typing import Literal, Optional
+from .job_metadata import JobMetadata
+
+
+class ChangeEvent(BaseModel):
+    sequence: StrictInt
+    epoch: StrictStr
+    operation: Literal[
+        "upload",
+        "delete",
+        "expire",
+        "evict",
+        "reset"
+    ]
+    namespace: Optional[StrictStr]
+    key: Optional[StrictStr]
+    path: Optional[StrictStr]
+    metadata: Optional[JobMetadata]
+    timestamp: StrictFloat
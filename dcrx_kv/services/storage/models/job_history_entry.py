@@ -0,0 +1,21 @@
+import uuid
+from pydantic import (
+    BaseModel,
+    StrictStr,
+    StrictInt,
+    StrictFloat
+)
+from typing import Optional
+
+
+class JobHistoryEntry(BaseModel):
+    job_id: uuid.UUID
+    key: StrictStr
+    namespace: StrictStr
+    path: StrictStr
+    operation_type: StrictStr
+    status: StrictStr
+    context: StrictStr
+    error: Optional[StrictStr]
+    version: StrictInt
+    recorded_at: StrictFloat
@@ -0,0 +1,23 @@
+from pydantic import (
+    BaseModel,
+    confloat,
+    conint
+)
+from typing import Optional, Union
+
+
+class NamespaceQuota(BaseModel):
+    """
+    A limit left as None is unlimited. Byte and key limits may be
+    zero to block new writes, while a rate or burst must be positive.
+    """
+
+    max_bytes: Optional[conint(strict=True, ge=0)]
+    max_keys: Optional[conint(strict=True, ge=0)]
+    requests_per_second: Optional[
+        Union[
+            conint(strict=True, gt=0),
+            confloat(strict=True, gt=0)
+        ]
+    ]
+    burst: Optional[conint(strict=True, gt=0)]
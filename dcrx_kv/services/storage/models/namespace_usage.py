@@ -0,0 +1,13 @@
+from pydantic import (
+    BaseModel,
+    StrictInt,
+    StrictStr
+)
+from .namespace_quota import NamespaceQuota
+
+
+class NamespaceUsage(BaseModel):
+    namespace: StrictStr
+    stored_bytes: StrictInt
+    keys: StrictInt
+    quota: NamespaceQuota
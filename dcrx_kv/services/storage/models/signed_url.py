@@ -0,0 +1,14 @@
+from pydantic import (
+    BaseModel,
+    StrictStr,
+    StrictInt
+)
+from typing import Literal, Optional
+
+
+class SignedUrl(BaseModel):
+    operation: Literal["get", "put"]
+    scope: StrictStr
+    expires: StrictInt
+    query: StrictStr
+    url: Optional[StrictStr]
@@ -0,0 +1,14 @@
+from dcrx_kv.env.time_parser import TIME_PATTERN
+from pydantic import (
+    BaseModel,
+    Field,
+    StrictStr
+)
+from typing import Literal, Optional
+
+
+class SignedUrlRequest(BaseModel):
+    operation: Literal["get", "put"]
+    namespace: StrictStr
+    key: Optional[StrictStr]
+    expires_in: StrictStr=Field('5m', regex=TIME_PATTERN)
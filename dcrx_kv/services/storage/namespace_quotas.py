@@ -0,0 +1,72 @@
+from dcrx_kv.env import Env
+from typing import Dict
+from .models import NamespaceQuota
+from .token_bucket import TokenBucket
+
+
+class NamespaceQuotas:
+    """
+    Per-namespace limits on stored bytes, key count and request
+    rate. Every namespace gets the defaults from the environment
+    unless a quota has been set for it at runtime. Quotas and rate
+    buckets live in this worker's memory - a quota set through the
+    API applies only to the worker that served the request and is
+    lost on restart, so limits meant for every worker belong in the
+    environment.
+    """
+
+    def __init__(self, env: Env) -> None:
+        max_bytes = None
+        if env.DCRX_KV_STORAGE_NAMESPACE_MAX_SIZE_MB:
+            max_bytes = env.DCRX_KV_STORAGE_NAMESPACE_MAX_SIZE_MB * 1024**2
+
+        self.default = NamespaceQuota(
+            max_bytes=max_bytes,
+            max_keys=env.DCRX_KV_STORAGE_NAMESPACE_MAX_KEYS,
+            requests_per_second=env.DCRX_KV_STORAGE_NAMESPACE_RATE,
+            burst=env.DCRX_KV_STORAGE_NAMESPACE_BURST
+        )
+
+        self._quotas: Dict[str, NamespaceQuota] = {}
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    def get(self, namespace: str) -> NamespaceQuota:
+        return self._quotas.get(namespace, self.default)
+
+    def set(
+        self,
+        namespace: str,
+        quota: NamespaceQuota
+    ):
+        self._quotas[namespace] = quota
+        self._buckets.pop(namespace, None)
+
+    def reset(self, namespace: str):
+        self._quotas.pop(namespace, None)
+        self._buckets.pop(namespace, None)
+
+    def acquire(self, namespace: str) -> float:
+        """
+        Takes a request token for the namespace, returning 0 if the
+        request may go ahead or else the seconds until it may.
+        """
+
+        bucket = self._buckets.get(namespace)
+
+        if bucket is None:
+            quota = self.get(namespace)
+            if quota.requests_per_second is None:
+                return 0
+
+            burst = quota.burst
+            if burst is None:
+                burst = max(int(quota.requests_per_second), 1)
+
+            bucket = TokenBucket(
+                quota.requests_per_second,
+                burst
+            )
+
+            self._buckets[namespace] = bucket
+
+        return bucket.acquire()
@@ -1,13 +1,18 @@
 import asyncio
 import functools
 import os
-import subprocess
 import time
 import uuid
 from concurrent.futures import ThreadPoolExecutor
 from dcrx_kv.database.models import DatabaseTransactionResult
 from dcrx_kv.env import Env
 from dcrx_kv.env.time_parser import TimeParser
+from dcrx_kv.metrics import metrics
+from dcrx_kv.services.cluster.ring import (
+    new_job_id,
+    normalize_node
+)
+from dcrx_kv.tracing import tracer
 from fs.errors import (
     ResourceNotFound, 
     ResourceReadOnly
@@ -17,18 +22,65 @@ from fastapi import UploadFile
 from typing import (
     Dict, 
     Union, 
-    List
+    List,
+    Optional,
+    Callable,
+    AsyncIterator,
+    Any
 )
 from .models import (
     Blob,
+    BlobChange,
+    BlobIntegrityException,
     PathNotFoundException,
     JobMetadata,
+    JobNotFoundException,
+    NamespaceUsage,
     ServerLimitException
 )
 
+from .change_feed import ChangeFeed
 from .connection import StorageConnection
-from .job import Job
-from .status import JobStatus
+from .encryption import NamespaceEncryption
+from .job import (
+    Job,
+    PARTIAL_UPLOADS_PATH
+)
+from .job_history import JobHistory
+from .namespace_quotas import NamespaceQuotas
+from .shared_memory import SharedMemoryFS
+from .store_usage import (
+    Reservation,
+    StoreUsage
+)
+from .status import (
+    JobStatus,
+    FINISHED_STATUSES
+)
+
+
+QUEUE_JOBS = metrics.gauge(
+    'dcrx_kv_queue_jobs',
+    'Storage jobs held by the queue.',
+    labels=('state',)
+)
+
+ADMISSION_REJECTIONS = metrics.counter(
+    'dcrx_kv_admission_rejections_total',
+    'Uploads rejected before their body was read.',
+    labels=('reason',)
+)
+
+STREAM_QUOTA_ABORTS = metrics.counter(
+    'dcrx_kv_stream_quota_aborts_total',
+    'Streamed uploads aborted for writing past a byte quota.'
+)
+
+QUEUE_WAIT_SECONDS = metrics.histogram(
+    'dcrx_kv_queue_wait_seconds',
+    'Time from a job being queued to it starting to run.',
+    labels=('operation',)
+)
 
 
 class JobQueue:
@@ -36,13 +88,33 @@ class JobQueue:
     def __init__(
         self,
         env: Env,
-        connection: StorageConnection
+        connection: StorageConnection,
+        history: Optional[JobHistory]=None
     ) -> None:
         self.pool_size = env.DCRX_KV_STORAGE_WORKERS
 
-        self._filesystem = MemoryFS()
+        self._filesystem: Union[MemoryFS, SharedMemoryFS, None] = None
+
+        if env.DCRX_KV_STORAGE_BACKEND == 'shared':
+            self._filesystem = SharedMemoryFS(
+                env.DCRX_KV_STORAGE_SHARED_MEMORY_PATH,
+                size_mb=env.DCRX_KV_STORAGE_SHARED_MEMORY_SIZE_MB,
+                max_keys=env.DCRX_KV_STORAGE_SHARED_MEMORY_MAX_KEYS,
+                max_blob_mb=env.DCRX_KV_STORAGE_SHARED_MEMORY_MAX_BLOB_MB
+            )
+
+        else:
+            self._filesystem = MemoryFS()
 
         self._connection = connection
+        self.history = history
+        self.encryption = NamespaceEncryption(env)
+
+        # Job ids carry a tag of this node when clustered, so peers
+        # can route job lookups here.
+        self.node_address = normalize_node(
+            env.DCRX_KV_CLUSTER_NODE_ADDRESS
+        ) if env.DCRX_KV_CLUSTER_NODE_ADDRESS else None
         self._jobs: Dict[uuid.UUID, Job] = {}
         self._active: Dict[uuid.UUID, asyncio.Task] = {}
 
@@ -50,22 +122,55 @@ class JobQueue:
         self.max_pending_jobs = env.DCRX_KV_STORAGE_MAX_PENDING
         self.max_job_workers = env.DCRX_KV_STORAGE_WORKERS
 
+        # Live counts of jobs running and waiting for a slot. Both
+        # are raised and lowered by _run_job itself, so they can
+        # not drift from the jobs actually in flight.
         self.active_jobs_count = 0
         self.pending_jobs_count = 0
-        self.running_jobs = asyncio.Queue(maxsize=self.max_jobs)
-        self.pending_jobs = asyncio.Queue(maxsize=self.max_pending_jobs)
+        self._slots = asyncio.Semaphore(self.max_jobs)
+        self.max_pending_wait = TimeParser(env.DCRX_KV_STORAGE_MAX_PENDING_WAIT).time
+
+        # The latest upload for each path, so an older job expiring
+        # never removes a blob a newer upload wrote.
+        self._path_uploads: Dict[str, uuid.UUID] = {}
 
         self.completed: List[asyncio.Task] = []
+        self._listeners: List[Callable[[BlobChange], None]] = []
+
+        self.changes = ChangeFeed(
+            max_size=env.DCRX_KV_STORAGE_CHANGE_FEED_SIZE
+        )
+        self.watch_heartbeat = TimeParser(env.DCRX_KV_STORAGE_WATCH_HEARTBEAT).time
+
+        self.add_listener(self.changes.append)
 
         self._executor = ThreadPoolExecutor(max_workers=env.DCRX_KV_STORAGE_WORKERS)
 
         self._cleanup_task: Union[asyncio.Task, None] = None
         self._job_max_age = TimeParser(env.DCRX_KV_STORAGE_BLOB_MAX_AGE).time
         self._job_prune_interval = TimeParser(env.DCRX_KV_STORAGE_PRUNE_INTERVAL).time
+        self.max_job_wait = TimeParser(env.DCRX_KV_STORAGE_MAX_JOB_WAIT).time
+        self.job_events_heartbeat = TimeParser(env.DCRX_KV_STORAGE_JOB_EVENTS_HEARTBEAT).time
         self._run_cleanup = True
 
         self.loop = asyncio.get_event_loop()
 
+        self.memory_headroom: Optional[Callable[[], int]] = None
+        self.store_usage = StoreUsage()
+        self.quotas = NamespaceQuotas(env)
+        self.retry_after = TimeParser(env.DCRX_KV_STORAGE_RETRY_AFTER).time
+
+        self.max_store_bytes: Union[int, None] = None
+        if env.DCRX_KV_STORAGE_MAX_STORE_SIZE_MB:
+            self.max_store_bytes = env.DCRX_KV_STORAGE_MAX_STORE_SIZE_MB * 1024**2
+
+        elif isinstance(self._filesystem, SharedMemoryFS):
+            self.max_store_bytes = self._filesystem.data_size
+
+        QUEUE_JOBS.set_function(lambda: self.active_jobs_count, 'active')
+        QUEUE_JOBS.set_function(lambda: self.pending_jobs_count, 'pending')
+        QUEUE_JOBS.set_function(lambda: len(self._jobs), 'tracked')
+
     async def start(self):
         self._cleanup_task = asyncio.create_task(
             self._monitor_jobs()
@@ -74,84 +179,33 @@ class JobQueue:
     async def _monitor_jobs(self):
         while self._run_cleanup:
 
-            await self.loop.run_in_executor(
-                self._executor,
-                functools.partial(
-                    subprocess.run,
-                    [
-                        "docker",
-                        "system",
-                        "prune",
-                        "-f"
-                    ],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE
-                )
-            )
-
             queue_jobs = dict(self._jobs)
-
-            pruneable_statuses = ['DONE', 'CANCELLED', 'FAILED']
             
             for job_id, job in queue_jobs.items():
                 
                 job_elapsed = time.monotonic() - job.job_start_time
-                job_is_pruneable = job.metadata.status in pruneable_statuses
 
-                if job.metadata.status in pruneable_statuses:
-                    self.completed.append(
-                        asyncio.create_task(
-                            job.close()
-                        )
-                    )
-
-                if job_is_pruneable and job_elapsed > self._job_max_age:
+                if job.finished is False or job_elapsed <= self._job_max_age:
+                    continue
 
-                    blob_exists = await self.loop.run_in_executor(
-                        self._executor,
-                        self._filesystem.exists,
-                        job.path
-                    )
+                is_latest_upload = self._path_uploads.get(job.path) == job_id
+                if is_latest_upload:
+                    del self._path_uploads[job.path]
 
-                    if blob_exists:
-                        try:
-                            await self.loop.run_in_executor(
-                                self._executor,
-                                self._filesystem.remove,
-                                job.path
-                            )
+                # Failed uploads left any earlier blob in place, so
+                # only completed ones expire theirs.
+                is_stored = job.state.status == JobStatus.DONE.value
 
-                        except (ResourceReadOnly, ResourceNotFound,):
-                            pass
+                if job.state.operation_type == 'upload' and is_latest_upload and is_stored:
+                    await self._expire(job)
 
-                    del self._jobs[job_id]
-            
-            for _ in range(self.active_jobs_count):
-                job: Job = await self.running_jobs.get()
-                job_is_pruneable = job.metadata.status in pruneable_statuses
-
-                if job_is_pruneable is False:
-                    await self.running_jobs.put(job)
-
-                elif self.pending_jobs_count > 0:
-                    await self.running_jobs.put(
-                        await self.pending_jobs.get()
+                self.completed.append(
+                    asyncio.create_task(
+                        job.close()
                     )
+                )
 
-                    self.active_jobs_count = self.running_jobs.qsize()
-                    self.pending_jobs_count = self.pending_jobs.qsize()
-
-            for _ in range(self.pending_jobs_count):
-                job: Job = await self.pending_jobs.get()
-                job_is_pruneable = job.metadata.status in pruneable_statuses
-
-                if job_is_pruneable is False:
-                    await self.pending_jobs.put(job)
-
-            self.pending_jobs_count = self.pending_jobs.qsize()
-
-
-            self.active_jobs_count = self.running_jobs.qsize()
+                del self._jobs[job_id]
             
             completed_tasks = list(self.completed)
             for completed_task in completed_tasks:
@@ -160,51 +214,436 @@ class JobQueue:
             
             await asyncio.sleep(self._job_prune_interval)
 
+    async def _expire(self, job: Job):
+        remove = functools.partial(
+            self._filesystem.remove,
+            job.path
+        )
+
+        # Other workers write to the shared arena too, so the blob
+        # is only removed if it is still the one this job wrote.
+        if isinstance(self._filesystem, SharedMemoryFS):
+            remove = functools.partial(
+                self._filesystem.remove,
+                job.path,
+                generation=job.generation
+            )
+
+        try:
+            await self.loop.run_in_executor(
+                self._executor,
+                remove
+            )
+
+        except (ResourceReadOnly, ResourceNotFound,):
+            return
+        
+        self.store_usage.record_remove(job.path)
+        self.emit(
+            BlobChange(
+                operation='expire',
+                namespace=job.state.namespace,
+                key=job.state.key,
+                path=job.state.path,
+                metadata=job.metadata
+            )
+        )
+
     async def upload(
         self, 
         blob: Blob,
         data: UploadFile
     ) -> JobMetadata:
+
+        admission_limit = self.admit(
+            data.size,
+            path=blob.path
+        )
+        if admission_limit:
+            return admission_limit
         
         job = Job(
             blob,
             self._connection,
-            workers=self.max_job_workers
+            workers=self.max_job_workers,
+            cipher=self.encryption.cipher(blob.namespace),
+            history=self.history,
+            job_id=new_job_id(self.node_address)
         )
 
         result = await job.create()
         if result.error:
             return result
 
-        if self.active_jobs_count >= self.max_jobs and self.pending_jobs_count < self.max_pending_jobs:
-            job.waiter = asyncio.Future()
-            await self.pending_jobs.put(job)
-            self.pending_jobs_count = self.pending_jobs.qsize()
+        server_limit = await self._enqueue(job)
+        if server_limit:
+            return server_limit
+
+        with tracer.span('queue.read_body'):
+            upload_data = await data.read()
+
+        reservation = self.store_usage.reservation(
+            job.path,
+            len(upload_data)
+        )
+        
+        job_id = job.state.id
+        self._active[job_id] = asyncio.create_task(
+            self._run_job(
+                job,
+                data=upload_data,
+                reservation=reservation
+            )
+        )
+
+        self._active[job_id].add_done_callback(
+            lambda _: self._active.pop(job_id, None)
+        )
+
+        self._jobs[job_id] = job
+        self._path_uploads[job.path] = job_id
+
+        return job.metadata
+    
+    async def upload_stream(
+        self,
+        blob: Blob,
+        stream: AsyncIterator[bytes],
+        size: Optional[int]=None
+    ) -> Union[JobMetadata, ServerLimitException]:
+
+        admission_limit = self.admit(
+            size,
+            path=blob.path
+        )
+        if admission_limit:
+            return admission_limit
+        
+        job = Job(
+            blob,
+            self._connection,
+            workers=self.max_job_workers,
+            cipher=self.encryption.cipher(blob.namespace),
+            history=self.history,
+            job_id=new_job_id(self.node_address)
+        )
+
+        result = await job.create()
+        if result.error:
+            return result
+
+        server_limit = await self._enqueue(job)
+        if server_limit:
+            return server_limit
+        
+        self._jobs[job.state.id] = job
+        self._path_uploads[job.path] = job.state.id
+
+        reservation = self.store_usage.reservation(
+            job.path,
+            size or 0
+        )
+
+        # The request body can only be read while the request
+        # is open, so streamed uploads run inline rather than
+        # as a background task.
+        await self._run_job(
+            job,
+            data=stream,
+            reservation=reservation
+        )
+
+        return job.metadata
+    
+    async def _run_job(
+        self,
+        job: Job,
+        data: Optional[
+            Union[bytes, AsyncIterator[bytes]]
+        ]=None,
+        reservation: Optional[Reservation]=None
+    ) -> Union[Blob, PathNotFoundException, BlobIntegrityException]:
+
+        self.pending_jobs_count += 1
+
+        try:
+            # Jobs wait here for one of the pool's slots, which is
+            # what holds them pending once the pool is full.
+            await asyncio.wait_for(
+                self._slots.acquire(),
+                self.max_pending_wait
+            )
+
+        except asyncio.TimeoutError:
+            if reservation:
+                reservation.release()
+
+            await job.cancel()
+
+            return job.state.to_blob()
+
+        finally:
+            self.pending_jobs_count -= 1
+
+        self.active_jobs_count += 1
+
+        if job.enqueued_time is not None:
+            QUEUE_WAIT_SECONDS.observe(
+                time.monotonic() - job.enqueued_time,
+                job.state.operation_type
+            )
+        
+        try:
+            with tracer.span(
+                'queue.run_job',
+                job_id=str(job.state.id),
+                operation=job.state.operation_type
+            ):
+                result = await job.run(
+                    self._filesystem,
+                    data=data,
+                    reserve=functools.partial(
+                        self._grow_reservation,
+                        reservation
+                    ) if reservation else None
+                )
+
+        finally:
+            self.active_jobs_count -= 1
+            self._slots.release()
+
+            # Once written the blob shows up in the next memory
+            # sample, so its reservation can be released.
+            if reservation:
+                reservation.release()
+
+        job_completed = job.state.status == JobStatus.DONE.value
+        if job_completed and job.state.operation_type == 'upload':
+            self.store_usage.record_write(job.path, job.stored_bytes)
+
+        elif job_completed and job.state.operation_type == 'delete':
+            self.store_usage.record_remove(job.path)
+
+        if job_completed and job.state.operation_type in ['upload', 'delete']:
+            self.emit(
+                BlobChange(
+                    operation=job.state.operation_type,
+                    namespace=job.state.namespace,
+                    key=job.state.key,
+                    path=job.state.path,
+                    metadata=job.metadata
+                )
+            )
+
+        return result
+    
+    def admit(
+        self,
+        size: Optional[int]=None,
+        path: Optional[str]=None
+    ) -> Union[ServerLimitException, None]:
+        """
+        Decides whether an upload of the given declared size can be
+        accepted, from queue depth, the namespace's quota, store
+        capacity and memory headroom, counting uploads still being
+        written. It touches
+        no I/O, so uploads can be turned away before their body is
+        read or any job is created. Uploads of unknown size are
+        admitted while any capacity is left.
+        """
+
+        required = size or 0
+
+        # Both counts are live, falling as soon as a job finishes
+        # or gives up waiting for a slot.
+        if self.active_jobs_count >= self.max_jobs and self.pending_jobs_count >= self.max_pending_jobs:
+            ADMISSION_REJECTIONS.inc('queue')
 
-        elif self.active_jobs_count >= self.max_jobs:
             return ServerLimitException(
                 message='Pending jobs quota reached. Please try again later.',
                 limit=self.max_pending_jobs,
                 current=self.pending_jobs_count
             )
         
-        else:
-            await self.running_jobs.put(job)
-            self.active_jobs_count = self.running_jobs.qsize()
+        if path:
+            namespace_limit = self._admit_namespace(
+                path,
+                required
+            )
+
+            if namespace_limit:
+                return namespace_limit
+
+        if self.max_store_bytes is not None:
+            store_available = self.max_store_bytes - self._stored_bytes() - self.store_usage.reserved_bytes
+
+            # Overwrites only need room for the difference in size.
+            if path:
+                store_available += self.store_usage.size(path)
+
+            if store_available < required or store_available <= 0:
+                ADMISSION_REJECTIONS.inc('store')
+
+                return ServerLimitException(
+                    message='Store capacity reached. Please try again later.',
+                    limit=max(store_available, 0),
+                    current=required
+                )
+
+        if self.memory_headroom is None:
+            return None
+        
+        headroom = self.memory_headroom() - self.store_usage.reserved_bytes
+
+        if headroom > required:
+            return None
+        
+        ADMISSION_REJECTIONS.inc('memory')
+        
+        return ServerLimitException(
+            message='Memory limit reached. Please try again later.',
+            limit=max(headroom, 0),
+            current=required
+        )
+    
+    def _admit_namespace(
+        self,
+        path: str,
+        required: int
+    ) -> Union[ServerLimitException, None]:
+        namespace = os.path.dirname(path)
+        quota = self.quotas.get(namespace)
+
+        if quota.max_keys is None and quota.max_bytes is None:
+            return None
+        
+        counts = self.store_usage.namespace(namespace)
 
-        upload_data = await data.read()
+        # Overwriting a key does not add one.
+        adds_key = self.store_usage.contains(path) is False
+
+        if quota.max_keys is not None and adds_key and counts.keys >= quota.max_keys:
+            ADMISSION_REJECTIONS.inc('namespace_keys')
+
+            return ServerLimitException(
+                message=f'Key quota for namespace - {namespace} - reached.',
+                limit=quota.max_keys,
+                current=counts.keys
+            )
         
-        self._active[job.metadata.id] = asyncio.create_task(
-            job.run(
-                self._filesystem,
-                data=upload_data
+        if quota.max_bytes is None:
+            return None
+        
+        namespace_available = quota.max_bytes - counts.stored_bytes - counts.reserved_bytes + self.store_usage.size(path)
+
+        if namespace_available < required or namespace_available <= 0:
+            ADMISSION_REJECTIONS.inc('namespace_bytes')
+
+            return ServerLimitException(
+                message=f'Storage quota for namespace - {namespace} - reached.',
+                limit=max(namespace_available, 0),
+                current=required
             )
     
+    def _grow_reservation(
+        self,
+        reservation: Reservation,
+        written: int
+    ) -> bool:
+        """
+        Extends an upload's reservation to cover the bytes written
+        so far, returning False once that would take its namespace
+        or the store past capacity.
+        """
+
+        required = written - reservation.size
+        if required <= 0:
+            return True
+
+        available: Union[int, None] = None
+
+        # The blob being replaced is freed once the upload lands.
+        replaced_bytes = self.store_usage.size(reservation.path)
+
+        quota = self.quotas.get(
+            os.path.dirname(reservation.path)
         )
 
-        self._jobs[job.metadata.id] = job
+        if quota.max_bytes is not None:
+            counts = self.store_usage.namespace(
+                os.path.dirname(reservation.path)
+            )
+
+            available = quota.max_bytes - counts.stored_bytes - counts.reserved_bytes + replaced_bytes
 
-        return job.metadata
+        if self.max_store_bytes is not None:
+            store_available = self.max_store_bytes - self._stored_bytes() - self.store_usage.reserved_bytes + replaced_bytes
+            available = store_available if available is None else min(available, store_available)
+
+        if available is not None and available < required:
+            STREAM_QUOTA_ABORTS.inc()
+            return False
+
+        reservation.grow(required)
+
+        return True
+    
+    def namespace_usage(self, namespace: str) -> NamespaceUsage:
+        counts = self.store_usage.namespace(namespace)
+
+        return NamespaceUsage(
+            namespace=namespace,
+            stored_bytes=counts.stored_bytes,
+            keys=counts.keys,
+            quota=self.quotas.get(namespace)
+        )
+    
+    def _stored_bytes(self) -> int:
+
+        # The shared arena is written by every worker, so only its
+        # header has the full count.
+        if isinstance(self._filesystem, SharedMemoryFS):
+            return self._filesystem.usage()['stored_bytes']
+        
+        return self.store_usage.stored_bytes
+    
+    def external_memory_bytes(self) -> int:
+        """
+        Returns the bytes the store holds outside the process heap,
+        which is the written region of a shared memory arena and
+        nothing for the in-memory filesystem.
+        """
+
+        if isinstance(self._filesystem, SharedMemoryFS):
+            return self._filesystem.usage()['allocated_bytes']
+        
+        return 0
+    
+    def add_listener(
+        self,
+        listener: Callable[[BlobChange], None]
+    ):
+        self._listeners.append(listener)
+
+    def emit(self, change: BlobChange):
+        for listener in self._listeners:
+            listener(change)
+    
+    async def _enqueue(self, job: Job) -> Union[ServerLimitException, None]:
+        """
+        Checks the job can run now or wait for a slot. Nothing is
+        held here, since _run_job counts the job from when it starts
+        waiting to when it finishes.
+        """
+
+        job.enqueued_time = time.monotonic()
+        
+        if self.active_jobs_count >= self.max_jobs and self.pending_jobs_count >= self.max_pending_jobs:
+            return ServerLimitException(
+                message='Pending jobs quota reached. Please try again later.',
+                limit=self.max_pending_jobs,
+                current=self.pending_jobs_count
+            )
     
     async def download(
         self,
@@ -214,7 +653,10 @@ class JobQueue:
         job = Job(
             blob,
             self._connection,
-            workers=self.max_job_workers
+            workers=self.max_job_workers,
+            cipher=self.encryption.cipher(blob.namespace),
+            history=self.history,
+            job_id=new_job_id(self.node_address)
         )
 
         result = await job.create()
@@ -230,33 +672,23 @@ class JobQueue:
         job = Job(
             blob,
             self._connection,
-            workers=self.max_job_workers
+            workers=self.max_job_workers,
+            cipher=self.encryption.cipher(blob.namespace),
+            history=self.history,
+            job_id=new_job_id(self.node_address)
         )
 
         result = await job.create()
         if result.error:
             return result
         
-        blob = await job.run(self._filesystem)
+        blob = await self._run_job(job)
 
         if isinstance(blob, PathNotFoundException):
             return blob
-
-        elif blob.error:
-            return JobMetadata(
-                id=result.id,
-                namespace=result.namespace,
-                key=result.key,
-                path=result.path,
-                content_type=result.content_type,
-                operation_type=result.operation_type,
-                backup_type=result.backup_type,
-                encoding=result.encoding,
-                context=f"Job {str(result.id)} failed to delete",
-                status=JobStatus.FAILED.value,
-                error=blob.error
-            )
         
+        # Failed deletions are recorded on the job's state, so its
+        # metadata carries the error either way.
         return job.metadata
     
     async def get_job_metadata(
@@ -266,11 +698,7 @@ class JobQueue:
     ) -> Union[JobMetadata, PathNotFoundException]:
         path_key = os.path.join(namespace, key)
 
-        metadata_set = await self._connection.select(
-            filters={
-                'path': path_key
-            }
-        )
+        metadata_set = await self._connection.select_by_path(path_key)
 
         if metadata_set.data is None or len(metadata_set.data) < 1:
             return PathNotFoundException(
@@ -279,22 +707,105 @@ class JobQueue:
                 message=f'Blob - {path_key} - not found.'
             )
         
-        metadata = metadata_set.data.pop()
-
-        return JobMetadata(
-            id=metadata.id,
-            key=metadata.key,
-            namespace=metadata.namespace,
-            filename=metadata.filename,
-            path=metadata.path,
-            content_type=metadata.content_type,
-            operation_type=metadata.operation_type,
-            encoding=metadata.encoding,
-            context=metadata.content_type,
-            status=metadata.status,
-            error=metadata.error
+        return metadata_set.data.pop()
+    
+    async def get_job(
+        self,
+        job_id: uuid.UUID
+    ) -> Union[JobMetadata, JobNotFoundException]:
+        
+        job = self._jobs.get(job_id)
+        if job:
+            return await self._settled(job)
+        
+        # Jobs pruned from (or run by another worker than) this
+        # queue are only visible through their stored metadata.
+        metadata_set = await self._connection.select(
+            filters={
+                'id': job_id
+            }
         )
+
+        if metadata_set.data is None or len(metadata_set.data) < 1:
+            return JobNotFoundException(
+                job_id=job_id,
+                message=f'Job - {job_id} - not found.'
+            )
+        
+        return metadata_set.data.pop()
+    
+    async def wait_for_job(
+        self,
+        job_id: uuid.UUID,
+        timeout: float
+    ) -> Union[JobMetadata, JobNotFoundException]:
+        """
+        Waits up to the timeout (capped at the configured maximum
+        job wait) for the job to finish, returning its latest
+        metadata either way.
+        """
+        
+        job = self._jobs.get(job_id)
+        if job is None:
+            return await self.get_job(job_id)
+        
+        deadline = time.monotonic() + min(timeout, self.max_job_wait)
+
+        while job.finished is False:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+
+            await job.wait_for_update(remaining)
+
+        return await self._settled(job)
+
+    async def _settled(self, job: Job) -> JobMetadata:
+        """
+        Returns the job's metadata, first waiting out its run when
+        it has finished but has yet to record and emit its change,
+        so a finished job is never reported ahead of its write.
+        """
+
+        active_task = self._active.get(job.state.id)
+        if job.finished and active_task and active_task.done() is False:
+            await asyncio.shield(active_task)
+
+        return job.metadata
+    
+    async def watch_job(
+        self,
+        job_id: uuid.UUID
+    ) -> AsyncIterator[Union[JobMetadata, None]]:
+        """
+        Yields the job's metadata on every status change until it
+        finishes, yielding None as a heartbeat while it is idle.
+        """
+        
+        job = self._jobs.get(job_id)
+        if job is None:
+            yield await self.get_job(job_id)
+            return
         
+        sent_version: Union[int, None] = None
+        sent_status: Union[str, None] = None
+
+        while sent_status not in FINISHED_STATUSES:
+
+            if job.state.version == sent_version:
+                updated = await job.wait_for_update(
+                    self.job_events_heartbeat
+                )
+
+                if updated is False:
+                    yield None
+
+                continue
+
+            sent_version = job.state.version
+            sent_status = job.state.status
+            yield job.metadata
+
 
     async def get_blob_metadata(
         self, 
@@ -319,7 +830,130 @@ class JobQueue:
             backup_type=metadata.backup_type
         )
     
-    async def cancel(self, job_id: uuid.UUID) -> Union[Job, PathNotFoundException]:
+    async def list_paths(self) -> List[str]:
+
+        if isinstance(self._filesystem, SharedMemoryFS):
+            paths: List[str] = await self.loop.run_in_executor(
+                self._executor,
+                self._filesystem.listpaths
+            )
+
+        else:
+            paths: List[str] = await self.loop.run_in_executor(
+                self._executor,
+                lambda: list(self._filesystem.walk.files())
+            )
+
+        paths = [
+            path.strip('/') for path in paths
+        ]
+
+        # Uploads still being written are not blobs yet.
+        return [
+            path for path in paths if path.split('/', 1)[0] != PARTIAL_UPLOADS_PATH
+        ]
+    
+    @property
+    def tracked_jobs_count(self) -> int:
+        return len(self._jobs)
+
+    async def usage(self) -> Dict[str, Any]:
+        """
+        Returns the number of stored keys and their total size in
+        bytes. The shared memory arena tracks both in its header,
+        which also counts blobs written by other workers.
+        """
+
+        if isinstance(self._filesystem, SharedMemoryFS):
+            usage = await self.loop.run_in_executor(
+                self._executor,
+                self._filesystem.usage
+            )
+
+            return {
+                'keys': usage['keys'],
+                'stored_bytes': usage['stored_bytes']
+            }
+        
+        return {
+            'keys': self.store_usage.keys,
+            'stored_bytes': self.store_usage.stored_bytes
+        }
+    
+    async def read_path(
+        self,
+        path: str,
+        decrypt: bool=False
+    ) -> bytes:
+        """
+        Returns the stored bytes at the path, which for encrypted
+        namespaces are ciphertext unless decrypt is set.
+        """
+
+        data = await self.loop.run_in_executor(
+            self._executor,
+            self._filesystem.readbytes,
+            path
+        )
+
+        cipher = self.encryption.cipher(
+            os.path.dirname(path)
+        )
+
+        if decrypt and cipher:
+            data = await self.loop.run_in_executor(
+                self._executor,
+                cipher.decrypt,
+                path,
+                data
+            )
+
+        return data
+    
+    async def write_path(
+        self,
+        path: str,
+        data: bytes
+    ):
+        namespace = os.path.dirname(path)
+
+        namespace_exists = await self.loop.run_in_executor(
+            self._executor,
+            self._filesystem.exists,
+            namespace
+        )
+
+        if namespace_exists is False:
+            await self.loop.run_in_executor(
+                self._executor,
+                self._filesystem.makedirs,
+                namespace
+            )
+
+        await self.loop.run_in_executor(
+            self._executor,
+            self._filesystem.writebytes,
+            path,
+            data
+        )
+
+        self.store_usage.record_write(path, len(data))
+    
+    async def evict_path(self, path: str):
+        try:
+            await self.loop.run_in_executor(
+                self._executor,
+                self._filesystem.remove,
+                path
+            )
+
+        except (ResourceReadOnly, ResourceNotFound,):
+            pass
+
+        else:
+            self.store_usage.record_remove(path)
+
+    async def cancel(self, job_id: uuid.UUID) -> Union[Job, JobNotFoundException]:
 
         active_task = self._active.get(job_id)
         if active_task and active_task.done() is False:
@@ -335,15 +969,15 @@ class JobQueue:
         cancelled_job = self._jobs.get(job_id)
 
         if cancelled_job is None:
-            return PathNotFoundException(
+            return JobNotFoundException(
                 job_id=job_id,
                 message=f'Job - {job_id} - not found or is not active.'
             )
 
-        job_is_cancellable = cancelled_job.metadata.status in cancellable_states
+        job_is_cancellable = cancelled_job.state.status in cancellable_states
 
         if job_is_cancellable is False:
-            return PathNotFoundException(
+            return JobNotFoundException(
                 job_id=job_id,
                 message=f'Job - {job_id} - not found or is not active.'
             )
@@ -356,40 +990,33 @@ class JobQueue:
     
     async def close(self):
 
+        self._run_cleanup = False
+
+        if self._cleanup_task:
+            self._cleanup_task.cancel()
+
+            try:
+                await self._cleanup_task
+
+            except asyncio.CancelledError:
+                pass
+
+            self._cleanup_task = None
+
+        active_tasks = list(self._active.values())
+        for job_task in active_tasks:
+            if not job_task.done():
+                job_task.cancel()
+
+        await asyncio.gather(*active_tasks, return_exceptions=True)
+
+        await asyncio.gather(*[
+            job.close() for job in self._jobs.values()
+        ])
+
         await self.loop.run_in_executor(
             self._executor,
             self._filesystem.close
         )
 
-        self._run_cleanup = False
-        await self._cleanup_task
-
-        cancel_jobs: List[Job] = []
-        for _ in range(self.pending_jobs_count):
-            job: Job = await self.pending_jobs.get()
-            if job.shutdown is False:
-                cancel_jobs.append(job)
-
-            await asyncio.gather(*[
-                asyncio.create_task(
-                    job.close()
-                ) for job in cancel_jobs
-            ])
-
-        cancel_jobs: List[Job] = []
-        for _ in range(self.active_jobs_count):
-            job: Job = await self.running_jobs.get()
-            if job.shutdown is False:
-                cancel_jobs.append(job)
-            
-            await asyncio.gather(*[
-                asyncio.create_task(
-                    job.close()
-                ) for job in cancel_jobs
-            ])
-        
-        for job_task in self._active.values():
-            if not job_task.done():
-                job_task.cancel()
-
-        self._executor.shutdown()
\ No newline at end of file
+        self._executor.shutdown(cancel_futures=True)
@@ -1,13 +1,29 @@
 import os
+import uuid
 from dcrx_kv.context.manager import context, ContextType
-from fastapi import APIRouter, HTTPException, UploadFile, File, Header
-from fastapi.responses import Response
-from typing import Literal, Annotated
+from dcrx_kv.env.time_parser import TimeParser, TIME_PATTERN
+from dcrx_kv.services.auth.url_signer import (
+    URL_EXPIRES_PARAM,
+    URL_SCOPE_PARAM
+)
+from fastapi import APIRouter, HTTPException, UploadFile, File, Header, Query, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import Response, StreamingResponse
+from typing import Literal, Annotated, List, Optional
+from urllib.parse import urlencode
 from .models import (
     Blob,
+    BlobIntegrityException,
+    ChangeEvent,
     PathNotFoundException,
+    JobHistoryEntry,
     JobMetadata,
-    ServerLimitException
+    JobNotFoundException,
+    NamespaceQuota,
+    NamespaceUsage,
+    ServerLimitException,
+    SignedUrl,
+    SignedUrlRequest
 )
 from .context import StorageServiceContext
 
@@ -59,13 +75,82 @@ async def upload_blob(
     if isinstance(result, ServerLimitException):
         raise HTTPException(
             429,
-            detail=result.dict()
+            detail=result.dict(),
+            headers={
+                'Retry-After': str(storage_service_context.queue.retry_after)
+            }
         )
 
     elif result.error:
         raise HTTPException(
             400,
-            detail=result.dict()
+            detail=jsonable_encoder(result)
+        )
+    
+    return result
+
+
+# Unlike multipart uploads, which are accepted and written in the
+# background, raw uploads stream the request body straight into the
+# job and so only respond once it has finished - hence the 200.
+@storage_router.put(
+    '/store/put/raw/{namespace}/{key}',
+    status_code=200,
+    responses={
+        400: {
+            "model": JobMetadata
+        },
+        429: {
+            "model": ServerLimitException
+        }
+    }
+)
+async def upload_raw_blob(
+    namespace: str,
+    key: str,
+    request: Request,
+    filename: Optional[str]=None,
+    persist: Literal["aws", "azure", "gcs", "disk"]="disk",
+    encoding: str='utf-8',
+    content_type: str=Header(default="application/octet-stream")
+) -> JobMetadata:
+    storage_service_context: StorageServiceContext = context.get(ContextType.STORAGE_SERVICE)
+
+    new_blob = Blob(
+        key=key,
+        namespace=namespace,
+        filename=filename or key,
+        path=os.path.join(
+            namespace,
+            key
+        ),
+        content_type=content_type,
+        operation_type="upload",
+        backup_type=persist,
+        encoding=encoding
+    )
+
+    content_length = request.headers.get('content-length')
+
+    result = await storage_service_context.queue.upload_stream(
+        new_blob,
+        request.stream(),
+        size=int(content_length) if content_length and content_length.isdigit() else None
+    )
+
+    if isinstance(result, ServerLimitException):
+        raise HTTPException(
+            429,
+            detail=result.dict(),
+            headers={
+                'Retry-After': str(storage_service_context.queue.retry_after)
+            }
+        )
+
+    elif result.error:
+        raise HTTPException(
+            400,
+            detail=jsonable_encoder(result)
         )
     
     return result
@@ -76,6 +161,12 @@ async def upload_blob(
     responses={
         404: {
             "model": PathNotFoundException
+        },
+        409: {
+            "model": BlobIntegrityException
+        },
+        500: {
+            "model": Blob
         }
     }
 )
@@ -109,6 +200,24 @@ async def download_blob(
                 "message": result.message          
             }
         )
+    
+    if isinstance(result, BlobIntegrityException):
+        raise HTTPException(
+            409,
+            detail=result.dict()
+        )
+    
+    # Failed reads still return the blob, with no data, so they
+    # must not be sent as an empty value.
+    if result.error:
+        raise HTTPException(
+            500,
+            detail={
+                "namespace": namespace,
+                'key': key,
+                "message": result.error
+            }
+        )
 
     return Response(
         content=result.data,
@@ -159,7 +268,7 @@ async def delete_blob(
     elif result.error:
         raise HTTPException(
             404,
-            detail=result.dict()
+            detail=jsonable_encoder(result)
         )
     
     
@@ -194,3 +303,252 @@ async def get_metadata(
         })
 
     return result
+
+
+@storage_router.get(
+    '/store/jobs/{job_id}',
+    responses={
+        404: {
+            "model": JobNotFoundException
+        }
+    }
+)
+async def get_job(
+    job_id: uuid.UUID,
+    wait: Annotated[
+        Optional[str],
+        Query(regex=TIME_PATTERN)
+    ]=None
+) -> JobMetadata:
+    storage_service_context: StorageServiceContext = context.get(ContextType.STORAGE_SERVICE)
+
+    if wait:
+        result = await storage_service_context.queue.wait_for_job(
+            job_id,
+            TimeParser(wait).time
+        )
+
+    else:
+        result = await storage_service_context.queue.get_job(job_id)
+
+    if isinstance(result, JobNotFoundException):
+        raise HTTPException(
+            404,
+            detail={
+                'job_id': str(job_id),
+                'message': result.message
+            }
+        )
+
+    return result
+
+
+@storage_router.get(
+    '/store/jobs/{job_id}/events',
+    response_class=StreamingResponse,
+    responses={
+        404: {
+            "model": JobNotFoundException
+        }
+    }
+)
+async def get_job_events(
+    job_id: uuid.UUID
+) -> StreamingResponse:
+    storage_service_context: StorageServiceContext = context.get(ContextType.STORAGE_SERVICE)
+
+    result = await storage_service_context.queue.get_job(job_id)
+
+    if isinstance(result, JobNotFoundException):
+        raise HTTPException(
+            404,
+            detail={
+                'job_id': str(job_id),
+                'message': result.message
+            }
+        )
+    
+    async def stream_events():
+        async for metadata in storage_service_context.queue.watch_job(job_id):
+
+            if metadata is None:
+                yield ': heartbeat\n\n'
+
+            elif isinstance(metadata, JobMetadata):
+                yield f'event: {metadata.status.lower()}\ndata: {metadata.json()}\n\n'
+
+    return StreamingResponse(
+        stream_events(),
+        media_type='text/event-stream',
+        headers={
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no'
+        }
+    )
+
+
+@storage_router.get(
+    '/store/jobs/{job_id}/history',
+    responses={
+        404: {
+            "model": JobNotFoundException
+        }
+    }
+)
+async def get_job_history(
+    job_id: uuid.UUID
+) -> List[JobHistoryEntry]:
+    storage_service_context: StorageServiceContext = context.get(ContextType.STORAGE_SERVICE)
+
+    history = await storage_service_context.history.get(job_id)
+
+    if len(history) < 1:
+        raise HTTPException(
+            404,
+            detail={
+                'job_id': str(job_id),
+                'message': f'No history found for job - {job_id}.'
+            }
+        )
+
+    return history
+
+
+@storage_router.get(
+    '/store/watch',
+    response_class=StreamingResponse
+)
+async def watch_changes(
+    namespace: Optional[str]=None,
+    prefix: Optional[str]=None,
+    since: Optional[int]=None,
+    epoch: Optional[str]=None,
+    last_event_id: Optional[str]=Header(default=None)
+) -> StreamingResponse:
+    storage_service_context: StorageServiceContext = context.get(ContextType.STORAGE_SERVICE)
+    queue = storage_service_context.queue
+
+    # Reconnecting EventSource clients resume from the last
+    # event id they saw, formatted as <epoch>:<sequence>.
+    if since is None and last_event_id:
+        last_epoch, _, last_sequence = last_event_id.rpartition(':')
+
+        if last_sequence.isdigit():
+            since = int(last_sequence)
+            epoch = epoch or last_epoch or None
+
+    async def stream_changes():
+        async for change in queue.changes.watch(
+            namespace=namespace,
+            prefix=prefix,
+            since=since,
+            epoch=epoch,
+            heartbeat=queue.watch_heartbeat
+        ):
+            
+            if change is None:
+                yield ': heartbeat\n\n'
+
+            elif isinstance(change, ChangeEvent):
+                yield f'id: {change.epoch}:{change.sequence}\nevent: {change.operation}\ndata: {change.json()}\n\n'
+
+    return StreamingResponse(
+        stream_changes(),
+        media_type='text/event-stream',
+        headers={
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no'
+        }
+    )
+
+
+@storage_router.get('/store/quotas/{namespace}')
+async def get_namespace_quota(namespace: str) -> NamespaceUsage:
+    storage_service_context: StorageServiceContext = context.get(ContextType.STORAGE_SERVICE)
+
+    return storage_service_context.queue.namespace_usage(namespace)
+
+
+@storage_router.put('/store/quotas/{namespace}')
+async def set_namespace_quota(
+    namespace: str,
+    quota: NamespaceQuota
+) -> NamespaceUsage:
+    storage_service_context: StorageServiceContext = context.get(ContextType.STORAGE_SERVICE)
+
+    # Quotas are held per worker and not persisted, so this only
+    # applies to the worker serving the request until it restarts.
+    # Limits for every worker belong in the DCRX_KV_STORAGE_NAMESPACE_*
+    # settings.
+    queue = storage_service_context.queue
+    queue.quotas.set(namespace, quota)
+
+    return queue.namespace_usage(namespace)
+
+
+@storage_router.delete('/store/quotas/{namespace}')
+async def reset_namespace_quota(namespace: str) -> NamespaceUsage:
+    storage_service_context: StorageServiceContext = context.get(ContextType.STORAGE_SERVICE)
+
+    queue = storage_service_context.queue
+    queue.quotas.reset(namespace)
+
+    return queue.namespace_usage(namespace)
+
+
+@storage_router.post(
+    '/store/sign',
+    responses={
+        400: {
+            "model": ServerLimitException
+        }
+    }
+)
+async def sign_url(
+    signing_request: SignedUrlRequest,
+    request: Request
+) -> SignedUrl:
+    auth_service_context = context.get(ContextType.AUTH_SERVICE)
+    manager = auth_service_context.manager
+
+    username = getattr(request.state, 'username', None)
+    if manager.can_access(username, signing_request.namespace) is False:
+        raise HTTPException(
+            403,
+            detail={
+                'namespace': signing_request.namespace,
+                'message': f'User {username} may not sign URLs for namespace {signing_request.namespace}'
+            }
+        )
+
+    expires_in = TimeParser(signing_request.expires_in).time
+    if expires_in <= 0 or expires_in > manager.url_signer.max_age:
+        raise HTTPException(
+            400,
+            detail=ServerLimitException(
+                message=f'Signed URLs must expire within {manager.url_signer.max_age} seconds',
+                limit=manager.url_signer.max_age,
+                current=expires_in
+            ).dict()
+        )
+
+    signed_params = manager.url_signer.sign(
+        signing_request.operation,
+        signing_request.namespace,
+        key=signing_request.key,
+        expires_in=expires_in
+    )
+
+    query = urlencode(signed_params)
+
+    url: Optional[str] = None
+    if signing_request.key:
+        url = f'/store/{signing_request.operation}/{signing_request.namespace}/{signing_request.key}?{query}'
+
+    return SignedUrl(
+        operation=signing_request.operation,
+        scope=signed_params[URL_SCOPE_PARAM],
+        expires=int(signed_params[URL_EXPIRES_PARAM]),
+        query=query,
+        url=url
+    )
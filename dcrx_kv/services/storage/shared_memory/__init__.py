@@ -0,0 +1,2 @@
+from .shared_memory_fs import SharedMemoryFS
+from .shared_memory_writer import SharedMemoryWriter
@@ -0,0 +1,21 @@
+import struct
+
+
+ARENA_MAGIC = b'DCRXKV02'
+
+# magic, arena size, slot count, data offset, data head, live bytes, key count
+HEADER_FORMAT = struct.Struct('<8sQQQQQQ')
+HEADER_SIZE = 64
+
+# The last write's generation, counted across every worker.
+GENERATION_FORMAT = struct.Struct('<Q')
+GENERATION_OFFSET = HEADER_FORMAT.size
+
+# state, key length, value length, value offset, key hash, generation
+SLOT_FORMAT = struct.Struct('<BxHxxxxQQQQ')
+SLOT_SIZE = 256
+MAX_KEY_LENGTH = SLOT_SIZE - SLOT_FORMAT.size
+
+SLOT_EMPTY = 0
+SLOT_USED = 1
+SLOT_DELETED = 2
@@ -0,0 +1,653 @@
+import fcntl
+import hashlib
+import mmap
+import os
+import threading
+from contextlib import contextmanager
+from fs.errors import (
+    DestinationExists,
+    ResourceError,
+    ResourceNotFound
+)
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union
+)
+from .arena_layout import (
+    ARENA_MAGIC,
+    GENERATION_FORMAT,
+    GENERATION_OFFSET,
+    HEADER_FORMAT,
+    HEADER_SIZE,
+    SLOT_FORMAT,
+    SLOT_SIZE,
+    MAX_KEY_LENGTH,
+    SLOT_EMPTY,
+    SLOT_USED,
+    SLOT_DELETED
+)
+from .shared_memory_writer import SharedMemoryWriter
+
+
+class SharedMemoryFS:
+    """
+    A flat key/value store held in a memory-mapped arena file so
+    that every Uvicorn worker on a host shares one consistent view
+    of stored blobs. The arena holds a fixed-size, open-addressed
+    index followed by a bump-allocated data region which is compacted
+    in place when it fills. Access is serialized across processes
+    with flock and across threads with a process-local lock.
+
+    Values are placed in the arena whole, under a single lock, so
+    blobs opened for writing are buffered until closed. Each blob
+    is capped at max_blob_mb to bound that buffer.
+
+    Each write is stamped with a generation counted across workers,
+    so a worker expiring its own upload can tell whether another
+    worker has since replaced it.
+
+    Only blobs and the store totals in the arena header are shared.
+    Jobs, the change feed, per-namespace usage and quotas, and rate
+    limits stay per worker, so with more than one worker a watch or
+    a namespace quota only sees the writes of the worker it reached.
+
+    Implements the subset of the PyFilesystem API used by Job.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        size_mb: int=512,
+        max_keys: int=65536,
+        max_blob_mb: int=64
+    ) -> None:
+        self.path = path
+        self.closed = False
+
+        self._lock = threading.Lock()
+        self._fd = os.open(
+            path,
+            os.O_RDWR | os.O_CREAT,
+            0o600
+        )
+
+        requested_size = size_mb * 1024**2
+        slot_count = max_keys
+        data_offset = HEADER_SIZE + (slot_count * SLOT_SIZE)
+
+        if data_offset >= requested_size:
+            os.close(self._fd)
+            raise ValueError(
+                f'Shared memory arena of {size_mb}MB is too small to index {max_keys} keys.'
+            )
+
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+
+        try:
+            arena_size = os.fstat(self._fd).st_size
+            if arena_size < HEADER_SIZE or self._read_magic() != ARENA_MAGIC:
+                # Reserve the whole arena up front so an undersized
+                # tmpfs fails here rather than with SIGBUS mid-write.
+                os.ftruncate(self._fd, 0)
+                os.posix_fallocate(self._fd, 0, requested_size)
+                arena_size = requested_size
+
+                self._map = mmap.mmap(self._fd, arena_size)
+                self._map[:data_offset] = bytes(data_offset)
+                self._write_header(
+                    arena_size,
+                    slot_count,
+                    data_offset,
+                    0,
+                    0,
+                    0
+                )
+
+            else:
+                self._map = mmap.mmap(self._fd, arena_size)
+
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+        (
+            _,
+            self.arena_size,
+            self.slot_count,
+            self.data_offset,
+            _,
+            _,
+            _
+        ) = HEADER_FORMAT.unpack_from(self._map, 0)
+
+        self.data_size = self.arena_size - self.data_offset
+        self.max_blob_bytes = min(
+            max_blob_mb * 1024**2,
+            self.data_size
+        )
+
+    @contextmanager
+    def _locked(self, exclusive: bool=False):
+        with self._lock:
+            fcntl.flock(
+                self._fd,
+                fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH
+            )
+
+            try:
+                yield
+
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def _read_magic(self) -> bytes:
+        return os.pread(self._fd, len(ARENA_MAGIC), 0)
+
+    def _read_header(self) -> Tuple[int, int, int]:
+        (
+            _,
+            _,
+            _,
+            _,
+            data_head,
+            live_bytes,
+            key_count
+        ) = HEADER_FORMAT.unpack_from(self._map, 0)
+
+        return data_head, live_bytes, key_count
+
+    def _write_header(
+        self,
+        arena_size: int,
+        slot_count: int,
+        data_offset: int,
+        data_head: int,
+        live_bytes: int,
+        key_count: int
+    ):
+        HEADER_FORMAT.pack_into(
+            self._map,
+            0,
+            ARENA_MAGIC,
+            arena_size,
+            slot_count,
+            data_offset,
+            data_head,
+            live_bytes,
+            key_count
+        )
+
+    def _update_header(
+        self,
+        data_head: int,
+        live_bytes: int,
+        key_count: int
+    ):
+        self._write_header(
+            self.arena_size,
+            self.slot_count,
+            self.data_offset,
+            data_head,
+            live_bytes,
+            key_count
+        )
+
+    def _next_generation(self) -> int:
+        (generation,) = GENERATION_FORMAT.unpack_from(
+            self._map,
+            GENERATION_OFFSET
+        )
+
+        generation += 1
+        GENERATION_FORMAT.pack_into(
+            self._map,
+            GENERATION_OFFSET,
+            generation
+        )
+
+        return generation
+
+    def _encode_key(self, path: str) -> Tuple[bytes, int]:
+        key = path.strip('/').encode()
+        if len(key) > MAX_KEY_LENGTH:
+            raise ResourceError(
+                path,
+                msg=f'path {{path}} exceeds the {MAX_KEY_LENGTH} byte shared memory key limit'
+            )
+
+        key_hash = int.from_bytes(
+            hashlib.blake2b(key, digest_size=8).digest(),
+            'little'
+        )
+
+        return key, key_hash
+
+    def _slot_position(self, slot_idx: int) -> int:
+        return HEADER_SIZE + (slot_idx * SLOT_SIZE)
+
+    def _read_slot(self, slot_idx: int) -> Tuple[int, int, int, int, int, int]:
+        return SLOT_FORMAT.unpack_from(
+            self._map,
+            self._slot_position(slot_idx)
+        )
+
+    def _write_slot(
+        self,
+        slot_idx: int,
+        state: int,
+        key: bytes,
+        value_length: int,
+        value_offset: int,
+        key_hash: int,
+        generation: int=0
+    ):
+        position = self._slot_position(slot_idx)
+        key_position = position + SLOT_FORMAT.size
+
+        self._map[key_position:key_position + len(key)] = key
+        SLOT_FORMAT.pack_into(
+            self._map,
+            position,
+            state,
+            len(key),
+            value_length,
+            value_offset,
+            key_hash,
+            generation
+        )
+
+    def _find_slot(
+        self,
+        key: bytes,
+        key_hash: int
+    ) -> Tuple[Union[int, None], Union[int, None]]:
+        """
+        Returns the slot holding the key (if any) and the first slot
+        the key could be inserted into.
+        """
+
+        free_slot: Union[int, None] = None
+        slot_idx = key_hash % self.slot_count
+
+        for _ in range(self.slot_count):
+            (
+                state,
+                key_length,
+                _,
+                _,
+                slot_hash,
+                _
+            ) = self._read_slot(slot_idx)
+
+            if state == SLOT_EMPTY:
+                if free_slot is None:
+                    free_slot = slot_idx
+
+                return None, free_slot
+
+            elif state == SLOT_DELETED and free_slot is None:
+                free_slot = slot_idx
+
+            elif state == SLOT_USED and slot_hash == key_hash:
+                key_position = self._slot_position(slot_idx) + SLOT_FORMAT.size
+                if self._map[key_position:key_position + key_length] == key:
+                    return slot_idx, free_slot
+
+            slot_idx = (slot_idx + 1) % self.slot_count
+
+        return None, free_slot
+
+    def _live_slots(self) -> List[Tuple[int, bytes, int, int, int, int]]:
+        live: List[Tuple[int, bytes, int, int, int, int]] = []
+        for slot_idx in range(self.slot_count):
+            (
+                state,
+                key_length,
+                value_length,
+                value_offset,
+                key_hash,
+                generation
+            ) = self._read_slot(slot_idx)
+
+            if state == SLOT_USED:
+                key_position = self._slot_position(slot_idx) + SLOT_FORMAT.size
+                live.append((
+                    value_offset,
+                    self._map[key_position:key_position + key_length],
+                    value_length,
+                    key_hash,
+                    generation,
+                    slot_idx
+                ))
+
+        return live
+
+    def _compact(self) -> int:
+        """
+        Slides every live value to the front of the data region and
+        rebuilds the index without tombstones. Returns the new data head.
+        """
+
+        live = sorted(self._live_slots())
+
+        self._map[HEADER_SIZE:self.data_offset] = bytes(
+            self.data_offset - HEADER_SIZE
+        )
+
+        data_head = 0
+        for value_offset, key, value_length, key_hash, generation, _ in live:
+            if value_offset != data_head:
+                self._map.move(
+                    self.data_offset + data_head,
+                    self.data_offset + value_offset,
+                    value_length
+                )
+
+            _, free_slot = self._find_slot(key, key_hash)
+            self._write_slot(
+                free_slot,
+                SLOT_USED,
+                key,
+                value_length,
+                data_head,
+                key_hash,
+                generation
+            )
+
+            data_head += value_length
+
+        return data_head
+
+    def exists(self, path: str) -> bool:
+        key, key_hash = self._encode_key(path)
+
+        with self._locked():
+            slot_idx, _ = self._find_slot(key, key_hash)
+
+        return slot_idx is not None
+
+    def makedirs(
+        self,
+        path: str,
+        permissions=None,
+        recreate: bool=False
+    ):
+        # Keys are flat paths, so namespaces need no directory entries.
+        return self
+
+    def readbytes(self, path: str) -> bytes:
+        key, key_hash = self._encode_key(path)
+
+        with self._locked():
+            slot_idx, _ = self._find_slot(key, key_hash)
+            if slot_idx is None:
+                raise ResourceNotFound(path)
+
+            (
+                _,
+                _,
+                value_length,
+                value_offset,
+                _,
+                _
+            ) = self._read_slot(slot_idx)
+
+            start = self.data_offset + value_offset
+            return self._map[start:start + value_length]
+
+    def writebytes(
+        self,
+        path: str,
+        contents: bytes
+    ) -> int:
+        """
+        Stores the value, returning the generation it was written
+        under.
+        """
+
+        key, key_hash = self._encode_key(path)
+        value_length = len(contents)
+
+        if value_length > self.max_blob_bytes:
+            raise ResourceError(
+                path,
+                msg=f'{{path}} exceeds the {self.max_blob_bytes} byte shared memory blob limit'
+            )
+
+        with self._locked(exclusive=True):
+            data_head, live_bytes, key_count = self._read_header()
+            slot_idx, free_slot = self._find_slot(key, key_hash)
+
+            previous_length = 0
+            if slot_idx is not None:
+                previous_length = self._read_slot(slot_idx)[2]
+
+            if live_bytes - previous_length + value_length > self.data_size:
+                raise ResourceError(
+                    path,
+                    msg='insufficient shared memory to store {path}'
+                )
+
+            if slot_idx is None and free_slot is None:
+                raise ResourceError(
+                    path,
+                    msg='shared memory index is full, cannot store {path}'
+                )
+
+            if data_head + value_length > self.data_size:
+
+                if slot_idx is not None:
+                    self._write_slot(
+                        slot_idx,
+                        SLOT_DELETED,
+                        b'',
+                        0,
+                        0,
+                        0
+                    )
+
+                    live_bytes -= previous_length
+                    key_count -= 1
+                    previous_length = 0
+
+                data_head = self._compact()
+                slot_idx, free_slot = self._find_slot(key, key_hash)
+
+            start = self.data_offset + data_head
+            self._map[start:start + value_length] = contents
+
+            if slot_idx is None:
+                slot_idx = free_slot
+                key_count += 1
+
+            generation = self._next_generation()
+
+            self._write_slot(
+                slot_idx,
+                SLOT_USED,
+                key,
+                value_length,
+                data_head,
+                key_hash,
+                generation
+            )
+
+            self._update_header(
+                data_head + value_length,
+                live_bytes - previous_length + value_length,
+                key_count
+            )
+
+        return generation
+
+    def openbin(
+        self,
+        path: str,
+        mode: str='r',
+        buffering: int=-1,
+        **options
+    ) -> SharedMemoryWriter:
+        if 'w' not in mode:
+            raise ResourceError(
+                path,
+                msg='shared memory blobs may only be opened for writing, use readbytes to read {path}'
+            )
+
+        self._encode_key(path)
+
+        return SharedMemoryWriter(
+            path,
+            self.writebytes,
+            self.max_blob_bytes
+        )
+
+    def move(
+        self,
+        src_path: str,
+        dst_path: str,
+        overwrite: bool=False
+    ) -> int:
+        """
+        Points the destination key at the source's value and drops
+        the source key, so the value itself is never copied. Returns
+        the generation the destination was written under.
+        """
+
+        src_key, src_hash = self._encode_key(src_path)
+        dst_key, dst_hash = self._encode_key(dst_path)
+
+        with self._locked(exclusive=True):
+            data_head, live_bytes, key_count = self._read_header()
+            src_idx, _ = self._find_slot(src_key, src_hash)
+
+            if src_idx is None:
+                raise ResourceNotFound(src_path)
+
+            (
+                _,
+                _,
+                value_length,
+                value_offset,
+                _,
+                _
+            ) = self._read_slot(src_idx)
+
+            dst_idx, _ = self._find_slot(dst_key, dst_hash)
+            if dst_idx is not None and overwrite is False:
+                raise DestinationExists(dst_path)
+
+            self._write_slot(
+                src_idx,
+                SLOT_DELETED,
+                b'',
+                0,
+                0,
+                0
+            )
+
+            key_count -= 1
+
+            dst_idx, free_slot = self._find_slot(dst_key, dst_hash)
+            if dst_idx is None:
+                dst_idx = free_slot
+                key_count += 1
+
+            else:
+                live_bytes -= self._read_slot(dst_idx)[2]
+
+            generation = self._next_generation()
+
+            self._write_slot(
+                dst_idx,
+                SLOT_USED,
+                dst_key,
+                value_length,
+                value_offset,
+                dst_hash,
+                generation
+            )
+
+            self._update_header(
+                data_head,
+                live_bytes,
+                key_count
+            )
+
+        return generation
+
+    def remove(
+        self,
+        path: str,
+        generation: Optional[int]=None
+    ):
+        """
+        Removes the value, or when given a generation only the value
+        written under it, so a writer never removes a value another
+        worker has since replaced it with.
+        """
+
+        key, key_hash = self._encode_key(path)
+
+        with self._locked(exclusive=True):
+            data_head, live_bytes, key_count = self._read_header()
+            slot_idx, _ = self._find_slot(key, key_hash)
+
+            if slot_idx is None:
+                raise ResourceNotFound(path)
+
+            (
+                _,
+                _,
+                value_length,
+                value_offset,
+                _,
+                slot_generation
+            ) = self._read_slot(slot_idx)
+
+            if generation is not None and generation != slot_generation:
+                raise ResourceNotFound(path)
+
+            self._write_slot(
+                slot_idx,
+                SLOT_DELETED,
+                b'',
+                0,
+                0,
+                0
+            )
+
+            if value_offset + value_length == data_head:
+                data_head = value_offset
+
+            self._update_header(
+                data_head,
+                live_bytes - value_length,
+                key_count - 1
+            )
+
+    def listpaths(self) -> List[str]:
+        with self._locked():
+            return [
+                key.decode() for _, key, _, _, _, _ in self._live_slots()
+            ]
+
+    def usage(self) -> Dict[str, int]:
+        with self._locked():
+            data_head, live_bytes, key_count = self._read_header()
+
+        return {
+            'arena_bytes': self.arena_size,
+            'capacity_bytes': self.data_size,
+            'stored_bytes': live_bytes,
+            'allocated_bytes': data_head,
+            'keys': key_count,
+            'max_keys': self.slot_count
+        }
+
+    def close(self):
+        if self.closed is False:
+            self.closed = True
+            self._map.close()
+            os.close(self._fd)
@@ -0,0 +1,58 @@
+from fs.errors import ResourceError
+from typing import Callable
+
+
+class SharedMemoryWriter:
+    """
+    Buffers a blob and commits it to the arena when closed. Writes
+    past max_size fail as they arrive rather than at commit, so an
+    oversized upload is never held in memory whole.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        commit: Callable[[str, bytes], None],
+        max_size: int
+    ) -> None:
+        self.path = path
+        self.closed = False
+        self.max_size = max_size
+
+        self._buffer = bytearray()
+        self._commit = commit
+        self._discarded = False
+
+    def write(self, data: bytes) -> int:
+        if len(self._buffer) + len(data) > self.max_size:
+            self.discard()
+
+            raise ResourceError(
+                self.path,
+                msg=f'{{path}} exceeds the {self.max_size} byte shared memory blob limit'
+            )
+
+        self._buffer.extend(data)
+        return len(data)
+
+    def discard(self):
+        self._discarded = True
+        self._buffer = bytearray()
+
+    def close(self):
+        if self.closed is False:
+            self.closed = True
+
+            if self._discarded is False:
+                self._commit(
+                    self.path,
+                    bytes(self._buffer)
+                )
+
+            self._buffer = bytearray()
+
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *args):
+        self.close()
@@ -9,4 +9,11 @@ class JobStatus(Enum):
     DELETING='DELETING'
     DONE='DONE'
     FAILED='FAILED'
-    CANCELLED='CANCELLED'
\ No newline at end of file
+    CANCELLED='CANCELLED'
+
+
+FINISHED_STATUSES = [
+    JobStatus.DONE.value,
+    JobStatus.FAILED.value,
+    JobStatus.CANCELLED.value
+]
\ No newline at end of file
@@ -0,0 +1,147 @@
+import os
+from typing import Dict
+
+
+class NamespaceCounts:
+
+    __slots__ = (
+        'stored_bytes',
+        'keys',
+        'reserved_bytes'
+    )
+
+    def __init__(self) -> None:
+        self.stored_bytes = 0
+        self.keys = 0
+        self.reserved_bytes = 0
+
+
+class Reservation:
+    """
+    Bytes held for a single upload until it completes. Streams of
+    unknown or understated size grow it as they are written.
+    """
+
+    __slots__ = (
+        '_usage',
+        'path',
+        'size'
+    )
+
+    def __init__(
+        self,
+        usage: 'StoreUsage',
+        path: str,
+        size: int
+    ) -> None:
+        self._usage = usage
+        self.path = path
+        self.size = 0
+
+        self.grow(size)
+
+    def grow(self, size: int):
+        self._usage.reserve(self.path, size)
+        self.size += size
+
+    def release(self):
+        self._usage.release(self.path, self.size)
+        self.size = 0
+
+
+class StoreUsage:
+    """
+    Running count of stored keys and bytes, in total and per
+    namespace, updated as blobs are written and removed so reading
+    it never walks the store. Bytes of uploads still being written
+    are held as reservations until they complete.
+    """
+
+    def __init__(self) -> None:
+        self.stored_bytes = 0
+        self.reserved_bytes = 0
+        self._sizes: Dict[str, int] = {}
+        self._namespaces: Dict[str, NamespaceCounts] = {}
+
+    @property
+    def keys(self) -> int:
+        return len(self._sizes)
+
+    def contains(self, path: str) -> bool:
+        return path in self._sizes
+
+    def size(self, path: str) -> int:
+        return self._sizes.get(path, 0)
+
+    def namespace(self, namespace: str) -> NamespaceCounts:
+        counts = self._namespaces.get(namespace)
+        if counts is None:
+            return NamespaceCounts()
+
+        return counts
+
+    def _counts(self, namespace: str) -> NamespaceCounts:
+        counts = self._namespaces.get(namespace)
+        if counts is None:
+            counts = NamespaceCounts()
+            self._namespaces[namespace] = counts
+
+        return counts
+
+    def reserve(
+        self,
+        path: str,
+        size: int
+    ):
+        self.reserved_bytes += size
+        self._counts(
+            os.path.dirname(path)
+        ).reserved_bytes += size
+
+    def reservation(
+        self,
+        path: str,
+        size: int
+    ) -> Reservation:
+        return Reservation(self, path, size)
+
+    def release(
+        self,
+        path: str,
+        size: int
+    ):
+        self.reserved_bytes -= size
+        self._counts(
+            os.path.dirname(path)
+        ).reserved_bytes -= size
+
+    def record_write(
+        self,
+        path: str,
+        size: int
+    ):
+        counts = self._counts(
+            os.path.dirname(path)
+        )
+
+        previous_size = self._sizes.get(path)
+        if previous_size is None:
+            previous_size = 0
+            counts.keys += 1
+
+        self.stored_bytes += size - previous_size
+        counts.stored_bytes += size - previous_size
+        self._sizes[path] = size
+
+    def record_remove(self, path: str):
+        size = self._sizes.pop(path, None)
+        if size is None:
+            return
+        
+        counts = self._counts(
+            os.path.dirname(path)
+        )
+
+        self.stored_bytes -= size
+        counts.stored_bytes -= size
+        counts.keys -= 1
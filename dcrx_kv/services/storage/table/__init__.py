@@ -1 +1,3 @@
-from .storage_table import StorageTable
\ No newline at end of file
+from .job_history_table import JobHistoryTable
+from .storage_table import StorageTable
+from .storage_migrations import STORAGE_MIGRATIONS
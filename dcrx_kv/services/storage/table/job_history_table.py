@@ -0,0 +1,252 @@
+import re
+import sqlalchemy
+from datetime import (
+    datetime,
+    timezone
+)
+from dcrx_kv.database.table_types import TableTypes
+from sqlalchemy.engine import Dialect
+from sqlalchemy.sql import (
+    CompoundSelect,
+    Insert,
+    Select,
+    bindparam,
+    text
+)
+from sqlalchemy.sql.elements import TextClause
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Union
+)
+from .storage_mysql_table import StorageMySQLTable
+from .storage_postgres_table import StoragePostgresMySQLTable
+from .storage_sqllite_table import StorageSQLiteTable
+
+
+PARTITION_TIME_FORMAT = '%Y%m%d%H%M%S'
+
+
+class JobHistoryTable:
+    """
+    Append-only log of job status transitions, split into one
+    partition per interval of recorded_at. Postgres routes rows
+    through a range-partitioned parent table, while other dialects
+    rotate to a new table for each interval. Either way retention
+    drops whole partitions rather than deleting rows.
+    """
+
+    def __init__(
+        self,
+        history_table_name: str,
+        selected: Union[
+            StorageMySQLTable,
+            StoragePostgresMySQLTable,
+            StorageSQLiteTable
+        ],
+        partition_interval: int
+    ) -> None:
+        self.name = history_table_name
+        self.partition_interval = max(partition_interval, 1)
+        self.partitioned = selected.table_type == TableTypes.POSTGRES
+
+        # Job ids are stored as the blobs table stores them.
+        self._job_id_type = selected.table.c.id.type
+
+        self.types_map: Dict[str, Callable[[Any], Any]] = {
+            'job_id': selected.types_map.get('id'),
+            'key': lambda value: str(value),
+            'namespace': lambda value: str(value),
+            'path': lambda value: str(value),
+            'operation_type': lambda value: str(value),
+            'status': lambda value: str(value),
+            'context': lambda value: str(value),
+            'error': lambda value: str(value) if value else None,
+            'version': lambda value: int(value),
+            'recorded_at': lambda value: float(value)
+        }
+
+        self.decoders: Dict[str, Callable[[Any], Any]] = {}
+        if selected.decoders.get('id'):
+            self.decoders['job_id'] = selected.decoders.get('id')
+
+        self._partition_pattern = re.compile(
+            rf'^{re.escape(history_table_name)}_(\d{{14}})$'
+        )
+
+        self._partitions: Dict[int, sqlalchemy.Table] = {}
+        self._insert_templates: Dict[int, Insert] = {}
+
+        self.parent: Union[sqlalchemy.Table, None] = None
+        self._parent_insert: Union[Insert, None] = None
+
+        if self.partitioned:
+            self.parent = self._build(
+                history_table_name,
+                postgresql_partition_by='RANGE (recorded_at)'
+            )
+
+            self._parent_insert = self.parent.insert()
+
+    def _build(
+        self,
+        table_name: str,
+        **kwargs: Any
+    ) -> sqlalchemy.Table:
+        return sqlalchemy.Table(
+            table_name,
+            sqlalchemy.MetaData(),
+            sqlalchemy.Column(
+                'job_id',
+                self._job_id_type
+            ),
+            sqlalchemy.Column(
+                'key',
+                sqlalchemy.TEXT
+            ),
+            sqlalchemy.Column(
+                'namespace',
+                sqlalchemy.TEXT
+            ),
+            sqlalchemy.Column(
+                'path',
+                sqlalchemy.TEXT
+            ),
+            sqlalchemy.Column(
+                'operation_type',
+                sqlalchemy.TEXT
+            ),
+            sqlalchemy.Column(
+                'status',
+                sqlalchemy.TEXT
+            ),
+            sqlalchemy.Column(
+                'context',
+                sqlalchemy.TEXT
+            ),
+            sqlalchemy.Column(
+                'error',
+                sqlalchemy.TEXT
+            ),
+            sqlalchemy.Column(
+                'version',
+                sqlalchemy.Integer
+            ),
+            sqlalchemy.Column(
+                'recorded_at',
+                sqlalchemy.Double
+            ),
+            sqlalchemy.Index(
+                f'ix_{table_name}_job_id',
+                'job_id'
+            ),
+            **kwargs
+        )
+
+    def partition_start(self, timestamp: float) -> int:
+        return int(timestamp // self.partition_interval) * self.partition_interval
+
+    def partition_name(self, start: int) -> str:
+        period = datetime.fromtimestamp(
+            start,
+            timezone.utc
+        ).strftime(PARTITION_TIME_FORMAT)
+
+        return f'{self.name}_{period}'
+
+    def parse_partition(self, table_name: str) -> Optional[int]:
+        match = self._partition_pattern.match(table_name)
+        if match is None:
+            return None
+
+        period = datetime.strptime(
+            match.group(1),
+            PARTITION_TIME_FORMAT
+        ).replace(tzinfo=timezone.utc)
+
+        return int(period.timestamp())
+
+    def partition(self, start: int) -> sqlalchemy.Table:
+        table = self._partitions.get(start)
+        if table is None:
+            table = self._build(
+                self.partition_name(start)
+            )
+
+            self._partitions[start] = table
+
+        return table
+
+    def forget_partition(self, start: int):
+        self._partitions.pop(start, None)
+        self._insert_templates.pop(start, None)
+
+    def create_partition_statement(
+        self,
+        start: int,
+        dialect: Dialect
+    ) -> TextClause:
+        # Postgres only - SQLAlchemy has no construct for attaching
+        # a partition to its parent.
+        preparer = dialect.identifier_preparer
+
+        return text(
+            f'CREATE TABLE IF NOT EXISTS {preparer.quote(self.partition_name(start))} '
+            f'PARTITION OF {preparer.format_table(self.parent)} '
+            f'FOR VALUES FROM ({start}) TO ({start + self.partition_interval})'
+        )
+
+    def insert_template(self, start: int) -> Insert:
+        if self.partitioned:
+            return self._parent_insert
+
+        template = self._insert_templates.get(start)
+        if template is None:
+            template = self.partition(start).insert()
+            self._insert_templates[start] = template
+
+        return template
+
+    def entry_params(self, entry: Any) -> Dict[str, Any]:
+        return {
+            name: convert(
+                getattr(entry, name)
+            ) for name, convert in self.types_map.items()
+        }
+
+    def job_params(self, job_id: Any) -> Dict[str, Any]:
+        return {
+            'match_job_id': self.types_map.get('job_id')(job_id)
+        }
+
+    def select_by_job(
+        self,
+        starts: List[int]
+    ) -> Union[Select, CompoundSelect, None]:
+        if self.partitioned:
+            return self.parent.select().where(
+                self.parent.c.job_id == bindparam('match_job_id')
+            ).order_by(
+                self.parent.c.recorded_at,
+                self.parent.c.version
+            )
+
+        if len(starts) < 1:
+            return None
+
+        selects: List[Select] = []
+        for start in sorted(starts):
+            table = self.partition(start)
+            selects.append(
+                table.select().where(
+                    table.c.job_id == bindparam('match_job_id')
+                )
+            )
+
+        return sqlalchemy.union_all(*selects).order_by(
+            sqlalchemy.column('recorded_at'),
+            sqlalchemy.column('version')
+        )
@@ -0,0 +1,50 @@
+from dcrx_kv.database.migrations import (
+    Migration,
+    add_column,
+    create_indexes
+)
+from sqlalchemy import Table
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+
+async def add_updated_at(
+    connection: AsyncConnection,
+    table: Table
+):
+    # Existing rows are left null rather than backfilled, which
+    # would rewrite the whole table. Each row is stamped on its
+    # next write.
+    await add_column(
+        connection,
+        table,
+        table.c.updated_at
+    )
+
+
+async def add_indexes(
+    connection: AsyncConnection,
+    table: Table
+):
+    await create_indexes(
+        connection,
+        table,
+        sorted(
+            table.indexes,
+            key=lambda index: index.name
+        )
+    )
+
+
+STORAGE_MIGRATIONS = [
+    Migration(
+        1,
+        'Add updated_at to blobs',
+        add_updated_at
+    ),
+    Migration(
+        2,
+        'Add namespace, status and updated_at indexes to blobs',
+        add_indexes,
+        transactional=False
+    )
+]
@@ -62,6 +62,31 @@ class StorageMySQLTable:
             sqlalchemy.Column(
                 'error',
                 sqlalchemy.TEXT
+            ),
+            sqlalchemy.Column(
+                'updated_at',
+                sqlalchemy.Double
+            ),
+            sqlalchemy.Index(
+                f'ix_{users_table_name}_namespace_key',
+                'namespace',
+                'key',
+                mysql_length={
+                    'namespace': 255,
+                    'key': 255
+                }
+            ),
+            sqlalchemy.Index(
+                f'ix_{users_table_name}_status_updated_at',
+                'status',
+                'updated_at',
+                mysql_length={
+                    'status': 32
+                }
+            ),
+            sqlalchemy.Index(
+                f'ix_{users_table_name}_updated_at',
+                'updated_at'
             )
         )
 
@@ -95,5 +120,11 @@ class StorageMySQLTable:
             'error': lambda value: str(value) if value else None
         }
 
+        # Reverses types_map for the columns not stored as the
+        # type JobMetadata holds them in.
+        self.decoders = {
+            'id': lambda value: uuid.UUID(str(value))
+        }
+
         self.table_type = TableTypes.MYSQL
 
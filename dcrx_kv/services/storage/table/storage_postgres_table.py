@@ -63,6 +63,27 @@ class StoragePostgresMySQLTable:
             sqlalchemy.Column(
                 'error',
                 sqlalchemy.TEXT
+            ),
+            sqlalchemy.Column(
+                'updated_at',
+                sqlalchemy.Double
+            ),
+            sqlalchemy.Index(
+                f'ix_{users_table_name}_namespace_key',
+                'namespace',
+                'key',
+                postgresql_concurrently=True
+            ),
+            sqlalchemy.Index(
+                f'ix_{users_table_name}_status_updated_at',
+                'status',
+                'updated_at',
+                postgresql_concurrently=True
+            ),
+            sqlalchemy.Index(
+                f'ix_{users_table_name}_updated_at',
+                'updated_at',
+                postgresql_concurrently=True
             )
         )
 
@@ -96,4 +117,8 @@ class StoragePostgresMySQLTable:
             'error': lambda value: str(value) if value else None
         }
 
+        # Columns are returned as the types JobMetadata holds
+        # them in, so rows need no decoding.
+        self.decoders = {}
+
         self.table_type = TableTypes.POSTGRES
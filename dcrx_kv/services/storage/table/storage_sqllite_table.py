@@ -62,6 +62,24 @@ class StorageSQLiteTable:
             sqlalchemy.Column(
                 'error',
                 sqlalchemy.TEXT
+            ),
+            sqlalchemy.Column(
+                'updated_at',
+                sqlalchemy.Double
+            ),
+            sqlalchemy.Index(
+                f'ix_{users_table_name}_namespace_key',
+                'namespace',
+                'key'
+            ),
+            sqlalchemy.Index(
+                f'ix_{users_table_name}_status_updated_at',
+                'status',
+                'updated_at'
+            ),
+            sqlalchemy.Index(
+                f'ix_{users_table_name}_updated_at',
+                'updated_at'
             )
         )
 
@@ -95,4 +113,10 @@ class StorageSQLiteTable:
             'error': lambda value: str(value) if value else None
         }
 
+        # Reverses types_map for the columns not stored as the
+        # type JobMetadata holds them in.
+        self.decoders = {
+            'id': lambda value: uuid.UUID(value.decode() if isinstance(value, bytes) else value)
+        }
+
         self.table_type = TableTypes.SQLITE
@@ -1,9 +1,11 @@
+import time
 from pydantic import BaseModel
 from sqlalchemy.sql import (
     Select,
     Insert,
     Update,
-    Delete
+    Delete,
+    bindparam
 )
 from typing import (
     Literal, 
@@ -22,6 +24,28 @@ from .storage_sqllite_table import StorageSQLiteTable
 
 M = TypeVar('M', bound=BaseModel)
 
+
+# Re-creating a job for an existing path leaves its key, namespace
+# and path as they were, so only these columns are rewritten.
+JOB_COLUMNS = (
+    'id',
+    'filename',
+    'content_type',
+    'operation_type',
+    'backup_type',
+    'encoding',
+    'context',
+    'status',
+    'error'
+)
+
+STATUS_COLUMNS = (
+    'context',
+    'status',
+    'error'
+)
+
+
 class StorageTable(Generic[M]):
 
     def __init__(
@@ -54,6 +78,79 @@ class StorageTable(Generic[M]):
             StorageMySQLTable
         )(users_table_name)
 
+        # Templates are built once and executed with bound values, so
+        # the hot per-job statements skip expression building and
+        # reuse their cached compiled SQL.
+        table = self.selected.table
+        path_filter = self.selected.columns.get('path') == bindparam('match_path')
+
+        self.insert_template: Insert = table.insert()
+        self.select_by_path_template: Select = table.select().where(path_filter)
+        self.delete_by_path_template: Delete = table.delete().where(path_filter)
+
+        self.update_by_path_template: Update = table.update().where(
+            path_filter
+        ).values({
+            name: bindparam(name) for name in JOB_COLUMNS + ('updated_at',)
+        })
+
+        self.update_status_by_path_template: Update = table.update().where(
+            path_filter
+        ).values({
+            name: bindparam(name) for name in STATUS_COLUMNS + ('updated_at',)
+        })
+
+    def path_params(self, path: str) -> Dict[str, Any]:
+        return {
+            'match_path': self.selected.types_map.get('path')(path)
+        }
+
+    def insert_params(self, blob: M) -> Dict[str, Any]:
+        params = {
+            name: convert(
+                getattr(blob, name)
+            ) for name, convert in self.selected.types_map.items()
+        }
+
+        params['updated_at'] = time.time()
+
+        return params
+    
+    def update_by_path_params(self, blob: M) -> Dict[str, Any]:
+        types_map = self.selected.types_map
+
+        params = {
+            name: types_map.get(name)(
+                getattr(blob, name)
+            ) for name in JOB_COLUMNS
+        }
+
+        params.update(
+            self.path_params(blob.path)
+        )
+
+        params['updated_at'] = time.time()
+
+        return params
+    
+    def update_status_by_path_params(
+        self,
+        path: str,
+        values: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        # Status values are written as given, like update_values.
+        params = {
+            name: values.get(name) for name in STATUS_COLUMNS
+        }
+
+        params.update(
+            self.path_params(path)
+        )
+
+        params['updated_at'] = time.time()
+
+        return params
+
     def select(
         self, 
         filters: Optional[Dict[str, Any]]={}
@@ -116,6 +213,25 @@ class StorageTable(Generic[M]):
 
         return updates
     
+    def update_values(
+        self,
+        values: Dict[str, Any],
+        filters: Optional[Dict[str, Any]]={}
+    ) -> Update:
+        
+        update_clause: Update = self.selected.table.update()
+
+        for field_name, value in filters.items():
+            update_clause = update_clause.where(
+                self.selected.columns.get(field_name) == self.selected.types_map.get(
+                    field_name
+                )(value)
+            )
+
+        # Values are written as given, so callers pass only
+        # columns already held in their stored types.
+        return update_clause.values(values)
+    
     def delete(
         self,
         filters: Dict[str, Any]
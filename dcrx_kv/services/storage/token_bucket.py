@@ -0,0 +1,42 @@
+import time
+from typing import Union
+
+
+class TokenBucket:
+
+    __slots__ = (
+        'rate',
+        'burst',
+        'tokens',
+        'updated'
+    )
+
+    def __init__(
+        self,
+        rate: Union[int, float],
+        burst: int
+    ) -> None:
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+
+    def acquire(self) -> float:
+        """
+        Takes a token if one is available, returning 0, or else the
+        seconds until one will be.
+        """
+
+        now = time.monotonic()
+
+        self.tokens = min(
+            self.tokens + (now - self.updated) * self.rate,
+            self.burst
+        )
+        self.updated = now
+
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0
+
+        return (1 - self.tokens) / self.rate
@@ -2,7 +2,7 @@ from dcrx_kv.database import (
     DatabaseConnection,
     ConnectionConfig
 )
-from dcrx_api.database.models import DatabaseTransactionResult
+from dcrx_kv.database.models import DatabaseTransactionResult
 from dcrx_kv.env import Env
 from typing import (
     List,
@@ -42,11 +42,7 @@ class UsersConnection(DatabaseConnection[DBUser]):
     ) -> DatabaseTransactionResult[DBUser]:
         return await self.get(
             self.table.select(
-                filters={
-                    name: self.table.selected.types_map.get(
-                        name
-                    )(value) for name, value in filters.items()
-                }
+                filters=filters
             )
         )
 
@@ -66,11 +62,7 @@ class UsersConnection(DatabaseConnection[DBUser]):
         return await self.insert_or_update(
             self.table.update(
                 users,
-                filters={
-                    name: self.table.selected.types_map.get(
-                        name
-                    )(value) for name, value in filters.items()
-                }
+                filters=filters
             )
         )
     
@@ -79,11 +71,7 @@ class UsersConnection(DatabaseConnection[DBUser]):
         filters: Dict[str, Any]
     ) -> DatabaseTransactionResult[DBUser]:
         return await self.delete([
-            self.table.delete({
-                name: self.table.selected.types_map.get(
-                    name
-                )(value) for name, value in filters.items()
-            })
+            self.table.delete(filters)
         ])
     
     async def drop(self) -> DatabaseTransactionResult[DBUser]:
@@ -1,5 +1,8 @@
 import uuid
-from dcrx_kv.services.auth.models import AuthenticationFailureException
+from dcrx_kv.services.auth.models import (
+    AuthenticationFailureException,
+    PasswordHashingLimitException
+)
 from dcrx_kv.context.manager import context, ContextType
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import JSONResponse
@@ -22,6 +25,9 @@ users_router = APIRouter()
     responses={
         401: {
             "model": AuthenticationFailureException
+        },
+        429: {
+            "model": PasswordHashingLimitException
         }
     }
 )
@@ -35,7 +41,16 @@ async def login_user(user: LoginUser) -> UserTransactionSuccessResponse:
         user
     )
 
-    if authorization.error:
+    if isinstance(authorization, PasswordHashingLimitException):
+        raise HTTPException(
+            429,
+            detail=authorization.dict(),
+            headers={
+                'Retry-After': str(auth_service_context.manager.retry_after)
+            }
+        )
+
+    elif authorization.error:
         raise HTTPException(401, detail=authorization.error)
     
     success_response = UserTransactionSuccessResponse(
@@ -104,6 +119,9 @@ async def get_user(
     responses={
         401: {
             "model": AuthenticationFailureException
+        },
+        429: {
+            "model": PasswordHashingLimitException
         }
     }
 )
@@ -114,6 +132,15 @@ async def create_user(user: NewUser) -> UserTransactionSuccessResponse:
 
     hashed_password = await auth_service_context.manager.encrypt(user.password)
 
+    if isinstance(hashed_password, PasswordHashingLimitException):
+        raise HTTPException(
+            429,
+            detail=hashed_password.dict(),
+            headers={
+                'Retry-After': str(auth_service_context.manager.retry_after)
+            }
+        )
+
     await users_service_context.connection.create([
         DBUser(
             id=uuid.uuid4(),
@@ -139,11 +166,16 @@ async def create_user(user: NewUser) -> UserTransactionSuccessResponse:
 async def update_user(user: UpdatedUser) -> UserTransactionSuccessResponse:
 
     users_service_context = context.get(ContextType.USERS_SERVICE)
+    auth_service_context = context.get(ContextType.AUTH_SERVICE)
 
     await users_service_context.connection.update([
         user
     ])
 
+    # Updates are not scoped to a single user, so any cached
+    # verification may now be stale.
+    auth_service_context.manager.token_cache.clear()
+
     return UserTransactionSuccessResponse(
         message='Updated user.'
     )
@@ -161,6 +193,13 @@ async def update_user(user: UpdatedUser) -> UserTransactionSuccessResponse:
 async def delete_user(user_id: str) -> UserTransactionSuccessResponse:
 
     users_service_context = context.get(ContextType.USERS_SERVICE)
+    auth_service_context = context.get(ContextType.AUTH_SERVICE)
+
+    users = await users_service_context.connection.select(
+        filters={
+            'id': user_id
+        }
+    )
 
     await users_service_context.connection.remove(
         filters={
@@ -168,6 +207,10 @@ async def delete_user(user_id: str) -> UserTransactionSuccessResponse:
         }
     )
 
+    if users.data:
+        for user in users.data:
+            auth_service_context.manager.token_cache.invalidate_user(user.username)
+
     return UserTransactionSuccessResponse(
         message='Deleted user.'
     )
\ No newline at end of file
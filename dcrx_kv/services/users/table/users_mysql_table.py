@@ -1,6 +1,6 @@
 import sqlalchemy
 import uuid
-from dcrx_api.database.table_types import TableTypes
+from dcrx_kv.database.table_types import TableTypes
 
 
 class UsersMySQLTable:
@@ -0,0 +1,10 @@
+from .exporter import InMemoryExporter
+from .span import (
+    Span,
+    TraceRecord
+)
+from .tracer import (
+    SpanScope,
+    Tracer,
+    tracer
+)
@@ -0,0 +1,31 @@
+from collections import deque
+from typing import (
+    Deque,
+    List,
+    Optional
+)
+from .span import TraceRecord
+
+
+class InMemoryExporter:
+    """
+    Keeps the most recent sampled traces. Spans of work that
+    outlives the request, such as background upload jobs, are still
+    added to their trace after it has been exported.
+    """
+
+    def __init__(self, max_traces: int=1000) -> None:
+        self.traces: Deque[TraceRecord] = deque(maxlen=max_traces)
+
+    def export(self, record: TraceRecord):
+        self.traces.append(record)
+
+    def get(self, trace_id: str) -> Optional[TraceRecord]:
+        for record in self.traces:
+            if record.trace_id == trace_id:
+                return record
+
+        return None
+
+    def recent(self) -> List[TraceRecord]:
+        return list(reversed(self.traces))
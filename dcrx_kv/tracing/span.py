@@ -0,0 +1,68 @@
+import time
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional
+)
+
+
+class TraceRecord:
+
+    __slots__ = (
+        'trace_id',
+        'spans'
+    )
+
+    def __init__(self, trace_id: str) -> None:
+        self.trace_id = trace_id
+        self.spans: List['Span'] = []
+
+
+class Span:
+
+    __slots__ = (
+        'record',
+        'span_id',
+        'parent_id',
+        'name',
+        'start',
+        'duration',
+        'attributes',
+        'error',
+        '_started'
+    )
+
+    def __init__(
+        self,
+        record: TraceRecord,
+        span_id: str,
+        parent_id: Optional[str],
+        name: str,
+        attributes: Dict[str, Any]
+    ) -> None:
+        self.record = record
+        self.span_id = span_id
+        self.parent_id = parent_id
+        self.name = name
+        self.attributes = attributes
+        self.error: Optional[str] = None
+        self.duration: Optional[float] = None
+
+        self.start = time.time()
+        self._started = time.perf_counter()
+
+    @property
+    def trace_id(self) -> str:
+        return self.record.trace_id
+
+    def set(
+        self,
+        name: str,
+        value: Any
+    ):
+        self.attributes[name] = value
+
+    def finish(self):
+        self.duration = time.perf_counter() - self._started
+        self.record.spans.append(self)
@@ -0,0 +1,192 @@
+import contextvars
+import functools
+import os
+import random
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Optional,
+    TypeVar,
+    Union
+)
+from .exporter import InMemoryExporter
+from .span import (
+    Span,
+    TraceRecord
+)
+
+
+T = TypeVar('T')
+
+
+current_span: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar(
+    'dcrx_kv_current_span',
+    default=None
+)
+
+
+class SpanScope:
+    """
+    Opens a span as a child of the current one on enter and makes it
+    current until exit. Outside a sampled trace it does nothing.
+    """
+
+    __slots__ = (
+        'span',
+        '_name',
+        '_attributes',
+        '_token'
+    )
+
+    def __init__(
+        self,
+        name: str,
+        attributes: dict
+    ) -> None:
+        self.span: Optional[Span] = None
+        self._name = name
+        self._attributes = attributes
+        self._token = None
+
+    def __enter__(self) -> Optional[Span]:
+        parent = current_span.get()
+        if parent is None:
+            return None
+
+        self.span = Span(
+            parent.record,
+            os.urandom(8).hex(),
+            parent.span_id,
+            self._name,
+            self._attributes
+        )
+
+        self._token = current_span.set(self.span)
+
+        return self.span
+
+    def __exit__(self, exc_type, exc, traceback):
+        if self.span is None:
+            return
+
+        if exc is not None:
+            self.span.error = repr(exc)
+
+        current_span.reset(self._token)
+        self.span.finish()
+
+
+class Tracer:
+
+    def __init__(
+        self,
+        sample_rate: float=0,
+        max_traces: int=1000
+    ) -> None:
+        self.sample_rate = sample_rate
+        self.exporter = InMemoryExporter(max_traces=max_traces)
+
+    def configure(
+        self,
+        sample_rate: float,
+        max_traces: int
+    ):
+        self.sample_rate = sample_rate
+        self.exporter = InMemoryExporter(max_traces=max_traces)
+
+    def start_trace(
+        self,
+        name: str,
+        force: bool=False,
+        **attributes: Any
+    ) -> Optional[Span]:
+        """
+        Starts a root span if this trace is sampled (or forced) and
+        makes it current, returning None otherwise.
+        """
+
+        if force is False and (self.sample_rate <= 0 or random.random() >= self.sample_rate):
+            return None
+
+        trace_id = os.urandom(16).hex()
+        root = Span(
+            TraceRecord(trace_id),
+            os.urandom(8).hex(),
+            None,
+            name,
+            attributes
+        )
+
+        current_span.set(root)
+
+        return root
+
+    def end_trace(self, root: Optional[Span]):
+        if root is None:
+            return
+
+        current_span.set(None)
+
+        root.finish()
+        self.exporter.export(root.record)
+
+    def span(
+        self,
+        name: str,
+        **attributes: Any
+    ) -> SpanScope:
+        return SpanScope(name, attributes)
+
+    def traced(
+        self,
+        name: str
+    ) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+        """
+        Decorates a coroutine function to run under a span.
+        """
+
+        def decorator(function: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+
+            @functools.wraps(function)
+            async def run_traced(*args: Any, **kwargs: Any) -> T:
+                if current_span.get() is None:
+                    return await function(*args, **kwargs)
+
+                with SpanScope(name, {}):
+                    return await function(*args, **kwargs)
+
+            return run_traced
+
+        return decorator
+
+    def wrap(
+        self,
+        name: Union[str, None],
+        function: Callable[..., T],
+        *args: Any,
+        **kwargs: Any
+    ) -> Callable[[], T]:
+        """
+        Binds a call for run_in_executor so it runs in a copy of the
+        caller's context, under a span of its own if named. Executor
+        threads do not otherwise inherit context variables.
+        """
+
+        if current_span.get() is None:
+            return functools.partial(function, *args, **kwargs)
+
+        def run_traced():
+            if name is None:
+                return function(*args, **kwargs)
+
+            with SpanScope(name, {}):
+                return function(*args, **kwargs)
+
+        return functools.partial(
+            contextvars.copy_context().run,
+            run_traced
+        )
+
+
+tracer = Tracer()
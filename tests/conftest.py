@@ -0,0 +1,102 @@
+import httpx
+import pytest
+import uuid
+from dcrx_kv.bench.client import (
+    BenchClient,
+    bench_client
+)
+from dcrx_kv.context.manager import context, ContextType
+from dcrx_kv.services.users.models import DBUser
+from typing import AsyncIterator
+
+
+SECRET_KEY = 'test-secret-key-test-secret-key-0'
+
+
+@pytest.fixture
+def anyio_backend():
+    return 'asyncio'
+
+
+@pytest.fixture
+def env_vars(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv('DCRX_KV_SECRET_KEY', SECRET_KEY)
+    monkeypatch.setenv('DCRX_KV_DATABASE_TYPE', 'sqlite')
+    monkeypatch.setenv(
+        'DCRX_KV_DATABASE_NAME',
+        str(tmp_path / 'dcrx.db')
+    )
+
+    return monkeypatch
+
+
+@pytest.fixture
+async def client(env_vars) -> AsyncIterator[BenchClient]:
+    """
+    Runs the app in-process, through its lifespan, with requests
+    signed as a cluster node.
+    """
+
+    async with bench_client(timeout=30) as app_client:
+        yield app_client
+
+
+async def signed_request(
+    client: BenchClient,
+    method: str,
+    path: str,
+    **kwargs
+) -> httpx.Response:
+    """
+    Sends a request built with any httpx arguments (params, files,
+    streamed content), signed as a cluster node over its encoded
+    body.
+    """
+
+    request = client.client.build_request(
+        method,
+        path,
+        **kwargs
+    )
+
+    body = await request.aread()
+
+    request.headers.update(
+        client.signer.sign(
+            method,
+            request.url.path,
+            request.url.query.decode(),
+            body=body
+        )
+    )
+
+    return await client.client.send(request)
+
+
+async def login_user(
+    client: BenchClient,
+    username: str,
+    password: str='test-password'
+):
+    """
+    Creates a user and logs the client in as them, so requests are
+    authenticated by token rather than signed as a node.
+    """
+
+    auth_service_context = context.get(ContextType.AUTH_SERVICE)
+    users_service_context = context.get(ContextType.USERS_SERVICE)
+
+    await users_service_context.connection.create([
+        DBUser(
+            id=uuid.uuid4(),
+            username=username,
+            first_name='Test',
+            last_name='User',
+            email=f'{username}@dcrx-kv.test',
+            disabled=False,
+            hashed_password=await auth_service_context.manager.encrypt(password)
+        )
+    ])
+
+    await client.login(username, password)
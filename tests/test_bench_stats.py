@@ -0,0 +1,120 @@
+import pytest
+import random
+from collections import Counter
+from dcrx_kv.bench import (
+    KeyChooser,
+    OperationMix,
+    ValueSizes,
+    parse_mix
+)
+from dcrx_kv.bench.stats import (
+    OperationRecorder,
+    percentile
+)
+
+
+def test_percentiles_report_observed_values():
+    ordered = [float(value) for value in range(1, 1001)]
+
+    assert percentile([], 99) == 0.0
+    assert percentile([0.5], 99.9) == 0.5
+    assert percentile(ordered, 0) == 1
+    assert percentile(ordered, 50) == 500
+    assert percentile(ordered, 95) == 950
+    assert percentile(ordered, 99) == 990
+    assert percentile(ordered, 99.9) == 999
+    assert percentile(ordered, 100) == 1000
+
+
+def test_recorders_summarize_latencies_in_milliseconds():
+    recorder = OperationRecorder('read')
+
+    for latency in [0.004, 0.001, 0.003, 0.002]:
+        recorder.record(latency, '200', False, size=10)
+
+    recorder.record(0.010, '500', True)
+
+    stats = recorder.summarize(2.0)
+
+    assert stats.count == 5
+    assert stats.errors == 1
+    assert stats.statuses == {'200': 4, '500': 1}
+    assert stats.bytes == 40
+    assert stats.throughput == 2.5
+    assert stats.mean_ms == pytest.approx(4)
+    assert stats.p50_ms == pytest.approx(3)
+    assert stats.p99_ms == pytest.approx(10)
+    assert stats.max_ms == pytest.approx(10)
+
+
+def test_empty_recorders_summarize_to_zero():
+    stats = OperationRecorder('read').summarize(0)
+
+    assert stats.count == 0
+    assert stats.throughput == 0
+    assert stats.p99_ms == 0
+    assert stats.max_ms == 0
+
+
+def test_mixes_are_weighted():
+    assert parse_mix('read=80, write=15,delete=5') == {
+        'read': 80,
+        'write': 15,
+        'delete': 5
+    }
+
+    with pytest.raises(ValueError):
+        parse_mix('scan=10')
+
+    with pytest.raises(ValueError):
+        parse_mix('read=0')
+
+    generator = random.Random(1)
+    mix = OperationMix(parse_mix('read=3,write=1,delete=0'))
+
+    operations = Counter(
+        mix.choose(generator) for _ in range(10000)
+    )
+
+    assert set(operations) == {'read', 'write'}
+    assert operations['read'] / operations['write'] == pytest.approx(3, rel=0.1)
+
+
+def test_zipf_keys_are_skewed():
+    generator = random.Random(1)
+
+    uniform = Counter(
+        KeyChooser(100).choose(generator) for _ in range(10000)
+    )
+
+    zipf = Counter(
+        KeyChooser(100, distribution='zipf').choose(generator) for _ in range(10000)
+    )
+
+    assert max(uniform.values()) < 200
+    assert zipf.most_common(1)[0][0] == 'key-0'
+    assert zipf['key-0'] > 1500
+
+    with pytest.raises(ValueError):
+        KeyChooser(0)
+
+
+def test_value_sizes_stay_in_bounds():
+    generator = random.Random(1)
+
+    assert ValueSizes('fixed:4kb').sample(generator) == 4096
+
+    uniform = ValueSizes('uniform:1kb-2kb')
+
+    assert all(
+        1024 <= uniform.sample(generator) <= 2048 for _ in range(1000)
+    )
+
+    lognormal = ValueSizes('lognormal:1kb,2', max_size=8192)
+
+    assert all(
+        1 <= lognormal.sample(generator) <= 8192 for _ in range(1000)
+    )
+
+    with pytest.raises(ValueError):
+        ValueSizes('uniform:2kb-1kb')
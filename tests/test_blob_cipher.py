@@ -0,0 +1,104 @@
+import os
+import pytest
+from dcrx_kv.env import Env
+from dcrx_kv.services.storage.encryption import (
+    BlobCipher,
+    BlobDecryptionError,
+    NamespaceEncryption
+)
+from dcrx_kv.services.storage.encryption.chunk_format import (
+    HEADER_SIZE,
+    TAG_SIZE
+)
+from conftest import SECRET_KEY
+
+
+CHUNK_SIZE = 16
+
+
+@pytest.fixture
+def cipher():
+    return BlobCipher(
+        os.urandom(32),
+        chunk_size=CHUNK_SIZE
+    )
+
+
+def encrypt(
+    cipher: BlobCipher,
+    path: str,
+    data: bytes,
+    write_size: int
+) -> bytes:
+    encryptor = cipher.encryptor(path)
+    sealed = [encryptor.header()]
+
+    for offset in range(0, len(data), write_size):
+        sealed.append(
+            encryptor.update(data[offset:offset + write_size])
+        )
+
+    sealed.append(encryptor.finalize())
+
+    return b''.join(sealed)
+
+
+@pytest.mark.parametrize('size', [0, 1, CHUNK_SIZE - 1, CHUNK_SIZE, CHUNK_SIZE + 1, CHUNK_SIZE * 3])
+@pytest.mark.parametrize('write_size', [1, 5, CHUNK_SIZE, 100])
+def test_round_trip(cipher, size, write_size):
+    data = os.urandom(size)
+    sealed = encrypt(cipher, 'tests/key', data, write_size)
+
+    chunk_count = max(-(-size // CHUNK_SIZE), 1)
+
+    assert len(sealed) == HEADER_SIZE + size + chunk_count * TAG_SIZE
+    assert cipher.decrypt('tests/key', sealed) == data
+
+
+def test_ciphertext_is_bound_to_its_path(cipher):
+    sealed = encrypt(cipher, 'tests/key', b'value', CHUNK_SIZE)
+
+    with pytest.raises(BlobDecryptionError):
+        cipher.decrypt('tests/other', sealed)
+
+
+def test_dropped_or_reordered_chunks_fail(cipher):
+    sealed = encrypt(cipher, 'tests/key', os.urandom(CHUNK_SIZE * 3), CHUNK_SIZE)
+    sealed_size = CHUNK_SIZE + TAG_SIZE
+
+    header = sealed[:HEADER_SIZE]
+    chunks = [
+        sealed[offset:offset + sealed_size] for offset in range(HEADER_SIZE, len(sealed), sealed_size)
+    ]
+
+    with pytest.raises(BlobDecryptionError):
+        cipher.decrypt('tests/key', header + b''.join(chunks[:-1]))
+
+    with pytest.raises(BlobDecryptionError):
+        cipher.decrypt('tests/key', header + chunks[1] + chunks[0] + chunks[2])
+
+
+def test_plaintext_is_rejected(cipher):
+    with pytest.raises(BlobDecryptionError):
+        cipher.decrypt('tests/key', b'x' * 100)
+
+
+def test_namespace_ciphers():
+    encryption = NamespaceEncryption(
+        Env(
+            DCRX_KV_SECRET_KEY=SECRET_KEY,
+            DCRX_KV_STORAGE_ENCRYPTED_NAMESPACES='secure, private'
+        )
+    )
+
+    assert encryption.cipher('tests') is None
+
+    secure = encryption.cipher('secure')
+    private = encryption.cipher('private')
+
+    assert encryption.cipher('secure') is secure
+
+    sealed = encrypt(secure, 'shared/key', b'value', CHUNK_SIZE)
+
+    with pytest.raises(BlobDecryptionError):
+        private.decrypt('shared/key', sealed)
@@ -0,0 +1,83 @@
+import pytest
+from dcrx_kv.services.storage.change_feed import ChangeFeed
+from dcrx_kv.services.storage.models import BlobChange
+
+
+pytestmark = pytest.mark.anyio
+
+
+def change(namespace: str, key: str) -> BlobChange:
+    return BlobChange(
+        operation='upload',
+        namespace=namespace,
+        key=key,
+        path=f'{namespace}/{key}'
+    )
+
+
+async def test_watch_filters_by_namespace_and_prefix():
+    feed = ChangeFeed()
+
+    for namespace, key in [
+        ('tests', 'a-1'),
+        ('other', 'a-2'),
+        ('tests', 'b-1'),
+        ('tests', 'a-3')
+    ]:
+        feed.append(change(namespace, key))
+
+    watch = feed.watch(
+        namespace='tests',
+        prefix='a-',
+        since=0
+    )
+
+    assert [(await watch.__anext__()).key for _ in range(2)] == ['a-1', 'a-3']
+
+    await watch.aclose()
+
+
+async def test_watch_heartbeats_while_idle():
+    feed = ChangeFeed()
+    watch = feed.watch(heartbeat=0.01)
+
+    assert await watch.__anext__() is None
+
+    feed.append(change('tests', 'key'))
+
+    assert (await watch.__anext__()).sequence == 1
+
+    await watch.aclose()
+
+
+async def test_watchers_behind_the_buffer_are_reset():
+    feed = ChangeFeed(max_size=2)
+
+    for idx in range(3):
+        feed.append(change('tests', f'key-{idx}'))
+
+    assert feed.first_sequence == 2
+    assert [event.sequence for event in feed.read_after(0)] == [2, 3]
+
+    watch = feed.watch(since=0)
+    reset = await watch.__anext__()
+
+    assert reset.operation == 'reset'
+    assert reset.sequence == 3
+
+    await watch.aclose()
+
+
+async def test_watchers_from_another_epoch_are_reset():
+    feed = ChangeFeed()
+    feed.append(change('tests', 'key'))
+
+    watch = feed.watch(since=1, epoch='stale')
+
+    assert (await watch.__anext__()).operation == 'reset'
+
+    feed.append(change('tests', 'other'))
+
+    assert (await watch.__anext__()).key == 'other'
+
+    await watch.aclose()
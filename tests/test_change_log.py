@@ -0,0 +1,58 @@
+import asyncio
+import pytest
+from dcrx_kv.services.replication.change_log import ChangeLog
+from dcrx_kv.services.storage.models import BlobChange
+
+
+pytestmark = pytest.mark.anyio
+
+
+def change(key: str, operation: str='upload') -> BlobChange:
+    return BlobChange(
+        operation=operation,
+        namespace='tests',
+        key=key,
+        path=f'tests/{key}'
+    )
+
+
+async def test_positions_and_retention():
+    log = ChangeLog(max_size=2)
+
+    assert log.first_position == 1
+    assert log.read_after(0) == []
+
+    for key in ['first', 'second', 'third']:
+        log.append(change(key))
+
+    assert log.position == 3
+    assert log.first_position == 2
+    assert log.get(1) is None
+    assert log.get(3).path == 'tests/third'
+
+    assert [record.position for record in log.read_after(0)] == [2, 3]
+    assert [record.position for record in log.read_after(2)] == [3]
+    assert log.read_after(3) == []
+
+
+async def test_expiry_is_logged_as_delete():
+    log = ChangeLog()
+
+    record = log.append(change('key', operation='expire'))
+
+    assert record.operation == 'delete'
+    assert record.epoch == log.epoch
+
+
+async def test_wait_wakes_on_append():
+    log = ChangeLog()
+
+    assert await log.wait(0, 0.01) is False
+
+    waiter = asyncio.create_task(log.wait(0, 5))
+    await asyncio.sleep(0)
+
+    log.append(change('key'))
+
+    assert await waiter is True
+    assert await log.wait(0, 0.01) is True
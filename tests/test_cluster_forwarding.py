@@ -0,0 +1,206 @@
+import asyncio
+import httpx
+import pytest
+import uuid
+from dcrx_kv.context.manager import context, ContextType
+from dcrx_kv.middleware.cluster_middleware import ClusterMiddleware
+from dcrx_kv.services.cluster.ring import new_job_id
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+
+
+pytestmark = pytest.mark.anyio
+
+
+NODE_ADDRESS = 'http://node-a'
+PEER_ADDRESS = 'http://node-b'
+
+
+class Node:
+    """
+    Answers every request with the name of the node, recording the
+    request and its body.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.received = []
+
+    async def __call__(self, scope, receive, send):
+        request = Request(scope, receive)
+        body = await request.body()
+
+        self.received.append((request, body))
+
+        response = JSONResponse({
+            'node': self.name
+        })
+
+        await response(scope, receive, send)
+
+
+@pytest.fixture
+def env_vars(env_vars):
+    env_vars.setenv('DCRX_KV_CLUSTER_NODE_ADDRESS', NODE_ADDRESS)
+    env_vars.setenv('DCRX_KV_CLUSTER_NODES', NODE_ADDRESS)
+
+    return env_vars
+
+
+@pytest.fixture
+async def peer(client):
+    manager = context.get(ContextType.CLUSTER_SERVICE).manager
+
+    peer = Node('peer')
+
+    await manager._client.aclose()
+    manager._client = httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=peer)
+    )
+
+    manager.ring.update([NODE_ADDRESS, PEER_ADDRESS])
+
+    return peer
+
+
+@pytest.fixture
+async def node(peer):
+    local = Node('local')
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(
+            app=ClusterMiddleware(local)
+        ),
+        base_url=NODE_ADDRESS
+    ) as node_client:
+        yield local, node_client
+
+
+def key_owned_by(address: str) -> str:
+    manager = context.get(ContextType.CLUSTER_SERVICE).manager
+
+    return next(
+        f'key-{idx}' for idx in range(1000) if manager.ring.owner(f'tests/key-{idx}') == address
+    )
+
+
+async def test_blob_requests_are_forwarded_to_their_owner(node, peer):
+    local, node_client = node
+    manager = context.get(ContextType.CLUSTER_SERVICE).manager
+
+    key = key_owned_by(PEER_ADDRESS)
+
+    response = await node_client.put(
+        f'/store/put/raw/tests/{key}',
+        params={
+            'filename': key
+        },
+        content=b'value',
+        headers={
+            'authorization': 'Bearer token'
+        }
+    )
+
+    assert response.json() == {'node': 'peer'}
+    assert len(local.received) == 0
+
+    request, body = peer.received[0]
+
+    assert request.url.path == f'/store/put/raw/tests/{key}'
+    assert request.url.query == f'filename={key}'
+    assert request.headers['authorization'] == 'Bearer token'
+    assert body == b'value'
+
+    # The relay signature stops the owner forwarding it on, but
+    # does not stand in for the caller's credentials.
+    assert manager.signer.verify(request, signed_payload=False)
+    assert manager.signer.verify(request) is False
+
+    response = await node_client.get(
+        f'/store/get/tests/{key_owned_by(NODE_ADDRESS)}'
+    )
+
+    assert response.json() == {'node': 'local'}
+
+
+async def test_job_requests_are_forwarded_to_the_node_that_ran_them(node, peer):
+    local, node_client = node
+
+    response = await node_client.get(
+        f'/store/jobs/{new_job_id(PEER_ADDRESS)}/history'
+    )
+
+    assert response.json() == {'node': 'peer'}
+
+    for job_id in [
+        new_job_id(NODE_ADDRESS),
+        uuid.uuid4(),
+        'not-a-job-id'
+    ]:
+        response = await node_client.get(f'/store/jobs/{job_id}')
+
+        assert response.json() == {'node': 'local'}
+
+    assert len(peer.received) == 1
+
+
+async def test_relayed_requests_are_served_locally(node, peer):
+    local, node_client = node
+    manager = context.get(ContextType.CLUSTER_SERVICE).manager
+
+    path = f'/store/get/tests/{key_owned_by(PEER_ADDRESS)}'
+
+    response = await node_client.get(
+        path,
+        headers=manager.sign('GET', path, body=None)
+    )
+
+    assert response.json() == {'node': 'local'}
+    assert len(peer.received) == 0
+
+
+async def test_rebalance_moves_blobs_and_emits_evictions(client):
+    manager = context.get(ContextType.CLUSTER_SERVICE).manager
+    queue = context.get(ContextType.STORAGE_SERVICE).queue
+
+    manager.ring.update([NODE_ADDRESS, PEER_ADDRESS])
+    key = key_owned_by(PEER_ADDRESS)
+    manager.ring.update([NODE_ADDRESS])
+
+    response = await client.request(
+        'PUT',
+        f'/store/put/raw/tests/{key}',
+        content=b'value'
+    )
+
+    assert response.status_code == 200
+
+    peer = Node('peer')
+
+    await manager._client.aclose()
+    manager._client = httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=peer)
+    )
+
+    await manager.update_members(
+        [NODE_ADDRESS, PEER_ADDRESS],
+        queue
+    )
+
+    async with asyncio.timeout(5):
+        await manager._rebalance_task
+
+    assert manager.moved == 1
+    assert await queue.list_paths() == []
+
+    request, body = peer.received[0]
+
+    assert request.url.path == f'/store/put/raw/tests/{key}'
+    assert body == b'value'
+    assert manager.signer.verify(request)
+    assert manager.signer.verify_body(request, body)
+
+    change = queue.changes.read_after(0)[-1]
+
+    assert change.operation == 'evict'
+    assert change.path == f'tests/{key}'
@@ -0,0 +1,53 @@
+import pytest
+from dcrx_kv.context.manager import context, ContextType
+
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def env_vars(env_vars):
+    env_vars.setenv('DCRX_KV_STORAGE_ENCRYPTED_NAMESPACES', 'secure')
+
+    return env_vars
+
+
+async def test_encrypted_blob_round_trips(client):
+    response = await client.request(
+        'PUT',
+        '/store/put/raw/secure/key',
+        content=b'value'
+    )
+
+    assert response.status_code == 200
+
+    queue = context.get(ContextType.STORAGE_SERVICE).queue
+    stored = await queue.read_path('secure/key')
+
+    assert b'value' not in stored
+
+    response = await client.request('GET', '/store/get/secure/key')
+
+    assert response.status_code == 200
+    assert response.content == b'value'
+
+
+async def test_tampered_blob_is_rejected(client):
+    await client.request(
+        'PUT',
+        '/store/put/raw/secure/key',
+        content=b'value'
+    )
+
+    queue = context.get(ContextType.STORAGE_SERVICE).queue
+    stored = bytearray(
+        await queue.read_path('secure/key')
+    )
+
+    stored[-1] ^= 0xFF
+    await queue.write_path('secure/key', bytes(stored))
+
+    response = await client.request('GET', '/store/get/secure/key')
+
+    assert response.status_code == 409
+    assert response.content != b''
@@ -0,0 +1,50 @@
+import pytest
+import time
+from dcrx_kv.services.replication.frame_reader import FrameReader
+from dcrx_kv.services.replication.models import ReplicationRecord
+
+
+pytestmark = pytest.mark.anyio
+
+
+def frame(position: int, data: bytes=b'') -> bytes:
+    record = ReplicationRecord(
+        position=position,
+        epoch='epoch',
+        operation='upload',
+        path=f'tests/{position}',
+        length=len(data),
+        timestamp=time.time()
+    )
+
+    return record.json().encode() + b'\n' + data
+
+
+async def read(chunks):
+
+    async def stream():
+        for chunk in chunks:
+            yield chunk
+
+    return [
+        (record.position, data) async for record, data in FrameReader(stream())
+    ]
+
+
+async def test_frames_split_across_chunks():
+    payload = frame(1, b'value\nwith newline') + frame(2) + frame(3, b'x' * 100)
+
+    expected = [
+        (1, b'value\nwith newline'),
+        (2, b''),
+        (3, b'x' * 100)
+    ]
+
+    assert await read([payload]) == expected
+    assert await read([payload[idx:idx + 7] for idx in range(0, len(payload), 7)]) == expected
+
+
+async def test_truncated_frame_is_dropped():
+    payload = frame(1, b'value') + frame(2, b'partial')
+
+    assert await read([payload[:-3]]) == [(1, b'value')]
@@ -0,0 +1,94 @@
+import uuid
+from collections import Counter
+from dcrx_kv.services.cluster.ring import (
+    HashRing,
+    new_job_id
+)
+
+
+NODES = [
+    'http://node-a',
+    'http://node-b',
+    'http://node-c'
+]
+
+KEYS = [
+    f'tests/key-{idx}' for idx in range(3000)
+]
+
+
+def test_keys_are_spread_across_nodes():
+    ring = HashRing(NODES)
+
+    owners = Counter(
+        ring.owner(key) for key in KEYS
+    )
+
+    assert set(owners) == set(NODES)
+
+    for node in NODES:
+        assert abs(owners[node] - len(KEYS) / len(NODES)) < len(KEYS) * 0.1
+
+
+def test_placement_is_independent_of_member_order():
+    ring = HashRing(NODES)
+    reordered_ring = HashRing(reversed(NODES))
+
+    assert all(
+        ring.owner(key) == reordered_ring.owner(key) for key in KEYS
+    )
+
+
+def test_adding_a_node_only_moves_keys_to_it():
+    ring = HashRing(NODES)
+    previous_owners = {
+        key: ring.owner(key) for key in KEYS
+    }
+
+    ring.update([*NODES, 'http://node-d'])
+
+    moved = [
+        key for key in KEYS if ring.owner(key) != previous_owners[key]
+    ]
+
+    assert len(moved) > 0
+    assert all(
+        ring.owner(key) == 'http://node-d' for key in moved
+    )
+
+
+def test_removing_a_node_only_moves_its_keys():
+    ring = HashRing(NODES)
+    previous_owners = {
+        key: ring.owner(key) for key in KEYS
+    }
+
+    ring.update(NODES[:2])
+
+    for key in KEYS:
+        if previous_owners[key] == 'http://node-c':
+            assert ring.owner(key) in NODES[:2]
+
+        else:
+            assert ring.owner(key) == previous_owners[key]
+
+
+def test_empty_rings_own_nothing():
+    assert HashRing([]).owner('tests/key') is None
+
+
+def test_job_ids_resolve_to_the_node_that_ran_them():
+    ring = HashRing(NODES)
+
+    for node in NODES:
+        job_id = new_job_id(node)
+
+        assert job_id.version == 4
+        assert ring.job_owner(job_id) == node
+
+    assert ring.job_owner(uuid.uuid4()) is None
+
+    job_id = new_job_id('http://node-c')
+    ring.update(NODES[:2])
+
+    assert ring.job_owner(job_id) is None
@@ -0,0 +1,164 @@
+import pytest
+import time
+from conftest import SECRET_KEY
+from dcrx_kv.database.models import DatabaseTransactionResult
+from dcrx_kv.env import Env
+from dcrx_kv.services.storage.connection import StorageConnection
+from dcrx_kv.services.storage.job_history import JobHistory
+from dcrx_kv.services.storage.job_state import JobState
+from dcrx_kv.services.storage.models import Blob
+from dcrx_kv.services.storage.status import JobStatus
+
+
+pytestmark = pytest.mark.anyio
+
+
+DAY = 86400
+
+
+def job_state(key: str='key') -> JobState:
+    return JobState(
+        Blob(
+            key=key,
+            namespace='tests',
+            filename=key,
+            path=f'tests/{key}',
+            operation_type='upload'
+        )
+    )
+
+
+@pytest.fixture
+def env(tmp_path):
+    return Env(
+        DCRX_KV_SECRET_KEY=SECRET_KEY,
+        DCRX_KV_DATABASE_TYPE='sqlite',
+        DCRX_KV_DATABASE_NAME=str(tmp_path / 'history.db'),
+        DCRX_KV_STORAGE_HISTORY_PARTITION_INTERVAL='1d',
+        DCRX_KV_STORAGE_HISTORY_RETENTION='2d',
+        DCRX_KV_STORAGE_HISTORY_MAX_BUFFERED=3
+    )
+
+
+@pytest.fixture
+async def connection(env):
+    connection = StorageConnection(env)
+
+    await connection.connect()
+    await connection.init()
+
+    yield connection
+
+    await connection.close()
+    await connection.engine.dispose()
+
+
+async def fail_append(start, entries):
+    return DatabaseTransactionResult(
+        message='Database transaction failed',
+        error='database is locked'
+    )
+
+
+async def test_transitions_are_buffered_then_flushed(env, connection):
+    history = JobHistory(env, connection)
+    state = job_state()
+
+    history.record(state)
+    state.transition(JobStatus.WRITING, 'writing')
+    history.record(state)
+
+    # Buffered entries are served before they are written.
+    entries = await history.get(state.id)
+
+    assert [entry.status for entry in entries] == ['CREATING', 'WRITING']
+    assert len(history.pending(state.id)) == 2
+
+    await history.flush()
+
+    assert history.pending(state.id) == []
+
+    state.transition(JobStatus.DONE, 'done')
+    history.record(state)
+
+    entries = await history.get(state.id)
+
+    assert [entry.version for entry in entries] == [0, 1, 2]
+    assert [entry.status for entry in entries] == ['CREATING', 'WRITING', 'DONE']
+
+    result = await connection.select_history(state.id)
+
+    assert len(result.data) == 2
+    assert await history.get(job_state().id) == []
+
+
+async def test_failed_flushes_are_retried_first(env, connection, monkeypatch):
+    history = JobHistory(env, connection)
+    state = job_state()
+
+    history.record(state)
+
+    append_history = connection.append_history
+    monkeypatch.setattr(connection, 'append_history', fail_append)
+
+    await history.flush()
+
+    assert history.last_error == 'database is locked'
+    assert len(history.pending(state.id)) == 1
+
+    state.transition(JobStatus.DONE, 'done')
+    history.record(state)
+
+    monkeypatch.setattr(connection, 'append_history', append_history)
+
+    await history.flush()
+
+    result = await connection.select_history(state.id)
+
+    assert [entry.version for entry in result.data] == [0, 1]
+    assert history.pending(state.id) == []
+
+
+async def test_entries_past_the_buffer_limit_are_dropped(env, connection, monkeypatch):
+    history = JobHistory(env, connection)
+    state = job_state()
+
+    for _ in range(4):
+        history.record(state)
+        state.transition(JobStatus.WRITING, 'writing')
+
+    assert [entry.version for entry in history.pending(state.id)] == [0, 1, 2]
+
+    monkeypatch.setattr(connection, 'append_history', fail_append)
+
+    await history.flush()
+
+    # Entries kept for retry hold their place in the buffer, so
+    # transitions recorded while it is full are the ones dropped.
+    state.transition(JobStatus.DONE, 'done')
+    history.record(state)
+
+    assert [entry.version for entry in history.pending(state.id)] == [0, 1, 2]
+
+
+async def test_partitions_past_retention_are_dropped(env, connection):
+    history = JobHistory(env, connection)
+    table = connection.history_table
+
+    current = table.partition_start(time.time())
+    expired = current - 3 * DAY
+    retained = current - DAY
+
+    for start in [expired, retained]:
+        result = await connection.create_history_partition(start)
+        assert result.error is None
+
+    await history.maintain()
+
+    partitions = await connection.list_history_partitions()
+
+    assert partitions.data == [
+        retained,
+        current,
+        current + DAY
+    ]
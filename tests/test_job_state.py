@@ -0,0 +1,92 @@
+import uuid
+from dcrx_kv.services.storage.job_state import JobState
+from dcrx_kv.services.storage.models import (
+    Blob,
+    JobMetadata
+)
+from dcrx_kv.services.storage.status import JobStatus
+
+
+def blob() -> Blob:
+    return Blob(
+        key='key',
+        namespace='tests',
+        filename='key.txt',
+        path='tests/key',
+        content_type='text/plain',
+        operation_type='upload',
+        backup_type='disk'
+    )
+
+
+def test_transitions_update_status_and_version():
+    state = JobState(blob())
+
+    assert state.status == JobStatus.CREATING.value
+    assert state.version == 0
+    assert state.finished is False
+
+    state.transition(JobStatus.WRITING, 'writing')
+
+    assert state.status == JobStatus.WRITING.value
+    assert state.context == f'Job {state.id} writing'
+    assert state.version == 1
+    assert state.finished is False
+
+    state.transition(JobStatus.FAILED, 'failed', error='disk full')
+
+    assert state.finished
+    assert state.version == 2
+    assert state.status_values() == {
+        'context': f'Job {state.id} failed',
+        'status': 'FAILED',
+        'error': 'disk full'
+    }
+
+    # Later transitions clear errors left by earlier ones.
+    state.transition(JobStatus.DONE, 'done')
+
+    assert state.finished
+    assert state.error is None
+
+
+def test_job_ids_can_be_assigned():
+    job_id = uuid.uuid4()
+
+    assert JobState(blob(), job_id=job_id).id == job_id
+    assert JobState(blob()).id != JobState(blob()).id
+
+
+def test_state_converts_to_metadata_and_blobs():
+    state = JobState(blob())
+    state.transition(JobStatus.DONE, 'done')
+
+    metadata = state.to_metadata()
+
+    assert metadata == JobMetadata(
+        id=state.id,
+        key='key',
+        namespace='tests',
+        filename='key.txt',
+        path='tests/key',
+        content_type='text/plain',
+        operation_type='upload',
+        backup_type='disk',
+        encoding='utf-8',
+        context=f'Job {state.id} done',
+        status='DONE',
+        error=None
+    )
+
+    result = state.to_blob(data=b'value')
+
+    assert result == Blob(
+        key='key',
+        namespace='tests',
+        filename='key.txt',
+        path='tests/key',
+        content_type='text/plain',
+        operation_type='upload',
+        backup_type='disk',
+        data=b'value'
+    )
@@ -0,0 +1,83 @@
+import asyncio
+import pytest
+import time
+from dcrx_kv.context.manager import context, ContextType
+from dcrx_kv.services.storage.models import Blob
+from conftest import signed_request
+
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def env_vars(env_vars):
+    env_vars.setenv('DCRX_KV_STORAGE_MAX_JOB_WAIT', '1s')
+
+    return env_vars
+
+
+async def get_job(client, job_id, wait):
+    return await signed_request(
+        client,
+        'GET',
+        f'/store/jobs/{job_id}',
+        params={
+            'wait': wait
+        }
+    )
+
+
+async def test_invalid_wait_is_rejected(client):
+    response = await client.request(
+        'PUT',
+        '/store/put/raw/tests/key',
+        content=b'value'
+    )
+
+    job_id = response.json()['id']
+
+    for wait in ['abc', '5x', '-1']:
+        response = await get_job(client, job_id, wait)
+        assert response.status_code == 422
+
+    response = await get_job(client, job_id, '1.5s')
+
+    assert response.status_code == 200
+    assert response.json()['status'] == 'DONE'
+
+
+async def test_wait_is_capped_at_max_job_wait(client):
+    queue = context.get(ContextType.STORAGE_SERVICE).queue
+    release = asyncio.Event()
+
+    async def stream():
+        await release.wait()
+        yield b'value'
+
+    upload = asyncio.create_task(
+        queue.upload_stream(
+            Blob(
+                key='key',
+                namespace='tests',
+                filename='key',
+                path='tests/key',
+                operation_type='upload'
+            ),
+            stream()
+        )
+    )
+
+    while len(queue._jobs) < 1:
+        await asyncio.sleep(0.01)
+
+    job_id = next(iter(queue._jobs))
+
+    start = time.monotonic()
+    response = await get_job(client, job_id, '1h')
+
+    assert response.status_code == 200
+    assert response.json()['status'] != 'DONE'
+    assert time.monotonic() - start < 5
+
+    release.set()
+    assert (await upload).status == 'DONE'
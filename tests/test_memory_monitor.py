@@ -0,0 +1,113 @@
+import pytest
+from dcrx_kv.services.monitoring.memory import cgroup
+from dcrx_kv.services.monitoring.memory import monitor
+from dcrx_kv.services.monitoring.memory.cgroup import (
+    read_cgroup_memory,
+    read_cgroup_memory_limit
+)
+from dcrx_kv.services.monitoring.memory.monitor import MemoryMonitor
+
+
+MiB = 1024**2
+
+
+@pytest.fixture
+def cgroup_root(tmp_path, monkeypatch):
+    monkeypatch.setattr(cgroup, 'CGROUP_ROOT', str(tmp_path / 'cgroup'))
+
+    return tmp_path / 'cgroup'
+
+
+def write_files(directory, files):
+    directory.mkdir(parents=True, exist_ok=True)
+
+    for filename, value in files.items():
+        (directory / filename).write_text(value)
+
+
+def test_v2_usage_is_read_from_the_limiting_cgroup(tmp_path, cgroup_root):
+    proc_cgroup = tmp_path / 'proc_cgroup'
+    proc_cgroup.write_text('0::/kubepods/pod/worker\n')
+
+    write_files(cgroup_root / 'kubepods' / 'pod', {
+        'memory.max': str(512 * MiB),
+        'memory.current': str(300 * MiB),
+        'memory.stat': f'anon {200 * MiB}\ninactive_file {50 * MiB}\n'
+    })
+
+    write_files(cgroup_root / 'kubepods' / 'pod' / 'worker', {
+        'memory.max': 'max',
+        'memory.current': str(100 * MiB)
+    })
+
+    limit, usage = read_cgroup_memory(str(proc_cgroup))
+
+    assert limit == 512 * MiB
+    assert usage == 250 * MiB
+    assert read_cgroup_memory_limit(str(proc_cgroup)) == 512 * MiB
+
+
+def test_v1_usage_is_read_from_the_limiting_cgroup(tmp_path, cgroup_root):
+    proc_cgroup = tmp_path / 'proc_cgroup'
+    proc_cgroup.write_text('4:memory:/docker/container\n')
+
+    write_files(cgroup_root / 'memory' / 'docker' / 'container', {
+        'memory.limit_in_bytes': str(256 * MiB),
+        'memory.usage_in_bytes': str(128 * MiB),
+        'memory.stat': f'total_inactive_file {28 * MiB}\n'
+    })
+
+    write_files(cgroup_root / 'memory', {
+        'memory.limit_in_bytes': str(2**63 - 4096),
+        'memory.usage_in_bytes': str(1024 * MiB)
+    })
+
+    assert read_cgroup_memory(str(proc_cgroup)) == (256 * MiB, 100 * MiB)
+
+
+def test_unlimited_cgroups_report_nothing(tmp_path, cgroup_root):
+    proc_cgroup = tmp_path / 'proc_cgroup'
+    proc_cgroup.write_text('0::/\n')
+
+    write_files(cgroup_root, {
+        'memory.max': 'max',
+        'memory.current': str(100 * MiB)
+    })
+
+    assert read_cgroup_memory(str(proc_cgroup)) == (None, None)
+    assert read_cgroup_memory(str(tmp_path / 'missing')) == (None, None)
+
+
+def test_monitor_uses_cgroup_usage_under_a_limit(monkeypatch):
+    memory_monitor = MemoryMonitor()
+    memory_monitor.track_external_usage(lambda: 10**12)
+
+    monkeypatch.setattr(
+        monitor,
+        'read_cgroup_memory',
+        lambda: (512 * MiB, 384 * MiB)
+    )
+
+    memory_monitor.update_monitor('test')
+
+    assert memory_monitor.limit_bytes == 512 * MiB
+    assert memory_monitor.used_bytes == 384 * MiB
+    assert memory_monitor.get_percent_used('test') == 75
+
+
+def test_monitor_falls_back_to_process_memory_without_a_limit(monkeypatch):
+    memory_monitor = MemoryMonitor()
+    memory_monitor.track_external_usage(lambda: 64 * MiB)
+
+    monkeypatch.setattr(
+        monitor,
+        'read_cgroup_memory',
+        lambda: (None, None)
+    )
+
+    memory_monitor.update_monitor('test')
+
+    rss = memory_monitor.latest('test_rss')
+
+    assert memory_monitor.used_bytes >= 64 * MiB
+    assert memory_monitor.used_bytes <= rss + 64 * MiB
@@ -0,0 +1,81 @@
+import pytest
+from dcrx_kv.metrics import MetricsRegistry
+
+
+pytestmark = pytest.mark.anyio
+
+
+def test_histogram_buckets_are_cumulative():
+    registry = MetricsRegistry()
+    histogram = registry.histogram(
+        'tests_seconds',
+        'Test latency.',
+        labels=('route',),
+        buckets=(1, 0.1, 0.5)
+    )
+
+    for value in [0.05, 0.1, 0.3, 0.7, 2]:
+        histogram.observe(value, '/tests')
+
+    assert histogram.render() == [
+        'tests_seconds_bucket{route="/tests",le="0.1"} 2',
+        'tests_seconds_bucket{route="/tests",le="0.5"} 3',
+        'tests_seconds_bucket{route="/tests",le="1"} 4',
+        'tests_seconds_bucket{route="/tests",le="+Inf"} 5',
+        'tests_seconds_sum{route="/tests"} 3.15',
+        'tests_seconds_count{route="/tests"} 5'
+    ]
+
+
+def test_registry_renders_the_text_format():
+    registry = MetricsRegistry()
+
+    counter = registry.counter(
+        'tests_total',
+        'Test requests.',
+        labels=('path',)
+    )
+
+    gauge = registry.gauge(
+        'tests_keys',
+        'Test keys.'
+    )
+
+    counter.inc('a"b\\c\nd')
+    counter.inc('a"b\\c\nd', amount=2)
+    gauge.set_function(lambda: 7)
+
+    assert registry.render() == '\n'.join([
+        '# HELP tests_total Test requests.',
+        '# TYPE tests_total counter',
+        'tests_total{path="a\\"b\\\\c\\nd"} 3',
+        '# HELP tests_keys Test keys.',
+        '# TYPE tests_keys gauge',
+        'tests_keys 7',
+        ''
+    ])
+
+
+def test_metrics_are_registered_once():
+    registry = MetricsRegistry()
+
+    counter = registry.counter('tests_total', 'Test requests.')
+
+    assert registry.counter('tests_total', 'Test requests.') is counter
+
+
+async def test_metrics_route_records_requests(client):
+    await client.request(
+        'PUT',
+        '/store/put/raw/tests/key',
+        content=b'value'
+    )
+
+    response = await client.client.get('/metrics')
+
+    assert response.status_code == 200
+    assert response.headers['content-type'].startswith('text/plain; version=0.0.4')
+    assert (
+        'dcrx_kv_request_duration_seconds_count{method="PUT",route="/store/put/raw/{namespace}/{key}",status="200"}'
+        in response.text
+    )
@@ -0,0 +1,71 @@
+import pytest
+import tracemalloc
+from dcrx_kv.bench import (
+    MicroBenchmark,
+    run_metadata_bench
+)
+
+
+pytestmark = pytest.mark.anyio
+
+
+def test_micro_benchmarks_count_calls_and_allocations():
+    calls = []
+    retained = []
+
+    def allocate():
+        calls.append(None)
+        retained.append(bytearray(4096))
+
+    result = MicroBenchmark(
+        iterations=50,
+        warmup=5,
+        allocation_samples=20
+    ).run('allocate', allocate)
+
+    assert len(calls) == 75
+    assert result.name == 'allocate'
+    assert result.iterations == 50
+    assert result.ns_per_op > 0
+    assert result.ops_per_second == pytest.approx(1e9/result.ns_per_op)
+    assert result.peak_bytes_per_op >= 4096
+    assert result.retained_blocks_per_op > 0
+    assert tracemalloc.is_tracing() is False
+
+
+async def test_async_micro_benchmarks_await_each_call():
+    calls = []
+
+    async def call():
+        calls.append(None)
+
+    result = await MicroBenchmark(
+        iterations=10,
+        warmup=2,
+        allocation_samples=3
+    ).run_async('call', call)
+
+    assert len(calls) == 15
+    assert result.iterations == 10
+    assert tracemalloc.is_tracing() is False
+
+
+async def test_metadata_bench_runs_every_step():
+    result = await run_metadata_bench(
+        iterations=5,
+        database_iterations=5
+    )
+
+    names = [
+        micro_result.name for micro_result in result.results
+    ]
+
+    assert result.suite == 'metadata'
+    assert len(names) == len(set(names))
+    assert {
+        'statement.insert',
+        'template.update_status_params',
+        'execute.update_status',
+        'execute.select_by_path',
+        'decode.job_metadata_trusted'
+    } <= set(names)
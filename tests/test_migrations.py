@@ -0,0 +1,118 @@
+import pytest
+import sqlalchemy
+from dcrx_kv.database.migrations import (
+    MigrationRunner,
+    get_column_names,
+    get_index_names
+)
+from dcrx_kv.services.storage.table.storage_migrations import STORAGE_MIGRATIONS
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.schema import CreateTable
+
+
+pytestmark = pytest.mark.anyio
+
+
+def blobs_table(*extra) -> sqlalchemy.Table:
+    return sqlalchemy.Table(
+        'blobs',
+        sqlalchemy.MetaData(),
+        sqlalchemy.Column('id', sqlalchemy.TEXT, primary_key=True),
+        sqlalchemy.Column('namespace', sqlalchemy.TEXT),
+        sqlalchemy.Column('status', sqlalchemy.TEXT),
+        *extra
+    )
+
+
+@pytest.fixture
+async def engine(tmp_path):
+    engine = create_async_engine(
+        f'sqlite+aiosqlite:///{tmp_path / "migrations.db"}'
+    )
+
+    # A table as an earlier release created it.
+    async with engine.connect() as connection:
+        await connection.execute(
+            CreateTable(blobs_table())
+        )
+
+        await connection.commit()
+
+    yield engine
+
+    await engine.dispose()
+
+
+@pytest.fixture
+def table():
+    return blobs_table(
+        sqlalchemy.Column('updated_at', sqlalchemy.Double),
+        sqlalchemy.Index('ix_blobs_namespace', 'namespace'),
+        sqlalchemy.Index('ix_blobs_status', 'status'),
+        sqlalchemy.Index('ix_blobs_updated_at', 'updated_at')
+    )
+
+
+async def schema(engine):
+    async with engine.connect() as connection:
+        return (
+            await get_column_names(connection, 'blobs'),
+            await get_index_names(connection, 'blobs')
+        )
+
+
+async def test_migrations_apply_in_order_up_to_target(engine, table):
+    runner = MigrationRunner(engine, table, list(reversed(STORAGE_MIGRATIONS)))
+
+    assert [migration.applied_at for migration in await runner.status()] == [None, None]
+
+    applied = await runner.migrate(target=1)
+
+    assert [migration.version for migration in applied] == [1]
+
+    columns, indexes = await schema(engine)
+
+    assert 'updated_at' in columns
+    assert indexes == set()
+
+    applied = await runner.migrate()
+
+    assert [migration.version for migration in applied] == [2]
+
+    _, indexes = await schema(engine)
+
+    assert indexes == {
+        'ix_blobs_namespace',
+        'ix_blobs_status',
+        'ix_blobs_updated_at'
+    }
+
+    assert all(
+        migration.applied_at is not None for migration in await runner.status()
+    )
+
+
+async def test_applied_migrations_are_not_rerun(engine, table):
+    runner = MigrationRunner(engine, table, STORAGE_MIGRATIONS)
+
+    assert len(await runner.migrate()) == 2
+    assert await runner.migrate() == []
+
+    # A fresh runner, as in another worker, reads what was recorded.
+    assert await MigrationRunner(engine, table, STORAGE_MIGRATIONS).migrate() == []
+
+
+async def test_operations_are_idempotent(engine, table):
+    runner = MigrationRunner(engine, table, STORAGE_MIGRATIONS)
+    await runner.migrate()
+
+    # Clearing the record makes a runner repeat every operation
+    # against a schema that already has their changes.
+    async with engine.connect() as connection:
+        await connection.execute(
+            runner.versions_table.delete()
+        )
+
+        await connection.commit()
+
+    assert len(await runner.migrate()) == 2
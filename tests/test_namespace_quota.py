@@ -0,0 +1,181 @@
+import pytest
+from dcrx_kv.bench.client import bench_client
+from dcrx_kv.context.manager import context, ContextType
+from dcrx_kv.services.storage.models import NamespaceQuota
+from conftest import login_user, signed_request
+
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def env_vars(env_vars):
+    env_vars.setenv('DCRX_KV_AUTH_OPERATORS', 'operator')
+
+    return env_vars
+
+
+@pytest.fixture
+async def operator_client(client):
+    await login_user(client, 'operator')
+
+    return client
+
+
+@pytest.fixture
+async def queue(client):
+    queue = context.get(ContextType.STORAGE_SERVICE).queue
+    queue.quotas.set(
+        'tests',
+        NamespaceQuota(max_bytes=100)
+    )
+
+    return queue
+
+
+async def put_stream(client, key, chunks):
+
+    async def stream():
+        for chunk in chunks:
+            yield chunk
+
+    return await signed_request(
+        client,
+        'PUT',
+        f'/store/put/raw/tests/{key}',
+        content=stream()
+    )
+
+
+async def test_overwrites_are_charged_the_difference(client, queue):
+    response = await client.request(
+        'PUT',
+        '/store/put/raw/tests/key',
+        content=b'a' * 60
+    )
+
+    assert response.status_code == 200
+
+    response = await client.request(
+        'PUT',
+        '/store/put/raw/tests/key',
+        content=b'b' * 90
+    )
+
+    assert response.status_code == 200
+    assert queue.namespace_usage('tests').stored_bytes == 90
+
+
+async def test_streams_past_quota_are_aborted(client, queue):
+    response = await put_stream(client, 'key', [b'a' * 40] * 2)
+
+    assert response.status_code == 200
+    assert response.json()['status'] == 'DONE'
+
+    response = await put_stream(client, 'other', [b'b' * 10] * 5)
+
+    assert response.status_code == 400
+    assert 'quota' in response.json()['detail']['error']
+
+    usage = queue.store_usage.namespace('tests')
+
+    assert usage.stored_bytes == 80
+    assert usage.reserved_bytes == 0
+
+    response = await client.request('GET', '/store/get/tests/other')
+
+    assert response.status_code == 404
+    
+    # Room freed by the blob being replaced counts toward the new one.
+    response = await put_stream(client, 'key', [b'c' * 25] * 4)
+
+    assert response.status_code == 200
+    assert queue.namespace_usage('tests').stored_bytes == 100
+
+
+@pytest.mark.parametrize('backend', ['memory', 'shared'])
+async def test_failed_overwrites_keep_the_stored_blob(env_vars, tmp_path, backend):
+    env_vars.setenv('DCRX_KV_STORAGE_BACKEND', backend)
+    env_vars.setenv('DCRX_KV_STORAGE_SHARED_MEMORY_PATH', str(tmp_path / 'test.arena'))
+    env_vars.setenv('DCRX_KV_STORAGE_SHARED_MEMORY_SIZE_MB', '8')
+    env_vars.setenv('DCRX_KV_STORAGE_SHARED_MEMORY_MAX_KEYS', '64')
+
+    async with bench_client(timeout=30) as client:
+        queue = context.get(ContextType.STORAGE_SERVICE).queue
+        queue.quotas.set(
+            'tests',
+            NamespaceQuota(max_bytes=100)
+        )
+
+        response = await put_stream(client, 'key', [b'a' * 40])
+
+        assert response.status_code == 200
+
+        response = await put_stream(client, 'key', [b'b' * 50] * 4)
+
+        assert response.status_code == 400
+
+        response = await client.request('GET', '/store/get/tests/key')
+
+        assert response.status_code == 200
+        assert response.content == b'a' * 40
+
+        assert await queue.list_paths() == ['tests/key']
+        assert queue.namespace_usage('tests').stored_bytes == 40
+
+
+@pytest.mark.parametrize('quota', [
+    {'max_bytes': -1},
+    {'max_keys': -1},
+    {'requests_per_second': 0},
+    {'burst': 0}
+])
+async def test_invalid_quotas_are_rejected(operator_client, quota):
+    response = await operator_client.client.put(
+        '/store/quotas/tests',
+        json=quota
+    )
+
+    assert response.status_code == 422
+
+
+async def test_only_operators_change_quotas(client):
+    await login_user(client, 'user')
+
+    response = await client.client.put(
+        '/store/quotas/tests',
+        json={
+            'max_keys': 1
+        }
+    )
+
+    assert response.status_code == 403
+
+    response = await client.client.delete('/store/quotas/tests')
+    assert response.status_code == 403
+
+    response = await client.client.get('/store/quotas/tests')
+    assert response.status_code == 200
+
+
+async def test_operators_set_and_reset_quotas(operator_client):
+    response = await operator_client.client.put(
+        '/store/quotas/tests',
+        json={
+            'max_keys': 0,
+            'requests_per_second': 0.5
+        }
+    )
+
+    assert response.status_code == 200
+
+    quotas = context.get(ContextType.STORAGE_SERVICE).queue.quotas
+
+    assert quotas.get('tests').max_keys == 0
+    assert quotas.acquire('tests') == 0
+    assert quotas.acquire('tests') > 0
+
+    response = await operator_client.client.delete('/store/quotas/tests')
+
+    assert response.status_code == 200
+    assert quotas.get('tests') == quotas.default
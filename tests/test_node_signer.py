@@ -0,0 +1,122 @@
+import pytest
+from dcrx_kv.env import Env
+from dcrx_kv.services.auth.node_signer import (
+    NodeSigner,
+    NODE_CONTENT_DIGEST_HEADER,
+    NODE_TIMESTAMP_HEADER,
+    NODE_SIGNATURE_HEADER
+)
+from starlette.requests import Request
+from conftest import SECRET_KEY
+
+
+def signer(secret_key: str=SECRET_KEY) -> NodeSigner:
+    return NodeSigner(
+        Env(
+            DCRX_KV_SECRET_KEY=secret_key,
+            DCRX_KV_NODE_SIGNATURE_MAX_AGE='30s'
+        )
+    )
+
+
+def request(
+    method: str,
+    path: str,
+    query: str,
+    headers: dict
+) -> Request:
+    return Request({
+        'type': 'http',
+        'method': method,
+        'path': path,
+        'query_string': query.encode(),
+        'headers': [
+            (name.encode(), value.encode()) for name, value in headers.items()
+        ]
+    })
+
+
+def test_signed_requests_verify():
+    headers = signer().sign('GET', '/store/get/tests/key', 'a=1')
+
+    assert signer().verify(
+        request('GET', '/store/get/tests/key', 'a=1', headers)
+    )
+
+
+def test_tampered_requests_are_rejected():
+    headers = signer().sign('GET', '/store/get/tests/key', 'a=1')
+
+    assert signer().verify(request('PUT', '/store/get/tests/key', 'a=1', headers)) is False
+    assert signer().verify(request('GET', '/store/get/tests/other', 'a=1', headers)) is False
+    assert signer().verify(request('GET', '/store/get/tests/key', 'a=2', headers)) is False
+    assert signer('another-secret-key').verify(request('GET', '/store/get/tests/key', 'a=1', headers)) is False
+
+
+def test_stale_or_missing_signatures_are_rejected():
+    headers = signer().sign('GET', '/store/get/tests/key')
+    headers[NODE_TIMESTAMP_HEADER] = str(float(headers[NODE_TIMESTAMP_HEADER]) - 60)
+
+    assert signer().verify(request('GET', '/store/get/tests/key', '', headers)) is False
+
+    headers = signer().sign('GET', '/store/get/tests/key')
+    del headers[NODE_SIGNATURE_HEADER]
+
+    assert signer().verify(request('GET', '/store/get/tests/key', '', headers)) is False
+
+
+def test_signatures_cover_the_body_digest():
+    headers = signer().sign('PUT', '/store/put/raw/tests/key', body=b'value')
+    signed_request = request('PUT', '/store/put/raw/tests/key', '', headers)
+
+    assert signer().verify(signed_request)
+    assert signer().verify_body(signed_request, b'value')
+    assert signer().verify_body(signed_request, b'other') is False
+
+    headers[NODE_CONTENT_DIGEST_HEADER] = signer().digest(b'other')
+
+    assert signer().verify(request('PUT', '/store/put/raw/tests/key', '', headers)) is False
+
+
+def test_unsigned_payloads_only_verify_when_allowed():
+    headers = signer().sign('PUT', '/store/put/raw/tests/key', body=None)
+    relayed_request = request('PUT', '/store/put/raw/tests/key', '', headers)
+
+    assert signer().verify(relayed_request, signed_payload=False)
+    assert signer().verify(relayed_request) is False
+    assert signer().verify_body(relayed_request, b'') is False
+
+
+@pytest.mark.anyio
+async def test_node_signed_bodies_must_match_their_digest(client):
+    response = await client.client.put(
+        '/store/put/raw/tests/key',
+        content=b'tampered',
+        headers=client.signer.sign(
+            'PUT',
+            '/store/put/raw/tests/key',
+            body=b'value'
+        )
+    )
+
+    assert response.status_code == 401
+
+    response = await client.request(
+        'PUT',
+        '/store/put/raw/tests/key',
+        content=b'value'
+    )
+
+    assert response.status_code == 200
+
+
+@pytest.mark.anyio
+async def test_node_signatures_only_authorize_internal_routes(client):
+    for path in [
+        '/users/tests/get',
+        '/monitoring/system',
+        '/store/quotas/tests'
+    ]:
+        response = await client.request('GET', path)
+
+        assert response.status_code == 401, path
@@ -0,0 +1,152 @@
+import asyncio
+import pytest
+from dcrx_kv.context.manager import context, ContextType
+from dcrx_kv.env import Env
+from dcrx_kv.services.auth.manager import AuthorizationSessionManager
+from dcrx_kv.services.auth.models import PasswordHashingLimitException
+from conftest import SECRET_KEY, login_user
+
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def manager():
+    manager = AuthorizationSessionManager(
+        Env(
+            DCRX_KV_SECRET_KEY=SECRET_KEY,
+            DCRX_KV_AUTH_HASH_WORKERS=1,
+            DCRX_KV_AUTH_HASH_MAX_PENDING=2
+        )
+    )
+
+    manager._loop = asyncio.get_running_loop()
+
+    return manager
+
+
+@pytest.fixture
+def hashing_calls(manager, monkeypatch):
+    calls = []
+    release = asyncio.Event()
+
+    async def run_hashing(hashing_call):
+        hashing_limit = manager._hashing_limit()
+        if hashing_limit:
+            return hashing_limit
+
+        manager._hashing_count += 1
+        calls.append(hashing_call.args)
+
+        try:
+            await release.wait()
+            password, _ = hashing_call.args
+            return password == 'correct'
+
+        finally:
+            manager._hashing_count -= 1
+
+    monkeypatch.setattr(manager, '_run_hashing', run_hashing)
+
+    return calls, release
+
+
+async def test_identical_attempts_share_one_check(manager, hashing_calls):
+    calls, release = hashing_calls
+
+    attempts = [
+        asyncio.ensure_future(
+            manager._verify_password('user', 'correct', 'hash')
+        ) for _ in range(5)
+    ]
+
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*attempts) == [True] * 5
+    assert len(calls) == 1
+
+
+async def test_bad_password_does_not_lock_out_user(manager, hashing_calls):
+    calls, release = hashing_calls
+
+    attacker = asyncio.ensure_future(
+        manager._verify_password('user', 'wrong', 'hash')
+    )
+
+    await asyncio.sleep(0)
+
+    user = asyncio.ensure_future(
+        manager._verify_password('user', 'correct', 'hash')
+    )
+
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await attacker is False
+    assert await user is True
+    assert len(calls) == 2
+
+
+async def test_global_hashing_limit_applies(manager, hashing_calls):
+    calls, release = hashing_calls
+
+    attempts = [
+        asyncio.ensure_future(
+            manager._verify_password(f'user-{idx}', 'correct', 'hash')
+        ) for idx in range(4)
+    ]
+
+    while len(calls) < 3:
+        await asyncio.sleep(0)
+
+    release.set()
+
+    results = await asyncio.gather(*attempts)
+
+    assert results[:3] == [True] * 3
+    assert isinstance(results[3], PasswordHashingLimitException)
+
+
+@pytest.fixture
+def env_vars(env_vars):
+    env_vars.setenv('DCRX_KV_AUTH_RETRY_AFTER', '3s')
+
+    return env_vars
+
+
+async def test_full_hashing_queue_asks_clients_to_retry(client, monkeypatch):
+    await login_user(client, 'user')
+
+    auth_manager = context.get(ContextType.AUTH_SERVICE).manager
+    monkeypatch.setattr(
+        auth_manager,
+        '_hashing_count',
+        auth_manager.hash_workers + auth_manager.hash_max_pending
+    )
+
+    response = await client.client.post(
+        '/users/login',
+        json={
+            'username': 'user',
+            'password': 'test-password'
+        }
+    )
+
+    assert response.status_code == 429
+    assert response.headers['retry-after'] == '3'
+
+    response = await client.client.post(
+        '/users/create',
+        json={
+            'username': 'other',
+            'first_name': 'Other',
+            'last_name': 'User',
+            'email': 'other@dcrx-kv.test',
+            'disabled': False,
+            'password': 'other-password'
+        }
+    )
+
+    assert response.status_code == 429
+    assert response.headers['retry-after'] == '3'
@@ -0,0 +1,197 @@
+import asyncio
+import pytest
+import threading
+import tracemalloc
+from dcrx_kv.services.monitoring.profiling import (
+    CPUProfiler,
+    HeapProfiler,
+    count_instances
+)
+from conftest import login_user
+
+
+pytestmark = pytest.mark.anyio
+
+
+class Tracked:
+    pass
+
+
+class TrackedChild(Tracked):
+    pass
+
+
+def spin(stop: threading.Event):
+    while not stop.is_set():
+        sum(range(1000))
+
+
+@pytest.fixture
+def env_vars(env_vars):
+    env_vars.setenv('DCRX_KV_AUTH_OPERATORS', 'operator')
+
+    return env_vars
+
+
+@pytest.fixture
+def heap_profiler():
+    profiler = HeapProfiler(max_snapshots=2)
+
+    yield profiler
+
+    profiler.stop()
+
+
+def test_cpu_profiles_collapse_sampled_stacks():
+    profiler = CPUProfiler()
+    stop = threading.Event()
+
+    worker = threading.Thread(
+        target=spin,
+        args=(stop,),
+        name='spinner'
+    )
+
+    worker.start()
+
+    try:
+        assert profiler.start(frequency=200)
+        assert profiler.start() is False
+
+        while profiler.samples < 5:
+            stop.wait(0.01)
+
+        stacks = profiler.stop()
+
+    finally:
+        stop.set()
+        worker.join()
+
+    assert profiler.running is False
+
+    spinner_stacks = [
+        line for line in stacks.splitlines() if line.startswith('spinner;')
+    ]
+
+    assert len(spinner_stacks) > 0
+    assert all(
+        'test_profiling:spin' in line for line in spinner_stacks
+    )
+
+    counts = [
+        int(line.rsplit(' ', 1)[1]) for line in stacks.splitlines()
+    ]
+
+    assert counts == sorted(counts, reverse=True)
+
+
+def test_heap_snapshots_group_and_diff_by_module(heap_profiler):
+    if tracemalloc.is_tracing():
+        pytest.skip('tracemalloc is already on for this interpreter')
+
+    first = heap_profiler.snapshot()
+    assert heap_profiler.tracing
+
+    allocations = [
+        bytearray(1024) for _ in range(100)
+    ]
+
+    second = heap_profiler.snapshot()
+
+    modules = {
+        usage['module']: usage for usage in heap_profiler.compare(second, first)
+    }
+
+    assert modules['test_profiling']['size_diff'] >= 100 * 1024
+    assert heap_profiler.previous(second.snapshot_id) is first
+
+    # Only the newest snapshots are kept.
+    third = heap_profiler.snapshot()
+
+    assert heap_profiler.get(first.snapshot_id) is None
+    assert heap_profiler.get(third.snapshot_id) is third
+
+    heap_profiler.stop()
+
+    assert heap_profiler.tracing is False
+    assert len(allocations) == 100
+
+
+def test_heap_profiler_leaves_existing_tracing_running(heap_profiler):
+    if tracemalloc.is_tracing():
+        pytest.skip('tracemalloc is already on for this interpreter')
+
+    tracemalloc.start()
+
+    try:
+        heap_profiler.snapshot()
+        heap_profiler.stop()
+
+        assert tracemalloc.is_tracing()
+
+    finally:
+        tracemalloc.stop()
+
+
+async def test_heap_tracing_stops_after_the_last_snapshot():
+    if tracemalloc.is_tracing():
+        pytest.skip('tracemalloc is already on for this interpreter')
+
+    profiler = HeapProfiler(max_tracing=0.05)
+    loop = asyncio.get_running_loop()
+
+    profiler.snapshot()
+    profiler.expire_tracing(loop)
+
+    await asyncio.sleep(0.02)
+
+    profiler.snapshot()
+    profiler.expire_tracing(loop)
+
+    await asyncio.sleep(0.04)
+    assert profiler.tracing
+
+    await asyncio.sleep(0.05)
+    assert profiler.tracing is False
+
+
+def test_census_counts_exact_types():
+    tracked = [Tracked(), Tracked(), TrackedChild()]
+
+    instances = count_instances([Tracked, TrackedChild])
+
+    assert len(instances[Tracked]) == 2
+    assert len(instances[TrackedChild]) == 1
+    assert len(tracked) == 3
+
+
+async def test_profiling_is_limited_to_operators(client):
+    await login_user(client, 'user')
+
+    for method, path in [
+        ('POST', '/monitoring/profiling/cpu'),
+        ('POST', '/monitoring/profiling/heap'),
+        ('GET', '/monitoring/profiling/objects')
+    ]:
+        response = await client.client.request(method, path)
+
+        assert response.status_code == 403, path
+
+
+async def test_operators_can_profile(client):
+    await login_user(client, 'operator')
+
+    response = await client.client.post(
+        '/monitoring/profiling/cpu',
+        params={
+            'duration': '1s'
+        }
+    )
+
+    assert response.status_code == 200
+    assert int(response.headers['x-dcrx-kv-profile-samples']) > 0
+
+    response = await client.client.get('/monitoring/profiling/objects')
+
+    assert response.status_code == 200
+    assert 'Job' in response.json()['objects']
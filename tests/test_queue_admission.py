@@ -0,0 +1,57 @@
+import asyncio
+import pytest
+from dcrx_kv.context.manager import context, ContextType
+from conftest import signed_request
+
+
+pytestmark = pytest.mark.anyio
+
+
+POOL_SIZE = 2
+MAX_PENDING = 1
+
+
+@pytest.fixture
+def env_vars(env_vars):
+    env_vars.setenv('DCRX_KV_STORAGE_POOL_SIZE', str(POOL_SIZE))
+    env_vars.setenv('DCRX_KV_STORAGE_MAX_PENDING', str(MAX_PENDING))
+
+    return env_vars
+
+
+async def test_sequential_raw_uploads_are_all_admitted(client):
+    for idx in range((POOL_SIZE + MAX_PENDING) * 3):
+        response = await client.request(
+            'PUT',
+            f'/store/put/raw/tests/key-{idx}',
+            content=b'value'
+        )
+
+        assert response.status_code == 200, response.text
+
+    queue = context.get(ContextType.STORAGE_SERVICE).queue
+
+    assert queue.active_jobs_count == 0
+    assert queue.pending_jobs_count == 0
+
+
+async def test_sequential_uploads_are_all_admitted(client):
+    queue = context.get(ContextType.STORAGE_SERVICE).queue
+
+    for idx in range((POOL_SIZE + MAX_PENDING) * 3):
+        response = await signed_request(
+            client,
+            'PUT',
+            f'/store/put/tests/key-{idx}',
+            files={
+                'blob': (f'key-{idx}', b'value')
+            }
+        )
+
+        assert response.status_code == 202, response.text
+
+        # Uploads run in the background, so each is let finish
+        # before the next is sent.
+        async with asyncio.timeout(5):
+            while queue.active_jobs_count + queue.pending_jobs_count > 0:
+                await asyncio.sleep(0.01)
@@ -0,0 +1,82 @@
+import asyncio
+import pytest
+from dcrx_kv.context.manager import context, ContextType
+
+
+pytestmark = pytest.mark.anyio
+
+
+MAX_AGE = 2
+
+
+@pytest.fixture
+def env_vars(env_vars):
+    env_vars.setenv('DCRX_KV_STORAGE_BLOB_MAX_AGE', f'{MAX_AGE}s')
+    env_vars.setenv('DCRX_KV_STORAGE_PRUNE_INTERVAL', '1s')
+
+    return env_vars
+
+
+async def test_expired_blob_is_removed_and_watched(client):
+    queue = context.get(ContextType.STORAGE_SERVICE).queue
+
+    response = await client.request(
+        'PUT',
+        '/store/put/raw/expiry/key',
+        content=b'value'
+    )
+
+    assert response.status_code == 200
+
+    operations = []
+
+    async with asyncio.timeout(10):
+        async for change in queue.changes.watch(
+            namespace='expiry',
+            since=0,
+            heartbeat=1
+        ):
+            if change is None:
+                continue
+
+            operations.append(change.operation)
+
+            if change.operation == 'expire':
+                break
+
+    assert operations == ['upload', 'expire']
+
+    response = await client.request('GET', '/store/get/expiry/key')
+
+    assert response.status_code == 404
+
+
+async def test_newer_upload_is_not_expired_by_older_job(client):
+    queue = context.get(ContextType.STORAGE_SERVICE).queue
+
+    await client.request(
+        'PUT',
+        '/store/put/raw/expiry/key',
+        content=b'first'
+    )
+
+    # Jobs are pruned once a second, so the uploads are spaced
+    # further apart than that to expire on different passes.
+    await asyncio.sleep(MAX_AGE * 0.75)
+
+    await client.request(
+        'PUT',
+        '/store/put/raw/expiry/key',
+        content=b'second'
+    )
+
+    # The first job ages out before the second, which should
+    # leave the second upload in place until it expires itself.
+    async with asyncio.timeout(10):
+        while queue.tracked_jobs_count > 1:
+            await asyncio.sleep(0.05)
+
+    response = await client.request('GET', '/store/get/expiry/key')
+
+    assert response.status_code == 200
+    assert response.content == b'second'
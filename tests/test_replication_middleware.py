@@ -0,0 +1,89 @@
+import pytest
+import uuid
+from dcrx_kv.context.manager import context, ContextType
+from dcrx_kv.bench.client import bench_client
+from dcrx_kv.middleware.replication_middleware import LOG_POSITION_HEADER
+from conftest import signed_request
+
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_primary_responses_carry_log_position(env_vars):
+    env_vars.setenv('DCRX_KV_REPLICATION_ROLE', 'primary')
+
+    async with bench_client(timeout=30) as client:
+        response = await client.request(
+            'PUT',
+            '/store/put/raw/tests/key',
+            content=b'value'
+        )
+
+        assert response.status_code == 200
+        assert response.headers[LOG_POSITION_HEADER] == '1'
+
+
+async def test_replica_redirects_writes_to_primary(env_vars):
+    env_vars.setenv('DCRX_KV_REPLICATION_ROLE', 'replica')
+    env_vars.setenv('DCRX_KV_REPLICATION_PRIMARY_ADDRESS', 'http://primary.invalid')
+
+    async with bench_client(timeout=30) as client:
+        response = await signed_request(
+            client,
+            'PUT',
+            '/store/put/raw/tests/key',
+            params={
+                'filename': 'key'
+            },
+            content=b'value'
+        )
+
+        assert response.status_code == 307
+        assert response.headers['location'] == 'http://primary.invalid/store/put/raw/tests/key?filename=key'
+
+
+async def test_requests_pass_through_without_replication(client):
+    response = await client.request(
+        'PUT',
+        '/store/put/raw/tests/key',
+        content=b'value'
+    )
+
+    assert response.status_code == 200
+    assert LOG_POSITION_HEADER not in response.headers
+
+
+async def test_async_uploads_carry_log_position_on_the_finished_job(env_vars):
+    env_vars.setenv('DCRX_KV_REPLICATION_ROLE', 'primary')
+
+    async with bench_client(timeout=30) as client:
+        response = await signed_request(
+            client,
+            'PUT',
+            '/store/put/tests/key',
+            files={
+                'blob': ('key', b'value')
+            }
+        )
+
+        assert response.status_code == 202
+        assert LOG_POSITION_HEADER not in response.headers
+
+        job_id = response.json()['id']
+
+        response = await signed_request(
+            client,
+            'GET',
+            f'/store/jobs/{job_id}',
+            params={
+                'wait': '5s'
+            }
+        )
+
+        assert response.json()['status'] == 'DONE'
+
+        manager = context.get(ContextType.REPLICATION_SERVICE).manager
+        record = manager.log.get(1)
+
+        assert record.metadata.id == uuid.UUID(job_id)
+        assert int(response.headers[LOG_POSITION_HEADER]) >= record.position
@@ -0,0 +1,85 @@
+import json
+import pytest
+from dcrx_kv.context.manager import context, ContextType
+
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def env_vars(env_vars):
+    env_vars.setenv('DCRX_KV_REPLICATION_ROLE', 'primary')
+    env_vars.setenv('DCRX_KV_REPLICATION_LOG_SIZE', '2')
+
+    return env_vars
+
+
+@pytest.fixture
+def manager(client):
+    return context.get(ContextType.REPLICATION_SERVICE).manager
+
+
+async def put(client, key):
+    response = await client.request(
+        'PUT',
+        f'/store/put/raw/tests/{key}',
+        content=key.encode()
+    )
+
+    assert response.status_code == 200
+
+
+def operation(frame: bytes) -> str:
+    header, _ = frame.split(b'\n', 1)
+    return json.loads(header)['operation']
+
+
+async def test_replicas_behind_the_log_are_resnapshot(client, manager):
+    await put(client, 'first')
+
+    stream = manager.stream(
+        'replica',
+        0,
+        epoch=manager.log.epoch
+    )
+
+    assert operation(await stream.__anext__()) == 'upload'
+
+    # Three more writes push record 2 out of a two record log
+    # before the replica reads past record 1.
+    for key in ['second', 'third', 'fourth']:
+        await put(client, key)
+
+    assert manager.log.first_position == 3
+
+    frames = [
+        await stream.__anext__() for _ in range(6)
+    ]
+
+    await stream.aclose()
+
+    assert [operation(frame) for frame in frames] == [
+        'reset',
+        'upload',
+        'upload',
+        'upload',
+        'upload',
+        'synced'
+    ]
+
+
+async def test_reset_clears_blobs_and_metadata(client, manager):
+    await put(client, 'key')
+
+    queue = context.get(ContextType.STORAGE_SERVICE).queue
+    connection = context.get(ContextType.STORAGE_SERVICE).connection
+
+    await manager._apply(
+        manager._control_record('reset', 0),
+        b''
+    )
+
+    assert await queue.list_paths() == []
+
+    result = await connection.select_by_path('tests/key')
+    assert result.data == []
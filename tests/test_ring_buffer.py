@@ -0,0 +1,69 @@
+from dcrx_kv.services.monitoring.base.ring_buffer import RingBuffer
+from dcrx_kv.services.monitoring.sampler import SystemSampler
+
+
+def test_empty_buffers_read_as_zero():
+    samples = RingBuffer(4)
+
+    assert samples.latest == 0
+    assert samples.percentile(99) == 0
+    assert samples.values() == []
+
+
+def test_percentiles_use_nearest_rank():
+    samples = RingBuffer(100)
+
+    for value in range(1, 101):
+        samples.append(value)
+
+    assert samples.percentile(0) == 1
+    assert samples.percentile(50) == 50
+    assert samples.percentile(90) == 90
+    assert samples.percentile(99) == 99
+    assert samples.percentile(100) == 100
+
+
+def test_percentile_ranks_are_not_rounded_up():
+    samples = RingBuffer(1000)
+
+    for value in range(1, 1001):
+        samples.append(value)
+
+    assert samples.percentile(99.9) == 999
+
+
+def test_appends_overwrite_the_oldest_samples():
+    samples = RingBuffer(3)
+
+    for value in [5, 1, 4]:
+        samples.append(value)
+
+    assert samples.values() == [5, 1, 4]
+    assert samples.percentile(100) == 5
+
+    samples.append(2)
+    samples.append(3)
+
+    assert samples.count == 3
+    assert samples.latest == 3
+    assert samples.values() == [4, 2, 3]
+    assert samples.percentile(50) == 3
+    assert samples.percentile(100) == 4
+
+
+def test_sampler_summarizes_every_monitor():
+    sampler = SystemSampler(
+        'tests',
+        interval=0.01,
+        window_size=10
+    )
+
+    for _ in range(3):
+        sampler.event_loop.mark()
+        sampler.sample()
+
+    summary = sampler.summary(percentiles=[50, 99])
+
+    assert summary['tests']['samples'] == 3
+    assert summary['tests_lag']['samples'] == 3
+    assert set(summary['tests_lag']) == {'latest', 'samples', 'p50', 'p99'}
@@ -0,0 +1,68 @@
+import pytest
+from dcrx_kv.database.row_decoder import RowDecoder
+from pydantic import (
+    BaseModel,
+    StrictInt,
+    StrictStr,
+    ValidationError
+)
+from typing import Optional
+
+
+class Row(BaseModel):
+    name: StrictStr
+    count: StrictInt
+    note: Optional[StrictStr]='none'
+
+
+def test_plans_are_built_once_per_shape():
+    decoder = RowDecoder(Row)
+
+    plan = decoder.plan(['name', 'extra', 'count', 'note'])
+
+    assert plan is decoder.plan(('name', 'extra', 'count', 'note'))
+    assert [(name, idx) for name, idx, _ in plan.steps] == [('name', 0), ('count', 2), ('note', 3)]
+    assert plan.complete is True
+
+    assert decoder.plan(['name', 'count']).complete is False
+
+
+def test_validated_rows():
+    decoder = RowDecoder(Row)
+
+    assert decoder.decode_all(
+        ['name', 'count'],
+        [('first', 1), ('second', 2)]
+    ) == [
+        Row(name='first', count=1),
+        Row(name='second', count=2)
+    ]
+
+    with pytest.raises(ValidationError):
+        decoder.decode_all(['name', 'count'], [('first', 'one')])
+
+
+def test_trusted_rows_pass_through_decoders():
+    decoder = RowDecoder(
+        Row,
+        decoders={
+            'count': int
+        },
+        validate=False
+    )
+
+    row = decoder.decode_all(
+        ['name', 'count', 'note'],
+        [('first', '1', None)]
+    ).pop()
+
+    assert row == Row(name='first', count=1, note=None)
+    assert row.__fields_set__ == {'name', 'count', 'note'}
+
+    partial = decoder.decode_all(
+        ['name', 'count'],
+        [('first', '1')]
+    ).pop()
+
+    assert partial.note == 'none'
+    assert partial.__fields_set__ == {'name', 'count'}
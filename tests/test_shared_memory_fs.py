@@ -0,0 +1,125 @@
+import pytest
+from dcrx_kv.services.storage.shared_memory import SharedMemoryFS
+from dcrx_kv.services.storage.shared_memory.arena_layout import (
+    HEADER_SIZE,
+    SLOT_SIZE
+)
+from fs.errors import (
+    DestinationExists,
+    ResourceError,
+    ResourceNotFound
+)
+
+
+@pytest.fixture
+def filesystem(tmp_path):
+    filesystem = SharedMemoryFS(
+        str(tmp_path / 'test.arena'),
+        size_mb=2,
+        max_keys=16,
+        max_blob_mb=1
+    )
+
+    yield filesystem
+
+    filesystem.close()
+
+
+def test_arena_is_sized_in_mebibytes(filesystem):
+    assert filesystem.arena_size == 2 * 1024**2
+    assert filesystem.data_size == filesystem.arena_size - HEADER_SIZE - 16 * SLOT_SIZE
+    assert filesystem.max_blob_bytes == 1024**2
+
+
+def test_write_read_remove(filesystem):
+    with filesystem.openbin('tests/key', mode='w') as blob_file:
+        blob_file.write(b'val')
+        blob_file.write(b'ue')
+
+    assert filesystem.readbytes('tests/key') == b'value'
+    assert filesystem.usage()['stored_bytes'] == 5
+
+    filesystem.remove('tests/key')
+
+    with pytest.raises(ResourceNotFound):
+        filesystem.readbytes('tests/key')
+
+
+def test_blobs_past_the_cap_are_refused(filesystem):
+    blob_file = filesystem.openbin('tests/key', mode='w')
+    blob_file.write(b'a' * 1024**2)
+
+    with pytest.raises(ResourceError):
+        blob_file.write(b'a')
+
+    blob_file.close()
+
+    assert filesystem.exists('tests/key') is False
+
+    with pytest.raises(ResourceError):
+        filesystem.writebytes('tests/key', b'a' * (1024**2 + 1))
+
+    assert filesystem.usage()['stored_bytes'] == 0
+
+
+def test_move_replaces_the_destination(filesystem):
+    filesystem.writebytes('tests/key', b'old value')
+    filesystem.writebytes('.partial/upload', b'new')
+
+    with pytest.raises(DestinationExists):
+        filesystem.move('.partial/upload', 'tests/key')
+
+    filesystem.move('.partial/upload', 'tests/key', overwrite=True)
+
+    assert filesystem.readbytes('tests/key') == b'new'
+    assert filesystem.listpaths() == ['tests/key']
+    assert filesystem.usage()['stored_bytes'] == 3
+    assert filesystem.usage()['keys'] == 1
+
+    filesystem.move('tests/key', 'tests/other')
+
+    assert filesystem.exists('tests/key') is False
+    assert filesystem.readbytes('tests/other') == b'new'
+
+
+def test_generation_guards_removal_across_workers(filesystem, tmp_path):
+    other_worker = SharedMemoryFS(
+        str(tmp_path / 'test.arena'),
+        size_mb=2,
+        max_keys=16,
+        max_blob_mb=1
+    )
+
+    first_generation = filesystem.writebytes('tests/key', b'first')
+    second_generation = other_worker.writebytes('tests/key', b'second')
+
+    assert second_generation > first_generation
+
+    with pytest.raises(ResourceNotFound):
+        filesystem.remove('tests/key', generation=first_generation)
+
+    assert filesystem.readbytes('tests/key') == b'second'
+
+    filesystem.remove('tests/key', generation=second_generation)
+
+    assert other_worker.exists('tests/key') is False
+
+    other_worker.close()
+
+
+def test_compaction_keeps_generations(filesystem):
+    value = b'a' * (filesystem.data_size // 3)
+
+    generation = filesystem.writebytes('tests/kept', value)
+    filesystem.writebytes('tests/dropped', value)
+    filesystem.writebytes('tests/first', value)
+    filesystem.remove('tests/dropped')
+
+    # Another value only fits once the dropped one is compacted away.
+    filesystem.writebytes('tests/second', value)
+
+    assert filesystem.usage()['allocated_bytes'] == 3 * len(value)
+
+    filesystem.remove('tests/kept', generation=generation)
+
+    assert filesystem.exists('tests/kept') is False
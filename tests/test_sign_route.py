@@ -0,0 +1,72 @@
+import pytest
+from conftest import login_user
+
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def env_vars(env_vars):
+    env_vars.setenv('DCRX_KV_SIGNED_URL_MAX_AGE', '1h')
+    env_vars.setenv('DCRX_KV_AUTH_NAMESPACE_ACCESS', 'limited=tests|images')
+
+    return env_vars
+
+
+async def sign(client, namespace='tests', expires_in=None):
+    signing_request = {
+        'operation': 'get',
+        'namespace': namespace,
+        'key': 'key'
+    }
+
+    if expires_in is not None:
+        signing_request['expires_in'] = expires_in
+
+    return await client.client.post(
+        '/store/sign',
+        json=signing_request
+    )
+
+
+async def test_signing_requires_a_valid_expiry(client):
+    await login_user(client, 'admin')
+
+    response = await sign(client, expires_in='30m')
+    assert response.status_code == 200
+
+    for expires_in in ['0', '0s', '2h']:
+        response = await sign(client, expires_in=expires_in)
+
+        assert response.status_code == 400, expires_in
+        assert response.json()['detail']['limit'] == 3600
+
+    for expires_in in ['soon', '-5m', '']:
+        response = await sign(client, expires_in=expires_in)
+
+        assert response.status_code == 422, expires_in
+
+
+async def test_signing_is_limited_to_granted_namespaces(client):
+    await login_user(client, 'limited')
+
+    for namespace in ['tests', 'images']:
+        response = await sign(client, namespace=namespace)
+
+        assert response.status_code == 200
+
+    response = await sign(client, namespace='private')
+    assert response.status_code == 403
+
+    response = await client.client.get('/store/get/private/key')
+    assert response.status_code == 403
+
+
+async def test_node_signatures_cannot_sign_urls(client):
+    response = await client.request(
+        'POST',
+        '/store/sign',
+        content=b'{"operation": "get", "namespace": "tests"}'
+    )
+
+    assert response.status_code == 401
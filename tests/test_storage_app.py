@@ -0,0 +1,63 @@
+import pytest
+from conftest import signed_request
+
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_upload_download_delete(client):
+    response = await client.request(
+        'PUT',
+        '/store/put/raw/tests/key',
+        content=b'value'
+    )
+
+    assert response.status_code == 200
+    assert response.json()['status'] == 'DONE'
+
+    response = await client.request('GET', '/store/get/tests/key')
+
+    assert response.status_code == 200
+    assert response.content == b'value'
+
+    response = await client.request('DELETE', '/store/delete/tests/key')
+
+    assert response.status_code == 200
+    assert response.json()['status'] == 'DONE'
+
+    response = await client.request('GET', '/store/get/tests/key')
+
+    assert response.status_code == 404
+
+
+async def test_multipart_uploads_are_accepted_and_raw_uploads_complete(client):
+    response = await signed_request(
+        client,
+        'PUT',
+        '/store/put/tests/multipart',
+        files={
+            'blob': ('multipart', b'value')
+        }
+    )
+
+    assert response.status_code == 202
+
+    response = await signed_request(
+        client,
+        'GET',
+        f'/store/jobs/{response.json()["id"]}',
+        params={
+            'wait': '5s'
+        }
+    )
+
+    assert response.json()['status'] == 'DONE'
+
+    response = await client.request(
+        'PUT',
+        '/store/put/raw/tests/raw',
+        content=b'value'
+    )
+
+    assert response.status_code == 200
+    assert response.json()['status'] == 'DONE'
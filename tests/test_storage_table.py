@@ -0,0 +1,134 @@
+import pytest
+from conftest import SECRET_KEY
+from dcrx_kv.env import Env
+from dcrx_kv.services.storage.connection import StorageConnection
+from dcrx_kv.services.storage.job_state import JobState
+from dcrx_kv.services.storage.models import Blob
+from dcrx_kv.services.storage.status import JobStatus
+
+
+pytestmark = pytest.mark.anyio
+
+
+def job_state(
+    key: str='key',
+    filename: str='key.txt'
+) -> JobState:
+    return JobState(
+        Blob(
+            key=key,
+            namespace='tests',
+            filename=filename,
+            path=f'tests/{key}',
+            content_type='text/plain',
+            operation_type='upload'
+        )
+    )
+
+
+@pytest.fixture
+async def connection(tmp_path):
+    connection = StorageConnection(
+        Env(
+            DCRX_KV_SECRET_KEY=SECRET_KEY,
+            DCRX_KV_DATABASE_TYPE='sqlite',
+            DCRX_KV_DATABASE_NAME=str(tmp_path / 'storage.db')
+        )
+    )
+
+    await connection.connect()
+    await connection.init()
+
+    yield connection
+
+    await connection.close()
+    await connection.engine.dispose()
+
+
+async def stored(
+    connection: StorageConnection,
+    path: str
+):
+    result = await connection.select_by_path(path)
+
+    assert result.error is None
+
+    return result.data
+
+
+async def test_templates_insert_and_select_by_path(connection):
+    state = job_state()
+    other = job_state(key='other')
+
+    result = await connection.create([
+        state.to_metadata(),
+        other.to_metadata()
+    ])
+
+    assert result.error is None
+
+    [metadata] = await stored(connection, 'tests/key')
+
+    assert metadata == state.to_metadata()
+    assert await stored(connection, 'tests/missing') == []
+
+
+async def test_status_updates_only_write_status_columns(connection):
+    state = job_state()
+    other = job_state(key='other')
+
+    await connection.create([
+        state.to_metadata(),
+        other.to_metadata()
+    ])
+
+    state.transition(JobStatus.FAILED, 'failed', error='disk full')
+
+    # Columns outside the status update are left as stored, even
+    # where the in-memory state has moved on.
+    state.filename = 'renamed.txt'
+
+    result = await connection.update_status(state)
+    assert result.error is None
+
+    [metadata] = await stored(connection, 'tests/key')
+
+    assert metadata.status == 'FAILED'
+    assert metadata.context == f'Job {state.id} failed'
+    assert metadata.error == 'disk full'
+    assert metadata.filename == 'key.txt'
+
+    state.transition(JobStatus.DONE, 'done')
+    await connection.update_status(state)
+
+    [metadata] = await stored(connection, 'tests/key')
+
+    assert metadata.status == 'DONE'
+    assert metadata.error is None
+
+    [other_metadata] = await stored(connection, 'tests/other')
+
+    assert other_metadata == other.to_metadata()
+
+
+async def test_jobs_recreated_on_a_path_replace_its_row(connection):
+    state = job_state()
+    await connection.create([state.to_metadata()])
+
+    replacement = job_state(filename='replacement.txt')
+    replacement.transition(JobStatus.CREATED, 'created')
+
+    result = await connection.update_by_path([
+        replacement.to_metadata()
+    ])
+
+    assert result.error is None
+
+    [metadata] = await stored(connection, 'tests/key')
+
+    assert metadata == replacement.to_metadata()
+
+    result = await connection.remove_by_path('tests/key')
+
+    assert result.error is None
+    assert await stored(connection, 'tests/key') == []
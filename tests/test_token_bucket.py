@@ -0,0 +1,39 @@
+import pytest
+import time
+from dcrx_kv.services.storage.token_bucket import TokenBucket
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(time, 'monotonic', lambda: now[0])
+
+    return now
+
+
+def test_burst_then_refill(clock):
+    bucket = TokenBucket(rate=2, burst=3)
+
+    assert [bucket.acquire() for _ in range(3)] == [0, 0, 0]
+    assert bucket.acquire() == pytest.approx(0.5)
+
+    clock[0] += 0.5
+
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == pytest.approx(0.5)
+
+
+def test_refill_is_capped_at_burst(clock):
+    bucket = TokenBucket(rate=10, burst=2)
+
+    clock[0] += 60
+
+    assert [bucket.acquire() for _ in range(2)] == [0, 0]
+    assert bucket.acquire() > 0
+
+
+def test_burst_is_at_least_one(clock):
+    bucket = TokenBucket(rate=1, burst=0)
+
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == pytest.approx(1)
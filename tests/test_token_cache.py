@@ -0,0 +1,66 @@
+import pytest
+import time
+from dcrx_kv.services.auth.token_cache import TokenCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(time, 'time', lambda: now[0])
+
+    return now
+
+
+def test_entries_expire_at_ttl_or_token_expiry(clock):
+    cache = TokenCache(ttl=30)
+
+    cache.put('token', 'user')
+    cache.put('short', 'user', token_expires_at=clock[0] + 5)
+
+    assert cache.get('token') == 'user'
+    assert cache.get('short') == 'user'
+
+    clock[0] += 5
+
+    assert cache.get('short') is None
+    assert cache.get('token') == 'user'
+
+    clock[0] += 25
+
+    assert cache.get('token') is None
+
+
+def test_least_recently_used_entries_are_evicted(clock):
+    cache = TokenCache(max_size=2)
+
+    cache.put('first', 'user')
+    cache.put('second', 'user')
+
+    assert cache.get('first') == 'user'
+
+    cache.put('third', 'user')
+
+    assert cache.get('second') is None
+    assert cache.get('first') == 'user'
+    assert cache.get('third') == 'user'
+
+
+def test_invalidating_a_user_drops_only_their_tokens(clock):
+    cache = TokenCache()
+
+    cache.put('first', 'user')
+    cache.put('second', 'user')
+    cache.put('other', 'another')
+
+    cache.invalidate_user('user')
+
+    assert cache.get('first') is None
+    assert cache.get('second') is None
+    assert cache.get('other') == 'another'
+
+
+def test_disabled_cache_holds_nothing(clock):
+    cache = TokenCache(max_size=0)
+    cache.put('token', 'user')
+
+    assert cache.get('token') is None
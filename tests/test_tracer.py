@@ -0,0 +1,141 @@
+import asyncio
+import pytest
+import threading
+from dcrx_kv.tracing import Tracer
+from dcrx_kv.tracing.tracer import current_span
+from conftest import login_user
+
+
+pytestmark = pytest.mark.anyio
+
+
+def spans_by_name(record):
+    return {
+        span.name: span for span in record.spans
+    }
+
+
+async def test_unsampled_requests_record_nothing():
+    tracer = Tracer(sample_rate=0)
+
+    assert tracer.start_trace('request') is None
+
+    with tracer.span('child') as span:
+        assert span is None
+
+    assert tracer.wrap('store.read', sum, [1, 2])() == 3
+    assert tracer.exporter.recent() == []
+
+
+async def test_spans_are_parented_to_the_current_span():
+    tracer = Tracer()
+
+    @tracer.traced('db.get')
+    async def get():
+        return current_span.get()
+
+    root = tracer.start_trace('request', force=True, path='/tests')
+
+    with tracer.span('auth'):
+        pass
+
+    with tracer.span('queue.run_job', job_id='job') as job_span:
+        db_span = await get()
+
+        with pytest.raises(ValueError):
+            with tracer.span('job.store'):
+                raise ValueError('failed')
+
+    assert current_span.get() is root
+
+    tracer.end_trace(root)
+
+    assert tracer.exporter.get(root.trace_id) is root.record
+    assert current_span.get() is None
+
+    spans = spans_by_name(root.record)
+
+    assert spans['request'].parent_id is None
+    assert spans['request'].attributes == {'path': '/tests'}
+    assert spans['auth'].parent_id == root.span_id
+    assert spans['queue.run_job'].parent_id == root.span_id
+    assert spans['db.get'] is db_span
+    assert spans['db.get'].parent_id == job_span.span_id
+    assert spans['job.store'].parent_id == job_span.span_id
+    assert spans['job.store'].error == "ValueError('failed')"
+
+    assert all(
+        span.trace_id == root.trace_id for span in root.record.spans
+    )
+
+    assert all(
+        span.duration is not None for span in root.record.spans
+    )
+
+
+async def test_wrapped_calls_carry_the_trace_into_the_executor():
+    tracer = Tracer()
+    loop = asyncio.get_running_loop()
+
+    def read(path: str):
+        return (
+            threading.current_thread(),
+            current_span.get(),
+            path
+        )
+
+    root = tracer.start_trace('request', force=True)
+
+    with tracer.span('job.store') as stage_span:
+        worker, read_span, path = await loop.run_in_executor(
+            None,
+            tracer.wrap('store.read', read, 'tests/key')
+        )
+
+        _, unnamed_span, _ = await loop.run_in_executor(
+            None,
+            tracer.wrap(None, read, 'tests/key')
+        )
+
+    tracer.end_trace(root)
+
+    assert worker is not threading.current_thread()
+    assert path == 'tests/key'
+    assert read_span.name == 'store.read'
+    assert read_span.parent_id == stage_span.span_id
+    assert read_span.trace_id == root.trace_id
+    assert read_span in root.record.spans
+    assert unnamed_span is stage_span
+
+
+async def test_forced_requests_are_traced(client):
+    await login_user(client, 'user')
+
+    response = await client.client.put(
+        '/store/put/raw/tests/key',
+        content=b'value',
+        headers={
+            'x-dcrx-kv-trace': '1'
+        }
+    )
+
+    assert response.status_code == 200
+
+    trace_id = response.headers['x-dcrx-kv-trace-id']
+
+    response = await client.client.get(f'/monitoring/traces/{trace_id}')
+
+    assert response.status_code == 200
+
+    trace = response.json()
+    spans = {
+        span['name']: span for span in trace['spans']
+    }
+
+    root = spans['request']
+
+    assert root['parent_id'] is None
+    assert root['attributes']['route'] == '/store/put/raw/{namespace}/{key}'
+    assert root['attributes']['status'] == 200
+    assert spans['queue.run_job']['parent_id'] == root['span_id']
+    assert trace['summary']['trace_id'] == trace_id
@@ -0,0 +1,71 @@
+import pytest
+import time
+from dcrx_kv.env import Env
+from dcrx_kv.services.auth.url_signer import (
+    UrlSigner,
+    URL_EXPIRES_PARAM,
+    URL_SIGNATURE_PARAM
+)
+from starlette.requests import Request
+from urllib.parse import urlencode
+from conftest import SECRET_KEY
+
+
+@pytest.fixture
+def signer():
+    return UrlSigner(
+        Env(
+            DCRX_KV_SECRET_KEY=SECRET_KEY,
+            DCRX_KV_SIGNED_URL_MAX_AGE='1h'
+        )
+    )
+
+
+def request(method: str, path: str, params: dict) -> Request:
+    return Request({
+        'type': 'http',
+        'method': method,
+        'path': path,
+        'query_string': urlencode(params).encode(),
+        'headers': []
+    })
+
+
+def test_key_scoped_urls(signer):
+    params = signer.sign('get', 'tests', key='key')
+
+    assert signer.verify(request('GET', '/store/get/tests/key', params))
+    assert signer.verify(request('GET', '/store/get/tests/other', params)) is False
+    assert signer.verify(request('PUT', '/store/get/tests/key', params)) is False
+    assert signer.verify(request('GET', '/store/delete/tests/key', params)) is False
+
+
+def test_namespace_scoped_urls(signer):
+    params = signer.sign('put', 'tests')
+
+    assert signer.verify(request('PUT', '/store/put/tests/key', params))
+    assert signer.verify(request('PUT', '/store/put/raw/tests/other', params))
+    assert signer.verify(request('PUT', '/store/put/raw/other/key', params)) is False
+    assert signer.verify(request('PUT', '/store/put/extra/tests/key', params)) is False
+
+
+def test_expired_or_tampered_urls_are_rejected(signer):
+    params = signer.sign('get', 'tests', key='key', expires_in=-1)
+
+    assert signer.verify(request('GET', '/store/get/tests/key', params)) is False
+
+    params = signer.sign('get', 'tests', key='key')
+    params[URL_EXPIRES_PARAM] = str(int(params[URL_EXPIRES_PARAM]) + 60)
+
+    assert signer.verify(request('GET', '/store/get/tests/key', params)) is False
+
+    params = signer.sign('get', 'tests', key='key')
+    del params[URL_SIGNATURE_PARAM]
+
+    assert signer.verify(request('GET', '/store/get/tests/key', params)) is False
+
+
+def test_expiry_is_capped_at_max_age(signer):
+    params = signer.sign('get', 'tests', expires_in=86400)
+
+    assert int(params[URL_EXPIRES_PARAM]) <= time.time() + 3600